@@ -24,6 +24,7 @@ from lib.actions import (
     ActionStatus,
     RiskLevel,
 )
+from lib.db_executor import offload
 from lib.state_store import get_store
 
 logger = logging.getLogger(__name__)
@@ -140,7 +141,8 @@ class ActionListResponse(BaseModel):
 
 
 @router.post("/propose", response_model=ActionStatusResponse)
-async def propose_action(request: ProposalRequest):
+@offload
+def propose_action(request: ProposalRequest):
     """Propose a new action for approval."""
     try:
         framework = get_action_framework()
@@ -168,7 +170,8 @@ async def propose_action(request: ProposalRequest):
 
 
 @router.post("/batch", response_model=BatchActionResponse)
-async def batch_propose(request: BatchProposalRequest):
+@offload
+def batch_propose(request: BatchProposalRequest):
     """Batch propose multiple actions."""
     try:
         framework = get_action_framework()
@@ -199,7 +202,8 @@ async def batch_propose(request: BatchProposalRequest):
 
 
 @router.post("/{action_id}/approve", response_model=ActionStatusResponse)
-async def approve_action(action_id: str, request: ApproveRequest):
+@offload
+def approve_action(action_id: str, request: ApproveRequest):
     """Approve a pending action."""
     try:
         framework = get_action_framework()
@@ -223,7 +227,8 @@ async def approve_action(action_id: str, request: ApproveRequest):
 
 
 @router.post("/{action_id}/reject", response_model=ActionStatusResponse)
-async def reject_action(action_id: str, request: RejectRequest):
+@offload
+def reject_action(action_id: str, request: RejectRequest):
     """Reject a pending action."""
     try:
         framework = get_action_framework()
@@ -245,7 +250,8 @@ async def reject_action(action_id: str, request: RejectRequest):
 
 
 @router.post("/{action_id}/execute", response_model=ActionExecutionResponse)
-async def execute_action(action_id: str, request: ExecuteRequest):
+@offload
+def execute_action(action_id: str, request: ExecuteRequest):
     """Execute an approved action."""
     try:
         framework = get_action_framework()
@@ -266,7 +272,8 @@ async def execute_action(action_id: str, request: ExecuteRequest):
 
 
 @router.get("/pending", response_model=ActionListResponse)
-async def get_pending_actions(action_type: str | None = None, limit: int = 50):
+@offload
+def get_pending_actions(action_type: str | None = None, limit: int = 50):
     """Get pending actions awaiting approval."""
     try:
         framework = get_action_framework()
@@ -283,7 +290,8 @@ async def get_pending_actions(action_type: str | None = None, limit: int = 50):
 
 
 @router.get("/history", response_model=ActionListResponse)
-async def get_action_history(
+@offload
+def get_action_history(
     entity_id: str | None = None, action_type: str | None = None, limit: int = 50
 ):
     """Get action execution history."""
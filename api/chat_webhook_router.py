@@ -18,6 +18,7 @@ from typing import Any
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
+from lib.db_executor import offload
 from lib.integrations.chat_commands import SlashCommandHandler
 
 logger = logging.getLogger(__name__)
@@ -123,7 +124,8 @@ class ChatWebhookResponse(BaseModel):
 
 
 @router.post("/webhook", response_model=ChatWebhookResponse)
-async def handle_webhook(request: ChatWebhookRequest) -> dict:
+@offload
+def handle_webhook(request: ChatWebhookRequest) -> dict:
     """
     Receive and process Chat webhook events.
 
@@ -202,7 +204,8 @@ async def handle_webhook(request: ChatWebhookRequest) -> dict:
 
 
 @router.post("/interactive", response_model=ChatWebhookResponse)
-async def handle_interactive_action(request: InteractiveActionRequest) -> dict:
+@offload
+def handle_interactive_action(request: InteractiveActionRequest) -> dict:
     """
     Handle interactive card button clicks.
 
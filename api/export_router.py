@@ -2,8 +2,9 @@
 Data Export API Router - REST endpoints for data governance and portability.
 
 Provides endpoints for:
-- Requesting bulk data exports
+- Requesting bulk data exports (inline or as resumable background jobs)
 - Checking export status
+- Streaming a single table as a download
 - Listing exportable tables
 - Getting table schemas
 - Supporting compliance and GDPR requirements
@@ -11,12 +12,13 @@ Provides endpoints for:
 
 import logging
 import sqlite3
-import threading
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from api.response_models import DetailResponse
 from lib.governance.data_export import DataExporter, ExportFormat, ExportRequest
+from lib.governance.export_jobs import COMPLETED, ExportJobManager
 from lib.paths import data_dir
 
 logger = logging.getLogger(__name__)
@@ -30,9 +32,51 @@ export_router = APIRouter(
 # Get database path — use lib.db for centralized resolution
 db_path = data_dir() / "moh_time_os.db"
 
-# Export instances by request ID — protected by lock for concurrent request safety
-_exports: dict = {}
-_exports_lock = threading.Lock()
+# Export jobs keep their state on disk, shared by all workers and resumed at startup
+export_jobs = ExportJobManager(db_path)
+
+_MEDIA_TYPES = {
+    ExportFormat.JSON: "application/json",
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.JSONL: "application/x-ndjson",
+}
+
+
+def _parse_format(format: str) -> ExportFormat:
+    try:
+        return ExportFormat[format.upper()]
+    except KeyError as e:
+        raise HTTPException(
+            status_code=400, detail="Invalid format. Supported: json, csv, jsonl"
+        ) from e
+
+
+def _job_status(state: dict) -> dict:
+    request = state["request"]
+    response = {
+        "status": "ok",
+        "request_id": state["job_id"],
+        "job_status": state["status"],
+        "format": request["format"],
+        "anonymized": request["anonymize_pii"],
+        "compressed": request["compress"],
+        "created_at": state["created_at"],
+        "tables_done": list(state["tables_done"]),
+        "error": state["error"],
+    }
+    if state["status"] == COMPLETED:
+        result = state["result"]
+        response.update(
+            {
+                "file_path": result["file_path"],
+                "table_count": result["table_count"],
+                "row_count": result["row_count"],
+                "size_bytes": result["size_bytes"],
+                "checksum_sha256": result["checksum_sha256"],
+                "tables": result["tables"],
+            }
+        )
+    return response
 
 
 @export_router.post("/export", response_model=DetailResponse)
@@ -40,54 +84,31 @@ def request_data_export(
     tables: list[str] = Query(..., description="Tables to export"),
     format: str = Query("json", description="Export format: json, csv, jsonl"),
     anonymize_pii: bool = Query(False, description="Anonymize PII columns"),
+    compress: bool = Query(False, description="gzip each table file"),
+    background: bool = Query(False, description="Run as a background job and return at once"),
     requested_by: str | None = Query(None, description="Who requested the export"),
     reason: str | None = Query(None, description="Reason for export"),
 ) -> dict:
     """
     Request bulk data export.
 
-    Returns request_id to check status later.
+    Returns request_id to check status later. With background=true the
+    export runs as a resumable job and job_status starts as "pending".
     """
     try:
-        # Validate format
-        try:
-            fmt = ExportFormat[format.upper()]
-        except KeyError as e:
-            raise HTTPException(
-                status_code=400, detail="Invalid format. Supported: json, csv, jsonl"
-            ) from e
-
-        # Create exporter
-        exporter = DataExporter(str(db_path))
-
-        # Create request
         request = ExportRequest(
             tables=tables,
-            format=fmt,
+            format=_parse_format(format),
             anonymize_pii=anonymize_pii,
             requested_by=requested_by,
             reason=reason,
+            compress=compress,
         )
-
-        # Export
-        result = exporter.export_tables(request)
-
-        # Store result — protected against concurrent request handlers
-        with _exports_lock:
-            _exports[result.request_id] = result
-
-        return {
-            "status": "ok",
-            "request_id": result.request_id,
-            "table_count": result.table_count,
-            "row_count": result.row_count,
-            "format": result.format.value,
-            "anonymized": result.anonymized,
-            "created_at": result.created_at,
-        }
+        job_id = export_jobs.submit(request, background=background)
+        return _job_status(export_jobs.get(job_id))
     except HTTPException:
         raise
-    except (sqlite3.Error, ValueError) as e:
+    except (sqlite3.Error, ValueError, OSError) as e:
         logger.error(f"Error requesting export: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -98,31 +119,61 @@ def get_export_status(request_id: str) -> dict:
     Check export status and get download link.
     """
     try:
-        with _exports_lock:
-            if request_id not in _exports:
-                raise HTTPException(status_code=404, detail="Export not found")
-            result = _exports[request_id]
-
-        return {
-            "status": "ok",
-            "request_id": result.request_id,
-            "file_path": result.file_path,
-            "table_count": result.table_count,
-            "row_count": result.row_count,
-            "size_bytes": result.size_bytes,
-            "format": result.format.value,
-            "anonymized": result.anonymized,
-            "created_at": result.created_at,
-            "checksum_sha256": result.checksum_sha256,
-            "tables": result.tables_included,
-        }
+        state = export_jobs.get(request_id)
+        if state is None:
+            raise HTTPException(status_code=404, detail="Export not found")
+        return _job_status(state)
     except HTTPException:
         raise
-    except (sqlite3.Error, ValueError) as e:
+    except (sqlite3.Error, ValueError, OSError) as e:
         logger.error(f"Error getting export status: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@export_router.post("/export/{request_id}/resume", response_model=DetailResponse)
+def resume_export(request_id: str) -> dict:
+    """
+    Resume a failed or interrupted export job from its first unfinished table.
+    """
+    state = export_jobs.get(request_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="Export not found")
+    if not export_jobs.resume(request_id):
+        raise HTTPException(
+            status_code=409, detail=f"Export is {state['status']} and cannot be resumed"
+        )
+    return _job_status(export_jobs.get(request_id))
+
+
+@export_router.get("/export/stream/{table}", response_class=StreamingResponse)
+def stream_table_export(
+    table: str,
+    format: str = Query("jsonl", description="Export format: json, csv, jsonl"),
+    anonymize_pii: bool = Query(False, description="Anonymize PII columns"),
+    compress: bool = Query(False, description="gzip the response body"),
+) -> StreamingResponse:
+    """
+    Stream one table as a file download.
+
+    Rows are read, anonymized and encoded in chunks as the client reads, so
+    memory stays constant regardless of table size.
+    """
+    fmt = _parse_format(format)
+    try:
+        body = DataExporter(str(db_path)).iter_export(
+            table, fmt, anonymize=anonymize_pii, compress=compress
+        )
+    except (sqlite3.Error, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    filename = f"{table}.{fmt.value}{'.gz' if compress else ''}"
+    return StreamingResponse(
+        body,
+        media_type="application/gzip" if compress else _MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @export_router.get("/exportable-tables", response_model=DetailResponse)
 def list_exportable_tables() -> dict:
     """
@@ -134,10 +134,64 @@ def list_subject_access_requests(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+_FULFILL_ACTIONS = ("find", "export", "delete", "anonymize")
+
+
+def _fulfill_action(action: str, subject_identifier: str, dry_run: bool) -> dict:
+    """Run one fulfilment action and shape its response."""
+    if action == "find":
+        report = _manager.find_subject_data(subject_identifier)
+        return {
+            "status": "ok",
+            "action": "find",
+            "subject_identifier": report.subject_identifier,
+            "tables_searched": len(report.tables_searched),
+            "tables_with_data": report.tables_with_data,
+            "total_records": report.total_records,
+            "generated_at": report.generated_at,
+        }
+
+    if action == "export":
+        file_path = _manager.export_subject_data(subject_identifier)
+        return {
+            "status": "ok",
+            "action": "export",
+            "file_path": file_path,
+            "subject_identifier": subject_identifier,
+        }
+
+    if action == "delete":
+        result = _manager.delete_subject_data(subject_identifier, dry_run=dry_run)
+        return {
+            "status": "ok",
+            "action": "delete",
+            "dry_run": dry_run,
+            "subject_identifier": result.subject_identifier,
+            "tables_affected": result.tables_affected,
+            "rows_deleted": result.rows_deleted,
+            "tables_skipped": result.tables_skipped,
+            "completed_at": result.completed_at,
+        }
+
+    result = _manager.anonymize_subject_data(subject_identifier, dry_run=dry_run)
+    return {
+        "status": "ok",
+        "action": "anonymize",
+        "dry_run": dry_run,
+        "subject_identifier": result.subject_identifier,
+        "tables_affected": result.tables_affected,
+        "rows_anonymized": result.rows_anonymized,
+        "tables_skipped": result.tables_skipped,
+        "completed_at": result.completed_at,
+    }
+
+
 @governance_router.post("/sar/{request_id}/fulfill", response_model=DetailResponse)
 def fulfill_subject_access_request(
     request_id: str,
-    action: str = Query(..., description="find, export, delete, or anonymize"),
+    action: str = Query(
+        ..., description="find, export, delete, or anonymize (comma-separate to run several)"
+    ),
     dry_run: bool = Query(True, description="Only simulate the action"),
 ) -> dict:
     """
@@ -149,6 +203,9 @@ def fulfill_subject_access_request(
     - delete: Delete subject data (dry-run by default)
     - anonymize: Anonymize subject data instead of delete
 
+    Several actions (e.g. "find,export,delete") run in order against one
+    search of the subject's data and return {"results": [...]}.
+
     Args:
         request_id: The SAR request ID
         action: What to do (find, export, delete, anonymize)
@@ -163,60 +220,21 @@ def fulfill_subject_access_request(
         if not sar:
             raise HTTPException(status_code=404, detail="Request not found")
 
-        # Perform the action
-        if action == "find":
-            report = _manager.find_subject_data(sar.subject_identifier)
-            return {
-                "status": "ok",
-                "action": "find",
-                "subject_identifier": report.subject_identifier,
-                "tables_searched": len(report.tables_searched),
-                "tables_with_data": report.tables_with_data,
-                "total_records": report.total_records,
-                "generated_at": report.generated_at,
-            }
-
-        elif action == "export":
-            file_path = _manager.export_subject_data(sar.subject_identifier)
-            return {
-                "status": "ok",
-                "action": "export",
-                "file_path": file_path,
-                "subject_identifier": sar.subject_identifier,
-            }
-
-        elif action == "delete":
-            result = _manager.delete_subject_data(sar.subject_identifier, dry_run=dry_run)
-            return {
-                "status": "ok",
-                "action": "delete",
-                "dry_run": dry_run,
-                "subject_identifier": result.subject_identifier,
-                "tables_affected": result.tables_affected,
-                "rows_deleted": result.rows_deleted,
-                "tables_skipped": result.tables_skipped,
-                "completed_at": result.completed_at,
-            }
-
-        elif action == "anonymize":
-            result = _manager.anonymize_subject_data(sar.subject_identifier, dry_run=dry_run)
-            return {
-                "status": "ok",
-                "action": "anonymize",
-                "dry_run": dry_run,
-                "subject_identifier": result.subject_identifier,
-                "tables_affected": result.tables_affected,
-                "rows_anonymized": result.rows_anonymized,
-                "tables_skipped": result.tables_skipped,
-                "completed_at": result.completed_at,
-            }
-
-        else:
+        actions = [a.strip() for a in action.split(",") if a.strip()]
+        if not actions or any(a not in _FULFILL_ACTIONS for a in actions):
             raise HTTPException(
                 status_code=400,
                 detail="Invalid action. Supported: find, export, delete, anonymize",
             )
 
+        # Perform the actions, sharing one search of the subject's data
+        with _manager.session():
+            results = [_fulfill_action(a, sar.subject_identifier, dry_run) for a in actions]
+
+        if len(results) == 1:
+            return results[0]
+        return {"status": "ok", "results": results}
+
     except HTTPException:
         raise
     except (sqlite3.Error, ValueError) as e:
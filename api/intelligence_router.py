@@ -24,6 +24,8 @@ from pydantic import BaseModel
 
 from api.response_models import IntelligenceResponse
 from lib.cache import cache_invalidate, cached
+from lib.cache.invalidation import PATTERNS, PROPOSALS, SCORES, SIGNALS
+from lib.db_executor import offload
 from lib.query_engine import QueryEngine
 
 logger = logging.getLogger(__name__)
@@ -567,9 +569,23 @@ def financial_aging():
 # INTELLIGENCE LAYER ENDPOINTS (Scoring, Signals, Patterns, Proposals)
 # =============================================================================
 
+# Cache dependency tags for the full pipeline endpoints: the intelligence
+# outputs plus the source tables they are computed from.
+_PIPELINE_TAGS = (
+    SCORES,
+    SIGNALS,
+    PATTERNS,
+    PROPOSALS,
+    "clients",
+    "projects",
+    "tasks",
+    "invoices",
+    "communications",
+)
+
 
 @intelligence_router.get("/snapshot", response_model=IntelligenceResponse)
-@cached(ttl=60, key_func=lambda: "intelligence:snapshot:full")
+@cached(ttl=60, key_func=lambda: "intelligence:snapshot:full", tags=_PIPELINE_TAGS, warm=True)
 def intelligence_snapshot():
     """
     Get complete intelligence snapshot.
@@ -582,7 +598,8 @@ def intelligence_snapshot():
     - Produces daily briefing
 
     This is a heavy endpoint (~45s). Use targeted endpoints for faster responses.
-    Cached for 60 seconds.
+    Cached for up to 60 seconds; invalidated and re-warmed in the background
+    when the underlying tables or intelligence outputs are written.
     """
     try:
         from lib.intelligence import generate_intelligence_snapshot
@@ -625,7 +642,7 @@ def critical_items():
 
 
 @intelligence_router.get("/briefing", response_model=IntelligenceResponse)
-@cached(ttl=300, key_func=lambda: "intelligence:briefing:daily")
+@cached(ttl=300, key_func=lambda: "intelligence:briefing:daily", tags=_PIPELINE_TAGS, warm=True)
 def daily_briefing():
     """
     Get daily briefing summary.
@@ -638,7 +655,8 @@ def daily_briefing():
     - Portfolio health
     - Top proposal headline
 
-    Cached for 300 seconds (5 minutes).
+    Cached for up to 300 seconds (5 minutes); invalidated and re-warmed like
+    /snapshot.
     """
     try:
         from lib.intelligence import (
@@ -694,12 +712,13 @@ def list_signals(
 
 
 @intelligence_router.get("/signals/summary", response_model=IntelligenceResponse)
-@cached(ttl=60, key_func=lambda: "intelligence:signals:summary")
+@cached(ttl=60, key_func=lambda: "intelligence:signals:summary", tags=(SIGNALS,), warm=True)
 def signals_summary():
     """
     Get signal summary (counts by severity and state).
 
-    Cached for 60 seconds.
+    Cached for up to 60 seconds; invalidated and re-warmed when signals are
+    written.
     """
     try:
         from lib.intelligence.signals import get_signal_summary
@@ -1999,7 +2018,8 @@ def performance_profile():
 
 
 @intelligence_router.get("/calibration/report", response_model=IntelligenceResponse)
-async def get_calibration_report(
+@offload
+def get_calibration_report(
     report_type: str = "weekly",
     signal_id: str | None = None,
 ):
@@ -2045,7 +2065,8 @@ async def get_calibration_report(
 
 
 @intelligence_router.get("/calibration/briefing", response_model=IntelligenceResponse)
-async def get_calibration_briefing():
+@offload
+def get_calibration_briefing():
     """
     GET /api/v2/intelligence/calibration/briefing
 
@@ -13,6 +13,8 @@ Endpoints:
 - GET /api/v2/paginated/signals — Paginated signals
 - GET /api/v2/paginated/clients — Paginated client list
 - GET /api/v2/paginated/invoices — Paginated invoice list
+- GET /api/v2/paginated/{tasks,signals,clients,invoices}/cursor — The same
+  listings by keyset cursor, where page N costs the same as page 1
 
 All endpoints query the live database. No fallback data — if the DB is
 unreachable or the table is missing, the endpoint returns an error.
@@ -20,18 +22,72 @@ unreachable or the table is missing, the endpoint returns an error.
 
 import logging
 import sqlite3
-from typing import Any
-
-from fastapi import APIRouter, Depends, HTTPException
-
-from lib import paths, safe_sql
-from lib.api.pagination import PaginatedResponse, PaginationParams, paginate, pagination_params
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from lib import paths
+from lib.api.pagination import (
+    CursorPaginatedResponse,
+    InvalidCursor,
+    KeysetSpec,
+    PaginatedResponse,
+    PaginationParams,
+    keyset_paginate,
+    offset_paginate,
+    pagination_params,
+)
+from lib.db import open_connection
+from lib.db_executor import offload
 
 logger = logging.getLogger(__name__)
 
 paginated_router = APIRouter(tags=["Pagination"])
 
 
+# ==== Listings ====
+# Newest first, ties broken by primary key. Each (key, id) pair has a
+# matching index in lib/schema.py.
+
+TASKS = KeysetSpec(
+    name="tasks",
+    source="tasks",
+    columns="id, title, description, status, priority, created_at, due_date AS due_at",
+    key="created_at",
+)
+
+SIGNALS = KeysetSpec(
+    name="signals",
+    source="signals",
+    columns=(
+        "signal_id AS id, signal_type AS type, value AS description, severity, created_at, "
+        "resolved_at IS NOT NULL AS resolved"
+    ),
+    key="created_at",
+    id="signal_id",
+)
+
+CLIENTS = KeysetSpec(
+    name="clients",
+    source="clients c",
+    columns=(
+        "c.id, c.name, c.tier, c.created_at, "
+        "(SELECT COUNT(*) FROM projects p WHERE p.client_id = c.id) AS projects"
+    ),
+    key="c.created_at",
+    id="c.id",
+)
+
+# invoices.created_at is nullable and NULLs never compare, so key on ''.
+INVOICES = KeysetSpec(
+    name="invoices",
+    source="invoices",
+    columns="id, external_id AS invoice_number, client_id, amount, status, created_at, due_at",
+    key="COALESCE(created_at, '')",
+)
+
+
 # ==== Database Helpers ====
 
 
@@ -39,7 +95,7 @@ def _get_connection() -> sqlite3.Connection:
     """Get a DB connection or raise."""
     try:
         db_path = str(paths.db_path())
-        conn = sqlite3.connect(db_path)
+        conn = open_connection(db_path)
         conn.row_factory = sqlite3.Row
         return conn
     except sqlite3.Error as e:
@@ -51,93 +107,50 @@ def _get_connection() -> sqlite3.Connection:
         ) from e
 
 
-def _query_table(
-    table: str,
-    columns: str,
-    order_by: str = "created_at DESC",
-    limit: int = 1000,
-) -> list[dict[str, Any]]:
-    """Query a table and return rows as dicts. Raises on failure."""
+@contextmanager
+def _listing(spec: KeysetSpec) -> Iterator[sqlite3.Connection]:
+    """Connection for one listing query. Raises 503 on query failure, 400 on a bad cursor."""
     conn = _get_connection()
     try:
-        cursor = conn.cursor()
-        # Table and column names are hardcoded strings from this file,
-        # not user input — safe to validate directly.
-        sql = safe_sql.select(table, columns=columns, order_by=order_by, suffix="LIMIT ?")
-        cursor.execute(sql, (limit,))
-        return [dict(row) for row in cursor.fetchall()]
+        yield conn
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except sqlite3.OperationalError as e:
-        logger.error("Query failed on table '%s': %s", table, e)
+        logger.error("Query failed on table '%s': %s", spec.name, e)
         raise HTTPException(
             status_code=503,
-            detail=f"Database query failed ({table}): {e}",
+            detail=f"Database query failed ({spec.name}): {e}",
         ) from e
     finally:
         conn.close()
 
 
-# ==== Live DB Fetching ====
-
-
-def _get_tasks_from_db() -> list[dict[str, Any]]:
-    """Fetch tasks from live database."""
-    return _query_table(
-        table="tasks",
-        columns="id, title, description, status, priority, created_at, due_at",
-    )
+def _page(spec: KeysetSpec, params: PaginationParams) -> PaginatedResponse:
+    """Page-numbered listing, counted and sliced in SQL."""
+    with _listing(spec) as conn:
+        return offset_paginate(conn, spec, params.page, params.page_size)
 
 
-def _get_signals_from_db() -> list[dict[str, Any]]:
-    """Fetch signals from live database."""
-    return _query_table(
-        table="signals",
-        columns="id, type, description, severity, created_at, resolved",
-    )
-
-
-def _get_clients_from_db() -> list[dict[str, Any]]:
-    """Fetch clients from live database with project counts."""
-    conn = _get_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT c.id, c.name, c.status, c.created_at,
-                   COALESCE(p.project_count, 0) AS projects
-            FROM clients c
-            LEFT JOIN (
-                SELECT client_id, COUNT(*) AS project_count
-                FROM projects
-                GROUP BY client_id
-            ) p ON p.client_id = c.id
-            ORDER BY c.created_at DESC
-            LIMIT 1000
-            """
-        )
-        return [dict(row) for row in cursor.fetchall()]
-    except sqlite3.OperationalError as e:
-        logger.error("Query failed on clients: %s", e)
-        raise HTTPException(
-            status_code=503,
-            detail=f"Database query failed (clients): {e}",
-        ) from e
-    finally:
-        conn.close()
+def _cursor_page(spec: KeysetSpec, limit: int, cursor: str | None) -> CursorPaginatedResponse:
+    """Keyset listing starting after *cursor*."""
+    with _listing(spec) as conn:
+        return keyset_paginate(conn, spec, limit, cursor)
 
 
-def _get_invoices_from_db() -> list[dict[str, Any]]:
-    """Fetch invoices from live database."""
-    return _query_table(
-        table="invoices",
-        columns="id, invoice_number, client_id, amount, status, created_at, due_at",
-    )
+def cursor_params(
+    limit: int = Query(50, ge=1, le=500, description="Items per page"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+) -> tuple[int, str | None]:
+    """FastAPI dependency to extract keyset pagination parameters from query string."""
+    return limit, cursor
 
 
 # ==== Endpoints ====
 
 
 @paginated_router.get("/tasks")
-async def list_tasks_paginated(
+@offload
+def list_tasks_paginated(
     params: PaginationParams = Depends(pagination_params),
 ) -> PaginatedResponse:
     """
@@ -149,12 +162,29 @@ async def list_tasks_paginated(
 
     Returns 503 if database is unavailable.
     """
-    tasks = _get_tasks_from_db()
-    return paginate(tasks, params.page, params.page_size)
+    return _page(TASKS, params)
+
+
+@paginated_router.get("/tasks/cursor")
+@offload
+def list_tasks_cursor(
+    page: tuple[int, str | None] = Depends(cursor_params),
+) -> CursorPaginatedResponse:
+    """
+    Get tasks by keyset cursor.
+
+    Query parameters:
+    - limit: Items per page (default 50, max 500)
+    - cursor: next_cursor of the previous page (omit for the first page)
+
+    Returns 400 for an invalid cursor, 503 if database is unavailable.
+    """
+    return _cursor_page(TASKS, *page)
 
 
 @paginated_router.get("/signals")
-async def list_signals_paginated(
+@offload
+def list_signals_paginated(
     params: PaginationParams = Depends(pagination_params),
 ) -> PaginatedResponse:
     """
@@ -166,12 +196,29 @@ async def list_signals_paginated(
 
     Returns 503 if database is unavailable.
     """
-    signals = _get_signals_from_db()
-    return paginate(signals, params.page, params.page_size)
+    return _page(SIGNALS, params)
+
+
+@paginated_router.get("/signals/cursor")
+@offload
+def list_signals_cursor(
+    page: tuple[int, str | None] = Depends(cursor_params),
+) -> CursorPaginatedResponse:
+    """
+    Get signals by keyset cursor.
+
+    Query parameters:
+    - limit: Items per page (default 50, max 500)
+    - cursor: next_cursor of the previous page (omit for the first page)
+
+    Returns 400 for an invalid cursor, 503 if database is unavailable.
+    """
+    return _cursor_page(SIGNALS, *page)
 
 
 @paginated_router.get("/clients")
-async def list_clients_paginated(
+@offload
+def list_clients_paginated(
     params: PaginationParams = Depends(pagination_params),
 ) -> PaginatedResponse:
     """
@@ -183,12 +230,29 @@ async def list_clients_paginated(
 
     Returns 503 if database is unavailable.
     """
-    clients = _get_clients_from_db()
-    return paginate(clients, params.page, params.page_size)
+    return _page(CLIENTS, params)
+
+
+@paginated_router.get("/clients/cursor")
+@offload
+def list_clients_cursor(
+    page: tuple[int, str | None] = Depends(cursor_params),
+) -> CursorPaginatedResponse:
+    """
+    Get clients by keyset cursor.
+
+    Query parameters:
+    - limit: Items per page (default 50, max 500)
+    - cursor: next_cursor of the previous page (omit for the first page)
+
+    Returns 400 for an invalid cursor, 503 if database is unavailable.
+    """
+    return _cursor_page(CLIENTS, *page)
 
 
 @paginated_router.get("/invoices")
-async def list_invoices_paginated(
+@offload
+def list_invoices_paginated(
     params: PaginationParams = Depends(pagination_params),
 ) -> PaginatedResponse:
     """
@@ -200,5 +264,21 @@ async def list_invoices_paginated(
 
     Returns 503 if database is unavailable.
     """
-    invoices = _get_invoices_from_db()
-    return paginate(invoices, params.page, params.page_size)
+    return _page(INVOICES, params)
+
+
+@paginated_router.get("/invoices/cursor")
+@offload
+def list_invoices_cursor(
+    page: tuple[int, str | None] = Depends(cursor_params),
+) -> CursorPaginatedResponse:
+    """
+    Get invoices by keyset cursor.
+
+    Query parameters:
+    - limit: Items per page (default 50, max 500)
+    - cursor: next_cursor of the previous page (omit for the first page)
+
+    Returns 400 for an invalid cursor, 503 if database is unavailable.
+    """
+    return _cursor_page(INVOICES, *page)
@@ -167,6 +167,7 @@ class SignalListResponse(BaseModel):
     signals: list[Any] = Field(default_factory=list)
     total: int = Field(default=0)
     page: int = Field(default=1)
+    next_cursor: str | None = Field(default=None)
 
 
 class TeamInvolvementResponse(BaseModel):
@@ -9,7 +9,7 @@ import json
 import logging
 import os
 import sqlite3
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
@@ -19,9 +19,10 @@ from pydantic import BaseModel
 
 from api.response_models import DetailResponse, MutationResponse
 from lib import db as db_module
-from lib import paths, safe_sql
+from lib import db_executor, paths, safe_sql
 from lib.analyzers import AnalyzerOrchestrator
 from lib.autonomous_loop import AutonomousLoop
+from lib.cache import get_warmer
 from lib.calibration import CalibrationEngine
 from lib.change_bundles import (
     create_bundle,
@@ -34,6 +35,8 @@ from lib.change_bundles import (
     rollback_bundle,
 )
 from lib.collectors import CollectorOrchestrator
+from lib.db import open_connection
+from lib.db_executor import NO_TIMEOUT, QueryTimeout, offload
 from lib.governance import DomainMode, get_governance
 from lib.observability.middleware import CorrelationIdMiddleware, RequestMetricsMiddleware
 from lib.security.headers import SecurityHeadersMiddleware
@@ -118,12 +121,12 @@ UI_DIR = paths.app_home() / "time-os-ui" / "dist"
 # These implement CLIENT-UI-SPEC-v2.9.md using lib/ui_spec_v21 modules
 from api.action_router import router as action_router  # noqa: E402
 from api.chat_webhook_router import router as chat_webhook_router  # noqa: E402
-from api.export_router import export_router  # noqa: E402
+from api.export_router import export_jobs, export_router  # noqa: E402
 from api.governance_router import governance_router  # noqa: E402, I001
 from api.intelligence_router import intelligence_router  # noqa: E402, I001
 from api.paginated_router import paginated_router  # noqa: E402
 from api.spec_router import spec_router  # noqa: E402
-from api.sse_router import sse_router  # noqa: E402
+from api.sse_router import get_event_tailer, sse_router  # noqa: E402
 
 # Router-level auth dependency = defense-in-depth on top of AuthMiddleware, so a
 # mounted route stays gated even if the global middleware is ever removed (WS2).
@@ -176,7 +179,7 @@ async def run_detectors_on_startup():
     """Run detectors to populate inbox_items table on server start."""
     try:
         db_path = db_module.get_db_path()
-        conn = sqlite3.connect(str(db_path))
+        conn = open_connection(str(db_path))
         conn.row_factory = sqlite3.Row
         detector = DetectorRunner(conn)
         result = detector.run_all()
@@ -189,9 +192,74 @@ async def run_detectors_on_startup():
         logger.info(f"[WARN] Detector startup failed: {e}")
 
 
+# ==== Cache Warmer ====
+# Recompute hot intelligence cache entries after their tags are published.
+@app.on_event("startup")
+async def start_cache_warmer():
+    """Start the background cache warmer."""
+    get_warmer().start()
+
+
+@app.on_event("shutdown")
+async def stop_cache_warmer():
+    """Stop the background cache warmer."""
+    get_warmer().stop()
+
+
+# ==== Event Stream ====
+# Tail the cross-process event log and fan new events out to SSE clients.
+@app.on_event("startup")
+async def start_event_tailer():
+    """Start the event log tailer."""
+    try:
+        await get_event_tailer().start()
+    except sqlite3.Error as e:
+        logger.warning(f"Event log tailer not started: {e}")
+
+
+@app.on_event("shutdown")
+async def stop_event_tailer():
+    """Stop the event log tailer."""
+    await get_event_tailer().stop()
+
+
+# ==== Database Worker Pool ====
+@app.on_event("shutdown")
+async def stop_db_executor():
+    """Stop the database worker pool used by offloaded handlers."""
+    db_executor.shutdown(wait=False)
+
+
+@app.exception_handler(QueryTimeout)
+async def query_timeout_handler(request: Request, exc: QueryTimeout):
+    """A database call ran past MOH_DB_TIMEOUT."""
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+
+# ==== Export Jobs ====
+@app.on_event("startup")
+async def resume_export_jobs():
+    """Resume export jobs interrupted by a restart."""
+    try:
+        export_jobs.resume_incomplete()
+    except OSError as e:
+        logger.warning(f"Export job resume failed: {e}")
+
+
+# ==== Priority Queue ====
+# Populate the stored queue off the request path; reads only catch up a bounded batch.
+@app.on_event("startup")
+async def start_priority_queue_sync():
+    """Bring the stored priority queue up to date in the background."""
+    from lib.analyzers import priority_queue
+
+    priority_queue.start_background_sync(analyzers.priority_analyzer)
+
+
 # Root endpoint
 @app.get("/")
-async def root(request: Request):
+@offload
+def root(request: Request):
     """Serve the dashboard UI."""
     index_path = UI_DIR / "index.html"
     if index_path.exists():
@@ -231,14 +299,22 @@ class ModeChange(BaseModel):
 # ==== Overview Endpoint ====
 
 
+def _stored_priorities(limit: int) -> dict:
+    """Highest-scoring items of the stored priority queue, caught up first."""
+    from lib.analyzers import priority_queue
+
+    if hasattr(analyzers, "priority_analyzer"):
+        priority_queue.catch_up(analyzers.priority_analyzer)
+    page = priority_queue.search_queue(store, limit=limit)
+    return {"items": page["items"], "total": page["total"]}
+
+
 @app.get("/api/overview", response_model=DetailResponse)
-async def get_overview():
+@offload
+def get_overview():
     """Get dashboard overview with priorities, calendar, decisions, anomalies."""
-    # Get priority queue
-    priority_queue = (
-        analyzers.priority_analyzer.analyze() if hasattr(analyzers, "priority_analyzer") else []
-    )
-    top_priorities = sorted(priority_queue, key=lambda x: x.get("score", 0), reverse=True)[:5]
+    # Top of the stored priority queue (see /api/priorities/advanced)
+    priorities = _stored_priorities(limit=5)
 
     # Get today's events
     from datetime import datetime
@@ -259,7 +335,7 @@ async def get_overview():
     )
 
     return {
-        "priorities": {"items": top_priorities, "total": len(priority_queue)},
+        "priorities": priorities,
         "calendar": {"events": [dict(e) for e in events], "event_count": len(events)},
         "decisions": {
             "pending": [dict(d) for d in pending_decisions],
@@ -280,7 +356,8 @@ async def get_overview():
 
 
 @app.get("/api/time/blocks", response_model=DetailResponse)
-async def get_time_blocks(date: str | None = None, lane: str | None = None):
+@offload
+def get_time_blocks(date: str | None = None, lane: str | None = None):
     """Get time blocks for a given date."""
     from datetime import date as dt
 
@@ -323,7 +400,8 @@ async def get_time_blocks(date: str | None = None, lane: str | None = None):
 
 
 @app.get("/api/time/summary", response_model=DetailResponse)
-async def get_time_summary(date: str | None = None):
+@offload
+def get_time_summary(date: str | None = None):
     """Get time summary for a date."""
     from datetime import date as dt
 
@@ -346,7 +424,8 @@ async def get_time_summary(date: str | None = None):
 
 
 @app.post("/api/time/schedule", response_model=MutationResponse)
-async def schedule_task(task_id: str, block_id: str | None = None, date: str | None = None):
+@offload
+def schedule_task(task_id: str, block_id: str | None = None, date: str | None = None):
     """Schedule a task into a time block."""
     from datetime import date as dt
 
@@ -366,7 +445,8 @@ async def schedule_task(task_id: str, block_id: str | None = None, date: str | N
 
 
 @app.post("/api/time/unschedule", response_model=MutationResponse)
-async def unschedule_task(task_id: str):
+@offload
+def unschedule_task(task_id: str):
     """Unschedule a task from its time block."""
     from lib.time_truth import BlockManager
 
@@ -380,7 +460,8 @@ async def unschedule_task(task_id: str):
 
 
 @app.get("/api/commitments", response_model=DetailResponse)
-async def get_commitments(status: str | None = None, limit: int = 50):
+@offload
+def get_commitments(status: str | None = None, limit: int = 50):
     """Get all commitments."""
     from lib.commitment_truth import CommitmentManager
 
@@ -409,7 +490,8 @@ async def get_commitments(status: str | None = None, limit: int = 50):
 
 
 @app.get("/api/commitments/untracked", response_model=DetailResponse)
-async def get_untracked_commitments(limit: int = 50):
+@offload
+def get_untracked_commitments(limit: int = 50):
     """Get commitments that aren't linked to tasks."""
     from lib.commitment_truth import CommitmentManager
 
@@ -433,7 +515,8 @@ async def get_untracked_commitments(limit: int = 50):
 
 
 @app.get("/api/commitments/due", response_model=DetailResponse)
-async def get_commitments_due(date: str | None = None):
+@offload
+def get_commitments_due(date: str | None = None):
     """Get commitments due by a date."""
     from datetime import date as dt
 
@@ -463,7 +546,8 @@ async def get_commitments_due(date: str | None = None):
 
 
 @app.get("/api/commitments/summary", response_model=DetailResponse)
-async def get_commitments_summary():
+@offload
+def get_commitments_summary():
     """Get commitments summary statistics."""
     from lib.commitment_truth import CommitmentManager
 
@@ -472,7 +556,8 @@ async def get_commitments_summary():
 
 
 @app.post("/api/commitments/{commitment_id}/link", response_model=MutationResponse)
-async def link_commitment(commitment_id: str, task_id: str):
+@offload
+def link_commitment(commitment_id: str, task_id: str):
     """Link a commitment to a task."""
     from lib.commitment_truth import CommitmentManager
 
@@ -483,7 +568,8 @@ async def link_commitment(commitment_id: str, task_id: str):
 
 
 @app.post("/api/commitments/{commitment_id}/done", response_model=MutationResponse)
-async def mark_commitment_done(commitment_id: str):
+@offload
+def mark_commitment_done(commitment_id: str):
     """Mark a commitment as done."""
     from lib.commitment_truth import CommitmentManager
 
@@ -497,7 +583,8 @@ async def mark_commitment_done(commitment_id: str):
 
 
 @app.get("/api/capacity/lanes", response_model=DetailResponse)
-async def get_capacity_lanes_endpoint():
+@offload
+def get_capacity_lanes_endpoint():
     """Get capacity lanes configuration."""
     try:
         from lib.capacity_truth import CapacityCalculator
@@ -511,7 +598,8 @@ async def get_capacity_lanes_endpoint():
 
 
 @app.get("/api/capacity/utilization", response_model=DetailResponse)
-async def get_capacity_utilization(lane_id: str | None = None, target_date: str | None = None):
+@offload
+def get_capacity_utilization(lane_id: str | None = None, target_date: str | None = None):
     """Get capacity utilization metrics."""
     try:
         from lib.capacity_truth import CapacityCalculator
@@ -527,13 +615,18 @@ async def get_capacity_utilization(lane_id: str | None = None, target_date: str
 
 
 @app.get("/api/capacity/forecast", response_model=DetailResponse)
-async def get_capacity_forecast(lane_id: str = "default", days: int = 7):
+@offload
+def get_capacity_forecast(lane_id: str = "default", days: int = 7):
     """Get capacity forecast for upcoming days."""
     try:
         from lib.capacity_truth import CapacityCalculator
 
         calc = CapacityCalculator(store)
-        forecasts = calc.forecast_capacity(lane_id, days_ahead=days)
+        start = date.today()
+        end = start + timedelta(days=days - 1)
+        forecasts = calc.get_utilization_matrix(
+            start.isoformat(), end.isoformat(), lane_ids=[lane_id]
+        )[lane_id]
         # Convert dataclass to dict and add _hours fields for frontend ForecastChart
         forecast_dicts = []
         for f in forecasts:
@@ -553,7 +646,8 @@ async def get_capacity_forecast(lane_id: str = "default", days: int = 7):
 
 
 @app.get("/api/capacity/debt", response_model=DetailResponse)
-async def get_capacity_debt(lane: str | None = None):
+@offload
+def get_capacity_debt(lane: str | None = None):
     """Get capacity debt (overcommitments)."""
     try:
         from lib.capacity_truth import DebtTracker
@@ -572,7 +666,8 @@ async def get_capacity_debt(lane: str | None = None):
 
 
 @app.post("/api/capacity/debt/accrue", status_code=501)
-async def accrue_debt(hours: float | None = None):
+@offload
+def accrue_debt(hours: float | None = None):
     """Record accrued capacity debt. Not yet implemented."""
     return JSONResponse(
         status_code=501,
@@ -581,7 +676,8 @@ async def accrue_debt(hours: float | None = None):
 
 
 @app.post("/api/capacity/debt/{debt_id}/resolve", status_code=501)
-async def resolve_debt(debt_id: str):
+@offload
+def resolve_debt(debt_id: str):
     """Resolve a capacity debt item. Not yet implemented."""
     return JSONResponse(
         status_code=501,
@@ -593,7 +689,8 @@ async def resolve_debt(debt_id: str):
 
 
 @app.get("/api/clients/health", response_model=DetailResponse)
-async def get_clients_health(limit: int = 20):
+@offload
+def get_clients_health(limit: int = 20):
     """Get client health overview."""
     from lib.client_truth import HealthCalculator
 
@@ -621,7 +718,8 @@ async def get_clients_health(limit: int = 20):
 
 
 @app.get("/api/clients/at-risk", response_model=DetailResponse)
-async def get_at_risk_clients(threshold: int = 50):
+@offload
+def get_at_risk_clients(threshold: int = 50):
     """Get clients that are at risk (health score below threshold)."""
     from lib.client_truth import HealthCalculator
 
@@ -645,7 +743,8 @@ async def get_at_risk_clients(threshold: int = 50):
 
 
 @app.get("/api/clients/{client_id}/health", response_model=DetailResponse)
-async def get_client_health(client_id: str):
+@offload
+def get_client_health(client_id: str):
     """Get detailed health for a specific client."""
     from lib.client_truth import HealthCalculator
 
@@ -654,7 +753,8 @@ async def get_client_health(client_id: str):
 
 
 @app.get("/api/clients/{client_id}/projects", response_model=DetailResponse)
-async def get_client_projects(client_id: str):
+@offload
+def get_client_projects(client_id: str):
     """Get projects for a client."""
     from lib.client_truth import ClientLinker
 
@@ -665,7 +765,8 @@ async def get_client_projects(client_id: str):
 
 
 @app.post("/api/clients/link", response_model=MutationResponse)
-async def link_project_to_client(project_id: str, client_id: str):
+@offload
+def link_project_to_client(project_id: str, client_id: str):
     """Link a project to a client."""
     from lib.client_truth import ClientLinker
 
@@ -676,7 +777,8 @@ async def link_project_to_client(project_id: str, client_id: str):
 
 
 @app.get("/api/clients/linking-stats", response_model=DetailResponse)
-async def get_linking_stats():
+@offload
+def get_linking_stats():
     """Get client linking statistics."""
     from lib.client_truth import ClientLinker
 
@@ -688,7 +790,8 @@ async def get_linking_stats():
 
 
 @app.get("/api/tasks", response_model=DetailResponse)
-async def get_tasks(
+@offload
+def get_tasks(
     status: str | None = None,
     project: str | None = None,
     assignee: str | None = None,
@@ -746,7 +849,8 @@ class TaskUpdate(BaseModel):
 
 
 @app.get("/api/tasks/{task_id}", response_model=DetailResponse)
-async def get_task(task_id: str):
+@offload
+def get_task(task_id: str):
     """Get a specific task."""
     task = store.get("tasks", task_id)
     if not task:
@@ -755,7 +859,8 @@ async def get_task(task_id: str):
 
 
 @app.post("/api/tasks", response_model=MutationResponse)
-async def create_task(task: TaskCreate):
+@offload
+def create_task(task: TaskCreate):
     """Create a new task."""
     import uuid
 
@@ -792,7 +897,8 @@ async def create_task(task: TaskCreate):
 
 
 @app.put("/api/tasks/{task_id}", response_model=MutationResponse)
-async def update_task(task_id: str, task: TaskUpdate):
+@offload
+def update_task(task_id: str, task: TaskUpdate):
     """Update a task with comprehensive validation and tracking."""
     existing = store.get("tasks", task_id)
     if not existing:
@@ -925,7 +1031,8 @@ class NoteAdd(BaseModel):
 
 
 @app.post("/api/tasks/{task_id}/notes", response_model=MutationResponse)
-async def add_task_note(task_id: str, body: NoteAdd):
+@offload
+def add_task_note(task_id: str, body: NoteAdd):
     """Add a note to a task."""
     task = store.get("tasks", task_id)
     if not task:
@@ -949,7 +1056,8 @@ async def add_task_note(task_id: str, body: NoteAdd):
 
 
 @app.delete("/api/tasks/{task_id}", response_model=MutationResponse)
-async def delete_task(task_id: str):
+@offload
+def delete_task(task_id: str):
     """Delete (archive) a task."""
     task = store.get("tasks", task_id)
     if not task:
@@ -989,7 +1097,8 @@ class EscalateRequest(BaseModel):
 
 
 @app.post("/api/tasks/{task_id}/delegate", response_model=MutationResponse)
-async def delegate_task(task_id: str, body: DelegateRequest):
+@offload
+def delegate_task(task_id: str, body: DelegateRequest):
     """Delegate a task to someone with validation and workload awareness."""
     task = store.get("tasks", task_id)
     if not task:
@@ -1162,7 +1271,8 @@ async def delegate_task(task_id: str, body: DelegateRequest):
 
 
 @app.post("/api/tasks/{task_id}/escalate", response_model=MutationResponse)
-async def escalate_task(task_id: str, body: EscalateRequest):
+@offload
+def escalate_task(task_id: str, body: EscalateRequest):
     """Escalate a task with priority boost and notification chain."""
     task = store.get("tasks", task_id)
     if not task:
@@ -1355,7 +1465,8 @@ async def escalate_task(task_id: str, body: EscalateRequest):
 
 
 @app.post("/api/tasks/{task_id}/recall", response_model=MutationResponse)
-async def recall_task(task_id: str):
+@offload
+def recall_task(task_id: str):
     """Recall a delegated task."""
     task = store.get("tasks", task_id)
     if not task:
@@ -1392,7 +1503,8 @@ async def recall_task(task_id: str):
 
 
 @app.get("/api/delegations", response_model=DetailResponse)
-async def get_delegations():
+@offload
+def get_delegations():
     """Get delegated tasks split by delegation direction."""
     delegated_by_me = store.query("""
         SELECT * FROM tasks
@@ -1417,7 +1529,8 @@ async def get_delegations():
 
 
 @app.get("/api/data-quality", response_model=DetailResponse)
-async def get_data_quality():
+@offload
+def get_data_quality():
     """Get data quality metrics and cleanup suggestions."""
     datetime.now().strftime("%Y-%m-%d")
 
@@ -1590,7 +1703,8 @@ class CleanupRequest(BaseModel):
 
 
 @app.post("/api/data-quality/cleanup/ancient", response_model=MutationResponse)
-async def cleanup_ancient_tasks(confirm: bool = False):
+@offload
+def cleanup_ancient_tasks(confirm: bool = False):
     """Archive tasks that are >30 days overdue."""
     tasks = store.query("""
         SELECT id, title FROM tasks
@@ -1627,7 +1741,8 @@ async def cleanup_ancient_tasks(confirm: bool = False):
 
 
 @app.post("/api/data-quality/cleanup/stale", response_model=MutationResponse)
-async def cleanup_stale_tasks(confirm: bool = False):
+@offload
+def cleanup_stale_tasks(confirm: bool = False):
     """Archive tasks that are 14-30 days overdue."""
     tasks = store.query("""
         SELECT id, title FROM tasks
@@ -1667,7 +1782,8 @@ async def cleanup_stale_tasks(confirm: bool = False):
 
 
 @app.post("/api/data-quality/recalculate-priorities", response_model=MutationResponse)
-async def recalculate_priorities():
+@offload
+def recalculate_priorities():
     """Recalculate priorities for all pending tasks."""
     tasks = store.query("""
         SELECT * FROM tasks
@@ -1749,7 +1865,8 @@ def _calculate_realistic_priority(task: dict, today) -> int:
 
 
 @app.post("/api/data-quality/cleanup/legacy-signals", response_model=MutationResponse)
-async def cleanup_legacy_signals(confirm: bool = False):
+@offload
+def cleanup_legacy_signals(confirm: bool = False):
     """
     Clean up legacy signals and proposals by:
     1. Expiring signals for tasks overdue > LEGACY_OVERDUE_THRESHOLD_DAYS
@@ -1757,7 +1874,7 @@ async def cleanup_legacy_signals(confirm: bool = False):
 
     This fixes the issue of 1000+ day old overdue tasks polluting the dashboard.
     """
-    conn = sqlite3.connect(store.db_path)
+    conn = open_connection(store.db_path)
     cursor = conn.cursor()
 
     try:
@@ -1856,7 +1973,8 @@ async def cleanup_legacy_signals(confirm: bool = False):
 
 
 @app.get("/api/data-quality/preview/{cleanup_type}", response_model=DetailResponse)
-async def preview_cleanup(cleanup_type: str):
+@offload
+def preview_cleanup(cleanup_type: str):
     """Preview what would be affected by a cleanup operation."""
     if cleanup_type == "ancient":
         tasks = store.query("""
@@ -1891,7 +2009,8 @@ async def preview_cleanup(cleanup_type: str):
 
 
 @app.get("/api/team", response_model=DetailResponse)
-async def get_team(type_filter: str | None = None):
+@offload
+def get_team(type_filter: str | None = None):
     """Get team members with workload metrics."""
     conditions = ["1=1"]
     params: list = []
@@ -1947,9 +2066,8 @@ async def get_team(type_filter: str | None = None):
 
 
 @app.get("/api/calendar", response_model=DetailResponse)
-async def api_calendar(
-    start_date: str | None = None, end_date: str | None = None, view: str = "week"
-):
+@offload
+def api_calendar(start_date: str | None = None, end_date: str | None = None, view: str = "week"):
     """Get calendar events."""
     from datetime import date
 
@@ -1979,7 +2097,8 @@ async def api_calendar(
 
 
 @app.get("/api/inbox", response_model=DetailResponse)
-async def api_inbox(limit: int = 50):
+@offload
+def api_inbox(limit: int = 50):
     """Get inbox items (unprocessed communications, new tasks, etc.)."""
     items = store.query(
         """
@@ -1995,7 +2114,8 @@ async def api_inbox(limit: int = 50):
 
 
 @app.get("/api/decisions", response_model=DetailResponse)
-async def api_decisions(limit: int = 20):
+@offload
+def api_decisions(limit: int = 20):
     """Get pending decisions."""
     decisions = store.query(
         """
@@ -2011,7 +2131,8 @@ async def api_decisions(limit: int = 20):
 
 
 @app.post("/api/priorities/{item_id}/complete", response_model=MutationResponse)
-async def api_priority_complete(item_id: str):
+@offload
+def api_priority_complete(item_id: str):
     """Complete a priority item (task)."""
     task = store.get("tasks", item_id)
     if not task:
@@ -2055,7 +2176,8 @@ async def api_priority_complete(item_id: str):
 
 
 @app.post("/api/priorities/{item_id}/snooze", response_model=MutationResponse)
-async def api_priority_snooze(item_id: str, days: int = 1):
+@offload
+def api_priority_snooze(item_id: str, days: int = 1):
     """Snooze a priority item."""
 
     task = store.get("tasks", item_id)
@@ -2090,7 +2212,8 @@ async def api_priority_snooze(item_id: str, days: int = 1):
 
 
 @app.post("/api/priorities/{item_id}/delegate", response_model=MutationResponse)
-async def api_priority_delegate(item_id: str, to: str):
+@offload
+def api_priority_delegate(item_id: str, to: str):
     """Delegate a priority item."""
     task = store.query("SELECT * FROM tasks WHERE id = ?", [item_id])
     if not task:
@@ -2149,7 +2272,8 @@ async def api_priority_delegate(item_id: str, to: str):
 
 
 @app.post("/api/decisions/{decision_id}", response_model=MutationResponse)
-async def api_decision(decision_id: str, action: ApprovalAction):
+@offload
+def api_decision(decision_id: str, action: ApprovalAction):
     """Process a decision (approve/reject) with side-effect execution."""
     dec = store.query("SELECT * FROM decisions WHERE id = ?", [decision_id])
     if not dec:
@@ -2358,21 +2482,24 @@ async def api_decision(decision_id: str, action: ApprovalAction):
 
 
 @app.get("/api/bundles", response_model=DetailResponse)
-async def api_bundles(status: str | None = None, domain: str | None = None, limit: int = 50):
+@offload
+def api_bundles(status: str | None = None, domain: str | None = None, limit: int = 50):
     """Get change bundles."""
     bundles = list_bundles(status=status or "", domain=domain or "", limit=limit)
     return {"bundles": bundles, "total": len(bundles)}
 
 
 @app.get("/api/bundles/rollbackable", response_model=DetailResponse)
-async def api_bundles_rollbackable():
+@offload
+def api_bundles_rollbackable():
     """Get bundles that can be rolled back."""
     bundles = list_rollbackable_bundles()
     return {"bundles": bundles, "total": len(bundles)}
 
 
 @app.get("/api/bundles/summary", response_model=DetailResponse)
-async def get_bundles_summary():
+@offload
+def get_bundles_summary():
     """Get summary of bundle activity."""
     all_bundles = list_bundles(limit=500)
 
@@ -2402,7 +2529,8 @@ async def get_bundles_summary():
 
 
 @app.post("/api/bundles/rollback-last", response_model=MutationResponse)
-async def rollback_last_bundle(domain: str | None = None):
+@offload
+def rollback_last_bundle(domain: str | None = None):
     """Rollback the most recent bundle."""
     rollbackable = list_rollbackable_bundles()
 
@@ -2429,7 +2557,8 @@ async def rollback_last_bundle(domain: str | None = None):
 
 
 @app.get("/api/bundles/{bundle_id}", response_model=DetailResponse)
-async def api_bundle_get(bundle_id: str):
+@offload
+def api_bundle_get(bundle_id: str):
     """Get a specific bundle."""
     bundle = get_bundle(bundle_id)
     if not bundle:
@@ -2438,7 +2567,8 @@ async def api_bundle_get(bundle_id: str):
 
 
 @app.post("/api/bundles/{bundle_id}/rollback", response_model=MutationResponse)
-async def api_bundle_rollback(bundle_id: str):
+@offload
+def api_bundle_rollback(bundle_id: str):
     """Rollback a specific bundle."""
     bundle = get_bundle(bundle_id)
     if not bundle:
@@ -2464,13 +2594,15 @@ calibration_engine = CalibrationEngine(store=store)
 
 
 @app.get("/api/calibration", response_model=DetailResponse)
-async def api_calibration_last():
+@offload
+def api_calibration_last():
     """Get last calibration results."""
     return calibration_engine.get_last_calibration()
 
 
 @app.post("/api/calibration/run", response_model=DetailResponse)
-async def api_calibration_run():
+@offload
+def api_calibration_run():
     """Run calibration."""
     return calibration_engine.run()
 
@@ -2485,7 +2617,8 @@ class FeedbackRequest(BaseModel):
 
 
 @app.post("/api/feedback", response_model=MutationResponse)
-async def api_feedback(feedback: FeedbackRequest):
+@offload
+def api_feedback(feedback: FeedbackRequest):
     """Submit feedback on a recommendation or action."""
     import uuid
 
@@ -2510,19 +2643,15 @@ async def api_feedback(feedback: FeedbackRequest):
 
 
 @app.get("/api/priorities", response_model=DetailResponse)
-async def get_priorities(limit: int = 20, context: str | None = None):
-    """Get prioritized items."""
-    priority_queue = (
-        analyzers.priority_analyzer.analyze() if hasattr(analyzers, "priority_analyzer") else []
-    )
-
-    sorted_items = sorted(priority_queue, key=lambda x: x.get("score", 0), reverse=True)[:limit]
-
-    return {"items": sorted_items, "total": len(priority_queue)}
+@offload
+def get_priorities(limit: int = 20, context: str | None = None):
+    """Get prioritized items, highest score first, from the stored priority queue."""
+    return _stored_priorities(limit=limit)
 
 
 @app.get("/api/priorities/filtered", response_model=DetailResponse)
-async def get_priorities_filtered(
+@offload
+def get_priorities_filtered(
     due: str | None = None,
     assignee: str | None = None,
     source: str | None = None,
@@ -2623,7 +2752,8 @@ class BulkAction(BaseModel):
 
 
 @app.post("/api/priorities/bulk", response_model=MutationResponse)
-async def bulk_action(body: BulkAction):
+@offload
+def bulk_action(body: BulkAction):
     """Perform bulk actions on priority items."""
     from lib.change_bundles import create_task_bundle, mark_applied
 
@@ -2735,14 +2865,16 @@ class SavedFilter(BaseModel):
 
 
 @app.get("/api/filters", response_model=DetailResponse)
-async def get_saved_filters():
+@offload
+def get_saved_filters():
     """Get saved filters."""
     filters = store.query("SELECT * FROM saved_filters ORDER BY name")
     return {"filters": [dict(f) for f in filters]}
 
 
 @app.get("/api/priorities/advanced", response_model=DetailResponse)
-async def advanced_filter(
+@offload
+def advanced_filter(
     q: str | None = None,
     due: str | None = None,
     assignee: str | None = None,
@@ -2755,118 +2887,42 @@ async def advanced_filter(
     order: str = "desc",
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
 ):
-    """Advanced priority filtering with more options."""
-    from lib.analyzers.priority import PriorityAnalyzer
-
-    analyzer = PriorityAnalyzer(store=store)
-    all_items = analyzer.analyze()
-
-    filtered = all_items
-
-    # Text search
-    if q:
-        q_lower = q.lower()
-        filtered = [i for i in filtered if q_lower in (i.get("title") or "").lower()]
-
-    # Due date filter
-    if due:
-        today = datetime.now().date()
-
-        if due == "today":
-            today_str = today.isoformat()
-            filtered = [i for i in filtered if i.get("due") and i["due"][:10] == today_str]
-        elif due == "tomorrow":
-            from datetime import timedelta
-
-            tomorrow_str = (today + timedelta(days=1)).isoformat()
-            filtered = [i for i in filtered if i.get("due") and i["due"][:10] == tomorrow_str]
-        elif due == "week":
-            from datetime import timedelta
-
-            week_end = (today + timedelta(days=7)).isoformat()
-            filtered = [i for i in filtered if i.get("due") and i["due"][:10] <= week_end]
-        elif due == "overdue":
-            today_str = today.isoformat()
-            filtered = [i for i in filtered if i.get("due") and i["due"][:10] < today_str]
-        elif due == "no_date":
-            filtered = [i for i in filtered if not i.get("due")]
-        elif due.startswith("range:"):
-            parts = due.split(":")
-            if len(parts) == 3:
-                start_date, end_date = parts[1], parts[2]
-                filtered = [
-                    i for i in filtered if i.get("due") and start_date <= i["due"][:10] <= end_date
-                ]
-
-    # Assignee filter
-    if assignee:
-        if assignee.lower() == "unassigned":
-            filtered = [i for i in filtered if not i.get("assignee")]
-        elif assignee.lower() == "me":
-            filtered = [i for i in filtered if i.get("assignee") and "me" in i["assignee"].lower()]
-        else:
-            filtered = [
-                i
-                for i in filtered
-                if i.get("assignee") and assignee.lower() in i["assignee"].lower()
-            ]
-
-    # Project filter
-    if project:
-        filtered = [
-            i for i in filtered if i.get("project") and project.lower() in i["project"].lower()
-        ]
-
-    # Status filter
-    if status:
-        filtered = [i for i in filtered if i.get("status") == status]
-
-    # Score filters
-    if min_score is not None:
-        filtered = [i for i in filtered if i.get("score", 0) >= min_score]
-    if max_score is not None:
-        filtered = [i for i in filtered if i.get("score", 0) <= max_score]
-
-    # Tags filter
-    if tags:
-        tag_list = [t.strip().lower() for t in tags.split(",")]
-
-        def has_tags(item):
-            item_tags = item.get("tags") or ""
-            if isinstance(item_tags, str):
-                item_tags = [t.strip().lower() for t in item_tags.split(",")]
-            else:
-                item_tags = [t.lower() for t in item_tags]
-            return any(t in item_tags for t in tag_list)
-
-        filtered = [i for i in filtered if has_tags(i)]
-
-    # Sorting
-    sort_key = {
-        "score": lambda x: x.get("score", 0),
-        "due": lambda x: x.get("due") or "9999-99-99",
-        "title": lambda x: (x.get("title") or "").lower(),
-        "assignee": lambda x: (x.get("assignee") or "").lower(),
-    }.get(sort, lambda x: x.get("score", 0))
-
-    reverse = order.lower() != "asc"
-    filtered = sorted(filtered, key=sort_key, reverse=reverse)
+    """
+    Advanced priority filtering with more options.
 
-    total = len(filtered)
-    filtered = filtered[offset : offset + limit]
+    Reads the stored priority queue (refreshed by the daemon and at startup,
+    and caught up a bounded batch at a time after task/email writes). Pass a
+    page's next_cursor as cursor to fetch the following page.
+    """
+    from lib.analyzers import priority_queue
 
-    return {
-        "items": filtered,
-        "total": total,
-        "offset": offset,
-        "limit": limit,
-        "has_more": offset + limit < total,
-    }
+    try:
+        priority_queue.catch_up(analyzers.priority_analyzer)
+        return priority_queue.search_queue(
+            store,
+            q=q,
+            due=due,
+            assignee=assignee,
+            project=project,
+            status=status,
+            min_score=min_score,
+            max_score=max_score,
+            tags=tags,
+            sort=sort,
+            order=order,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 @app.post("/api/priorities/archive-stale", response_model=MutationResponse)
-async def archive_stale(days_threshold: int = 14):
+@offload
+def archive_stale(days_threshold: int = 14):
     """Archive stale priority items."""
 
     cutoff = (datetime.now() - timedelta(days=days_threshold)).isoformat()
@@ -2892,7 +2948,8 @@ async def archive_stale(days_threshold: int = 14):
 
 
 @app.get("/api/events", response_model=DetailResponse)
-async def get_events(hours: int = 24):
+@offload
+def get_events(hours: int = 24):
     """Get upcoming events."""
     try:
         start = datetime.now().isoformat()
@@ -2914,7 +2971,8 @@ async def get_events(hours: int = 24):
 
 
 @app.get("/api/day/{date}", response_model=DetailResponse)
-async def get_day_analysis(date: str | None = None):
+@offload
+def get_day_analysis(date: str | None = None):
     """Get analysis for a specific day."""
     from datetime import date as date_type
 
@@ -2926,7 +2984,8 @@ async def get_day_analysis(date: str | None = None):
 
 
 @app.get("/api/week", response_model=DetailResponse)
-async def get_week_analysis():
+@offload
+def get_week_analysis():
     """Get analysis for the current week."""
     try:
         from lib.time_truth import CalendarSync
@@ -2939,7 +2998,8 @@ async def get_week_analysis():
 
 
 @app.get("/api/emails", response_model=DetailResponse)
-async def get_emails(actionable_only: bool = False, unread_only: bool = False, limit: int = 30):
+@offload
+def get_emails(actionable_only: bool = False, unread_only: bool = False, limit: int = 30):
     """Get emails from communications."""
     conditions = ["type = 'email'"]
 
@@ -2960,7 +3020,8 @@ async def get_emails(actionable_only: bool = False, unread_only: bool = False, l
 
 
 @app.post("/api/emails/{email_id}/mark-actionable", response_model=MutationResponse)
-async def mark_email_actionable(email_id: str):
+@offload
+def mark_email_actionable(email_id: str):
     """Mark an email as actionable."""
     store.update(
         "communications",
@@ -2971,7 +3032,8 @@ async def mark_email_actionable(email_id: str):
 
 
 @app.get("/api/insights", response_model=DetailResponse)
-async def get_insights(category: str | None = None):
+@offload
+def get_insights(category: str | None = None):
     """Get insights."""
     conditions = ["(expires_at IS NULL OR expires_at > datetime('now'))"]
     params = []
@@ -2990,7 +3052,8 @@ async def get_insights(category: str | None = None):
 
 
 @app.get("/api/anomalies", response_model=DetailResponse)
-async def get_anomalies():
+@offload
+def get_anomalies():
     """Get anomalies."""
     anomalies = store.query("""
         SELECT * FROM insights
@@ -3003,7 +3066,8 @@ async def get_anomalies():
 
 
 @app.get("/api/notifications", response_model=DetailResponse)
-async def get_notifications(include_dismissed: bool = False, limit: int = 50):
+@offload
+def get_notifications(include_dismissed: bool = False, limit: int = 50):
     """Get notifications."""
     conditions = ["1=1"]
     if not include_dismissed:
@@ -3024,7 +3088,8 @@ async def get_notifications(include_dismissed: bool = False, limit: int = 50):
 
 
 @app.get("/api/notifications/stats", response_model=DetailResponse)
-async def get_notification_stats():
+@offload
+def get_notification_stats():
     """Get notification statistics."""
     try:
         total = store.count("notifications")
@@ -3036,7 +3101,8 @@ async def get_notification_stats():
 
 
 @app.post("/api/notifications/{notif_id}/dismiss", response_model=MutationResponse)
-async def dismiss_notification(notif_id: str):
+@offload
+def dismiss_notification(notif_id: str):
     """Dismiss a notification."""
     store.update(
         "notifications",
@@ -3047,7 +3113,8 @@ async def dismiss_notification(notif_id: str):
 
 
 @app.post("/api/notifications/dismiss-all", response_model=MutationResponse)
-async def dismiss_all_notifications():
+@offload
+def dismiss_all_notifications():
     """Dismiss all notifications."""
     now = datetime.now().isoformat()
     notifications = store.query(
@@ -3064,7 +3131,8 @@ async def dismiss_all_notifications():
 
 
 @app.get("/api/approvals", response_model=DetailResponse)
-async def get_approvals():
+@offload
+def get_approvals():
     """Get pending approvals."""
     approvals = store.query(
         "SELECT * FROM decisions WHERE approved IS NULL ORDER BY created_at DESC"
@@ -3073,7 +3141,8 @@ async def get_approvals():
 
 
 @app.post("/api/approvals/{decision_id}", response_model=DetailResponse)
-async def process_approval(decision_id: str, body: ApprovalAction):
+@offload
+def process_approval(decision_id: str, body: ApprovalAction):
     """Process an approval."""
     decision = store.get("decisions", decision_id)
     if not decision:
@@ -3097,7 +3166,8 @@ class ModifyApproval(BaseModel):
 
 
 @app.post("/api/approvals/{decision_id}/modify", response_model=MutationResponse)
-async def modify_approval(decision_id: str, body: ModifyApproval):
+@offload
+def modify_approval(decision_id: str, body: ModifyApproval):
     """Modify and approve a decision."""
     dec = store.get("decisions", decision_id)
     if not dec:
@@ -3121,7 +3191,8 @@ async def modify_approval(decision_id: str, body: ModifyApproval):
 
 
 @app.get("/api/governance", response_model=DetailResponse)
-async def get_governance_status():
+@offload
+def get_governance_status():
     """Get governance configuration and status."""
     return {
         "domains": governance.get_all_domains(),
@@ -3131,7 +3202,8 @@ async def get_governance_status():
 
 
 @app.put("/api/governance/{domain}", response_model=DetailResponse)
-async def set_governance_mode(domain: str, body: ModeChange):
+@offload
+def set_governance_mode(domain: str, body: ModeChange):
     """Set governance mode for a domain."""
     try:
         mode = DomainMode(body.mode)
@@ -3160,7 +3232,8 @@ class ThresholdUpdate(BaseModel):
 
 
 @app.put("/api/governance/{domain}/threshold", response_model=DetailResponse)
-async def set_governance_threshold(domain: str, body: ThresholdUpdate):
+@offload
+def set_governance_threshold(domain: str, body: ThresholdUpdate):
     """Set confidence threshold for a domain."""
     if not (0 <= body.threshold <= 1):
         raise HTTPException(400, "Threshold must be between 0 and 1")
@@ -3178,7 +3251,8 @@ async def set_governance_threshold(domain: str, body: ThresholdUpdate):
 
 
 @app.get("/api/governance/history", response_model=DetailResponse)
-async def get_governance_history(limit: int = 50):
+@offload
+def get_governance_history(limit: int = 50):
     """Get governance action history."""
     history = store.query(
         """
@@ -3193,14 +3267,16 @@ async def get_governance_history(limit: int = 50):
 
 
 @app.post("/api/governance/emergency-brake", response_model=MutationResponse)
-async def activate_emergency_brake(reason: str = "Manual activation"):
+@offload
+def activate_emergency_brake(reason: str = "Manual activation"):
     """Activate emergency brake."""
     governance.emergency_brake(reason)
     return {"success": True, "active": True, "reason": reason}
 
 
 @app.delete("/api/governance/emergency-brake", response_model=MutationResponse)
-async def release_emergency_brake():
+@offload
+def release_emergency_brake():
     """Release emergency brake."""
     governance.release_emergency_brake()
     return {"success": True, "active": False}
@@ -3210,32 +3286,37 @@ async def release_emergency_brake():
 
 
 @app.get("/api/sync/status", response_model=DetailResponse)
-async def get_sync_status():
+@offload
+def get_sync_status():
     """Get sync status for all collectors."""
     return collectors.get_status()
 
 
 @app.post("/api/sync", response_model=DetailResponse)
-async def force_sync(source: str | None = None):
+@offload(timeout=NO_TIMEOUT)
+def force_sync(source: str | None = None):
     """Force a sync operation."""
     return collectors.force_sync(source=source or "")
 
 
 @app.post("/api/analyze", response_model=DetailResponse)
-async def run_analysis():
+@offload(timeout=NO_TIMEOUT)
+def run_analysis():
     """Run analysis."""
     return analyzers.analyze()
 
 
 @app.post("/api/cycle", response_model=DetailResponse)
-async def run_cycle():
+@offload(timeout=NO_TIMEOUT)
+def run_cycle():
     """Run a full autonomous cycle."""
     loop = AutonomousLoop(store, collectors, analyzers, governance)
     return loop.run_cycle()
 
 
 @app.get("/api/status", response_model=DetailResponse)
-async def get_status():
+@offload
+def get_status():
     """Get system status."""
     return {
         "status": "ok",
@@ -3246,7 +3327,8 @@ async def get_status():
 
 
 @app.get("/api/health")
-async def health_check():
+@offload
+def health_check():
     """Health check endpoint with real subsystem checks."""
     from lib.observability.health import HealthChecker, HealthStatus
 
@@ -3258,13 +3340,15 @@ async def health_check():
 
 
 @app.get("/api/ready")
-async def readiness_probe():
+@offload
+def readiness_probe():
     """Lightweight readiness probe for load balancer health checks."""
     return JSONResponse(content={"status": "ready"}, status_code=200)
 
 
 @app.get("/api/debug/config")
-async def debug_config():
+@offload
+def debug_config():
     """
     Config debug endpoint -- returns non-secret configuration.
 
@@ -3299,7 +3383,8 @@ async def debug_config():
 
 
 @app.get("/api/metrics")
-async def metrics():
+@offload
+def metrics():
     """
     Prometheus-format metrics endpoint.
 
@@ -3343,18 +3428,22 @@ async def metrics():
 
 
 @app.get("/api/debug/db", response_model=DetailResponse)
-async def debug_db():
+@offload
+def debug_db():
     """
     Debug endpoint to inspect database configuration.
 
-    Returns resolved DB path, file info, schema version, and column lists
-    for key tables (tasks, communications).
+    Returns resolved DB path, file info, schema version, column lists
+    for key tables (tasks, communications), and StateStore connection pool stats.
     """
-    return db_module.get_db_info()
+    info = db_module.get_db_info()
+    info["connection_pool"] = store.pool_stats()
+    return info
 
 
 @app.get("/api/summary", response_model=DetailResponse)
-async def get_summary():
+@offload
+def get_summary():
     """Get a comprehensive summary."""
     from datetime import date
 
@@ -3408,7 +3497,8 @@ async def get_summary():
 
 
 @app.get("/api/search", response_model=DetailResponse)
-async def search_items(q: str, limit: int = 20):
+@offload
+def search_items(q: str, limit: int = 20):
     """Search across tasks, projects, and clients."""
     results = []
 
@@ -3449,7 +3539,8 @@ async def search_items(q: str, limit: int = 20):
 
 
 @app.get("/api/team/workload", response_model=DetailResponse)
-async def get_team_workload():
+@offload
+def get_team_workload():
     """Get team workload distribution."""
     workload = store.query("""
         SELECT
@@ -3482,7 +3573,8 @@ async def get_team_workload():
 
 
 @app.get("/api/priorities/grouped", response_model=DetailResponse)
-async def get_grouped_priorities(group_by: str = "project", limit: int = 10):
+@offload
+def get_grouped_priorities(group_by: str = "project", limit: int = 10):
     """Get priorities grouped by a field."""
     if group_by not in ("project", "assignee", "source"):
         group_by = "project"
@@ -3583,7 +3675,8 @@ def _compute_fallback_health(client: dict) -> int:
 
 
 @app.get("/api/clients", response_model=DetailResponse)
-async def get_clients(
+@offload
+def get_clients(
     tier: str | None = None,
     health: str | None = None,
     ar_status: str | None = None,
@@ -3692,7 +3785,8 @@ async def get_clients(
 
 
 @app.get("/api/clients/portfolio", response_model=DetailResponse)
-async def get_client_portfolio():
+@offload
+def get_client_portfolio():
     """Get client portfolio overview."""
     tier_stats = store.query("""
         SELECT
@@ -3750,7 +3844,8 @@ async def get_client_portfolio():
 
 
 @app.get("/api/clients/{client_id}", response_model=DetailResponse)
-async def get_client_detail(client_id: str):
+@offload
+def get_client_detail(client_id: str):
     """Get detailed client information."""
     client = store.get("clients", client_id)
     if not client:
@@ -3818,7 +3913,8 @@ class ClientUpdate(BaseModel):
 
 
 @app.put("/api/clients/{client_id}", response_model=MutationResponse)
-async def update_client(client_id: str, body: ClientUpdate):
+@offload
+def update_client(client_id: str, body: ClientUpdate):
     """Update client information."""
     client = store.get("clients", client_id)
     if not client:
@@ -3857,9 +3953,8 @@ async def update_client(client_id: str, body: ClientUpdate):
 
 
 @app.get("/api/projects", response_model=DetailResponse)
-async def get_projects(
-    client_id: str | None = None, include_archived: bool = False, limit: int = 50
-):
+@offload
+def get_projects(client_id: str | None = None, include_archived: bool = False, limit: int = 50):
     """Get projects with filters."""
     conditions = ["1=1"]
     params = []
@@ -3885,7 +3980,8 @@ async def get_projects(
 
 
 @app.get("/api/projects/candidates", response_model=DetailResponse)
-async def get_project_candidates():
+@offload
+def get_project_candidates():
     """Get projects that could be enrolled (candidates and proposed)."""
     candidates = store.query("""
         SELECT p.*, c.name as client_name
@@ -3904,7 +4000,8 @@ async def get_project_candidates():
 
 
 @app.get("/api/projects/enrolled", response_model=DetailResponse)
-async def get_enrolled_projects():
+@offload
+def get_enrolled_projects():
     """Get enrolled projects with client info and task counts."""
     projects = store.query("""
         SELECT p.*, c.name as client_name, c.tier as client_tier,
@@ -3931,7 +4028,8 @@ class EnrollmentAction(BaseModel):
 
 
 @app.post("/api/projects/{project_id}/enrollment", response_model=MutationResponse)
-async def process_enrollment(project_id: str, body: EnrollmentAction):
+@offload
+def process_enrollment(project_id: str, body: EnrollmentAction):
     """Process project enrollment action."""
     project = store.get("projects", project_id)
     if not project:
@@ -3976,7 +4074,8 @@ async def process_enrollment(project_id: str, body: EnrollmentAction):
 
 
 @app.get("/api/projects/detect", response_model=DetailResponse)
-async def detect_new_projects(force: bool = False):
+@offload
+def detect_new_projects(force: bool = False):
     """Detect new projects from tasks."""
     # Find unique project names in tasks that aren't in projects table
     new_projects = store.query("""
@@ -3992,7 +4091,8 @@ async def detect_new_projects(force: bool = False):
 
 
 @app.get("/api/projects/{project_id}", response_model=DetailResponse)
-async def get_project_detail(project_id: str):
+@offload
+def get_project_detail(project_id: str):
     """Get detailed project information."""
     project = store.get("projects", project_id)
     if not project:
@@ -4032,7 +4132,8 @@ async def get_project_detail(project_id: str):
 
 
 @app.post("/api/sync/xero", response_model=DetailResponse)
-async def sync_xero():
+@offload(timeout=NO_TIMEOUT)
+def sync_xero():
     """Sync with Xero."""
     return collectors.sync(source="xero")
 
@@ -4050,6 +4151,13 @@ async def bulk_link_tasks(request: Request):
     if not links:
         raise HTTPException(status_code=400, detail="No links provided")
 
+    results = await store.arun(_link_tasks, links)
+    succeeded = sum(1 for r in results if r.get("success"))
+    return {"total": len(results), "succeeded": succeeded, "results": results}
+
+
+def _link_tasks(links: list[dict]) -> list[dict]:
+    """Apply bulk task links; one result per entry."""
     results = []
     for entry in links:
         task_id = entry.get("task_id")
@@ -4079,12 +4187,12 @@ async def bulk_link_tasks(request: Request):
         except (sqlite3.Error, ValueError) as e:
             results.append({"task_id": task_id, "success": False, "error": str(e)})
 
-    succeeded = sum(1 for r in results if r.get("success"))
-    return {"total": len(results), "succeeded": succeeded, "results": results}
+    return results
 
 
 @app.post("/api/projects/propose", response_model=MutationResponse)
-async def propose_project(name: str, client_id: str | None = None, type: str = "retainer"):
+@offload
+def propose_project(name: str, client_id: str | None = None, type: str = "retainer"):
     """Propose a new project."""
     import uuid
 
@@ -4107,14 +4215,16 @@ async def propose_project(name: str, client_id: str | None = None, type: str = "
 
 
 @app.post("/api/emails/{email_id}/dismiss", response_model=MutationResponse)
-async def dismiss_email(email_id: str):
+@offload
+def dismiss_email(email_id: str):
     """Dismiss an email."""
     store.update("communications", email_id, {"processed": 1})
     return {"success": True, "id": email_id}
 
 
 @app.get("/api/digest/weekly", response_model=DetailResponse)
-async def get_weekly_digest():
+@offload
+def get_weekly_digest():
     """Get weekly digest."""
     from datetime import date
 
@@ -4179,7 +4289,8 @@ class BlockerRequest(BaseModel):
 
 
 @app.post("/api/tasks/{task_id}/block", response_model=MutationResponse)
-async def add_blocker(task_id: str, body: BlockerRequest):
+@offload
+def add_blocker(task_id: str, body: BlockerRequest):
     """Add a blocker to a task."""
     task = store.get("tasks", task_id)
     if not task:
@@ -4207,7 +4318,8 @@ async def add_blocker(task_id: str, body: BlockerRequest):
 
 
 @app.delete("/api/tasks/{task_id}/block/{blocker_id}", response_model=MutationResponse)
-async def remove_blocker(task_id: str, blocker_id: str):
+@offload
+def remove_blocker(task_id: str, blocker_id: str):
     """Remove a blocker from a task."""
     task = store.get("tasks", task_id)
     if not task:
@@ -4231,7 +4343,8 @@ async def remove_blocker(task_id: str, blocker_id: str):
 
 
 @app.get("/api/dependencies", response_model=DetailResponse)
-async def get_dependencies():
+@offload
+def get_dependencies():
     """Get task dependency graph."""
     blocked = store.query("""
         SELECT * FROM tasks
@@ -4274,7 +4387,8 @@ async def get_dependencies():
 
 
 @app.get("/api/control-room/proposals", response_model=DetailResponse)
-async def get_proposals(
+@offload
+def get_proposals(
     limit: int = 7,
     status: str = "open",
     days: int = 7,
@@ -4372,7 +4486,7 @@ async def get_proposals(
         # Fallback: Generate proposals from signals
         from datetime import datetime, timedelta
 
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
 
@@ -4523,7 +4637,8 @@ async def get_proposals(
 
 
 @app.get("/api/control-room/issues", response_model=DetailResponse)
-async def get_issues(
+@offload
+def get_issues(
     limit: int = 5, days: int = 7, client_id: str | None = None, member_id: str | None = None
 ):
     """Get issues from real data in moh_time_os.db.
@@ -4537,7 +4652,7 @@ async def get_issues(
     try:
         from datetime import datetime, timedelta
 
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
 
@@ -4691,10 +4806,11 @@ class ResolveIssueRequest(BaseModel):
 
 
 @app.patch("/api/control-room/issues/{issue_id}/resolve", response_model=MutationResponse)
-async def resolve_issue(issue_id: str, body: ResolveIssueRequest):
+@offload
+def resolve_issue(issue_id: str, body: ResolveIssueRequest):
     """Resolve an issue."""
     try:
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         cur = conn.cursor()
 
         # Check if issues table has the issue
@@ -4734,7 +4850,8 @@ class ChangeIssueStateRequest(BaseModel):
 
 
 @app.patch("/api/control-room/issues/{issue_id}/state", response_model=MutationResponse)
-async def change_issue_state(issue_id: str, body: ChangeIssueStateRequest):
+@offload
+def change_issue_state(issue_id: str, body: ChangeIssueStateRequest):
     """Change an issue's state."""
     valid_states = ["open", "monitoring", "awaiting", "blocked", "resolved", "closed"]
     if body.state not in valid_states:
@@ -4744,7 +4861,7 @@ async def change_issue_state(issue_id: str, body: ChangeIssueStateRequest):
         }
 
     try:
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         cur = conn.cursor()
 
         # Check if issues table has the issue
@@ -4783,10 +4900,11 @@ class AddIssueNoteRequest(BaseModel):
 
 
 @app.post("/api/control-room/issues/{issue_id}/notes", response_model=MutationResponse)
-async def add_issue_note(issue_id: str, body: AddIssueNoteRequest):
+@offload
+def add_issue_note(issue_id: str, body: AddIssueNoteRequest):
     """Add a note to an issue."""
     try:
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         cur = conn.cursor()
 
         # Create notes table if not exists
@@ -4830,10 +4948,11 @@ async def add_issue_note(issue_id: str, body: AddIssueNoteRequest):
 
 
 @app.get("/api/control-room/watchers", response_model=DetailResponse)
-async def get_watchers(hours: int = 24):
+@offload
+def get_watchers(hours: int = 24):
     """Get issue watchers/alerts that have been triggered recently."""
     try:
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
 
@@ -4895,10 +5014,11 @@ class DismissWatcherRequest(BaseModel):
 
 
 @app.post("/api/control-room/watchers/{watcher_id}/dismiss", response_model=MutationResponse)
-async def dismiss_watcher(watcher_id: str, body: DismissWatcherRequest):
+@offload
+def dismiss_watcher(watcher_id: str, body: DismissWatcherRequest):
     """Dismiss a watcher (remove from active list)."""
     try:
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         cur = conn.cursor()
 
         # Set triggered_at to NULL to hide from active watchers
@@ -4925,10 +5045,11 @@ class SnoozeWatcherRequest(BaseModel):
 
 
 @app.post("/api/control-room/watchers/{watcher_id}/snooze", response_model=MutationResponse)
-async def snooze_watcher(watcher_id: str, body: SnoozeWatcherRequest):
+@offload
+def snooze_watcher(watcher_id: str, body: SnoozeWatcherRequest):
     """Snooze a watcher for N hours."""
     try:
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         cur = conn.cursor()
 
         # Set snoozed_until to hide until that time
@@ -4956,10 +5077,11 @@ async def snooze_watcher(watcher_id: str, body: SnoozeWatcherRequest):
 
 
 @app.get("/api/control-room/fix-data", response_model=DetailResponse)
-async def get_fix_data():
+@offload
+def get_fix_data():
     """Get data quality issues for Fix tab."""
     try:
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
 
@@ -5004,7 +5126,8 @@ class TagProposalRequest(BaseModel):
 
 
 @app.post("/api/control-room/issues", response_model=MutationResponse)
-async def create_issue_from_proposal(body: TagProposalRequest):
+@offload
+def create_issue_from_proposal(body: TagProposalRequest):
     """Tag a proposal to create a monitored Issue."""
     try:
         svc = IssueService()
@@ -5017,7 +5140,8 @@ async def create_issue_from_proposal(body: TagProposalRequest):
 
 
 @app.get("/api/control-room/proposals/{proposal_id}", response_model=DetailResponse)
-async def get_proposal_detail(proposal_id: str):
+@offload
+def get_proposal_detail(proposal_id: str):
     """Get detailed view of a proposal with full signal information.
 
     Returns:
@@ -5155,7 +5279,8 @@ class SnoozeProposalRequest(BaseModel):
 
 
 @app.post("/api/control-room/proposals/{proposal_id}/snooze", response_model=MutationResponse)
-async def snooze_proposal(proposal_id: str, body: SnoozeProposalRequest):
+@offload
+def snooze_proposal(proposal_id: str, body: SnoozeProposalRequest):
     """Snooze a proposal for N days."""
     try:
         from datetime import timedelta
@@ -5177,7 +5302,8 @@ class DismissProposalRequest(BaseModel):
 
 
 @app.post("/api/control-room/proposals/{proposal_id}/dismiss", response_model=MutationResponse)
-async def dismiss_proposal(proposal_id: str, body: DismissProposalRequest):
+@offload
+def dismiss_proposal(proposal_id: str, body: DismissProposalRequest):
     """Dismiss a proposal."""
     try:
         svc = ProposalService()
@@ -5199,10 +5325,11 @@ class ResolveFixDataRequest(BaseModel):
 @app.post(
     "/api/control-room/fix-data/{item_type}/{item_id}/resolve", response_model=MutationResponse
 )
-async def resolve_fix_data_item(item_type: str, item_id: str, body: ResolveFixDataRequest):
+@offload
+def resolve_fix_data_item(item_type: str, item_id: str, body: ResolveFixDataRequest):
     """Resolve a fix-data item (identity conflict or ambiguous link)."""
     try:
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         now = datetime.now().isoformat()
@@ -5258,7 +5385,8 @@ async def resolve_fix_data_item(item_type: str, item_id: str, body: ResolveFixDa
 
 
 @app.get("/api/control-room/couplings", response_model=DetailResponse)
-async def get_couplings(anchor_type: str | None = None, anchor_id: str | None = None):
+@offload
+def get_couplings(anchor_type: str | None = None, anchor_id: str | None = None):
     """Get intersections/couplings."""
     try:
         svc = CouplingService()
@@ -5273,10 +5401,11 @@ async def get_couplings(anchor_type: str | None = None, anchor_id: str | None =
 
 
 @app.get("/api/control-room/clients", response_model=DetailResponse)
-async def get_control_room_clients():
+@offload
+def get_control_room_clients():
     """Get clients for control room."""
     try:
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         cur.execute("""
@@ -5299,10 +5428,11 @@ async def get_control_room_clients():
 
 
 @app.get("/api/control-room/team", response_model=DetailResponse)
-async def get_control_room_team():
+@offload
+def get_control_room_team():
     """Get team members for control room."""
     try:
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         cur.execute("""
@@ -5325,10 +5455,11 @@ async def get_control_room_team():
 
 
 @app.get("/api/control-room/evidence/{entity_type}/{entity_id}", response_model=DetailResponse)
-async def get_evidence(entity_type: str, entity_id: str):
+@offload
+def get_evidence(entity_type: str, entity_id: str):
     """Get evidence/proof for an entity."""
     try:
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
 
@@ -5359,13 +5490,14 @@ async def get_evidence(entity_type: str, entity_id: str):
 
 
 @app.get("/api/control-room/health", response_model=DetailResponse)
-async def control_room_health():
+@offload
+def control_room_health():
     """Health check endpoint for the Control Room API."""
     import datetime
 
     try:
         # Check database connectivity
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         cur = conn.cursor()
         cur.execute("SELECT COUNT(*) FROM signals")
         signal_count = cur.fetchone()[0]
@@ -5395,7 +5527,8 @@ async def control_room_health():
 
 
 @app.post("/api/admin/seed-identities", response_model=MutationResponse)
-async def seed_identities():
+@offload
+def seed_identities():
     """Seed identity profiles from clients and people tables."""
     try:
         from lib.v4.seed_identities import (
@@ -5416,7 +5549,8 @@ async def seed_identities():
 
 
 @app.get("/api/command/client-health", response_model=DetailResponse)
-async def command_client_health():
+@offload
+def command_client_health():
     """Client health overview for agency command center."""
     try:
         from lib.command_center import ClientHealthView
@@ -5429,7 +5563,8 @@ async def command_client_health():
 
 
 @app.get("/api/command/client-health/{client_id}", response_model=DetailResponse)
-async def command_client_detail(client_id: str):
+@offload
+def command_client_detail(client_id: str):
     """Single client deep-dive for command center."""
     try:
         from lib.command_center import ClientHealthView
@@ -5442,7 +5577,8 @@ async def command_client_detail(client_id: str):
 
 
 @app.get("/api/command/team-load", response_model=DetailResponse)
-async def command_team_load():
+@offload
+def command_team_load():
     """Team load overview for agency command center."""
     try:
         from lib.command_center import TeamLoadView
@@ -5455,7 +5591,8 @@ async def command_team_load():
 
 
 @app.get("/api/command/team-load/{member_name}", response_model=DetailResponse)
-async def command_member_detail(member_name: str):
+@offload
+def command_member_detail(member_name: str):
     """Single team member deep-dive for command center."""
     try:
         from lib.command_center import TeamLoadView
@@ -5468,7 +5605,8 @@ async def command_member_detail(member_name: str):
 
 
 @app.get("/api/command/decisions", response_model=DetailResponse)
-async def command_decisions():
+@offload
+def command_decisions():
     """Decision queue -- items waiting on Molham."""
     try:
         from lib.command_center import DecisionQueueView
@@ -5484,7 +5622,8 @@ async def command_decisions():
 
 
 @app.get("/api/command/week-strip", response_model=DetailResponse)
-async def command_week_strip():
+@offload
+def command_week_strip():
     """10-day week strip with available minutes, tasks due, and collision status."""
     try:
         from dataclasses import asdict
@@ -5532,11 +5671,12 @@ async def command_week_strip():
 
 
 @app.get("/api/command/findings", response_model=DetailResponse)
-async def command_findings():
+@offload
+def command_findings():
     """Active detection findings grouped by correlation."""
     try:
         store = get_store()
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         conn.row_factory = sqlite3.Row
         try:
             now = datetime.now().isoformat()
@@ -5668,11 +5808,12 @@ def _group_findings(findings: list[dict]) -> list[dict]:
 
 
 @app.get("/api/command/findings/{finding_id}", response_model=DetailResponse)
-async def command_finding_detail(finding_id: str, refresh: bool = False):
+@offload
+def command_finding_detail(finding_id: str, refresh: bool = False):
     """Single finding detail with optional micro-sync refresh."""
     try:
         store = get_store()
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         conn.row_factory = sqlite3.Row
         try:
             row = conn.execute(
@@ -5720,7 +5861,7 @@ def _micro_sync_for_finding(finding: dict, db_path: str) -> None:
     if detector == "bottleneck":
         # entity_id is the member name -- look up email
         try:
-            conn = sqlite3.connect(db_path)
+            conn = open_connection(db_path)
             try:
                 row = conn.execute(
                     "SELECT email FROM people WHERE name = ? AND type = 'internal'",
@@ -5737,7 +5878,7 @@ def _micro_sync_for_finding(finding: dict, db_path: str) -> None:
         parts = entity_id.rsplit("_", 1)
         person_name = parts[0] if len(parts) > 1 else entity_id
         try:
-            conn = sqlite3.connect(db_path)
+            conn = open_connection(db_path)
             try:
                 row = conn.execute(
                     "SELECT email FROM people WHERE name = ? AND type = 'internal'",
@@ -5778,11 +5919,12 @@ def _micro_sync_for_finding(finding: dict, db_path: str) -> None:
 
 
 @app.post("/api/command/findings/{finding_id}/acknowledge", response_model=MutationResponse)
-async def command_finding_acknowledge(finding_id: str):
+@offload
+def command_finding_acknowledge(finding_id: str):
     """Mark a finding as acknowledged ('Got it')."""
     try:
         store = get_store()
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         try:
             now = datetime.now().isoformat()
             cursor = conn.execute(
@@ -5807,11 +5949,12 @@ async def command_finding_acknowledge(finding_id: str):
 
 
 @app.post("/api/command/findings/{finding_id}/suppress", response_model=MutationResponse)
-async def command_finding_suppress(finding_id: str):
+@offload
+def command_finding_suppress(finding_id: str):
     """Mark a finding as suppressed ('Expected') for 30 days."""
     try:
         store = get_store()
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         try:
             now = datetime.now()
             suppressed_until = (now + timedelta(days=30)).strftime("%Y-%m-%d")
@@ -5839,11 +5982,12 @@ async def command_finding_suppress(finding_id: str):
 
 
 @app.get("/api/command/staleness", response_model=DetailResponse)
-async def command_staleness():
+@offload
+def command_staleness():
     """Detection system staleness status."""
     try:
         store = get_store()
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         conn.row_factory = sqlite3.Row
         try:
             row = conn.execute(
@@ -5889,11 +6033,12 @@ async def command_staleness():
 
 
 @app.get("/api/command/weight-review", response_model=DetailResponse)
-async def command_weight_review():
+@offload
+def command_weight_review():
     """Pending weight confirmations for the task weight learning loop."""
     try:
         store = get_store()
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         conn.row_factory = sqlite3.Row
         try:
             rows = conn.execute(
@@ -5931,13 +6076,14 @@ class WeightReviewPayload(BaseModel):
 
 
 @app.post("/api/command/weight-review/{task_id}", response_model=MutationResponse)
-async def command_weight_review_action(task_id: str, payload: WeightReviewPayload):
+@offload
+def command_weight_review_action(task_id: str, payload: WeightReviewPayload):
     """Confirm or correct a task's derived weight."""
     try:
         import hashlib
 
         store = get_store()
-        conn = sqlite3.connect(store.db_path)
+        conn = open_connection(store.db_path)
         try:
             now = datetime.now().isoformat()
 
@@ -5998,7 +6144,8 @@ async def command_weight_review_action(task_id: str, payload: WeightReviewPayloa
 
 
 @app.get("/{path:path}")
-async def spa_fallback(path: str, request: Request):
+@offload
+def spa_fallback(path: str, request: Request):
     """Serve static files or fall back to SPA index.html."""
     if path.startswith("api/"):
         raise HTTPException(status_code=404, detail="Not Found")
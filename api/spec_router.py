@@ -37,6 +37,9 @@ from api.response_models import (
     TeamInvolvementResponse,
 )
 from lib import paths
+from lib.api.pagination import InvalidCursor, KeysetSpec, keyset_page
+from lib.db import open_connection
+from lib.db_executor import offload
 from lib.ui_spec_v21.endpoints import (
     ClientEndpoints,
     FinancialsEndpoints,
@@ -95,7 +98,7 @@ def _validate_sql_fragment(fragment: str) -> None:
 def get_db() -> sqlite3.Connection:
     """Get database connection with row factory."""
     db_path = str(paths.db_path())
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -159,7 +162,8 @@ class IssueTransitionRequest(BaseModel):
 
 
 @spec_router.get("/clients", response_model=ClientIndexResponse)
-async def get_clients(
+@offload
+def get_clients(
     status: str | None = Query(None, description="Filter by status: active|recently_active|cold"),
     tier: str | None = Query(None, description="Filter by tier"),
     has_issues: bool | None = Query(None, description="Filter clients with open issues"),
@@ -189,7 +193,8 @@ async def get_clients(
 
 
 @spec_router.get("/clients/{client_id}", response_model=DetailResponse)
-async def get_client_detail(
+@offload
+def get_client_detail(
     client_id: str,
     include: str | None = Query(None, description="Comma-separated sections to include"),
 ):
@@ -214,7 +219,8 @@ async def get_client_detail(
 
 
 @spec_router.get("/clients/{client_id}/snapshot", response_model=DetailResponse)
-async def get_client_snapshot(
+@offload
+def get_client_snapshot(
     client_id: str,
     context_issue_id: str | None = Query(None),
     context_inbox_item_id: str | None = Query(None),
@@ -248,7 +254,8 @@ async def get_client_snapshot(
 
 
 @spec_router.get("/clients/{client_id}/invoices", response_model=InvoiceListResponse)
-async def get_client_invoices(
+@offload
+def get_client_invoices(
     client_id: str,
     status: str | None = Query(None, description="Filter by status"),
     page: int = Query(1, ge=1),
@@ -268,7 +275,8 @@ async def get_client_invoices(
 
 
 @spec_router.get("/clients/{client_id}/ar-aging", response_model=DetailResponse)
-async def get_client_ar_aging(client_id: str):
+@offload
+def get_client_ar_aging(client_id: str):
     """
     GET /api/v2/clients/:id/ar-aging
 
@@ -286,7 +294,8 @@ async def get_client_ar_aging(client_id: str):
 
 
 @spec_router.get("/inbox", response_model=InboxResponse)
-async def get_inbox(
+@offload
+def get_inbox(
     state: str | None = Query(None, description="Filter by state: proposed|snoozed"),
     type: str | None = Query(
         None, description="Filter by type: issue|flagged_signal|orphan|ambiguous"
@@ -336,7 +345,8 @@ async def get_inbox(
 
 
 @spec_router.get("/inbox/recent", response_model=InboxRecentResponse)
-async def get_inbox_recent(
+@offload
+def get_inbox_recent(
     days: int = Query(7, ge=1, le=90, description="Number of days to look back"),
     state: str | None = Query(
         None, description="Filter by terminal state: linked_to_issue|dismissed"
@@ -363,7 +373,8 @@ async def get_inbox_recent(
 
 
 @spec_router.get("/inbox/counts", response_model=InboxCountsResponse)
-async def get_inbox_counts():
+@offload
+def get_inbox_counts():
     """
     GET /api/v2/inbox/counts
 
@@ -378,7 +389,8 @@ async def get_inbox_counts():
 
 
 @spec_router.post("/inbox/{item_id}/action", response_model=MutationResponse)
-async def execute_inbox_action(
+@offload
+def execute_inbox_action(
     item_id: str,
     request: InboxActionRequest,
     actor: str = Query(..., description="User ID performing the action"),
@@ -419,7 +431,8 @@ async def execute_inbox_action(
 
 
 @spec_router.post("/inbox/{item_id}/read", response_model=MutationResponse)
-async def mark_inbox_read(
+@offload
+def mark_inbox_read(
     item_id: str,
     actor: str = Query(..., description="User ID marking as read"),
     request_id: str = Depends(get_request_id),
@@ -444,7 +457,8 @@ async def mark_inbox_read(
 
 
 @spec_router.get("/issues", response_model=ListResponse)
-async def get_issues(
+@offload
+def get_issues(
     client_id: str | None = Query(None, description="Filter by client"),
     state: str | None = Query(None, description="Filter by state"),
     severity: str | None = Query(None, description="Filter by severity"),
@@ -519,7 +533,8 @@ async def get_issues(
 
 
 @spec_router.get("/issues/{issue_id}", response_model=DetailResponse)
-async def get_issue(issue_id: str):
+@offload
+def get_issue(issue_id: str):
     """
     GET /api/v2/issues/:id
 
@@ -545,7 +560,8 @@ async def get_issue(issue_id: str):
 
 
 @spec_router.post("/issues/{issue_id}/transition", response_model=MutationResponse)
-async def transition_issue(
+@offload
+def transition_issue(
     issue_id: str,
     request: IssueTransitionRequest,
     actor: str = Query(..., description="User ID performing the action"),
@@ -587,20 +603,30 @@ async def transition_issue(
 
 # ==== Signals Endpoints (§7.7) ====
 
+# Newest observation first; idx_signals_v29_client_observed serves each page.
+_CLIENT_SIGNALS = KeysetSpec(
+    name="client_signals", source="signals_v29", columns="*", key="observed_at"
+)
+
 
 @spec_router.get("/clients/{client_id}/signals", response_model=SignalListResponse)
-async def get_client_signals(
+@offload
+def get_client_signals(
     client_id: str,
     sentiment: str | None = Query(None, description="Filter: good|neutral|bad|all"),
     source: str | None = Query(None, description="Filter by source"),
     days: int = Query(30, ge=1, le=365),
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
 ):
     """
     GET /api/v2/clients/:id/signals
 
     Spec: 7.7 Signals
+
+    Pass a response's next_cursor as cursor to page by keyset (page is then
+    ignored), which keeps deep pages as cheap as the first.
     """
     conn = get_db()
     try:
@@ -640,10 +666,10 @@ async def get_client_signals(
                 "GROUP BY sentiment, source",
             ]
         )
-        cursor = conn.execute(
+        summary_rows = conn.execute(
             sql,
             [client_id, cutoff.isoformat()],
-        )
+        ).fetchall()
 
         by_source: dict[str, dict[str, int]] = {}
         summary: dict[str, int | dict[str, dict[str, int]]] = {
@@ -652,7 +678,7 @@ async def get_client_signals(
             "bad": 0,
             "by_source": by_source,
         }
-        for row in cursor.fetchall():
+        for row in summary_rows:
             sent, src, count = row
             if isinstance(summary[sent], int):
                 summary[sent] = summary[sent] + count
@@ -661,22 +687,22 @@ async def get_client_signals(
             by_source[src][sent] = count
 
         # Get paginated signals
-        offset = (page - 1) * limit
         _validate_sql_fragment(where_clause)
-        sql = "".join(
-            [
-                "SELECT * FROM signals_v29 ",
-                "WHERE ",
+        try:
+            rows, next_cursor = keyset_page(
+                conn,
+                _CLIENT_SIGNALS,
+                limit,
+                cursor,
                 where_clause,
-                " ",
-                "ORDER BY observed_at DESC ",
-                "LIMIT ? OFFSET ?",
-            ]
-        )
-        cursor = conn.execute(sql, params + [limit, offset])
+                params,
+                offset=(page - 1) * limit,
+            )
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
 
         signals = []
-        for row in cursor.fetchall():
+        for row in rows:
             signal = dict(row)
             if signal.get("evidence"):
                 try:
@@ -697,10 +723,15 @@ async def get_client_signals(
                 where_clause,
             ]
         )
-        cursor = conn.execute(sql, params)
-        total = cursor.fetchone()[0]
+        total = conn.execute(sql, params).fetchone()[0]
 
-        return {"summary": summary, "signals": signals, "total": total, "page": page}
+        return {
+            "summary": summary,
+            "signals": signals,
+            "total": total,
+            "page": page,
+            "next_cursor": next_cursor,
+        }
     finally:
         conn.close()
 
@@ -709,7 +740,8 @@ async def get_client_signals(
 
 
 @spec_router.get("/clients/{client_id}/team", response_model=TeamInvolvementResponse)
-async def get_client_team(client_id: str, days: int = Query(30, ge=1, le=365)):
+@offload
+def get_client_team(client_id: str, days: int = Query(30, ge=1, le=365)):
     """
     GET /api/v2/clients/:id/team
 
@@ -759,7 +791,8 @@ async def get_client_team(client_id: str, days: int = Query(30, ge=1, le=365)):
 
 
 @spec_router.get("/team", response_model=ListResponse)
-async def get_team():
+@offload
+def get_team():
     """
     GET /api/v2/team
 
@@ -814,7 +847,8 @@ async def get_team():
 
 
 @spec_router.get("/engagements", response_model=EngagementListResponse)
-async def get_engagements(
+@offload
+def get_engagements(
     client_id: str | None = Query(None),
     state: str | None = Query(None),
     type: str | None = Query(None),
@@ -902,7 +936,8 @@ async def get_engagements(
 
 
 @spec_router.get("/engagements/{engagement_id}", response_model=DetailResponse)
-async def get_engagement(engagement_id: str):
+@offload
+def get_engagement(engagement_id: str):
     """
     GET /api/v2/engagements/:id
 
@@ -944,7 +979,8 @@ class EngagementTransitionRequest(BaseModel):
 
 
 @spec_router.post("/engagements/{engagement_id}/transition", response_model=MutationResponse)
-async def transition_engagement(
+@offload
+def transition_engagement(
     engagement_id: str, request: EngagementTransitionRequest, actor: str = Query("user")
 ):
     """
@@ -985,7 +1021,8 @@ async def transition_engagement(
 
 
 @spec_router.get("/health", response_model=HealthResponse)
-async def health_check():
+@offload
+def health_check():
     """Health check endpoint."""
     conn = get_db()
     try:
@@ -1002,7 +1039,8 @@ async def health_check():
 
 
 @spec_router.post("/jobs/snooze-expiry", response_model=MutationResponse)
-async def run_snooze_expiry_job():
+@offload
+def run_snooze_expiry_job():
     """
     Run snooze expiry job.
 
@@ -1033,7 +1071,8 @@ async def run_snooze_expiry_job():
 
 
 @spec_router.post("/jobs/regression-watch", response_model=MutationResponse)
-async def run_regression_watch_job():
+@offload
+def run_regression_watch_job():
     """
     Run regression watch expiry job.
 
@@ -1062,7 +1101,8 @@ async def run_regression_watch_job():
 
 
 @spec_router.get("/priorities", response_model=ListResponse)
-async def get_priorities_v2(limit: int = Query(20), context: str | None = Query(None)):
+@offload
+def get_priorities_v2(limit: int = Query(20), context: str | None = Query(None)):
     """
     GET /api/v2/priorities
 
@@ -1092,7 +1132,8 @@ async def get_priorities_v2(limit: int = Query(20), context: str | None = Query(
 
 
 @spec_router.get("/projects", response_model=ListResponse)
-async def get_projects_v2(limit: int = Query(50), status: str | None = Query(None)):
+@offload
+def get_projects_v2(limit: int = Query(50), status: str | None = Query(None)):
     """
     GET /api/v2/projects
 
@@ -1136,7 +1177,8 @@ async def get_projects_v2(limit: int = Query(50), status: str | None = Query(Non
 
 
 @spec_router.get("/events", response_model=ListResponse)
-async def get_events_v2(
+@offload
+def get_events_v2(
     start_date: str | None = Query(None),
     end_date: str | None = Query(None),
     limit: int = Query(50),
@@ -1185,7 +1227,8 @@ async def get_events_v2(
 
 
 @spec_router.get("/invoices", response_model=ListResponse)
-async def get_invoices_v2(
+@offload
+def get_invoices_v2(
     status: str | None = Query(None),
     client_id: str | None = Query(None),
     limit: int = Query(50),
@@ -1235,7 +1278,8 @@ async def get_invoices_v2(
 
 
 @spec_router.get("/proposals", response_model=ListResponse)
-async def get_proposals_v2(
+@offload
+def get_proposals_v2(
     limit: int = Query(20),
     status: str = Query("open"),
     days: int = Query(7),
@@ -1299,7 +1343,8 @@ async def get_proposals_v2(
 
 
 @spec_router.get("/proposals/{proposal_id}", response_model=DetailResponse)
-async def get_proposal_detail_v2(
+@offload
+def get_proposal_detail_v2(
     proposal_id: str,
     max_signals: int = Query(5, ge=1, le=50),
 ):
@@ -1453,7 +1498,8 @@ def _build_signal_description(signal_type: str, value: dict) -> str:
 
 
 @spec_router.get("/watchers", response_model=ListResponse)
-async def get_watchers_v2(hours: int = Query(24)):
+@offload
+def get_watchers_v2(hours: int = Query(24)):
     """
     GET /api/v2/watchers
     """
@@ -1482,7 +1528,8 @@ async def get_watchers_v2(hours: int = Query(24)):
 
 
 @spec_router.get("/couplings", response_model=ListResponse)
-async def get_couplings_v2(
+@offload
+def get_couplings_v2(
     anchor_type: str | None = Query(None),
     anchor_id: str | None = Query(None),
 ):
@@ -1550,7 +1597,8 @@ async def get_couplings_v2(
 
 
 @spec_router.get("/fix-data", response_model=FixDataResponse)
-async def get_fix_data_v2():
+@offload
+def get_fix_data_v2():
     """
     GET /api/v2/fix-data
     """
@@ -1616,7 +1664,8 @@ def _proposal_type_to_issue_type(proposal_type: str) -> str:
 
 
 @spec_router.get("/intelligence/patterns", response_model=PatternDetectionResponse)
-async def get_intelligence_patterns():
+@offload
+def get_intelligence_patterns():
     """
     GET /api/v2/intelligence/patterns
 
@@ -1726,7 +1775,8 @@ class IssueStateChangeRequest(BaseModel):
 
 
 @spec_router.post("/proposals/{proposal_id}/snooze", response_model=MutationResponse)
-async def snooze_proposal(proposal_id: str, request: SnoozeRequest):
+@offload
+def snooze_proposal(proposal_id: str, request: SnoozeRequest):
     """
     POST /api/v2/proposals/:id/snooze
 
@@ -1755,7 +1805,8 @@ async def snooze_proposal(proposal_id: str, request: SnoozeRequest):
 
 
 @spec_router.post("/proposals/{proposal_id}/dismiss", response_model=MutationResponse)
-async def dismiss_proposal(proposal_id: str, request: DismissRequest):
+@offload
+def dismiss_proposal(proposal_id: str, request: DismissRequest):
     """
     POST /api/v2/proposals/:id/dismiss
 
@@ -1781,7 +1832,8 @@ async def dismiss_proposal(proposal_id: str, request: DismissRequest):
 
 
 @spec_router.post("/watchers/{watcher_id}/dismiss", response_model=MutationResponse)
-async def dismiss_watcher(watcher_id: str, request: WatcherDismissRequest):
+@offload
+def dismiss_watcher(watcher_id: str, request: WatcherDismissRequest):
     """
     POST /api/v2/watchers/:id/dismiss
 
@@ -1807,7 +1859,8 @@ async def dismiss_watcher(watcher_id: str, request: WatcherDismissRequest):
 
 
 @spec_router.post("/watchers/{watcher_id}/snooze", response_model=MutationResponse)
-async def snooze_watcher(watcher_id: str, request: WatcherSnoozeRequest):
+@offload
+def snooze_watcher(watcher_id: str, request: WatcherSnoozeRequest):
     """
     POST /api/v2/watchers/:id/snooze
 
@@ -1836,7 +1889,8 @@ async def snooze_watcher(watcher_id: str, request: WatcherSnoozeRequest):
 
 
 @spec_router.post("/fix-data/{item_type}/{item_id}/resolve", response_model=MutationResponse)
-async def resolve_fix_data(item_type: str, item_id: str, request: FixDataResolveRequest):
+@offload
+def resolve_fix_data(item_type: str, item_id: str, request: FixDataResolveRequest):
     """
     POST /api/v2/fix-data/:type/:id/resolve
 
@@ -1871,7 +1925,8 @@ async def resolve_fix_data(item_type: str, item_id: str, request: FixDataResolve
 
 
 @spec_router.post("/issues", response_model=MutationResponse)
-async def create_issue_from_proposal(request: CreateIssueRequest):
+@offload
+def create_issue_from_proposal(request: CreateIssueRequest):
     """
     POST /api/v2/issues
 
@@ -1934,7 +1989,8 @@ async def create_issue_from_proposal(request: CreateIssueRequest):
 
 
 @spec_router.post("/issues/{issue_id}/notes", response_model=MutationResponse)
-async def add_issue_note(issue_id: str, request: IssueNoteRequest):
+@offload
+def add_issue_note(issue_id: str, request: IssueNoteRequest):
     """
     POST /api/v2/issues/:id/notes
 
@@ -1974,7 +2030,8 @@ async def add_issue_note(issue_id: str, request: IssueNoteRequest):
 
 
 @spec_router.patch("/issues/{issue_id}/resolve", response_model=MutationResponse)
-async def resolve_issue(issue_id: str, request: IssueResolveRequest):
+@offload
+def resolve_issue(issue_id: str, request: IssueResolveRequest):
     """
     PATCH /api/v2/issues/:id/resolve
 
@@ -2009,7 +2066,8 @@ async def resolve_issue(issue_id: str, request: IssueResolveRequest):
 
 
 @spec_router.patch("/issues/{issue_id}/state", response_model=MutationResponse)
-async def change_issue_state(issue_id: str, request: IssueStateChangeRequest):
+@offload
+def change_issue_state(issue_id: str, request: IssueStateChangeRequest):
     """
     PATCH /api/v2/issues/:id/state
 
@@ -2060,7 +2118,8 @@ async def change_issue_state(issue_id: str, request: IssueStateChangeRequest):
 
 
 @spec_router.get("/evidence/{entity_type}/{entity_id}", response_model=ListResponse)
-async def get_evidence_v2(entity_type: str, entity_id: str):
+@offload
+def get_evidence_v2(entity_type: str, entity_id: str):
     """
     GET /api/v2/evidence/{entity_type}/{entity_id}
     """
@@ -2106,7 +2165,8 @@ def _get_query_engine() -> Any:
 
 
 @spec_router.get("/clients/{client_id}/email-participants", response_model=DetailResponse)
-async def get_client_email_participants(client_id: str):
+@offload
+def get_client_email_participants(client_id: str):
     """
     GET /api/v2/clients/:id/email-participants
 
@@ -2123,7 +2183,8 @@ async def get_client_email_participants(client_id: str):
 
 
 @spec_router.get("/clients/{client_id}/attachments", response_model=DetailResponse)
-async def get_client_attachments(client_id: str):
+@offload
+def get_client_attachments(client_id: str):
     """
     GET /api/v2/clients/:id/attachments
 
@@ -2140,7 +2201,8 @@ async def get_client_attachments(client_id: str):
 
 
 @spec_router.get("/clients/{client_id}/invoice-detail", response_model=DetailResponse)
-async def get_client_invoice_detail(client_id: str):
+@offload
+def get_client_invoice_detail(client_id: str):
     """
     GET /api/v2/clients/:id/invoice-detail
 
@@ -2157,7 +2219,8 @@ async def get_client_invoice_detail(client_id: str):
 
 
 @spec_router.get("/team/{person_id}/calendar-detail", response_model=DetailResponse)
-async def get_person_calendar_detail(person_id: str):
+@offload
+def get_person_calendar_detail(person_id: str):
     """
     GET /api/v2/team/:id/calendar-detail
 
@@ -2174,7 +2237,8 @@ async def get_person_calendar_detail(person_id: str):
 
 
 @spec_router.get("/tasks/{task_id}/asana-detail", response_model=DetailResponse)
-async def get_task_asana_detail(task_id: str):
+@offload
+def get_task_asana_detail(task_id: str):
     """
     GET /api/v2/tasks/:id/asana-detail
 
@@ -2191,7 +2255,8 @@ async def get_task_asana_detail(task_id: str):
 
 
 @spec_router.get("/chat/analytics", response_model=DetailResponse)
-async def get_chat_analytics():
+@offload
+def get_chat_analytics():
     """
     GET /api/v2/chat/analytics
 
@@ -2208,7 +2273,8 @@ async def get_chat_analytics():
 
 
 @spec_router.get("/financial/detail", response_model=DetailResponse)
-async def get_financial_detail():
+@offload
+def get_financial_detail():
     """
     GET /api/v2/financial/detail
 
@@ -2225,7 +2291,8 @@ async def get_financial_detail():
 
 
 @spec_router.get("/search", response_model=DetailResponse)
-async def search(q: str = Query(..., description="Search query")):
+@offload
+def search(q: str = Query(..., description="Search query")):
     """
     GET /api/v2/search
 
@@ -2275,7 +2342,8 @@ async def search(q: str = Query(..., description="Search query")):
 
 
 @spec_router.get("/projects/asana-context", response_model=DetailResponse)
-async def get_asana_portfolio_context():
+@offload
+def get_asana_portfolio_context():
     """
     GET /api/v2/projects/asana-context
 
@@ -2305,7 +2373,8 @@ class MuteRequest(BaseModel):
 
 
 @spec_router.post("/notifications/mute", response_model=MutationResponse)
-async def mute_entity_notifications(body: MuteRequest):
+@offload
+def mute_entity_notifications(body: MuteRequest):
     """
     POST /api/v2/notifications/mute
 
@@ -2334,7 +2403,8 @@ class UnmuteRequest(BaseModel):
 
 
 @spec_router.post("/notifications/unmute", response_model=MutationResponse)
-async def unmute_entity_notifications(body: UnmuteRequest):
+@offload
+def unmute_entity_notifications(body: UnmuteRequest):
     """
     POST /api/v2/notifications/unmute
 
@@ -2353,7 +2423,8 @@ async def unmute_entity_notifications(body: UnmuteRequest):
 
 
 @spec_router.get("/notifications/mutes", response_model=DetailResponse)
-async def get_active_mutes():
+@offload
+def get_active_mutes():
     """
     GET /api/v2/notifications/mutes
 
@@ -2377,7 +2448,8 @@ async def get_active_mutes():
 
 
 @spec_router.get("/notifications/analytics", response_model=DetailResponse)
-async def get_notification_analytics(days: int = Query(default=30, ge=1, le=365)):
+@offload
+def get_notification_analytics(days: int = Query(default=30, ge=1, le=365)):
     """
     GET /api/v2/notifications/analytics?days=30
 
@@ -8,6 +8,14 @@ Events include:
   - metric_refresh: Dashboard metrics updated
   - system_status: Heartbeat/connection status
 
+Events come from the cross-process event log (lib/event_log.py): the daemon,
+AutonomousLoop and API workers append to it, and each API process runs one
+EventLogTailer that reads new entries by seq and fans them out through its
+EventBus to per-client bounded queues. Logged events carry their seq as the
+SSE id, so a reconnecting EventSource resumes from Last-Event-ID. A client
+whose queue fills up is disconnected and catches up from the log when it
+reconnects.
+
 AUTHENTICATION: All endpoints require a valid Bearer token.
 Set INTEL_API_TOKEN environment variable to enable auth.
 Without this env var, auth is disabled (development mode).
@@ -22,18 +30,26 @@ import json
 import logging
 import sqlite3
 from collections.abc import AsyncGenerator
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
 from api.auth import require_auth, verify_token
 from api.response_models import DetailResponse
+from lib import db_executor, event_log
+from lib.db_executor import offload
 
 logger = logging.getLogger(__name__)
 
+# Events buffered per SSE client before it is disconnected as too slow.
+QUEUE_SIZE = 256
+
+# How often the tailer checks the event log for writes from other processes.
+POLL_INTERVAL_SECONDS = 0.5
+
 sse_router = APIRouter(tags=["Events"])
 
 
@@ -47,14 +63,29 @@ class Event:
     timestamp: str
 
     def to_sse(self) -> str:
-        """Format event as SSE message."""
-        lines = [
-            f"id: {self.id}",
+        """Format event as SSE message (no id line if the event has no id)."""
+        lines = [f"id: {self.id}"] if self.id else []
+        lines += [
             f"event: {self.event_type}",
             f"data: {json.dumps(self.data)}",
         ]
         return "\n".join(lines) + "\n\n"
 
+    @classmethod
+    def from_log(cls, entry: event_log.LogEvent) -> "Event":
+        """Event for an event log entry; its id is the entry's seq."""
+        return cls(
+            id=str(entry.seq),
+            event_type=entry.event_type,
+            data=entry.data,
+            timestamp=entry.created_at,
+        )
+
+    @property
+    def seq(self) -> int | None:
+        """Event log seq, or None for events that were not logged."""
+        return int(self.id) if self.id.isdigit() else None
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON responses."""
         return asdict(self)
@@ -71,8 +102,8 @@ class EventBus:
         self._lock = asyncio.Lock()
 
     async def subscribe(self) -> asyncio.Queue:
-        """Subscribe to events, returns a queue to receive them."""
-        queue: asyncio.Queue = asyncio.Queue()
+        """Subscribe to events, returns a bounded queue to receive them."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
         async with self._lock:
             self._subscribers.add(queue)
         return queue
@@ -102,14 +133,95 @@ class EventBus:
             # Clean up dead subscribers
             for queue in dead_queues:
                 self._subscribers.discard(queue)
+                _close_queue(queue)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
 
     def get_history(self) -> list[Event]:
         """Get event history."""
         return self._event_history.copy()
 
 
+def _close_queue(queue: asyncio.Queue) -> None:
+    """Replace a dropped subscriber's backlog with the end-of-stream marker (None)."""
+    try:
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+    except (asyncio.QueueEmpty, asyncio.QueueFull):
+        pass
+
+
+class EventLogTailer:
+    """
+    Reads new event log entries and publishes them on an EventBus.
+
+    One per API process. It polls every POLL_INTERVAL_SECONDS (a primary-key
+    range read that returns nothing when idle) and immediately after
+    notify(), which this process calls when it appends to the log itself.
+    """
+
+    def __init__(self, event_bus: EventBus, poll_interval: float = POLL_INTERVAL_SECONDS):
+        self.event_bus = event_bus
+        self.poll_interval = poll_interval
+        self.last_seq: int | None = None
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start tailing from the current end of the log (no-op if running)."""
+        if self._task is not None and not self._task.done():
+            return
+        if self.last_seq is None:
+            self.last_seq = await db_executor.run(event_log.latest_seq)
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def notify(self) -> None:
+        """Check the log now instead of at the next poll."""
+        self._wake.set()
+
+    async def poll(self) -> int:
+        """Publish every entry after last_seq; returns how many were published."""
+        if self.last_seq is None:
+            self.last_seq = await db_executor.run(event_log.latest_seq)
+        published = 0
+        while True:
+            entries = await db_executor.run(event_log.read_after, self.last_seq)
+            for entry in entries:
+                await self.event_bus.publish(Event.from_log(entry))
+                self.last_seq = entry.seq
+            published += len(entries)
+            if len(entries) < event_log.READ_BATCH:
+                return published
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.poll()
+            except (sqlite3.Error, db_executor.QueryTimeout) as e:
+                logger.warning(f"Event log tail failed: {e}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+
+
 # Global event bus instance
 _event_bus: EventBus | None = None
+_tailer: EventLogTailer | None = None
 
 
 def get_event_bus() -> EventBus:
@@ -120,6 +232,14 @@ def get_event_bus() -> EventBus:
     return _event_bus
 
 
+def get_event_tailer() -> EventLogTailer:
+    """Get or create the event log tailer feeding the event bus."""
+    global _tailer
+    if _tailer is None:
+        _tailer = EventLogTailer(get_event_bus())
+    return _tailer
+
+
 def _create_event(event_type: str, data: dict) -> Event:
     """Create an event with timestamp and ID."""
     return Event(
@@ -130,16 +250,29 @@ def _create_event(event_type: str, data: dict) -> Event:
     )
 
 
+async def _replay(after_seq: int) -> AsyncGenerator[Event, None]:
+    """Logged events after *after_seq*, oldest first."""
+    while True:
+        entries = await db_executor.run(event_log.read_after, after_seq)
+        for entry in entries:
+            yield Event.from_log(entry)
+            after_seq = entry.seq
+        if len(entries) < event_log.READ_BATCH:
+            return
+
+
 async def _heartbeat_generator(
-    queue: asyncio.Queue, event_bus: EventBus
+    queue: asyncio.Queue, event_bus: EventBus, resume_after: int | None = None
 ) -> AsyncGenerator[str, None]:
     """
     Generate SSE stream with heartbeat.
 
-    Emits events from the queue and sends a heartbeat every 30 seconds
-    to keep the connection alive.
+    With *resume_after* (the client's Last-Event-ID), first replays the logged
+    events after it, then emits events from the queue, skipping any already
+    replayed. Sends a heartbeat every 30 seconds to keep the connection alive.
     """
     heartbeat_task = None
+    last_seq = resume_after
     try:
 
         async def send_heartbeat():
@@ -147,21 +280,40 @@ async def _heartbeat_generator(
             while True:
                 try:
                     await asyncio.sleep(30)
-                    event = _create_event("system_status", {"status": "connected"})
-                    await queue.put(event)
+                    # No id: heartbeats must not move the client's Last-Event-ID
+                    event = replace(_create_event("system_status", {"status": "connected"}), id="")
+                    queue.put_nowait(event)
                 except asyncio.CancelledError:
                     break
+                except asyncio.QueueFull:
+                    logger.debug("Heartbeat skipped, queue full")
                 except (sqlite3.Error, ValueError) as e:
                     logger.error(f"Heartbeat error: {e}")
 
         # Start heartbeat task
         heartbeat_task = asyncio.create_task(send_heartbeat())
 
+        if resume_after is not None:
+            try:
+                async for event in _replay(resume_after):
+                    last_seq = event.seq
+                    yield event.to_sse()
+            except (sqlite3.Error, db_executor.QueryTimeout) as e:
+                logger.error(f"SSE replay failed: {e}")
+                return
+
         # Stream events from queue
         while True:
             try:
                 # Wait for event with timeout to handle cleanup
                 event = await asyncio.wait_for(queue.get(), timeout=60.0)
+                if event is None:
+                    # Dropped as too slow; the client reconnects and resumes
+                    break
+                if event.seq is not None:
+                    if last_seq is not None and event.seq <= last_seq:
+                        continue
+                    last_seq = event.seq
                 yield event.to_sse()
             except TimeoutError:
                 # Connection idle, check if we should close
@@ -186,6 +338,10 @@ async def _heartbeat_generator(
 @sse_router.get("/events/stream")
 async def stream_events(
     token: str | None = Query(None, description="Bearer token (EventSource cannot set headers)"),
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+    since: int | None = Query(
+        None, ge=0, description="Resume after this event id (initial connections)"
+    ),
 ) -> StreamingResponse:
     """
     Server-Sent Events endpoint for real-time data push.
@@ -198,6 +354,10 @@ async def stream_events(
 
     Keep-alive heartbeat sent every 30 seconds.
 
+    Each logged event's id is its event log sequence number. A reconnecting
+    EventSource sends it back as Last-Event-ID and the stream resumes with
+    the events it missed; ?since= does the same for a first connection.
+
     AUTH: the browser EventSource API cannot set request headers, so this route
     authenticates via the ?token= query param (validated here in constant time)
     instead of the Authorization header. It is therefore exempt from the global
@@ -209,11 +369,16 @@ async def stream_events(
             detail="Authentication required. Provide ?token= (EventSource).",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    resume_after = since
+    if last_event_id and last_event_id.isdigit():
+        resume_after = int(last_event_id)
     event_bus = get_event_bus()
     try:
+        await get_event_tailer().start()
+        # Subscribe before replaying so nothing logged in between is missed
         queue = await event_bus.subscribe()
         return StreamingResponse(
-            _heartbeat_generator(queue, event_bus),
+            _heartbeat_generator(queue, event_bus, resume_after),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -221,7 +386,7 @@ async def stream_events(
                 "Connection": "keep-alive",
             },
         )
-    except (sqlite3.Error, ValueError) as e:
+    except (sqlite3.Error, ValueError, db_executor.QueryTimeout) as e:
         logger.error(f"SSE stream setup failed: {e}")
         raise HTTPException(status_code=500, detail="Failed to establish SSE stream") from e
 
@@ -231,22 +396,20 @@ async def stream_events(
     response_model=DetailResponse,
     dependencies=[Depends(require_auth)],
 )
+@offload
 def get_event_history(limit: int = Query(100, description="Maximum events to return")):
     """
     Get recent event history.
 
-    Returns the last N events (default 100).
+    Returns the last N events (default 100) from the event log, so it includes
+    events published by other processes.
     Useful for initial state sync or when SSE unavailable.
     """
     try:
         if limit < 1 or limit > 500:
             raise HTTPException(status_code=400, detail="limit must be between 1 and 500")
 
-        event_bus = get_event_bus()
-        history = event_bus.get_history()
-
-        # Return last N events
-        events = history[-limit:] if limit else history
+        events = [Event.from_log(entry) for entry in event_log.recent(limit)]
         return {
             "status": "ok",
             "data": [event.to_dict() for event in events],
@@ -275,21 +438,26 @@ async def publish_event(
 
     For testing/demo purposes. In production, events are published
     by the system's internal event producers.
+
+    The event is appended to the event log, so every API process streams it.
+    If the log is unavailable it is still delivered to this process's clients.
     """
     try:
-        event = _create_event(
-            event_type,
-            {
-                "message": message,
-                "severity": severity or "info",
-            },
-        )
-        event_bus = get_event_bus()
-        await event_bus.publish(event)
+        data = {"message": message, "severity": severity or "info"}
+        try:
+            seq = await db_executor.run(event_log.publish, event_type, data, "api")
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Event log unavailable, publishing locally only: {e}")
+            event = _create_event(event_type, data)
+            await get_event_bus().publish(event)
+            event_id = event.id
+        else:
+            get_event_tailer().notify()
+            event_id = str(seq)
         return {
             "status": "ok",
-            "event_id": event.id,
-            "timestamp": event.timestamp,
+            "event_id": event_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
         }
     except (sqlite3.Error, ValueError) as e:
         logger.error(f"publish_event failed: {e}")
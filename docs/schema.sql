@@ -218,6 +218,37 @@ CREATE TABLE IF NOT EXISTS [communications] (
     updated_at TEXT NOT NULL DEFAULT (datetime('now'))
 )
 
+CREATE TABLE IF NOT EXISTS [communication_client_attribution] (
+    communication_id TEXT PRIMARY KEY,
+    client_id TEXT,
+    method TEXT NOT NULL,
+    matched_pattern TEXT,
+    subject TEXT,
+    linked_client_id TEXT,
+    attributed_at TEXT NOT NULL
+)
+
+CREATE TABLE IF NOT EXISTS [communication_attribution_patterns] (
+    client_id TEXT PRIMARY KEY,
+    pattern TEXT NOT NULL
+)
+
+CREATE TABLE IF NOT EXISTS [priority_queue] (
+    item_type TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    score REAL NOT NULL,
+    title_key TEXT NOT NULL DEFAULT '',
+    due_key TEXT NOT NULL,
+    assignee_key TEXT NOT NULL DEFAULT '',
+    project_key TEXT NOT NULL DEFAULT '',
+    status TEXT,
+    tags_key TEXT,
+    item_json TEXT NOT NULL,
+    input_sig TEXT,
+    scored_at TEXT NOT NULL,
+    PRIMARY KEY (item_type, item_id)
+)
+
 CREATE TABLE IF NOT EXISTS [people] (
     id TEXT PRIMARY KEY,
     name TEXT NOT NULL,
@@ -684,6 +715,8 @@ CREATE TABLE IF NOT EXISTS [time_blocks] (
     date TEXT NOT NULL,
     start_time TEXT NOT NULL,
     end_time TEXT NOT NULL,
+    start_min INTEGER,
+    end_min INTEGER,
     lane TEXT NOT NULL,
     task_id TEXT REFERENCES tasks(id),
     is_protected INTEGER DEFAULT 0,
@@ -1026,6 +1059,14 @@ CREATE TABLE IF NOT EXISTS [intelligence_events] (
     consumer TEXT
 )
 
+CREATE TABLE IF NOT EXISTS [event_log] (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_type TEXT NOT NULL,
+    data TEXT NOT NULL DEFAULT '{}',
+    source TEXT,
+    created_at TEXT NOT NULL
+)
+
 CREATE TABLE IF NOT EXISTS [intelligence_events_archive] (
     id TEXT PRIMARY KEY,
     event_type TEXT,
@@ -1115,6 +1156,16 @@ CREATE TABLE IF NOT EXISTS [signal_state] (
     UNIQUE(signal_id, entity_type, entity_id, status)
 )
 
+CREATE TABLE IF NOT EXISTS [signal_entity_fingerprints] (
+    entity_type TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    mode_key TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    detected_json TEXT NOT NULL DEFAULT '[]',
+    evaluated_at TEXT NOT NULL,
+    UNIQUE(entity_type, entity_id, mode_key)
+)
+
 CREATE TABLE IF NOT EXISTS [artifacts] (
     artifact_id TEXT PRIMARY KEY,
     type TEXT NOT NULL,
@@ -16,6 +16,7 @@ from typing import Any
 
 from lib import paths
 from lib.compat import StrEnum
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -239,7 +240,7 @@ class CapacityCommandPage7Engine:
         self._events_cache: list[dict] = []
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -16,9 +16,28 @@ from typing import Any
 
 from lib import paths
 from lib.compat import StrEnum
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
+# Linked, non-internal clients (§3 Zone C)
+_ELIGIBLE_CLIENTS_SQL = """
+    SELECT DISTINCT c.id
+    FROM clients c
+    WHERE EXISTS (
+        SELECT 1 FROM projects p
+        WHERE p.client_id = c.id
+        AND p.is_internal = 0
+    )
+    OR EXISTS (
+        SELECT 1 FROM invoices i
+        WHERE i.client_id = c.id
+    )
+"""
+
+# Valid AR: sent/overdue and unpaid
+_VALID_AR_WHERE = "status IN ('sent', 'overdue') AND payment_date IS NULL"
+
 
 # ==============================================================================
 # ENUMS & TYPES (per §2 LOCKED)
@@ -131,6 +150,32 @@ class ClientPortfolioItem:
     why_low: list[str]
 
 
+@dataclass
+class ClientFrame:
+    """
+    Per-client inputs to the §6 domain scores.
+
+    Loaded for many clients at once by Client360Page10Engine._load_frames with
+    grouped queries, so scoring a portfolio does not query per client.
+    """
+
+    client_id: str
+    name: str = ""
+    tier: str | None = None
+    exists: bool = False
+    # Active, non-internal projects with overdue_count / active_count
+    active_projects: list[dict] = field(default_factory=list)
+    has_internal_projects: bool = False
+    has_active_retainer: bool = False
+    # Valid (unpaid sent/overdue) AR by bucket
+    ar_current: float = 0.0
+    ar_moderate: float = 0.0
+    ar_severe: float = 0.0
+    ar_total: float = 0.0
+    next_task_due: str | None = None
+    next_commitment_deadline: str | None = None
+
+
 @dataclass
 class Move:
     """Move card per §10.1"""
@@ -238,9 +283,15 @@ class Client360Page10Engine:
         # Cache
         self._clients_cache: dict[str, dict] = {}
         self._scores_cache: dict[str, tuple[HealthBreakdown, float]] = {}
+        self._frames: dict[str, ClientFrame] = {}
+        self._all_frames_loaded = False
+        # Portfolio-wide score inputs, loaded once on first use
+        self._max_ar: float | None = None
+        self._comm_threads: list[dict] | None = None
+        self._open_commitments: list[dict] | None = None
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -343,6 +394,195 @@ class Client360Page10Engine:
             return Confidence.MED, why_low[:2]
         return Confidence.HIGH, []
 
+    # ==========================================================================
+    # SCORE INPUTS (bulk loaded)
+    # ==========================================================================
+
+    def _load_frames(self, client_ids: list[str] | None = None) -> None:
+        """
+        Load ClientFrames with grouped queries on one connection.
+
+        With client_ids=None every client is loaded (the portfolio path);
+        otherwise only the given clients.
+        """
+        if client_ids is None:
+            scope, params = "", ()
+        else:
+            client_ids = [cid for cid in client_ids if cid not in self._frames]
+            if not client_ids:
+                return
+            scope = f"AND {{col}} IN ({', '.join('?' for _ in client_ids)})"
+            params = tuple(client_ids)
+
+        def where(col: str) -> str:
+            return scope.format(col=col)
+
+        frames = {cid: ClientFrame(cid) for cid in client_ids or ()}
+
+        def frame(cid: str) -> ClientFrame:
+            if cid not in frames:
+                frames[cid] = ClientFrame(cid)
+            return frames[cid]
+
+        conn = self._get_conn()
+        try:
+            for row in conn.execute(
+                f"SELECT id, name, tier FROM clients WHERE 1=1 {where('id')}",  # noqa: S608 — placeholders only
+                params,
+            ):
+                f = frame(row["id"])
+                f.name, f.tier, f.exists = row["name"], row["tier"], True
+
+            for row in conn.execute(
+                f"""
+                SELECT p.client_id, p.id, p.name, p.status,
+                       (p.is_internal = 0 AND p.status = 'active') as is_active_external,
+                       (p.is_internal = 1) as is_internal,
+                       (p.type = 'retainer' AND p.status = 'active') as is_active_retainer,
+                       COALESCE(t.overdue_count, 0) as overdue_count,
+                       COALESCE(t.active_count, 0) as active_count
+                FROM projects p
+                LEFT JOIN (
+                    SELECT project_id,
+                           SUM(CASE WHEN due_date < date('now')
+                                    AND due_date >= '2026-01-01' THEN 1 ELSE 0 END) as overdue_count,
+                           COUNT(*) as active_count
+                    FROM tasks
+                    WHERE status NOT IN ('done', 'completed')
+                    GROUP BY project_id
+                ) t ON t.project_id = p.id
+                WHERE p.client_id IS NOT NULL {where("p.client_id")}
+            """,  # noqa: S608 — placeholders only
+                params,
+            ):
+                f = frame(row["client_id"])
+                if row["is_active_external"]:
+                    f.active_projects.append(
+                        {
+                            "id": row["id"],
+                            "name": row["name"],
+                            "status": row["status"],
+                            "overdue_count": row["overdue_count"],
+                            "active_count": row["active_count"],
+                        }
+                    )
+                f.has_internal_projects = f.has_internal_projects or bool(row["is_internal"])
+                f.has_active_retainer = f.has_active_retainer or bool(row["is_active_retainer"])
+
+            for row in conn.execute(
+                f"""
+                SELECT client_id,
+                    COALESCE(SUM(CASE WHEN aging_bucket = 'current' THEN amount ELSE 0 END), 0) as current,
+                    COALESCE(SUM(CASE WHEN aging_bucket IN ('1-30', '31-60') THEN amount ELSE 0 END), 0) as moderate,
+                    COALESCE(SUM(CASE WHEN aging_bucket IN ('61-90', '90+') THEN amount ELSE 0 END), 0) as severe,
+                    COALESCE(SUM(amount), 0) as total
+                FROM invoices
+                WHERE {_VALID_AR_WHERE} AND client_id IS NOT NULL {where("client_id")}
+                GROUP BY client_id
+            """,  # noqa: S608 — placeholders only
+                params,
+            ):
+                f = frame(row["client_id"])
+                f.ar_current, f.ar_moderate = row["current"], row["moderate"]
+                f.ar_severe, f.ar_total = row["severe"], row["total"]
+
+            for row in conn.execute(
+                f"""
+                SELECT p.client_id, MIN(t.due_date) as next
+                FROM tasks t
+                JOIN projects p ON t.project_id = p.id
+                WHERE t.status NOT IN ('done', 'completed')
+                AND t.due_date >= date('now')
+                AND t.due_date >= '2026-01-01'
+                {where("p.client_id")}
+                GROUP BY p.client_id
+            """,  # noqa: S608 — placeholders only
+                params,
+            ):
+                if row["client_id"] is not None:
+                    frame(row["client_id"]).next_task_due = row["next"]
+
+            try:
+                rows = conn.execute(
+                    f"""
+                    SELECT client_id, MIN(deadline) as next
+                    FROM commitments
+                    WHERE status = 'open'
+                    AND deadline >= date('now')
+                    {where("client_id")}
+                    GROUP BY client_id
+                """,  # noqa: S608 — placeholders only
+                    params,
+                ).fetchall()
+            except sqlite3.Error as e:
+                # Older commitments tables have no client_id/deadline
+                logger.debug(f"Could not load commitment deadlines: {e}")
+                rows = []
+            for row in rows:
+                if row["client_id"] is not None:
+                    frame(row["client_id"]).next_commitment_deadline = row["next"]
+        finally:
+            conn.close()
+
+        self._frames.update(frames)
+        if client_ids is None:
+            self._all_frames_loaded = True
+
+    def _frame(self, client_id: str) -> ClientFrame:
+        """Score inputs for one client, loading them if the portfolio load did not."""
+        if client_id not in self._frames and not self._all_frames_loaded:
+            self._load_frames([client_id])
+        return self._frames.get(client_id) or ClientFrame(client_id)
+
+    def _get_max_ar(self) -> float:
+        """Largest per-client valid AR total, for value normalization (min 1)."""
+        if self._max_ar is None:
+            self._max_ar = (
+                self._query_scalar(f"""
+                SELECT MAX(total) FROM (
+                    SELECT client_id, SUM(amount) as total
+                    FROM invoices
+                    WHERE {_VALID_AR_WHERE}
+                    GROUP BY client_id
+                )
+            """)  # noqa: S608 — constant clause
+                or 1
+            )
+        return self._max_ar
+
+    def _get_comm_threads(self) -> list[dict]:
+        """High-risk comm threads (communications has no client_id, so shared)."""
+        if self._comm_threads is None:
+            self._comm_threads = self._query_all("""
+                SELECT
+                    c.id,
+                    c.subject,
+                    (julianday('now') - julianday(c.received_at)) * 24 as age_hours,
+                    c.response_deadline as expected_response_by,
+                    c.requires_response
+                FROM communications c
+                WHERE c.processed = 0
+                AND c.requires_response = 1
+                ORDER BY c.received_at DESC
+                LIMIT 5
+            """)
+        return self._comm_threads
+
+    def _get_open_commitments(self) -> list[dict]:
+        """Open commitments (no client_id in table, so shared by all clients)."""
+        if self._open_commitments is None:
+            self._open_commitments = self._query_all("""
+                SELECT
+                    commitment_id as id,
+                    status,
+                    due_at as deadline,
+                    (julianday(due_at) - julianday('now')) as days_to_deadline
+                FROM commitments
+                WHERE status NOT IN ('fulfilled', 'closed')
+                LIMIT 10
+            """)
+        return self._open_commitments
+
     # ==========================================================================
     # DOMAIN SCORES (§6 LOCKED)
     # ==========================================================================
@@ -359,33 +599,12 @@ class Client360Page10Engine:
         score = 100.0
         why_low = []
 
-        # Get projects linked to client
-        projects = self._query_all(
-            """
-            SELECT p.id, p.name, p.status,
-                   (SELECT COUNT(*) FROM tasks t
-                    WHERE t.project_id = p.id
-                    AND t.status NOT IN ('done', 'completed')
-                    AND t.due_date < date('now')
-                    AND t.due_date >= '2026-01-01') as overdue_count,
-                   (SELECT COUNT(*) FROM tasks t
-                    WHERE t.project_id = p.id
-                    AND t.status NOT IN ('done', 'completed')) as active_count
-            FROM projects p
-            WHERE p.client_id = ? AND p.is_internal = 0 AND p.status = 'active'
-        """,
-            (client_id,),
-        )
+        frame = self._frame(client_id)
+        projects = frame.active_projects
 
         if not projects:
             # No delivery data - check if internal only
-            internal = self._query_one(
-                """
-                SELECT COUNT(*) as c FROM projects WHERE client_id = ? AND is_internal = 1
-            """,
-                (client_id,),
-            )
-            if internal and internal["c"] > 0:
+            if frame.has_internal_projects:
                 return DomainScore(100.0, Confidence.HIGH, [])
             # Unknown delivery
             return DomainScore(100.0, Confidence.MED, ["No linked projects"])
@@ -396,7 +615,6 @@ class Client360Page10Engine:
 
         for p in projects:
             overdue = p.get("overdue_count", 0)
-            p.get("active_count", 0)
 
             # Determine project status (RED/YELLOW/GREEN)
             if overdue >= 3:
@@ -433,32 +651,18 @@ class Client360Page10Engine:
         """
         why_low = []
 
-        # Get valid AR by bucket
-        ar_data = self._query_one(
-            """
-            SELECT
-                COALESCE(SUM(CASE WHEN aging_bucket = 'current' THEN amount ELSE 0 END), 0) as current,
-                COALESCE(SUM(CASE WHEN aging_bucket IN ('1-30', '31-60') THEN amount ELSE 0 END), 0) as moderate,
-                COALESCE(SUM(CASE WHEN aging_bucket IN ('61-90', '90+') THEN amount ELSE 0 END), 0) as severe,
-                COALESCE(SUM(amount), 0) as total
-            FROM invoices
-            WHERE client_id = ?
-            AND status IN ('sent', 'overdue')
-            AND payment_date IS NULL
-
-        """,
-            (client_id,),
-        )
+        # Valid AR by bucket
+        frame = self._frame(client_id)
 
-        if not ar_data or ar_data["total"] == 0:
+        if frame.ar_total == 0:
             # No AR = healthy
             conf, conf_why = self._compute_confidence("cash")
             return DomainScore(100.0, conf, conf_why)
 
-        total = ar_data["total"]
-        current_pct = ar_data["current"] / total if total > 0 else 1.0
-        moderate_pct = ar_data["moderate"] / total if total > 0 else 0.0
-        severe_pct = ar_data["severe"] / total if total > 0 else 0.0
+        total = frame.ar_total
+        current_pct = frame.ar_current / total if total > 0 else 1.0
+        moderate_pct = frame.ar_moderate / total if total > 0 else 0.0
+        severe_pct = frame.ar_severe / total if total > 0 else 0.0
 
         # Formula: 100*current + 50*moderate + 0*severe
         score = 100 * current_pct + 50 * moderate_pct + 0 * severe_pct
@@ -482,23 +686,8 @@ class Client360Page10Engine:
         why_low = []
 
         # Get high-risk comm threads for client
-        # Note: communications table has no client_id, using subject match instead
-        threads = self._query_all(
-            """
-            SELECT
-                c.id,
-                c.subject,
-                (julianday('now') - julianday(c.received_at)) * 24 as age_hours,
-                c.response_deadline as expected_response_by,
-                c.requires_response
-            FROM communications c
-            WHERE c.processed = 0
-            AND c.requires_response = 1
-            ORDER BY c.received_at DESC
-            LIMIT 5
-        """,
-            (),
-        )
+        # Note: communications table has no client_id, so threads are shared
+        threads = self._get_comm_threads()
 
         if not threads:
             # No comms data - could be fine or missing
@@ -542,19 +731,7 @@ class Client360Page10Engine:
         why_low = []
 
         # Get commitments (no client_id in table, using all open commitments)
-        commitments = self._query_all(
-            """
-            SELECT
-                commitment_id as id,
-                status,
-                due_at as deadline,
-                (julianday(due_at) - julianday('now')) as days_to_deadline
-            FROM commitments
-            WHERE status NOT IN ('fulfilled', 'closed')
-            LIMIT 10
-        """,
-            (),
-        )
+        commitments = self._get_open_commitments()
 
         if not commitments:
             conf, conf_why = self._compute_confidence("commitments")
@@ -633,52 +810,18 @@ class Client360Page10Engine:
         - Tier weighting: A +0.2, B +0.1, C +0.0
         - Optional: retainer flag
         """
-        # Get client tier
-        client = self._query_one("SELECT tier FROM clients WHERE id = ?", (client_id,))
-        tier = client.get("tier", "C") if client else "C"
-        tier_bonus = {"A": 0.2, "B": 0.1, "C": 0.0}.get(tier, 0.0)
-
-        # Get valid AR total
-        ar = self._query_one(
-            """
-            SELECT COALESCE(SUM(amount), 0) as total
-            FROM invoices
-            WHERE client_id = ?
-            AND status IN ('sent', 'overdue')
-            AND payment_date IS NULL
+        frame = self._frame(client_id)
 
-        """,
-            (client_id,),
-        )
-        ar_total = ar.get("total", 0) if ar else 0
-
-        # Get max AR across all clients for normalization
-        max_ar = (
-            self._query_scalar("""
-            SELECT MAX(total) FROM (
-                SELECT client_id, SUM(amount) as total
-                FROM invoices
-                WHERE status IN ('sent', 'overdue')
-                AND payment_date IS NULL
-
-                GROUP BY client_id
-            )
-        """)
-            or 1
-        )
+        # Client tier
+        tier = frame.tier if frame.exists else "C"
+        tier_bonus = {"A": 0.2, "B": 0.1, "C": 0.0}.get(tier, 0.0)
 
-        ar_normalized = ar_total / max_ar if max_ar > 0 else 0
+        # Valid AR total, normalized by the max AR across all clients
+        max_ar = self._get_max_ar()
+        ar_normalized = frame.ar_total / max_ar if max_ar > 0 else 0
 
-        # Check for active retainer
-        retainer = self._query_one(
-            """
-            SELECT 1 FROM projects
-            WHERE client_id = ? AND type = 'retainer' AND status = 'active'
-            LIMIT 1
-        """,
-            (client_id,),
-        )
-        retainer_bonus = 0.1 if retainer else 0
+        # Active retainer
+        retainer_bonus = 0.1 if frame.has_active_retainer else 0
 
         value = ar_normalized * 0.5 + tier_bonus + retainer_bonus
         return max(0.0, min(1.0, value))
@@ -732,19 +875,7 @@ class Client360Page10Engine:
 
     def get_severe_ar_total(self, client_id: str) -> float:
         """Get severe AR total (61+) per §6.3."""
-        result = self._query_one(
-            """
-            SELECT COALESCE(SUM(amount), 0) as total
-            FROM invoices
-            WHERE client_id = ?
-            AND aging_bucket IN ('61-90', '90+')
-            AND status IN ('sent', 'overdue')
-            AND payment_date IS NULL
-
-        """,
-            (client_id,),
-        )
-        return result.get("total", 0) if result else 0
+        return self._frame(client_id).ar_severe
 
     # ==========================================================================
     # PORTFOLIO (§3 Zone C)
@@ -752,40 +883,28 @@ class Client360Page10Engine:
 
     def get_eligible_clients(self) -> list[str]:
         """Get eligible clients (linked, non-internal)."""
-        rows = self._query_all("""
-            SELECT DISTINCT c.id
-            FROM clients c
-            WHERE EXISTS (
-                SELECT 1 FROM projects p
-                WHERE p.client_id = c.id
-                AND p.is_internal = 0
-            )
-            OR EXISTS (
-                SELECT 1 FROM invoices i
-                WHERE i.client_id = c.id
-
-            )
-        """)
+        rows = self._query_all(_ELIGIBLE_CLIENTS_SQL)
         return [r["id"] for r in rows]
 
     def build_portfolio(self) -> list[ClientPortfolioItem]:
-        """Build portfolio heatstrip per Zone C (max 25)."""
+        """
+        Build portfolio heatstrip per Zone C (max 25).
+
+        Score inputs for every client are loaded up front with grouped queries
+        (see _load_frames), so the per-client loop does no I/O.
+        """
         client_ids = self.get_eligible_clients()
+        self._load_frames()
         items = []
 
         for cid in client_ids:
-            client = self._query_one(
-                """
-                SELECT id, name, tier FROM clients WHERE id = ?
-            """,
-                (cid,),
-            )
-            if not client:
+            frame = self._frame(cid)
+            if not frame.exists:
                 continue
 
             breakdown, health = self.compute_health_score(cid)
             value = self.compute_value_score(cid)
-            tier = client.get("tier", "C") or "C"
+            tier = frame.tier or "C"
             posture = self.determine_posture(health, value, tier)
             top_driver = self.determine_top_driver(breakdown)
             severe_ar = self.get_severe_ar_total(cid)
@@ -797,7 +916,7 @@ class Client360Page10Engine:
             items.append(
                 ClientPortfolioItem(
                     client_id=cid,
-                    client_name=client.get("name", ""),
+                    client_name=frame.name,
                     tier=tier,
                     health_score=round(health, 1),
                     posture=posture,
@@ -830,41 +949,19 @@ class Client360Page10Engine:
 
     def _get_next_break_at(self, client_id: str) -> str | None:
         """Get ISO timestamp of next consequence."""
-        # Check overdue tasks
-        task = self._query_one(
-            """
-            SELECT MIN(due_date) as next
-            FROM tasks t
-            JOIN projects p ON t.project_id = p.id
-            WHERE p.client_id = ?
-            AND t.status NOT IN ('done', 'completed')
-            AND t.due_date >= date('now')
-            AND t.due_date >= '2026-01-01'
-        """,
-            (client_id,),
-        )
+        frame = self._frame(client_id)
 
-        if task and task.get("next"):
-            next_val = task["next"]
+        # Check upcoming task due dates
+        if frame.next_task_due:
+            next_val = frame.next_task_due
             # Only append time if not already present
             if "T" not in next_val:
                 next_val += "T23:59:59"
             return next_val
 
         # Check commitment deadlines
-        commit = self._query_one(
-            """
-            SELECT MIN(deadline) as next
-            FROM commitments
-            WHERE client_id = ?
-            AND status = 'open'
-            AND deadline >= date('now')
-        """,
-            (client_id,),
-        )
-
-        if commit and commit.get("next"):
-            return commit["next"]
+        if frame.next_commitment_deadline:
+            return frame.next_commitment_deadline
 
         return None
 
@@ -1051,11 +1148,15 @@ class Client360Page10Engine:
         """Generate triage moves for unlinked clients/comms."""
         moves = []
 
-        # Check for unlinked comms
+        # Check for unlinked comms. Client360 counts identity-linked mail only
+        # (attribution method 'linked'), never a client name in the subject.
         unlinked = self._query_all("""
             SELECT id, subject, from_email as from_address
             FROM communications
-            WHERE client_id IS NULL
+            WHERE id NOT IN (
+                SELECT communication_id FROM communication_client_attribution
+                WHERE method = 'linked'
+            )
             AND processed = 0
             ORDER BY received_at DESC
             LIMIT 3
@@ -1511,7 +1612,10 @@ class Client360Page10Engine:
                     ELSE 'LOW'
                 END as risk
             FROM communications
-            WHERE client_id = ?
+            WHERE id IN (
+                SELECT communication_id FROM communication_client_attribution
+                WHERE client_id = ? AND method = 'linked'
+            )
             AND processed = 0
             ORDER BY received_at DESC
             LIMIT ?
@@ -1937,7 +2041,10 @@ class Client360Page10Engine:
                     )
                 ) as overdue
             FROM communications
-            WHERE client_id = ?
+            WHERE id IN (
+                SELECT communication_id FROM communication_client_attribution
+                WHERE client_id = ? AND method = 'linked'
+            )
         """,
             (client_id,),
         )
@@ -1952,7 +2059,10 @@ class Client360Page10Engine:
                     OR COALESCE(age_hours, (julianday('now') - julianday(received_at)) * 24) > 72
                 ) THEN 1 ELSE 0 END) as overdue
             FROM communications
-            WHERE client_id = ?
+            WHERE id IN (
+                SELECT communication_id FROM communication_client_attribution
+                WHERE client_id = ? AND method = 'linked'
+            )
         """,
             (client_id,),
         )
@@ -1972,7 +2082,10 @@ class Client360Page10Engine:
                 CASE WHEN expected_response_by IS NOT NULL
                      AND datetime(expected_response_by) < datetime('now') THEN 1 ELSE 0 END as sla_breach
             FROM communications
-            WHERE client_id = ?
+            WHERE id IN (
+                SELECT communication_id FROM communication_client_attribution
+                WHERE client_id = ? AND method = 'linked'
+            )
             AND processed = 0
             ORDER BY received_at DESC
             LIMIT 7
@@ -2210,7 +2323,10 @@ class Client360Page10Engine:
             """
             SELECT COUNT(*) as cnt
             FROM communications
-            WHERE client_id = ?
+            WHERE id IN (
+                SELECT communication_id FROM communication_client_attribution
+                WHERE client_id = ? AND method = 'linked'
+            )
             AND received_at >= datetime('now', '-24 hours')
         """,
             (client_id,),
@@ -16,6 +16,7 @@ from typing import Any
 
 from lib import paths
 from lib.compat import StrEnum
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -220,7 +221,7 @@ class CommsCommitmentsPage11Engine:
         self._commitments_cache: dict[str, CommitmentUnit] = {}
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -330,8 +331,8 @@ class CommsCommitmentsPage11Engine:
             SELECT
                 COALESCE(thread_id, id) as thread_id,
                 MAX(id) as latest_id,
-                MAX(client_id) as client_id,
-                MAX(subject) as subject,
+                MAX(a.client_id) as client_id,
+                MAX(communications.subject) as subject,
                 MAX(from_email) as from_email,
                 MAX(from_domain) as from_domain,
                 MAX(from_name) as from_name,
@@ -347,6 +348,7 @@ class CommsCommitmentsPage11Engine:
                 COUNT(*) as msg_count,
                 GROUP_CONCAT(id) as evidence_ids
             FROM communications
+            LEFT JOIN communication_client_attribution a ON a.communication_id = communications.id
             WHERE processed = 0 OR received_at > datetime('now', '-7 days')
             GROUP BY COALESCE(thread_id, id)
             ORDER BY last_received_at DESC
@@ -11,6 +11,7 @@ from enum import Enum
 from pathlib import Path
 
 from lib import paths
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -113,7 +114,7 @@ class ConfidenceModel:
         self.db_path = db_path or paths.db_path()
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
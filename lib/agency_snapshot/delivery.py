@@ -12,6 +12,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from lib.db import open_connection
+
 from .. import safe_sql
 from .scoring import Confidence, Domain, ScoredItem, clamp01
 
@@ -143,7 +145,7 @@ class DeliveryEngine:
         self.now = datetime.now(timezone.utc)
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from lib import paths
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +35,7 @@ class DeltaTracker:
         self.SNAPSHOT_HISTORY_PATH.mkdir(parents=True, exist_ok=True)
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -28,8 +28,9 @@ from lib.contracts import (
     enforce_thresholds_strict,
 )
 from lib.contracts.predicates import NormalizedData
-from lib.contracts.schema import SCHEMA_VERSION
+from lib.contracts.schema import SCHEMA_VERSION, partial_snapshot_contract
 from lib.contracts.thresholds import ResolutionStats
+from lib.db import open_connection
 
 from .capacity_command_page7 import CapacityCommandPage7Engine
 from .confidence import ConfidenceModel, TrustState
@@ -45,6 +46,7 @@ from .scoring import (
     clamp01,
     rank_items,
 )
+from .section_memo import SectionMemo, sidecar_path
 
 logger = logging.getLogger(__name__)
 
@@ -107,8 +109,13 @@ class AgencySnapshotGenerator:
         self._trust: TrustState | None = None
         self._drawers: dict[str, dict] = {}
 
+        # Section memoisation (see section_memo.py). Sections built from a
+        # fallback path are not recorded, so a transient failure is retried.
+        self._degraded_sections: set[str] = set()
+        self._section_fingerprints: dict[str, str] = {}
+
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -164,22 +171,27 @@ class AgencySnapshotGenerator:
             SELECT
                 cmt.commitment_id, cmt.commitment_text as content,
                 cmt.scope_ref_type, cmt.scope_ref_id,
-                c.id as resolved_client_id,
+                (
+                    SELECT a.client_id
+                    FROM communications m
+                    JOIN communication_client_attribution a ON a.communication_id = m.id
+                    WHERE m.thread_id = cmt.scope_ref_id
+                    AND a.client_id IS NOT NULL
+                    LIMIT 1
+                ) as resolved_client_id,
                 cmt.due_at as due_date, cmt.status
             FROM commitments cmt
-            LEFT JOIN communications m ON cmt.scope_ref_id = m.thread_id
-            LEFT JOIN clients c ON m.subject LIKE '%' || c.name || '%'
             WHERE cmt.status NOT IN ('fulfilled', 'closed')
         """)
 
-        # Communications with client resolution via subject matching
-        # Schema lacks client_id, so we resolve via subject LIKE client.name
+        # Communications with client resolution from the pre-resolved
+        # attribution table (identity link, else client name in subject)
         communications = self._query_all("""
             SELECT
                 m.id, m.subject, m.from_email, m.created_at, m.received_at,
-                c.id as client_id
+                a.client_id
             FROM communications m
-            LEFT JOIN clients c ON m.subject LIKE '%' || c.name || '%'
+            LEFT JOIN communication_client_attribution a ON a.communication_id = m.id
             WHERE m.received_at IS NOT NULL OR m.created_at IS NOT NULL
         """)
 
@@ -260,7 +272,7 @@ class AgencySnapshotGenerator:
         """
         return os.environ.get("MOH_TIME_OS_ENV", "current_data_model")
 
-    def generate(self) -> dict:
+    def generate(self, incremental: bool = True) -> dict:
         """
         Generate complete agency snapshot with multi-layer validation.
 
@@ -270,9 +282,14 @@ class AgencySnapshotGenerator:
         3. Validate (predicates → invariants → thresholds → schema)
         4. Emit
 
+        With incremental=True, page sections whose source tables are unchanged
+        since the previous saved snapshot are reused from it and skip schema
+        revalidation. incremental=False rebuilds every section.
+
         Violations RAISE - no logging-only paths.
         """
         started_at = datetime.now(timezone.utc)
+        self._degraded_sections = set()
 
         # Get trust state first (needed for gating)
         self._trust = self.confidence_model.get_trust_state()
@@ -307,26 +324,57 @@ class AgencySnapshotGenerator:
         # =========================================================
         # STEP 2: Build full snapshot
         # =========================================================
+        prev_snapshot = self._load_previous_snapshot()
+        memo = None
+        if incremental:
+            memo = SectionMemo(
+                self.db_path,
+                context={
+                    "mode": self.mode.value,
+                    "horizon": self.horizon.value,
+                    "scope": self.scope,
+                    "data_integrity": self._trust.data_integrity,
+                },
+                previous_snapshot=prev_snapshot,
+                previous_path=self._snapshot_path(),
+                now=started_at,
+            )
+
         # Note: Using minimal implementations until page engines are schema-fixed
         snapshot["narrative"] = self._build_narrative_minimal()
         snapshot["tiles"] = self._build_tiles_minimal()
-        snapshot["heatstrip_projects"] = self._build_heatstrip_minimal(normalized)
+        section_builders = {
+            "heatstrip_projects": self._build_heatstrip_minimal,
+            "delivery_command": self._build_delivery_command_minimal,
+            "client_360": self._build_client_360_minimal,
+            "cash_ar": self._build_cash_ar_minimal,
+            "comms_commitments": self._build_comms_commitments_minimal,
+            "capacity_command": self._build_capacity_command_minimal,
+        }
+        reused = set()
+        for section, build in section_builders.items():
+            cached = memo.reusable(section) if memo else None
+            if cached is not None:
+                snapshot[section] = cached
+                reused.add(section)
+                continue
+            snapshot[section] = build(normalized)
+            if memo and section not in self._degraded_sections:
+                memo.record(section)
         snapshot["constraints"] = []
         snapshot["exceptions"] = []
-        snapshot["delivery_command"] = self._build_delivery_command_minimal(normalized)
-        snapshot["client_360"] = self._build_client_360_minimal(normalized)
-        snapshot["cash_ar"] = self._build_cash_ar_minimal(normalized)
-        snapshot["comms_commitments"] = self._build_comms_commitments_minimal(normalized)
-        snapshot["capacity_command"] = self._build_capacity_command_minimal(normalized)
         snapshot["drawers"] = self._drawers
+        self._section_fingerprints = memo.fingerprints if memo else {}
+
+        if reused:
+            logger.info(f"Reused unchanged snapshot sections: {', '.join(sorted(reused))}")
 
         snapshot["meta"]["finished_at"] = datetime.now(timezone.utc).isoformat()
         snapshot["meta"]["duration_ms"] = (
             datetime.now(timezone.utc) - started_at
         ).total_seconds() * 1000
 
-        # Compute deltas BEFORE patchwork boundary (load previous snapshot if exists)
-        prev_snapshot = self._load_previous_snapshot()
+        # Compute deltas BEFORE patchwork boundary
         if prev_snapshot:
             snapshot["meta"]["deltas"] = self._compute_deltas_with_previous(snapshot, prev_snapshot)
         else:
@@ -353,9 +401,13 @@ class AgencySnapshotGenerator:
         logger.info(f"Running threshold gate (env={env})...")
         enforce_thresholds_strict(stats, env)
 
-        # Gate 4: Schema validation (shape)
+        # Gate 4: Schema validation (shape). Reused sections already passed
+        # this gate when they were built.
         logger.info("Running schema validation...")
-        validated = AgencySnapshotContract.model_validate(snapshot)
+        if reused:
+            validated = partial_snapshot_contract(frozenset(reused)).model_validate(snapshot)
+        else:
+            validated = AgencySnapshotContract.model_validate(snapshot)
 
         logger.info("All validation gates passed.")
 
@@ -1510,6 +1562,7 @@ class AgencySnapshotGenerator:
             }
         except (sqlite3.Error, ValueError, OSError) as e:
             logger.warning(f"Client360Page10Engine.generate() failed: {e}, using minimal data")
+            self._degraded_sections.add("client_360")
             portfolio = []
             for client in normalized.clients[:25]:
                 tier = client.get("tier")
@@ -1536,6 +1589,7 @@ class AgencySnapshotGenerator:
             return self._build_cash_ar()
         except (sqlite3.Error, ValueError, OSError) as e:
             logger.warning(f"CashARPage12Engine.generate() failed: {e}, using minimal data")
+            self._degraded_sections.add("cash_ar")
             total_ar = sum(inv.get("amount", 0) for inv in normalized.invoices)
             severe_ar = sum(
                 inv.get("amount", 0)
@@ -1605,6 +1659,7 @@ class AgencySnapshotGenerator:
             logger.warning(
                 f"CommsCommitmentsPage11Engine.generate() failed: {e}, using minimal data"
             )
+            self._degraded_sections.add("comms_commitments")
             threads = []
             for comm in normalized.communications[:10]:
                 threads.append(
@@ -1649,6 +1704,7 @@ class AgencySnapshotGenerator:
             people_overview_raw = self.capacity_engine.build_people_overview()
         except (sqlite3.Error, ValueError, OSError) as e:
             logger.warning(f"CapacityCommandPage7Engine.build_people_overview() failed: {e}")
+            self._degraded_sections.add("capacity_command")
 
         # Convert PersonData objects to dicts if we got them
         if people_overview_raw and hasattr(people_overview_raw[0], "__dict__"):
@@ -1703,9 +1759,12 @@ class AgencySnapshotGenerator:
             "drawer": {},
         }
 
+    def _snapshot_path(self) -> Path:
+        return _output_path() / "agency_snapshot.json"
+
     def _load_previous_snapshot(self) -> dict | None:
         """Load previous snapshot if it exists."""
-        prev_path = _output_path() / "agency_snapshot.json"
+        prev_path = self._snapshot_path()
 
         if not prev_path.exists():
             return None
@@ -1719,12 +1778,23 @@ class AgencySnapshotGenerator:
 
     def save(self, snapshot: dict, path: Path = None) -> Path:
         """Save snapshot to file and history."""
-        path = path or _output_path() / "agency_snapshot.json"
+        path = path or self._snapshot_path()
         path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(path, "w") as f:
             json.dump(snapshot, f, indent=2, default=str)
 
+        # Section fingerprints for the next incremental generate(); empty when
+        # this generator did not build the snapshot, which disables reuse.
+        with open(sidecar_path(path), "w") as f:
+            json.dump(
+                {
+                    "generated_at": snapshot.get("meta", {}).get("generated_at"),
+                    "fingerprints": self._section_fingerprints,
+                },
+                f,
+            )
+
         # Save to history for delta tracking
         from .deltas import DeltaTracker
 
@@ -0,0 +1,173 @@
+"""
+Section Memo - Reuse unchanged agency snapshot sections between runs.
+
+Each memoised section is keyed on a fingerprint of the source tables it reads
+(row count, highest rowid and latest updated_at/created_at per table), the
+generator's mode/horizon/scope/data_integrity and an hourly clock bucket. When
+the fingerprint matches the one recorded next to the previous snapshot on disk,
+that snapshot's section is reused instead of being rebuilt and revalidated.
+
+The clock bucket bounds staleness from writes that do not touch updated_at and
+keeps the time-windowed metrics (24h counts, overdue ages) moving.
+
+Fingerprints live in a sidecar file (agency_snapshot.sections.json) written by
+AgencySnapshotGenerator.save(), tagged with the snapshot's generated_at so a
+snapshot written without fingerprints never has its sections reused.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from lib.db import open_connection
+
+logger = logging.getLogger(__name__)
+
+# Tables lib.gates.evaluate_gates() reads; engines that call it see their results.
+_GATE_TABLES = (
+    "projects",
+    "brands",
+    "clients",
+    "tasks",
+    "communications",
+    "invoices",
+    "capacity_lanes",
+)
+
+# Source tables per memoised section.
+SECTION_SOURCES: dict[str, tuple[str, ...]] = {
+    "heatstrip_projects": ("projects",),
+    "delivery_command": ("projects", "tasks", "clients"),
+    "client_360": (
+        *_GATE_TABLES,
+        "communication_client_attribution",
+        "commitments",
+        "client_health_log",
+    ),
+    "cash_ar": _GATE_TABLES,
+    "comms_commitments": (
+        *_GATE_TABLES,
+        "communication_client_attribution",
+        "commitments",
+        "cost_snapshots",
+    ),
+    "capacity_command": (
+        "tasks",
+        "projects",
+        "capacity_lanes",
+        "team_members",
+        "team_capacity",
+        "events",
+    ),
+}
+
+# Bump when a section builder's output changes for the same inputs.
+MEMO_VERSION = 1
+
+# Sections are rebuilt at least once per bucket even when no input moved.
+CLOCK_BUCKET_SECONDS = 3600
+
+
+def sidecar_path(snapshot_path: Path) -> Path:
+    """Fingerprint sidecar stored next to *snapshot_path*."""
+    return snapshot_path.with_name(f"{snapshot_path.stem}.sections.json")
+
+
+def table_watermark(conn: sqlite3.Connection, table: str) -> list | None:
+    """(count, max rowid, latest updated_at/created_at) for *table*, None if missing."""
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info([{table}])")}
+    if not columns:
+        return None
+    stamps = [c for c in ("updated_at", "created_at") if c in columns]
+    if len(stamps) == 2:
+        latest = "MAX(COALESCE(updated_at, created_at))"
+    elif stamps:
+        latest = f"MAX({stamps[0]})"
+    else:
+        latest = "NULL"
+    try:
+        row = conn.execute(
+            f"SELECT COUNT(*), MAX(rowid), {latest} FROM [{table}]"  # noqa: S608 — table names from SECTION_SOURCES
+        ).fetchone()
+    except sqlite3.OperationalError:
+        # WITHOUT ROWID tables
+        row = conn.execute(f"SELECT COUNT(*), NULL, {latest} FROM [{table}]").fetchone()  # noqa: S608
+    return list(row)
+
+
+class SectionMemo:
+    """
+    Fingerprints for one snapshot run and the sections reusable from the last one.
+
+    Missing or unreadable state degrades to rebuilding every section.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        context: dict,
+        previous_snapshot: dict | None,
+        previous_path: Path,
+        now: datetime,
+    ):
+        self.context = context
+        self.clock = int(now.timestamp()) // CLOCK_BUCKET_SECONDS
+        self.fingerprints: dict[str, str] = {}
+        self._previous = previous_snapshot or {}
+        self._stored = self._load_stored(previous_path)
+
+        tables = sorted({t for sources in SECTION_SOURCES.values() for t in sources})
+        conn = open_connection(str(db_path))
+        try:
+            self._watermarks = {t: table_watermark(conn, t) for t in tables}
+        except sqlite3.Error as e:
+            logger.warning(f"Snapshot section watermarks unavailable, rebuilding all: {e}")
+            self._watermarks = None
+        finally:
+            conn.close()
+
+    def _load_stored(self, previous_path: Path) -> dict:
+        path = sidecar_path(previous_path)
+        if not self._previous or not path.exists():
+            return {}
+        try:
+            with open(path) as f:
+                stored = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not load snapshot section fingerprints: {e}")
+            return {}
+        # Only trust fingerprints written for the snapshot actually on disk.
+        if stored.get("generated_at") != self._previous.get("meta", {}).get("generated_at"):
+            return {}
+        return stored.get("fingerprints", {})
+
+    def fingerprint(self, section: str) -> str | None:
+        """Input fingerprint for *section*, None when it cannot be memoised."""
+        if self._watermarks is None or section not in SECTION_SOURCES:
+            return None
+        inputs = {
+            "version": MEMO_VERSION,
+            "section": section,
+            "clock": self.clock,
+            "context": self.context,
+            "tables": {t: self._watermarks[t] for t in SECTION_SOURCES[section]},
+        }
+        payload = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def reusable(self, section: str):
+        """The previous snapshot's *section* if its inputs are unchanged, else None."""
+        fp = self.fingerprint(section)
+        if fp is None or self._stored.get(section) != fp or section not in self._previous:
+            return None
+        self.fingerprints[section] = fp
+        return self._previous[section]
+
+    def record(self, section: str) -> None:
+        """Mark a freshly built *section* as reusable on the next run."""
+        fp = self.fingerprint(section)
+        if fp is not None:
+            self.fingerprints[section] = fp
@@ -19,6 +19,7 @@ from pathlib import Path
 from typing import Any
 
 from lib import paths
+from lib.db import open_connection
 
 from .gates import GateEvaluator
 
@@ -55,7 +56,7 @@ class SnapshotAggregator:
         self._gates_cache = None
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -11,6 +11,8 @@ Monitors:
 import json
 from datetime import datetime, timedelta, timezone
 
+from .score_sink import ScoreSink
+
 
 class AnomalyDetector:
     """Detects anomalies and unusual patterns that need attention."""
@@ -413,18 +415,25 @@ class AnomalyDetector:
 
     def save_anomaly(self, anomaly: dict):
         """Persist anomaly to database for tracking."""
-        self.store.insert(
-            "insights",
-            {
-                "id": f"anomaly_{anomaly['type']}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
-                "type": "anomaly",
-                "source": "anomaly_detector",
-                "title": anomaly["message"],
-                "data": json.dumps(anomaly),
-                "priority": {"critical": 100, "high": 80, "medium": 50, "low": 20}.get(
-                    anomaly["severity"], 50
-                ),
-                "status": "active",
-                "created_at": datetime.now(timezone.utc).isoformat(),
-            },
-        )
+        self.save_anomalies([anomaly])
+
+    def save_anomalies(self, anomalies: list[dict]) -> int:
+        """Persist several anomalies in one transaction. Returns rows written."""
+        sink = ScoreSink(self.store)
+        for anomaly in anomalies:
+            sink.insert(
+                "insights",
+                {
+                    "id": f"anomaly_{anomaly['type']}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
+                    "type": "anomaly",
+                    "source": "anomaly_detector",
+                    "title": anomaly["message"],
+                    "data": json.dumps(anomaly),
+                    "priority": {"critical": 100, "high": 80, "medium": 50, "low": 20}.get(
+                        anomaly["severity"], 50
+                    ),
+                    "status": "active",
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                },
+            )
+        return sink.flush().inserted
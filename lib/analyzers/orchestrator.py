@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from .anomaly import AnomalyDetector
 from .patterns import PatternAnalyzer
 from .priority import PriorityAnalyzer
+from .score_sink import ScoreSink
 from .time import TimeAnalyzer
 
 
@@ -285,7 +286,8 @@ class AnalyzerOrchestrator:
 
     def save_analysis(self, analysis: dict):
         """Save analysis results to database."""
-        self.store.insert(
+        sink = ScoreSink(self.store)
+        sink.insert(
             "insights",
             {
                 "id": f"analysis_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
@@ -298,3 +300,4 @@ class AnalyzerOrchestrator:
                 "created_at": datetime.now(timezone.utc).isoformat(),
             },
         )
+        sink.flush()
@@ -14,6 +14,8 @@ import yaml
 from lib import paths
 
 from ..state_store import StateStore, get_store
+from . import priority_queue
+from .score_sink import ScoreSink
 
 logger = logging.getLogger(__name__)
 
@@ -55,53 +57,13 @@ class PriorityAnalyzer:
         """
         Compute priority queue across all actionable items.
         Returns sorted list of items with scores and reasons.
-        """
-        items = []
-
-        # Get all pending tasks
-        tasks = self.store.query(
-            "SELECT * FROM tasks WHERE status NOT IN ('completed', 'done', 'cancelled')"
-        )
-
-        for task in tasks:
-            score, reasons = self._score_task(dict(task))
-            items.append(
-                {
-                    "type": "task",
-                    "id": task["id"],
-                    "source_id": task.get("source_id"),
-                    "title": task["title"],
-                    "score": score,
-                    "due": task.get("due_date"),
-                    "project": task.get("project"),
-                    "assignee": task.get("assignee"),
-                    "source": task["source"],
-                    "status": task["status"],
-                    "reasons": reasons,
-                }
-            )
-
-        # Get emails needing response
-        emails = self.store.query(
-            "SELECT * FROM communications WHERE requires_response = 1 AND processed = 0"
-        )
 
-        for email in emails:
-            score, reasons = self._score_email(dict(email))
-            items.append(
-                {
-                    "type": "email",
-                    "id": email["id"],
-                    "source_id": email.get("source_id"),
-                    "title": email.get("subject", "(no subject)"),
-                    "score": score,
-                    "due": email.get("response_deadline"),
-                    "from": email.get("from_email"),
-                    "source": "email",
-                    "sentiment": email.get("sentiment"),
-                    "reasons": reasons,
-                }
-            )
+        Also rewrites the stored priority_queue table read by /api/overview
+        and /api/priorities[/advanced] (see priority_queue.py). Run by the
+        daemon's "priorities" stage.
+        """
+        scored = self._score_rows(changed_only=False)
+        items = [item for item, _, _ in scored]
 
         # Sort by score descending
         items.sort(key=lambda x: x["score"], reverse=True)
@@ -109,11 +71,106 @@ class PriorityAnalyzer:
         # Update priority scores in DB
         self._update_stored_scores(items)
 
+        # Persist for SQL filtering and paging
+        self.store.transaction(lambda conn: priority_queue.write_items(conn, scored, replace=True))
+
         # Store in cache for quick access
         self.store.set_cache("priority_queue", items)
 
         return items
 
+    def sync_queue(self, limit: int | None = None) -> dict:
+        """
+        Incrementally update the stored priority_queue table.
+
+        Rescores only items that are new or whose scoring inputs changed since
+        their row was written, and drops items that were closed. Scores are not
+        written back to tasks/communications; analyze() does that.
+
+        Args:
+            limit: Rescore at most this many tasks and emails each, and remove
+                at most this many closed items; "more" tells whether any were
+                left for the next call.
+
+        Returns:
+            {"rescored": int, "removed": int, "more": bool}
+        """
+        scored = self._score_rows(changed_only=True, limit=limit)
+        closed = [
+            (row["item_type"], row["item_id"])
+            for row in self.store.query(priority_queue.closed_items_sql(limit))
+        ]
+        more = limit is not None and (
+            len(closed) >= limit
+            or any(
+                sum(1 for item, _, _ in scored if item["type"] == kind) >= limit
+                for kind in (priority_queue.TASK, priority_queue.EMAIL)
+            )
+        )
+        removed = 0
+        if scored or closed:
+
+            def write(conn):
+                priority_queue.write_items(conn, scored)
+                return priority_queue.remove_items(conn, closed)
+
+            removed = self.store.transaction(write)
+            logger.info(f"Priority queue sync: {len(scored)} rescored, {removed} removed")
+        return {"rescored": len(scored), "removed": removed, "more": more}
+
+    def _score_rows(
+        self, changed_only: bool, limit: int | None = None
+    ) -> list[tuple[dict, str, object]]:
+        """(item, input_sig, tags) for open tasks and emails needing a response."""
+        scored = []
+
+        # Get all pending tasks
+        for task in self.store.query(
+            priority_queue.source_rows_sql(priority_queue.TASK, changed_only, limit)
+        ):
+            sig = task.pop("input_sig")
+            scored.append((self._task_item(task), sig, task.get("tags")))
+
+        # Get emails needing response
+        for email in self.store.query(
+            priority_queue.source_rows_sql(priority_queue.EMAIL, changed_only, limit)
+        ):
+            sig = email.pop("input_sig")
+            scored.append((self._email_item(email), sig, None))
+
+        return scored
+
+    def _task_item(self, task: dict) -> dict:
+        score, reasons = self._score_task(task)
+        return {
+            "type": "task",
+            "id": task["id"],
+            "source_id": task.get("source_id"),
+            "title": task["title"],
+            "score": score,
+            "due": task.get("due_date"),
+            "project": task.get("project"),
+            "assignee": task.get("assignee"),
+            "source": task["source"],
+            "status": task["status"],
+            "reasons": reasons,
+        }
+
+    def _email_item(self, email: dict) -> dict:
+        score, reasons = self._score_email(email)
+        return {
+            "type": "email",
+            "id": email["id"],
+            "source_id": email.get("source_id"),
+            "title": email.get("subject", "(no subject)"),
+            "score": score,
+            "due": email.get("response_deadline"),
+            "from": email.get("from_email"),
+            "source": "email",
+            "sentiment": email.get("sentiment"),
+            "reasons": reasons,
+        }
+
     def _score_task(self, task: dict) -> tuple[float, list[str]]:
         """
         Score a task with DIMINISHING RETURNS for very overdue items.
@@ -329,27 +386,29 @@ class PriorityAnalyzer:
 
         return round(min(100, max(0, score)), 2), reasons
 
-    def _update_stored_scores(self, items: list[dict]):
-        """Update priority scores in the database."""
+    def _update_stored_scores(self, items: list[dict]) -> int:
+        """
+        Update priority scores in the database.
+
+        Only rows whose stored priority / priority_reasons differ are written,
+        in one transaction. Returns the number of rows changed.
+        """
+        sink = ScoreSink(self.store)
+        tables = {"task": "tasks", "email": "communications"}
         for item in items:
-            if item["type"] == "task":
-                self.store.update(
-                    "tasks",
-                    item["id"],
-                    {
-                        "priority": int(item["score"]),
-                        "priority_reasons": json.dumps(item["reasons"]),
-                    },
-                )
-            elif item["type"] == "email":
-                self.store.update(
-                    "communications",
+            table = tables.get(item["type"])
+            if table:
+                sink.update(
+                    table,
                     item["id"],
                     {
                         "priority": int(item["score"]),
                         "priority_reasons": json.dumps(item["reasons"]),
                     },
                 )
+        result = sink.flush()
+        logger.info(f"Priority scores: {result.updated} changed, {result.unchanged} unchanged")
+        return result.updated
 
     def get_top_priorities(self, limit: int = 10, item_type: str = None) -> list[dict]:
         """Get top N priority items, optionally filtered by type."""
@@ -0,0 +1,407 @@
+"""
+Materialised priority queue.
+
+PriorityAnalyzer scores open tasks and emails needing a response; the scored
+items are persisted in priority_queue so readers can filter, sort and page
+them in indexed SQL instead of rescoring everything and slicing in Python.
+
+- PriorityAnalyzer.analyze() (the daemon's "priorities" stage, a full pass)
+  rewrites the table.
+- PriorityAnalyzer.sync_queue() is incremental: it rescores only items that
+  are new or whose scoring inputs changed since their row was written (the
+  row's input_sig is a json_array of those columns, compared in a join) and
+  drops items that were closed.
+- start_background_sync() runs a full sync_queue() off the request path when
+  the API starts, so a fresh deploy or a DB the daemon has not analysed yet is
+  populated in the background.
+- catch_up() runs a bounded sync_queue(limit=CATCH_UP_LIMIT) before a read
+  when a task or communication write was published, or the last sync is older
+  than SYNC_INTERVAL_SECONDS (writes from other processes are not published
+  here). A read never rescores more than that; anything left is picked up by
+  later reads, the background sync or the daemon's full pass.
+- search_queue() pushes the /api/priorities/advanced filters and sort into
+  SQL, with keyset pagination on (sort key, item_type, item_id) and signed
+  cursors from lib.api.pagination.
+
+Scores also drift with the clock (days until due, email age), project health
+and dependencies on other tasks; the next full pass picks those up.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from lib.api.pagination import InvalidCursor, decode_cursor, encode_cursor
+from lib.cache.invalidation import subscribe
+
+logger = logging.getLogger(__name__)
+
+TASK = "task"
+EMAIL = "email"
+
+# Sort key for items without a due date (last in ascending order).
+NO_DUE = "9999-99-99"
+
+SYNC_INTERVAL_SECONDS = 30.0
+
+# Most items of each kind a read request rescores or removes.
+CATCH_UP_LIMIT = 200
+
+# Columns whose change rescores an item in sync_queue(). priority is left out:
+# the analyzer writes its own score back into it.
+TASK_SIG_COLUMNS = (
+    "title",
+    "status",
+    "due_date",
+    "assignee",
+    "project",
+    "project_id",
+    "tags",
+    "dependencies",
+    "blockers",
+    "source",
+    "source_id",
+)
+EMAIL_SIG_COLUMNS = (
+    "subject",
+    "from_email",
+    "response_deadline",
+    "sentiment",
+    "labels",
+    "stakeholder_tier",
+    "is_vip",
+    "age_hours",
+    "created_at",
+    "source_id",
+)
+
+SORT_COLUMNS = {
+    "score": "score",
+    "due": "due_key",
+    "title": "title_key",
+    "assignee": "assignee_key",
+}
+
+_BATCH = 1000
+
+_QUEUE_SOURCES = frozenset({"tasks", "communications"})
+_stale = threading.Event()
+_stale.set()
+_last_sync = 0.0
+_sync_lock = threading.Lock()
+_subscribed = False
+
+
+def _open_where(item_type: str, alias: str) -> str:
+    """Rows of *item_type* that belong in the queue."""
+    if item_type == TASK:
+        return f"{alias}.status NOT IN ('completed', 'done', 'cancelled')"
+    return f"{alias}.requires_response = 1 AND {alias}.processed = 0"
+
+
+def source_rows_sql(item_type: str, changed_only: bool = False, limit: int | None = None) -> str:
+    """
+    SELECT for the source rows of *item_type*, each with its input_sig.
+
+    With changed_only, only rows missing from the queue or whose input_sig
+    differs from the stored one. With limit, at most that many rows.
+    """
+    table, columns = (
+        ("tasks", TASK_SIG_COLUMNS) if item_type == TASK else ("communications", EMAIL_SIG_COLUMNS)
+    )
+    sig = "json_array(" + ", ".join(f"s.{c}" for c in columns) + ")"
+    sql = f"SELECT s.*, {sig} AS input_sig FROM {table} s"  # noqa: S608 — constant identifiers
+    if changed_only:
+        sql += (
+            f" LEFT JOIN priority_queue q ON q.item_type = '{item_type}' AND q.item_id = s.id"
+            f" WHERE {_open_where(item_type, 's')} AND q.input_sig IS NOT {sig}"
+        )
+    else:
+        sql += f" WHERE {_open_where(item_type, 's')}"
+    if limit is not None:
+        sql += f" LIMIT {int(limit)}"
+    return sql
+
+
+def _tags_key(tags) -> str | None:
+    """Tags as ",a,b," (lowercased) so one tag matches with LIKE '%,a,%'."""
+    if isinstance(tags, str):
+        try:
+            parsed = json.loads(tags)
+        except (json.JSONDecodeError, TypeError):
+            parsed = tags.split(",")
+        tags = parsed if isinstance(parsed, list) else [str(parsed)]
+    names = [str(t).strip().lower() for t in tags or [] if str(t).strip()]
+    return "," + ",".join(names) + "," if names else None
+
+
+def _row(item: dict, input_sig: str | None, tags, now: str) -> tuple:
+    return (
+        item["type"],
+        item["id"],
+        item["score"],
+        (item.get("title") or "").lower(),
+        (item.get("due") or "")[:10] or NO_DUE,
+        (item.get("assignee") or "").lower(),
+        (item.get("project") or "").lower(),
+        item.get("status"),
+        _tags_key(tags),
+        json.dumps(item),
+        input_sig,
+        now,
+    )
+
+
+def write_items(
+    conn: sqlite3.Connection, scored: list[tuple[dict, str, object]], replace: bool = False
+) -> int:
+    """
+    Upsert (item, input_sig, tags) triples into priority_queue.
+
+    Runs inside the caller's transaction. With replace=True the table is
+    cleared first, so it holds exactly *scored*.
+    """
+    if replace:
+        conn.execute("DELETE FROM priority_queue")
+    now = datetime.now(timezone.utc).isoformat()
+    rows = [_row(item, sig, tags, now) for item, sig, tags in scored]
+    for start in range(0, len(rows), _BATCH):
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO priority_queue
+                (item_type, item_id, score, title_key, due_key, assignee_key,
+                 project_key, status, tags_key, item_json, input_sig, scored_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            rows[start : start + _BATCH],
+        )
+    return len(rows)
+
+
+def closed_items_sql(limit: int | None = None) -> str:
+    """SELECT (item_type, item_id) of queue rows whose source is no longer open."""
+    sql = f"""
+        SELECT q.item_type, q.item_id FROM priority_queue q
+        WHERE (q.item_type = '{TASK}' AND q.item_id NOT IN (
+                   SELECT s.id FROM tasks s WHERE {_open_where(TASK, "s")}))
+           OR (q.item_type = '{EMAIL}' AND q.item_id NOT IN (
+                   SELECT s.id FROM communications s WHERE {_open_where(EMAIL, "s")}))
+    """  # noqa: S608 — constant filters only
+    if limit is not None:
+        sql += f" LIMIT {int(limit)}"
+    return sql
+
+
+def remove_items(conn: sqlite3.Connection, keys: list[tuple[str, str]]) -> int:
+    """Delete (item_type, item_id) rows from priority_queue; caller commits."""
+    removed = 0
+    for start in range(0, len(keys), _BATCH):
+        removed += conn.executemany(
+            "DELETE FROM priority_queue WHERE item_type = ? AND item_id = ?",
+            keys[start : start + _BATCH],
+        ).rowcount
+    return removed
+
+
+def _on_publish(tags: frozenset[str]) -> None:
+    if tags & _QUEUE_SOURCES:
+        _stale.set()
+
+
+def _subscribe() -> None:
+    global _subscribed
+    if not _subscribed:
+        subscribe(_on_publish)
+        _subscribed = True
+
+
+def _sync(analyzer, limit: int | None) -> dict:
+    """sync_queue() under _sync_lock (held by the caller), tracking staleness."""
+    global _last_sync
+    _stale.clear()
+    try:
+        result = analyzer.sync_queue(limit=limit)
+    except sqlite3.Error:
+        _stale.set()
+        raise
+    if result["more"]:
+        _stale.set()  # the rest on a later call
+    _last_sync = time.monotonic()
+    return result
+
+
+def catch_up(
+    analyzer, max_age_seconds: float = SYNC_INTERVAL_SECONDS, limit: int = CATCH_UP_LIMIT
+) -> dict | None:
+    """
+    Bounded analyzer.sync_queue(limit=limit) if the queue may be stale.
+
+    Returns None if the queue was fresh, or a sync (e.g. the startup one) is
+    already running; the caller then serves what is stored. The first call
+    subscribes to StateStore publishes, so later task and communication writes
+    in this process mark the queue stale immediately.
+    """
+    _subscribe()
+    if not _stale.is_set() and time.monotonic() - _last_sync < max_age_seconds:
+        return None
+    if not _sync_lock.acquire(blocking=False):
+        return None
+    try:
+        if not _stale.is_set() and time.monotonic() - _last_sync < max_age_seconds:
+            return None
+        return _sync(analyzer, limit)
+    finally:
+        _sync_lock.release()
+
+
+def start_background_sync(analyzer) -> threading.Thread:
+    """Run a full sync_queue() on a daemon thread (API startup)."""
+
+    def run() -> None:
+        with _sync_lock:
+            try:
+                result = _sync(analyzer, None)
+            except sqlite3.Error as e:
+                logger.warning(f"Priority queue background sync failed: {e}")
+                return
+        logger.info(f"Priority queue background sync: {result}")
+
+    _subscribe()
+    thread = threading.Thread(target=run, name="priority-queue-sync", daemon=True)
+    thread.start()
+    return thread
+
+
+def _like(text: str) -> str:
+    escaped = text.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _due_filter(due: str, today: date) -> tuple[str, list] | None:
+    if due == "today":
+        return "due_key = ?", [today.isoformat()]
+    if due == "tomorrow":
+        return "due_key = ?", [(today + timedelta(days=1)).isoformat()]
+    if due == "week":
+        return "due_key <= ?", [(today + timedelta(days=7)).isoformat()]
+    if due == "overdue":
+        return "due_key < ?", [today.isoformat()]
+    if due == "no_date":
+        return "due_key = ?", [NO_DUE]
+    if due.startswith("range:"):
+        parts = due.split(":")
+        if len(parts) == 3:
+            return "due_key BETWEEN ? AND ? AND due_key != ?", [parts[1], parts[2], NO_DUE]
+    return None
+
+
+def search_queue(
+    store,
+    q: str | None = None,
+    due: str | None = None,
+    assignee: str | None = None,
+    project: str | None = None,
+    status: str | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+    tags: str | None = None,
+    sort: str = "score",
+    order: str = "desc",
+    limit: int = 50,
+    offset: int = 0,
+    cursor: str | None = None,
+    today: date | None = None,
+) -> dict:
+    """
+    Filter, sort and page the stored queue in SQL.
+
+    Results are ordered by the sort key, then (item_type, item_id) so pages
+    are stable. When *cursor* (a previous page's next_cursor) is given the
+    page starts after it and *offset* is ignored.
+
+    Returns:
+        {"items", "total", "offset", "limit", "has_more", "next_cursor"}
+    """
+    today = today or datetime.now().date()
+    where: list[str] = []
+    params: list = []
+
+    if q:
+        where.append("title_key LIKE ? ESCAPE '\\'")
+        params.append(_like(q))
+    if due:
+        clause = _due_filter(due, today)
+        if clause:
+            where.append(clause[0])
+            params.extend(clause[1])
+    if assignee:
+        if assignee.lower() == "unassigned":
+            where.append("assignee_key = ''")
+        else:
+            where.append("assignee_key LIKE ? ESCAPE '\\'")
+            params.append(_like(assignee))
+    if project:
+        where.append("project_key LIKE ? ESCAPE '\\'")
+        params.append(_like(project))
+    if status:
+        where.append("status = ?")
+        params.append(status)
+    if min_score is not None:
+        where.append("score >= ?")
+        params.append(min_score)
+    if max_score is not None:
+        where.append("score <= ?")
+        params.append(max_score)
+    if tags:
+        names = [t.strip().lower() for t in tags.split(",") if t.strip()]
+        if names:
+            where.append("(" + " OR ".join("tags_key LIKE ? ESCAPE '\\'" for _ in names) + ")")
+            params.extend(_like(f",{name},") for name in names)
+
+    filters = " AND ".join(where) or "1 = 1"
+    total = store.query(
+        f"SELECT COUNT(*) AS c FROM priority_queue WHERE {filters}",  # noqa: S608 — placeholders only
+        params,
+    )[0]["c"]
+
+    column = SORT_COLUMNS.get(sort, "score")
+    descending = order.lower() != "asc"
+    direction = "DESC" if descending else "ASC"
+    scope = f"priority_queue:{column}:{direction.lower()}"
+    page_where, page_params = filters, list(params)
+    if cursor:
+        position = decode_cursor(cursor, scope)
+        if len(position) != 3:
+            raise InvalidCursor("Invalid cursor")
+        page_where += f" AND ({column}, item_type, item_id) {'<' if descending else '>'} (?, ?, ?)"
+        page_params.extend(position)
+        offset = 0
+    rows = store.query(
+        f"""
+        SELECT item_json, {column} AS sort_key, item_type, item_id
+        FROM priority_queue
+        WHERE {page_where}
+        ORDER BY {column} {direction}, item_type {direction}, item_id {direction}
+        LIMIT ? OFFSET ?
+    """,  # noqa: S608 — whitelisted sort column, placeholders only
+        [*page_params, limit + 1, offset],
+    )
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor([last["sort_key"], last["item_type"], last["item_id"]], scope)
+
+    return {
+        "items": [json.loads(row["item_json"]) for row in rows],
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+    }
@@ -0,0 +1,100 @@
+"""
+Score Sink - Batched persistence of analyzer scores.
+
+Analyzers buffer their writes here instead of calling StateStore.update /
+insert per row. flush() diffs score updates against the stored values and
+writes only the rows that changed, plus any new rows, with executemany in a
+single transaction, then publishes the touched tables once.
+"""
+
+import logging
+from dataclasses import dataclass, field
+
+from lib.bulk_write import DEFAULT_CHUNK_SIZE, BulkWriteResult, update_rows, write_rows
+from lib.cache.invalidation import publish, row_tags
+
+from ..state_store import StateStore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FlushResult:
+    """Outcome of one ScoreSink.flush()."""
+
+    updated: int = 0  # existing rows whose score columns changed
+    unchanged: int = 0  # score updates skipped because the stored values matched
+    inserted: int = 0  # new rows written
+    tables: list[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> int:
+        return self.updated + self.inserted
+
+
+class ScoreSink:
+    """
+    Buffers score writes and flushes them in one transaction.
+
+    Usage:
+        sink = ScoreSink(store)
+        sink.update("tasks", task_id, {"priority": 80, "priority_reasons": "[...]"})
+        sink.insert("insights", {...})
+        result = sink.flush()   # result.changed rows written
+    """
+
+    def __init__(self, store: StateStore, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.store = store
+        self.chunk_size = chunk_size
+        # (table, columns) -> rows, so every executemany batch shares a column list
+        self._updates: dict[tuple[str, tuple[str, ...]], list[dict]] = {}
+        self._inserts: dict[tuple[str, tuple[str, ...]], list[dict]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(rows) for rows in self._updates.values()) + sum(
+            len(rows) for rows in self._inserts.values()
+        )
+
+    def update(self, table: str, id: str, values: dict) -> None:
+        """Set *values* on the existing row *id* of *table* at the next flush."""
+        row = {"id": id, **values}
+        self._updates.setdefault((table, tuple(row)), []).append(row)
+
+    def insert(self, table: str, row: dict) -> None:
+        """Insert (or replace) *row* into *table* at the next flush."""
+        self._inserts.setdefault((table, tuple(row)), []).append(row)
+
+    def flush(self) -> FlushResult:
+        """Write everything buffered in one transaction and clear the buffer."""
+        updates, self._updates = self._updates, {}
+        inserts, self._inserts = self._inserts, {}
+        if not updates and not inserts:
+            return FlushResult()
+
+        def write(conn) -> list[tuple[str, BulkWriteResult, bool]]:
+            return [
+                (table, update_rows(conn, table, rows, chunk_size=self.chunk_size), True)
+                for (table, _), rows in updates.items()
+            ] + [
+                (table, write_rows(conn, table, rows, chunk_size=self.chunk_size), False)
+                for (table, _), rows in inserts.items()
+            ]
+
+        flushed = FlushResult()
+        tags: set[str] = set()
+        for table, r, is_update in self.store.transaction(write):
+            if is_update:
+                flushed.updated += r.written
+                flushed.unchanged += r.unchanged
+            else:
+                flushed.inserted += r.written
+            if r.written and table not in flushed.tables:
+                flushed.tables.append(table)
+                tags |= row_tags(table)
+        if tags:
+            publish(tags)
+        logger.debug(
+            f"Score sink flush: {flushed.updated} updated, {flushed.unchanged} unchanged, "
+            f"{flushed.inserted} inserted"
+        )
+        return flushed
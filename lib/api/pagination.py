@@ -6,15 +6,42 @@ Features:
 - paginate(): Helper to slice and wrap query results
 - PaginationParams: FastAPI dependency for pagination query parameters
 - CursorPaginatedResponse: Model for cursor-based pagination
+- KeysetSpec / keyset_paginate(): keyset pagination in SQL, so page N costs
+  the same as page 1
+- encode_cursor() / decode_cursor(): opaque, signed keyset cursors
 """
 
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+from dataclasses import dataclass
 from typing import Any, TypeVar
 
 from fastapi import Query
 from pydantic import BaseModel, Field
 
+from lib import paths
+
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 
+CURSOR_SECRET_ENV = "MOH_CURSOR_SECRET"  # noqa: S105 — env var name, not a secret
+CURSOR_SECRET_FILE = ".cursor_secret"  # noqa: S105 — file name, not a secret
+
+# Without MOH_CURSOR_SECRET cursors are signed with a key kept in
+# CURSOR_SECRET_FILE under the data dir, created on first use, so they survive
+# restarts and work across API workers. Keys by file path.
+_file_secrets: dict[str, bytes] = {}
+_file_secret_lock = threading.Lock()
+
 
 class PaginationParams(BaseModel):
     """Pagination parameters."""
@@ -91,3 +118,240 @@ def paginate(
         has_next=page < total_pages,
         has_prev=page > 1,
     )
+
+
+# ==== Keyset Pagination ====
+
+
+class InvalidCursor(ValueError):
+    """A cursor was malformed, tampered with, or issued for another listing."""
+
+
+def _load_or_create_secret(path: str) -> bytes:
+    """Read the key file at *path*, creating it (mode 0600) if missing."""
+    try:
+        with open(path, "rb") as f:
+            secret = f.read()
+        if secret:
+            return secret
+    except FileNotFoundError:
+        pass
+    # Write a private temp file and link it into place, so concurrent workers
+    # never see a partial key and all end up with the first one written.
+    tmp = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(tmp, os.O_CREAT | os.O_TRUNC | os.O_WRONLY, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(secrets.token_bytes(32))
+        try:
+            os.link(tmp, path)
+            logger.info(f"Created cursor signing key {path}")
+        except FileExistsError:
+            pass
+    finally:
+        os.unlink(tmp)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _cursor_secret() -> bytes:
+    secret = os.environ.get(CURSOR_SECRET_ENV)
+    if secret:
+        return secret.encode()
+    path = str(paths.data_dir() / CURSOR_SECRET_FILE)
+    cached = _file_secrets.get(path)
+    if cached is not None:
+        return cached
+    with _file_secret_lock:
+        if path not in _file_secrets:
+            _file_secrets[path] = _load_or_create_secret(path)
+        return _file_secrets[path]
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(_cursor_secret(), payload, hashlib.sha256).digest()[:16]
+
+
+def encode_cursor(values: list, scope: str = "") -> str:
+    """
+    Opaque cursor for the keyset position *values* (sort key, then id).
+
+    The cursor is signed and bound to *scope* (the listing and sort order it
+    was issued for); decode_cursor() rejects it anywhere else.
+    """
+    payload = json.dumps([scope, values], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload + _sign(payload)).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, scope: str = "") -> list:
+    """Inverse of encode_cursor(); InvalidCursor if it fails verification."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode() + b"=" * (-len(cursor) % 4))
+    except (binascii.Error, ValueError) as e:
+        raise InvalidCursor("Invalid cursor") from e
+    payload, signature = raw[:-16], raw[-16:]
+    if len(raw) <= 16 or not hmac.compare_digest(signature, _sign(payload)):
+        raise InvalidCursor("Invalid cursor")
+    try:
+        cursor_scope, values = json.loads(payload)
+    except (UnicodeDecodeError, json.JSONDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursor("Invalid cursor") from e
+    if cursor_scope != scope or not isinstance(values, list):
+        raise InvalidCursor("Cursor was issued for a different listing")
+    return values
+
+
+@dataclass(frozen=True)
+class KeysetSpec:
+    """
+    Declarative keyset pagination over one listing.
+
+    Rows are ordered by (key, id), both descending or both ascending, and a
+    page continues after the previous page's last (key, id), so an index on
+    (key, id) serves every page with the same cost.
+
+    Attributes:
+        name: Listing name; cursors are bound to it and the sort direction
+        source: FROM clause (a table, or a table plus joins)
+        columns: SELECT list returned for each row
+        key: Sort key expression; must not be NULL (NULLs never compare)
+        id: Unique tiebreaker expression, normally the primary key
+        descending: Newest / largest first
+    """
+
+    name: str
+    source: str
+    columns: str
+    key: str
+    id: str = "id"
+    descending: bool = True
+
+    @property
+    def scope(self) -> str:
+        return f"{self.name}:{'desc' if self.descending else 'asc'}"
+
+    def page_sql(self, where: str | None = None, after: bool = False) -> str:
+        """
+        SELECT for one page: *where*, then the cursor predicate, LIMIT ? OFFSET ?.
+
+        With *after*, three placeholders (the cursor's key, key again, id)
+        follow those of *where*.
+        """
+        conditions = [where] if where else []
+        if after:
+            # (key, id) < (?, ?), spelled out so an expression key can still
+            # range-scan its index.
+            op = "<" if self.descending else ">"
+            conditions.append(f"{self.key} {op}= ? AND ({self.key} {op} ? OR {self.id} {op} ?)")
+        direction = "DESC" if self.descending else "ASC"
+        sql = (
+            f"SELECT {self.columns}, {self.key} AS _keyset_key, {self.id} AS _keyset_id"  # noqa: S608 — spec fragments are code constants
+            f" FROM {self.source}"
+        )
+        if conditions:
+            sql += " WHERE " + " AND ".join(f"({c})" for c in conditions)
+        return sql + f" ORDER BY {self.key} {direction}, {self.id} {direction} LIMIT ? OFFSET ?"
+
+
+def keyset_page(
+    conn: sqlite3.Connection,
+    spec: KeysetSpec,
+    limit: int,
+    cursor: str | None = None,
+    where: str | None = None,
+    params: list | None = None,
+    offset: int = 0,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """
+    Fetch one page in *spec*'s order.
+
+    Args:
+        conn: Connection to run the query on
+        spec: The listing's KeysetSpec
+        limit: Maximum rows to return
+        cursor: A previous page's next_cursor, or None for the first page
+        where: Extra filter (trusted SQL with ? placeholders)
+        params: Values for the placeholders in *where*
+        offset: Rows to skip when there is no cursor (page-numbered callers)
+
+    Returns:
+        (rows, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If limit < 1
+        InvalidCursor: If *cursor* does not verify for this spec
+    """
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    values = list(params or [])
+    if cursor:
+        position = decode_cursor(cursor, spec.scope)
+        if len(position) != 2:
+            raise InvalidCursor("Invalid cursor")
+        key, last_id = position
+        values.extend([key, key, last_id])
+        offset = 0
+    result = conn.execute(spec.page_sql(where, after=bool(cursor)), [*values, limit + 1, offset])
+    names = [d[0] for d in result.description]
+    rows = [dict(zip(names, row, strict=True)) for row in result.fetchall()]
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1]["_keyset_key"], rows[-1]["_keyset_id"]], spec.scope)
+    for row in rows:
+        del row["_keyset_key"], row["_keyset_id"]
+    return rows, next_cursor
+
+
+def keyset_paginate(
+    conn: sqlite3.Connection,
+    spec: KeysetSpec,
+    limit: int,
+    cursor: str | None = None,
+    where: str | None = None,
+    params: list | None = None,
+) -> CursorPaginatedResponse:
+    """keyset_page() wrapped in CursorPaginatedResponse."""
+    rows, next_cursor = keyset_page(conn, spec, limit, cursor, where, params)
+    return CursorPaginatedResponse(
+        data=rows, next_cursor=next_cursor, has_more=next_cursor is not None
+    )
+
+
+def offset_paginate(
+    conn: sqlite3.Connection,
+    spec: KeysetSpec,
+    page: int,
+    page_size: int,
+    where: str | None = None,
+    params: list | None = None,
+) -> PaginatedResponse:
+    """
+    Page-numbered listing in SQL: COUNT(*) plus LIMIT/OFFSET in *spec*'s order.
+
+    Only the requested page is read into Python, but SQLite still steps over
+    the skipped rows; use keyset_paginate() for deep paging.
+    """
+    if page < 1:
+        raise ValueError("page must be >= 1")
+    if page_size < 1:
+        raise ValueError("page_size must be >= 1")
+    count_sql = f"SELECT COUNT(*) FROM {spec.source}"  # noqa: S608 — spec fragments are code constants
+    if where:
+        count_sql += f" WHERE {where}"
+    total = conn.execute(count_sql, params or []).fetchone()[0]
+    data, _ = keyset_page(
+        conn, spec, page_size, where=where, params=params, offset=(page - 1) * page_size
+    )
+
+    total_pages = (total + page_size - 1) // page_size
+    return PaginatedResponse(
+        data=data,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        has_next=page < total_pages,
+        has_prev=page > 1,
+    )
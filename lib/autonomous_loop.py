@@ -13,13 +13,15 @@ two parallel runtimes. For production behavior, read and change ``lib/daemon.py`
 import argparse
 import json
 import logging
+import os
 import sqlite3
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from lib import paths
+from lib import event_log, paths
+from lib.db import open_connection
 
 from .analyzers import AnalyzerOrchestrator
 from .change_bundles import BundleManager
@@ -480,6 +482,21 @@ class AutonomousLoop:
             },
         )
 
+        # Tell SSE clients (in the API process) that dashboard data changed
+        try:
+            event_log.publish(
+                "metric_refresh",
+                {
+                    "cycle": self.cycle_count,
+                    "success": results.get("success", False),
+                    "completed_at": results["completed_at"],
+                },
+                source="autonomous_loop",
+                store=self.store,
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"metric_refresh event not logged: {e}")
+
         logger.info("═══════════════════════════════════════")
         logger.info(f"  CYCLE {self.cycle_count} COMPLETE ({results['duration_ms']:.0f}ms)")
         logger.info("═══════════════════════════════════════\n")
@@ -563,6 +580,7 @@ class AutonomousLoop:
         import time
         from pathlib import Path
 
+        from lib.cache.invalidation import PATTERNS, PROPOSALS, SCORES, SIGNALS, client_tag, publish
         from lib.intelligence.cost_to_serve import CostToServeEngine
         from lib.intelligence.health_unifier import HealthUnifier
         from lib.intelligence.patterns import detect_all_patterns
@@ -649,6 +667,7 @@ class AutonomousLoop:
             logger.error(f"Intelligence: temporal normalization init failed: {e}")
 
         # --- 1. Score all entities and persist to score_history ---
+        scored_clients: set[str] = set()
         try:
             health_unifier = HealthUnifier(db_path)
 
@@ -675,6 +694,8 @@ class AutonomousLoop:
                             data_completeness=sc.get("data_completeness", 0),
                         )
                         results["scores_recorded"] += 1
+                        if entity_type == "client":
+                            scored_clients.add(sc["entity_id"])
                 except (sqlite3.Error, ValueError, OSError) as e:
                     logger.error(f"Intelligence: {entity_type} scoring failed: {e}")
         except (sqlite3.Error, ValueError, OSError) as e:
@@ -735,7 +756,12 @@ class AutonomousLoop:
         # a valid empty shape instead of hitting UnboundLocalError.
         signal_results: dict = {"signals": []}
         try:
-            signal_results = detect_all_signals(db_path)
+            full_rescan = os.environ.get("MOH_INTELLIGENCE_FULL_RESCAN", "0").strip().lower() in (
+                "1",
+                "true",
+                "yes",
+            )
+            signal_results = detect_all_signals(db_path, incremental=not full_rescan)
             detected = signal_results.get("signals", [])
             results["signals_detected"] = len(detected)
 
@@ -1207,6 +1233,10 @@ class AutonomousLoop:
             except (sqlite3.Error, ValueError, OSError) as e:
                 logger.error(f"Intelligence: audit trail end failed: {e}")
 
+        # Outputs above are written through their own connections, not StateStore,
+        # so publish their cache tags here for the intelligence endpoints.
+        publish([SCORES, SIGNALS, PATTERNS, PROPOSALS, *map(client_tag, scored_clients)])
+
         return results
 
     def _process_capacity_truth(self) -> dict:
@@ -1328,6 +1358,7 @@ class AutonomousLoop:
         - projects.client_id (from brand, NULL if internal)
         - tasks.brand_id, client_id, project_link_status, client_link_status
         - communications.from_domain, client_id, link_status
+        - communication_client_attribution (new/changed comms and clients)
         - invoices.aging_bucket (for valid AR)
         """
         from .normalizer import Normalizer
@@ -1336,6 +1367,7 @@ class AutonomousLoop:
             "tasks_updated": 0,
             "projects_updated": 0,
             "communications_updated": 0,
+            "communications_attributed": 0,
             "invoices_updated": 0,
         }
 
@@ -1346,6 +1378,7 @@ class AutonomousLoop:
             results["tasks_updated"] = norm_results.get("tasks", 0)
             results["projects_updated"] = norm_results.get("projects", 0)
             results["communications_updated"] = norm_results.get("communications", 0)
+            results["communications_attributed"] = norm_results.get("communication_attribution", 0)
             results["invoices_updated"] = norm_results.get("invoices", 0)
 
         except (sqlite3.Error, ValueError, OSError) as e:
@@ -1370,7 +1403,7 @@ class AutonomousLoop:
             return {"status": "skipped", "reason": "already_sent_today"}
 
         # Check detection_last_run from sync_state
-        conn = sqlite3.connect(db_path)
+        conn = open_connection(db_path)
         conn.row_factory = sqlite3.Row
         try:
             cursor = conn.execute(
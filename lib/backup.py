@@ -1,24 +1,255 @@
-"""Backup and restore functionality for MOH Time OS."""
-
+"""
+Backup and restore functionality for MOH Time OS.
+
+Full backups are taken online with the SQLite backup API, copying
+BACKUP_PAGES_PER_STEP pages per step, so writers are never blocked for the
+length of the copy and no WAL checkpoint is forced first. Backups are stored
+gzip-compressed by default.
+
+Between full backups, archive_wal() copies the WAL frames committed since its
+last run into compressed segments. Each full backup owns one WAL chain; a
+backup plus its chain can be restored to any archived point with
+restore_backup(until=...).
+
+Layout under backups/:
+    moh_time_os_<ts>[_<label>].db.gz     full backup
+    wal/<backup stem>/manifest.json      chain cursor and segment list
+    wal/<backup stem>/<seq>.wal.gz       archived WAL frames
+
+A chain only continues across a WAL reset that archive_wal() sealed itself
+(RESTART checkpoint covering exactly the frames it archived). Any other reset
+may have dropped frames, so archive_wal() starts a new chain with a full backup
+(a "rebase", labelled REBASE_LABEL). The archiver therefore owns checkpointing:
+connections opened through lib.db.open_connection() (the StateStore pool included)
+do not auto-checkpoint at the default 1000 pages.
+"""
+
+import gzip
+import json
 import logging
+import os
+import re
 import shutil
 import sqlite3
+import struct
+from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
 
 from . import paths
-from .store import checkpoint_wal, db_exists
+from .store import db_exists
 
 log = logging.getLogger("moh_time_os")
 
+# Pages copied per backup step; the source read lock is released between steps.
+BACKUP_PAGES_PER_STEP = 1024
+
+# Label of the full backups archive_wal() takes to start a new chain.
+REBASE_LABEL = "rebase"
+_REBASE_STEM = re.compile(rf"moh_time_os_\d{{8}}_\d{{6}}_{REBASE_LABEL}(_\d+)?")
+
+_WAL_MAGIC = (0x377F0682, 0x377F0683)  # little- / big-endian checksums
+_WAL_HEADER = struct.Struct(">8I")
+_FRAME_HEADER = struct.Struct(">6I")
+_FRAME_HEADER_SIZE = _FRAME_HEADER.size
+
+ProgressCallback = Callable[[int, int, int], object]
+
 
 def _backup_dir():
     return paths.db_path().parent / "backups"
 
 
-def create_backup(label: str = None) -> Path | None:
+def _wal_path() -> Path:
+    return Path(str(paths.db_path()) + "-wal")
+
+
+def _backup_stem(backup_path: Path) -> str:
+    name = backup_path.name
+    for suffix in (".db.gz", ".db"):
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return backup_path.stem
+
+
+def _is_rebase(backup_path: Path) -> bool:
+    return _REBASE_STEM.fullmatch(_backup_stem(backup_path)) is not None
+
+
+def _chain_dir(backup_path: Path) -> Path:
+    return backup_path.parent / "wal" / _backup_stem(backup_path)
+
+
+def _load_manifest(chain_dir: Path) -> dict | None:
+    path = chain_dir / "manifest.json"
+    if not path.exists():
+        return None
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        log.warning(f"Could not read WAL chain manifest {path}: {e}")
+        return None
+
+
+def _save_manifest(chain_dir: Path, manifest: dict) -> None:
+    chain_dir.mkdir(parents=True, exist_ok=True)
+    tmp = chain_dir / "manifest.json.tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, chain_dir / "manifest.json")
+
+
+# =============================================================================
+# WAL parsing
+# =============================================================================
+
+
+def _wal_checksum(data: bytes, s1: int, s2: int, big_endian: bool) -> tuple[int, int]:
+    """SQLite's WAL checksum of *data*, continuing from (s1, s2)."""
+    words = struct.unpack(f"{'>' if big_endian else '<'}{len(data) // 4}I", data)
+    for i in range(0, len(words), 2):
+        s1 = (s1 + words[i] + s2) & 0xFFFFFFFF
+        s2 = (s2 + words[i + 1] + s1) & 0xFFFFFFFF
+    return s1, s2
+
+
+def _read_wal_header(wal_path: Path) -> dict | None:
+    """Generation, page size and checksum state of the WAL, None if empty/invalid."""
+    try:
+        with open(wal_path, "rb") as f:
+            raw = f.read(_WAL_HEADER.size)
+    except FileNotFoundError:
+        return None
+    if len(raw) < _WAL_HEADER.size:
+        return None
+    magic, _version, page_size, ckpt_seq, salt1, salt2, c1, c2 = _WAL_HEADER.unpack(raw)
+    if magic not in _WAL_MAGIC:
+        return None
+    big_endian = magic == _WAL_MAGIC[1]
+    if _wal_checksum(raw[:24], 0, 0, big_endian) != (c1, c2):
+        return None
+    return {
+        "generation": [ckpt_seq, salt1, salt2],
+        "page_size": page_size,
+        "big_endian": big_endian,
+        "checksum": [c1, c2],
+    }
+
+
+def _copy_committed_frames(
+    wal_path: Path, header: dict, start_frame: int, checksum: list[int], out
+) -> tuple[int, list[int]]:
+    """
+    Write the committed frames after *start_frame* to *out*.
+
+    Frames are validated the way SQLite recovers a WAL: matching salts and a
+    running checksum. Frames after the last commit frame belong to an open
+    transaction and are left for the next run. Returns (frame count, checksum)
+    at the last commit written.
+    """
+    page_size = header["page_size"]
+    frame_size = _FRAME_HEADER_SIZE + page_size
+    salts = tuple(header["generation"][1:])
+    s1, s2 = checksum
+    committed, committed_sum = start_frame, [s1, s2]
+    pending: list[bytes] = []
+    frame = start_frame
+
+    with open(wal_path, "rb") as f:
+        f.seek(_WAL_HEADER.size + start_frame * frame_size)
+        while True:
+            raw = f.read(frame_size)
+            if len(raw) < frame_size:
+                break
+            _pgno, commit, salt1, salt2, c1, c2 = _FRAME_HEADER.unpack_from(raw)
+            if (salt1, salt2) != salts:
+                break
+            s1, s2 = _wal_checksum(raw[:8], s1, s2, header["big_endian"])
+            s1, s2 = _wal_checksum(raw[_FRAME_HEADER_SIZE:], s1, s2, header["big_endian"])
+            if (s1, s2) != (c1, c2):
+                break
+            frame += 1
+            pending.append(raw)
+            if commit:
+                for chunk in pending:
+                    out.write(chunk)
+                pending = []
+                committed, committed_sum = frame, [s1, s2]
+    return committed, committed_sum
+
+
+def _apply_wal_segment(db_file: Path, segment: Path, page_size: int) -> None:
+    """Write archived frames into *db_file*, as a checkpoint would."""
+    with gzip.open(segment, "rb") as seg, open(db_file, "r+b") as out:
+        while True:
+            raw = seg.read(_FRAME_HEADER_SIZE + page_size)
+            if len(raw) < _FRAME_HEADER_SIZE + page_size:
+                break
+            pgno, commit = struct.unpack_from(">II", raw)
+            out.seek((pgno - 1) * page_size)
+            out.write(raw[_FRAME_HEADER_SIZE:])
+            if commit:
+                out.truncate(commit * page_size)
+
+
+# =============================================================================
+# Full backups
+# =============================================================================
+
+
+def _log_progress(status: int, remaining: int, total: int) -> None:
+    log.debug(f"Backup progress: {total - remaining}/{total} pages")
+
+
+def _online_copy(src_path: Path, dst_path: Path, progress: ProgressCallback | None) -> None:
+    """Copy *src_path* to *dst_path* with the SQLite backup API, page-step by page-step."""
+    src = sqlite3.connect(str(src_path), timeout=30.0)
+    dst = sqlite3.connect(str(dst_path))
+    try:
+        src.backup(dst, pages=BACKUP_PAGES_PER_STEP, progress=progress or _log_progress)
+    finally:
+        dst.close()
+        src.close()
+
+
+def _gzip_file(src: Path, dst: Path) -> None:
+    with open(src, "rb") as f_in, gzip.open(dst, "wb", compresslevel=6) as f_out:
+        shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+
+
+def _start_chain(backup_path: Path, generation: list[int] | None, created_at: str) -> None:
+    """Record the WAL position a new backup's chain continues from."""
+    header = _read_wal_header(_wal_path())
+    current = header["generation"] if header else None
+    manifest = {
+        "backup": backup_path.name,
+        "created_at": created_at,
+        # The backup already holds every frame of the generation it was read
+        # from; replaying them again from frame 0 is idempotent.
+        "cursor": {
+            "generation": current,
+            "frame": 0,
+            "checksum": header["checksum"] if header else None,
+            "page_size": header["page_size"] if header else None,
+            "big_endian": header["big_endian"] if header else None,
+            "sealed": header is None,
+        },
+        # A reset while the backup ran may have dropped frames it never saw.
+        "broken": generation != current,
+        "segments": [],
+    }
+    _save_manifest(_chain_dir(backup_path), manifest)
+
+
+def create_backup(
+    label: str = None, compress: bool = True, progress: ProgressCallback | None = None
+) -> Path | None:
     """
-    Create a backup of the database.
+    Create an online backup of the database and start its WAL chain.
+
+    *progress* is passed to sqlite3.Connection.backup and called after each
+    step with (status, remaining, total) pages.
     Returns backup path or None if failed.
     """
     if not db_exists():
@@ -27,21 +258,26 @@ def create_backup(label: str = None) -> Path | None:
 
     _backup_dir().mkdir(parents=True, exist_ok=True)
 
-    # Checkpoint WAL first to ensure consistency
-    try:
-        checkpoint_wal()
-    except (sqlite3.Error, ValueError, OSError) as e:
-        # Non-critical - proceed with backup anyway
-        log.warning(f"WAL checkpoint failed before backup: {e}", exc_info=True)
-
     # Generate backup filename
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    filename = f"moh_time_os_{timestamp}_{label}.db" if label else f"moh_time_os_{timestamp}.db"
-
-    backup_path = _backup_dir() / filename
+    now = datetime.now(timezone.utc)
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    base_stem = f"moh_time_os_{timestamp}_{label}" if label else f"moh_time_os_{timestamp}"
+    stem, n = base_stem, 1
+    # Rebases can follow a backup within the same second; never reuse a name.
+    while any((_backup_dir() / f"{stem}{ext}").exists() for ext in (".db", ".db.gz")):
+        n += 1
+        stem = f"{base_stem}_{n}"
+    backup_path = _backup_dir() / (f"{stem}.db.gz" if compress else f"{stem}.db")
+    tmp_path = _backup_dir() / f".{stem}.db.tmp"
 
     try:
-        shutil.copy2(paths.db_path(), backup_path)
+        header = _read_wal_header(_wal_path())
+        _online_copy(paths.db_path(), tmp_path, progress)
+        if compress:
+            _gzip_file(tmp_path, backup_path)
+        else:
+            os.replace(tmp_path, backup_path)
+        _start_chain(backup_path, header["generation"] if header else None, now.isoformat())
         log.info(f"Created backup: {backup_path}")
         return backup_path
     except PermissionError as e:
@@ -53,25 +289,172 @@ def create_backup(label: str = None) -> Path | None:
     except (sqlite3.Error, ValueError) as e:
         log.error(f"Backup failed - unexpected error: {e}", exc_info=True)
         return None
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+# =============================================================================
+# Incremental WAL archiving
+# =============================================================================
+
+
+def _active_chain() -> tuple[Path, dict] | None:
+    """(chain dir, manifest) of the most recent full backup, if it has one."""
+    latest = get_latest_backup()
+    if latest is None:
+        return None
+    chain_dir = _chain_dir(latest)
+    manifest = _load_manifest(chain_dir)
+    return (chain_dir, manifest) if manifest else None
+
+
+def _rebase(reason: str) -> dict:
+    log.info(f"WAL archive: starting a new chain ({reason})")
+    backup = create_backup(label=REBASE_LABEL)
+    return {"status": "rebased", "reason": reason, "backup": backup, "frames": 0}
+
+
+def _follows(previous: list[int] | None, generation: list[int]) -> bool:
+    """
+    Whether *generation* is the WAL written right after *previous* was reset.
+
+    A reset increments salt-1. The checkpoint sequence is not compared: SQLite
+    counts it per connection, so a WAL reset by a newly opened connection
+    restarts at 1. With no previous WAL, only a freshly created one (sequence 0)
+    qualifies; anything later means generations were written and reset in
+    between.
+    """
+    if previous is None:
+        return generation[0] == 0
+    return generation[1] == (previous[1] + 1) & 0xFFFFFFFF
+
+
+def _checkpoint(conn: sqlite3.Connection) -> tuple[int, int, int] | None:
+    """
+    RESTART-checkpoint the WAL; returns (busy, log frames, checkpointed frames).
+
+    After a successful RESTART the next writer starts a new WAL generation.
+    timeout=0 on *conn* makes the checkpoint give up instead of waiting on
+    readers (and stalling writers behind it).
+    """
+    try:
+        return conn.execute("PRAGMA wal_checkpoint(RESTART)").fetchone()
+    except sqlite3.Error as e:
+        log.debug(f"WAL archive: seal checkpoint skipped: {e}")
+        return None
+
+
+def archive_wal() -> dict:
+    """
+    Archive WAL frames committed since the last run into the active chain.
+
+    Starts a new chain with a full backup when there is none, the chain is
+    broken, or the WAL was reset by someone else since the last run.
+    Returns a summary dict with status 'archived', 'idle', 'rebased' or 'skipped'.
+    """
+    if not db_exists():
+        return {"status": "skipped", "reason": "database does not exist", "frames": 0}
+
+    active = _active_chain()
+    if active is None:
+        return _rebase("no chain")
+    chain_dir, manifest = active
+    if manifest.get("broken"):
+        return _rebase("chain broken")
+
+    cursor = manifest["cursor"]
+    header = _read_wal_header(_wal_path())
+    if header is None:
+        # Empty or missing WAL: fine if we sealed the last generation ourselves.
+        if cursor["sealed"]:
+            return {"status": "idle", "frames": 0}
+        manifest["broken"] = True
+        _save_manifest(chain_dir, manifest)
+        return _rebase("WAL truncated before archive")
+
+    generation = header["generation"]
+    if generation == cursor["generation"]:
+        start, checksum = cursor["frame"], cursor["checksum"]
+    elif cursor["sealed"] and _follows(cursor["generation"], generation):
+        start, checksum = 0, header["checksum"]
+    else:
+        manifest["broken"] = True
+        _save_manifest(chain_dir, manifest)
+        return _rebase("WAL reset before archive")
+
+    seq = len(manifest["segments"]) + 1
+    segment = chain_dir / f"{seq:06d}.wal.gz"
+    sealed = False
+    # Held open so the WAL is not deleted (last connection closing) mid-read.
+    conn = sqlite3.connect(str(paths.db_path()), timeout=0)
+    try:
+        with gzip.open(segment, "wb", compresslevel=6) as out:
+            frame, checksum = _copy_committed_frames(_wal_path(), header, start, checksum, out)
+            result = _checkpoint(conn)
+            if result is not None:
+                busy, log_frames, checkpointed = result
+                if log_frames == checkpointed > frame:
+                    # Committed between the copy and the checkpoint: archive them
+                    # too, before a writer resets the WAL over them.
+                    frame, checksum = _copy_committed_frames(
+                        _wal_path(), header, frame, checksum, out
+                    )
+                sealed = busy == 0 and log_frames == checkpointed == frame
+    finally:
+        conn.close()
+
+    cursor.update(
+        {
+            "generation": generation,
+            "frame": frame,
+            "checksum": checksum,
+            "page_size": header["page_size"],
+            "big_endian": header["big_endian"],
+            "sealed": False,
+        }
+    )
+    frames = frame - start
+    if frames:
+        manifest["segments"].append(
+            {
+                "file": segment.name,
+                "archived_at": datetime.now(timezone.utc).isoformat(),
+                "generation": generation,
+                "first_frame": start,
+                "last_frame": frame,
+                "page_size": header["page_size"],
+            }
+        )
+    else:
+        segment.unlink()
+    cursor["sealed"] = sealed
+    _save_manifest(chain_dir, manifest)
+
+    if frames:
+        log.info(f"WAL archive: {frames} frames -> {segment.name}")
+        return {"status": "archived", "frames": frames, "segment": segment}
+    return {"status": "idle", "frames": 0}
 
 
 def list_backups() -> list[tuple[Path, datetime, int]]:
     """
-    List available backups.
+    List available full backups.
     Returns list of (path, modified_time, size_bytes).
     """
     if not _backup_dir().exists():
         return []
 
     backups = []
-    for f in _backup_dir().glob("*.db"):
-        try:
-            stat = f.stat()
-            mtime = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
-            backups.append((f, mtime, stat.st_size))
-        except OSError as e:
-            # File may have been deleted/moved - skip it
-            log.warning(f"Could not stat backup {f}: {e}")
+    for pattern in ("*.db", "*.db.gz"):
+        for f in _backup_dir().glob(pattern):
+            try:
+                stat = f.stat()
+                mtime = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+                backups.append((f, mtime, stat.st_size))
+            except OSError as e:
+                # File may have been deleted/moved - skip it
+                log.warning(f"Could not stat backup {f}: {e}")
 
     # Sort by modified time, newest first
     backups.sort(key=lambda x: x[1], reverse=True)
@@ -84,9 +467,54 @@ def get_latest_backup() -> Path | None:
     return backups[0][0] if backups else None
 
 
-def restore_backup(backup_path: Path, create_safety_backup: bool = True) -> bool:
+# =============================================================================
+# Restore
+# =============================================================================
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """Naive datetimes are taken as UTC, matching the stored timestamps."""
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def _segments_until(backup_path: Path, until: datetime) -> list[tuple[Path, int]] | None:
+    """(segment path, page size) to replay to reach *until*, None if unreachable."""
+    chain_dir = _chain_dir(backup_path)
+    manifest = _load_manifest(chain_dir)
+    if manifest is None:
+        log.error(f"No WAL chain for backup: {backup_path}")
+        return None
+    if datetime.fromisoformat(manifest["created_at"]) > until:
+        log.error(f"Backup {backup_path.name} is newer than {until.isoformat()}")
+        return None
+    return [
+        (chain_dir / s["file"], s["page_size"])
+        for s in manifest["segments"]
+        if datetime.fromisoformat(s["archived_at"]) <= until
+    ]
+
+
+def _stage_restore(backup_path: Path, segments: list[tuple[Path, int]]) -> Path:
+    """Materialise the backup (plus replayed WAL segments) next to the live DB."""
+    staged = paths.db_path().with_name(f".restore_{_backup_stem(backup_path)}.db")
+    if backup_path.name.endswith(".gz"):
+        with gzip.open(backup_path, "rb") as f_in, open(staged, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+    else:
+        shutil.copy2(backup_path, staged)
+    for segment, page_size in segments:
+        _apply_wal_segment(staged, segment, page_size)
+    return staged
+
+
+def restore_backup(
+    backup_path: Path, create_safety_backup: bool = True, until: datetime | None = None
+) -> bool:
     """
     Restore database from a backup.
+
+    With *until*, archived WAL segments of the backup's chain up to that time
+    are replayed on top of it (point-in-time restore, at archive granularity).
     Optionally creates a safety backup of current state first.
     Returns True if successful.
     """
@@ -94,32 +522,38 @@ def restore_backup(backup_path: Path, create_safety_backup: bool = True) -> bool
         log.error(f"Backup file does not exist: {backup_path}")
         return False
 
+    segments = []
+    if until is not None:
+        until = _as_utc(until)
+        segments = _segments_until(backup_path, until)
+        if segments is None:
+            return False
+
     # Safety backup of current state
     if create_safety_backup and db_exists():
         safety = create_backup(label="pre_restore")
         if safety:
             log.info(f"Created safety backup: {safety}")
 
+    staged = None
     try:
-        # Checkpoint current WAL if exists
-        if db_exists():
-            try:
-                checkpoint_wal()
-            except (sqlite3.Error, ValueError, OSError) as e:
-                # Non-critical - proceed with restore anyway
-                log.warning(f"WAL checkpoint failed during restore: {e}", exc_info=True)
-
-        # Copy backup to main path
-        shutil.copy2(backup_path, paths.db_path())
-
-        # Also remove any leftover WAL/SHM files
-        wal_file = Path(str(paths.db_path()) + "-wal")
-        shm_file = Path(str(paths.db_path()) + "-shm")
-        for f in [wal_file, shm_file]:
-            if f.exists():
-                f.unlink()
-
-        log.info(f"Restored from backup: {backup_path}")
+        # Pooled StateStore connections must not keep reading (or mmap'ing) the
+        # file while it is overwritten; they reopen lazily afterwards.
+        from .state_store import StateStore
+
+        if StateStore._instance is not None:
+            StateStore._instance.close_connections()
+
+        staged = _stage_restore(backup_path, segments)
+
+        # Write through SQLite so the live WAL/SHM stay consistent for any
+        # connection that is still open.
+        _online_copy(staged, paths.db_path(), None)
+
+        log.info(
+            f"Restored from backup: {backup_path}"
+            + (f" (+{len(segments)} WAL segments to {until.isoformat()})" if until else "")
+        )
         return True
     except PermissionError as e:
         log.error(f"Restore failed - permission denied: {e}")
@@ -130,24 +564,46 @@ def restore_backup(backup_path: Path, create_safety_backup: bool = True) -> bool
     except (sqlite3.Error, ValueError) as e:
         log.error(f"Restore failed - unexpected error: {e}", exc_info=True)
         return False
+    finally:
+        if staged is not None and staged.exists():
+            staged.unlink()
 
 
-def restore_latest() -> bool:
-    """Restore from the most recent backup."""
-    latest = get_latest_backup()
-    if not latest:
-        log.error("No backups available to restore")
-        return False
-    return restore_backup(latest)
+def restore_latest(until: datetime | None = None) -> bool:
+    """Restore from the most recent backup (taken at or before *until*, if given)."""
+    if until is None:
+        latest = get_latest_backup()
+        if not latest:
+            log.error("No backups available to restore")
+            return False
+        return restore_backup(latest)
+
+    until = _as_utc(until)
+    for path, _, _ in list_backups():
+        manifest = _load_manifest(_chain_dir(path))
+        if manifest and datetime.fromisoformat(manifest["created_at"]) <= until:
+            return restore_backup(path, until=until)
+    log.error(f"No backup taken at or before {until.isoformat()}")
+    return False
 
 
 def prune_backups(keep: int = 7) -> int:
     """
-    Prune old backups, keeping the N most recent.
+    Prune old backups and their WAL chains, keeping the N most recent.
+
+    Rebase backups taken by archive_wal() do not count towards N; they are kept
+    while they are newer than the oldest kept backup (they continue the restore
+    window from there), or up to N of them if there are no other backups.
     Returns number of backups deleted.
     """
     backups = list_backups()
-    to_delete = backups[keep:]
+    regular = [b for b in backups if not _is_rebase(b[0])]
+    rebases = [b for b in backups if _is_rebase(b[0])]
+    if regular[:keep]:
+        oldest_kept = regular[:keep][-1][1]
+        to_delete = regular[keep:] + [b for b in rebases if b[1] < oldest_kept]
+    else:
+        to_delete = rebases[keep:]
 
     deleted = 0
     for path, _, _ in to_delete:
@@ -157,8 +613,14 @@ def prune_backups(keep: int = 7) -> int:
             log.info(f"Pruned backup: {path.name}")
         except PermissionError as e:
             log.warning(f"Failed to prune {path} - permission denied: {e}")
+            continue
         except OSError as e:
             log.warning(f"Failed to prune {path}: {e}")
+            continue
+
+        chain_dir = _chain_dir(path)
+        if chain_dir.exists():
+            shutil.rmtree(chain_dir, ignore_errors=True)
 
     return deleted
 
@@ -187,4 +649,11 @@ def backup_status() -> str:
     if len(backups) > 5:
         lines.append(f"- ... and {len(backups) - 5} more")
 
+    manifest = _load_manifest(_chain_dir(backups[0][0]))
+    if manifest and manifest["segments"]:
+        lines.append(
+            f"- WAL archive: {len(manifest['segments'])} segments, "
+            f"last {manifest['segments'][-1]['archived_at']}"
+        )
+
     return "\n".join(lines)
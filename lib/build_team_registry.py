@@ -11,12 +11,13 @@ import uuid
 from datetime import datetime, timezone
 
 from lib import paths
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
 
 def get_conn():
-    conn = sqlite3.connect(str(paths.db_path()))
+    conn = open_connection(str(paths.db_path()))
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -0,0 +1,304 @@
+"""
+Bulk write engine for StateStore.
+
+Turns a list of row dicts into prepared parameter tuples and writes them with
+``executemany`` in fixed-size chunks on a caller-supplied connection (the
+caller owns the transaction). JSON serialisation is decided once per column:
+only columns that actually carry dict/list values go through ``json.dumps``.
+
+Optional "only changed" mode compares a content hash of each incoming row with
+the hash of the stored row (same key) and skips rows that are identical, so an
+unchanged re-sync reads the table once and writes nothing.
+
+Used by StateStore.insert_many / replace_source_rows / replace_all_rows, and
+(update_rows) by the analyzers' ScoreSink for partial-column score updates.
+"""
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from itertools import islice
+from operator import itemgetter
+
+from lib import db as db_module
+from lib import safe_sql
+
+DEFAULT_CHUNK_SIZE = 500
+
+# Keys per IN (...) lookup when fetching stored rows to diff against. Stays well
+# under SQLITE_MAX_VARIABLE_NUMBER on every SQLite build we ship with.
+_LOOKUP_BATCH = 500
+
+
+@dataclass
+class BulkWriteResult:
+    """Outcome of one bulk write."""
+
+    rows: int = 0  # rows in the incoming payload
+    written: int = 0  # rows actually inserted/replaced
+    unchanged: int = 0  # rows skipped because the stored content hash matched
+    deleted: int = 0  # stale rows removed by a replace
+    chunks: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "written": self.written,
+            "unchanged": self.unchanged,
+            "deleted": self.deleted,
+            "chunks": self.chunks,
+        }
+
+
+def _columns_of(rows: Sequence[dict]) -> list[str]:
+    """Column list taken from the first row, validated as SQL identifiers."""
+    columns = list(rows[0].keys())
+    for col in columns:
+        db_module.validate_identifier(col)
+    return columns
+
+
+def prepare_rows(columns: list[str], rows: Sequence[dict]) -> list[tuple]:
+    """Build parameter tuples in *columns* order, JSON-encoding dict/list cells.
+
+    Columns are classified once: a column is JSON-bearing only if some row holds a
+    dict or list in it, and only those columns pay for ``json.dumps``.
+    """
+    getter = itemgetter(*columns)
+    try:
+        if len(columns) == 1:
+            tuples = [(getter(row),) for row in rows]
+        else:
+            tuples = [getter(row) for row in rows]
+    except KeyError as e:
+        raise ValueError(f"bulk write row is missing column {e.args[0]!r}") from e
+
+    json_idx = [
+        i for i in range(len(columns)) if any(isinstance(t[i], dict | list) for t in tuples)
+    ]
+    if not json_idx:
+        return tuples
+
+    dumps = json.dumps
+    prepared = []
+    for t in tuples:
+        values = list(t)
+        for i in json_idx:
+            v = values[i]
+            if isinstance(v, dict | list):
+                values[i] = dumps(v)
+        prepared.append(tuple(values))
+    return prepared
+
+
+def _canonical(value) -> str:
+    """Stable text form of a cell, insensitive to SQLite type affinity round-trips."""
+    if value is None:
+        return "\x00"
+    if isinstance(value, bool | int | float):
+        f = float(value)
+        return str(int(f)) if f.is_integer() else repr(f)
+    if isinstance(value, bytes):
+        return value.hex()
+    return str(value)
+
+
+def content_hash(values: Iterable) -> bytes:
+    """Content hash of a row's cell values (order-sensitive)."""
+    h = hashlib.blake2b(digest_size=16)
+    for v in values:
+        h.update(_canonical(v).encode("utf-8", "surrogatepass"))
+        h.update(b"\x1f")
+    return h.digest()
+
+
+def _chunks(items: Sequence, size: int) -> Iterator[list]:
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+class _Differ:
+    """Hashes the compared columns of incoming tuples and stored rows."""
+
+    def __init__(self, columns: list[str], key_column: str, ignore_columns: Iterable[str]):
+        if key_column not in columns:
+            raise ValueError(f"only_changed requires rows to carry key column {key_column!r}")
+        db_module.validate_identifier(key_column)
+        ignored = set(ignore_columns)
+        self.key_column = key_column
+        self.key_idx = columns.index(key_column)
+        self.compared = [c for c in columns if c not in ignored]
+        self._compared_idx = [columns.index(c) for c in self.compared]
+        self.select_columns = ", ".join([key_column, *self.compared])
+
+    def incoming_hash(self, row: tuple) -> bytes:
+        return content_hash(row[i] for i in self._compared_idx)
+
+    @staticmethod
+    def stored_hash(row: sqlite3.Row | tuple) -> bytes:
+        return content_hash(row[1:])
+
+
+def _stored_hashes_by_key(
+    conn: sqlite3.Connection, table: str, differ: _Differ, keys: list
+) -> dict:
+    """Fetch stored hashes for *keys* with batched IN lookups."""
+    stored = {}
+    for batch in _chunks(keys, _LOOKUP_BATCH):
+        sql = safe_sql.select(
+            table,
+            columns=differ.select_columns,
+            where=safe_sql.in_clause(differ.key_column, safe_sql.in_placeholders(len(batch))),
+        )
+        for row in conn.execute(sql, batch):
+            stored[row[0]] = differ.stored_hash(row)
+    return stored
+
+
+def _stored_hashes_where(
+    conn: sqlite3.Connection, table: str, differ: _Differ, where: str, params: list
+) -> dict:
+    """Fetch stored hashes for every row matching *where* (one scan)."""
+    sql = safe_sql.select(table, columns=differ.select_columns, where=where)
+    return {row[0]: differ.stored_hash(row) for row in conn.execute(sql, params)}
+
+
+def _executemany_chunked(
+    conn: sqlite3.Connection, sql: str, tuples: Sequence[tuple], chunk_size: int
+) -> int:
+    chunks = 0
+    for batch in _chunks(tuples, chunk_size):
+        conn.executemany(sql, batch)
+        chunks += 1
+    return chunks
+
+
+def write_rows(
+    conn: sqlite3.Connection,
+    table: str,
+    rows: Sequence[dict],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    only_changed: bool = False,
+    key_column: str = "id",
+    ignore_columns: Iterable[str] = (),
+    scope_where: str | None = None,
+    scope_params: list | None = None,
+) -> BulkWriteResult:
+    """INSERT OR REPLACE *rows* into *table* on *conn* (caller owns the transaction).
+
+    With ``scope_where`` set the write is a replace: every stored row matching the
+    scope is removed unless it is re-supplied. Without ``only_changed`` that is a
+    DELETE of the whole scope followed by the inserts; with ``only_changed`` only
+    stale keys are deleted and only new or changed rows are written, so unchanged
+    rows (including any columns not in the payload) are left untouched.
+
+    ``ignore_columns`` are excluded from the content hash (e.g. sync timestamps
+    that differ on every run); they are still written for changed rows.
+    """
+    db_module.validate_identifier(table)
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    result = BulkWriteResult(rows=len(rows))
+    scope_params = scope_params or []
+
+    if not only_changed:
+        if scope_where is not None:
+            cur = conn.execute(safe_sql.delete(table, where=scope_where), scope_params)
+            result.deleted = max(cur.rowcount, 0)
+        if rows:
+            columns = _columns_of(rows)
+            tuples = prepare_rows(columns, rows)
+            sql = safe_sql.insert_or_replace(table, columns)
+            result.chunks = _executemany_chunked(conn, sql, tuples, chunk_size)
+            result.written = len(tuples)
+        return result
+
+    if not rows:
+        if scope_where is not None:
+            cur = conn.execute(safe_sql.delete(table, where=scope_where), scope_params)
+            result.deleted = max(cur.rowcount, 0)
+        return result
+
+    columns = _columns_of(rows)
+    tuples = prepare_rows(columns, rows)
+    differ = _Differ(columns, key_column, ignore_columns)
+    key_idx = differ.key_idx
+
+    if scope_where is not None:
+        stored = _stored_hashes_where(conn, table, differ, scope_where, scope_params)
+    else:
+        stored = _stored_hashes_by_key(conn, table, differ, list({t[key_idx] for t in tuples}))
+
+    changed = [t for t in tuples if stored.get(t[key_idx]) != differ.incoming_hash(t)]
+    result.unchanged = len(tuples) - len(changed)
+
+    if scope_where is not None:
+        incoming_keys = {t[key_idx] for t in tuples}
+        stale = [(k,) for k in stored if k not in incoming_keys]
+        if stale:
+            delete_sql = safe_sql.delete(table, where=f"{key_column} = ?")
+            conn.executemany(delete_sql, stale)
+            result.deleted = len(stale)
+
+    if changed:
+        sql = safe_sql.insert_or_replace(table, columns)
+        result.chunks = _executemany_chunked(conn, sql, changed, chunk_size)
+        result.written = len(changed)
+    return result
+
+
+def update_rows(
+    conn: sqlite3.Connection,
+    table: str,
+    rows: Sequence[dict],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    only_changed: bool = True,
+    key_column: str = "id",
+) -> BulkWriteResult:
+    """UPDATE existing rows of *table* from *rows* (caller owns the transaction).
+
+    Only the columns carried by *rows* are set; unlike ``write_rows`` this never
+    inserts and leaves every other column untouched. With ``only_changed`` the
+    stored values are fetched by key first and only rows that differ are
+    written; keys with no stored row are skipped. ``written`` counts rows
+    actually updated.
+    """
+    db_module.validate_identifier(table)
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    result = BulkWriteResult(rows=len(rows))
+    if not rows:
+        return result
+
+    columns = _columns_of(rows)
+    tuples = prepare_rows(columns, rows)
+    differ = _Differ(columns, key_column, ())
+    key_idx = differ.key_idx
+
+    if only_changed:
+        stored = _stored_hashes_by_key(conn, table, differ, list({t[key_idx] for t in tuples}))
+        changed = []
+        for t in tuples:
+            stored_hash = stored.get(t[key_idx])
+            if stored_hash is None:
+                continue
+            if stored_hash == differ.incoming_hash(t):
+                result.unchanged += 1
+            else:
+                changed.append(t)
+    else:
+        changed = list(tuples)
+
+    if changed:
+        set_idx = [i for i in range(len(columns)) if i != key_idx]
+        sql = safe_sql.update(table, [columns[i] for i in set_idx], where=f"{key_column} = ?")
+        params = [tuple(t[i] for i in set_idx) + (t[key_idx],) for t in changed]
+        for batch in _chunks(params, chunk_size):
+            result.written += max(conn.executemany(sql, batch).rowcount, 0)
+            result.chunks += 1
+    return result
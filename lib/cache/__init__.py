@@ -1,20 +1,29 @@
 """
-In-memory cache layer for MOH Time OS.
+Cache layer for MOH Time OS.
 
 Provides:
-- CacheManager: TTL-based cache with LRU eviction and pattern invalidation
+- CacheManager: TTL-based cache with LRU eviction and pattern/tag invalidation
+- SQLiteCacheManager: Same API backed by a SQLite file shared across processes
 - @cached: Decorator for caching function results
 - @cache_invalidate: Decorator for invalidating cache on writes
-- get_cache: Access global cache instance
+- get_cache: Access global cache instance (backend chosen by MOH_CACHE_BACKEND)
+- publish: Invalidate entries by dependency tag and notify subscribers
+- CacheWarmer / get_warmer: Recompute hot keys after their tags are published
 """
 
 from .cache_manager import CacheManager, CacheStats
 from .decorators import cache_invalidate, cached, get_cache
+from .invalidation import CacheWarmer, get_warmer, publish
+from .sqlite_cache import SQLiteCacheManager
 
 __all__ = [
     "CacheManager",
     "CacheStats",
+    "CacheWarmer",
+    "SQLiteCacheManager",
     "cached",
     "cache_invalidate",
     "get_cache",
+    "get_warmer",
+    "publish",
 ]
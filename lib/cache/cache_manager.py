@@ -4,6 +4,7 @@ In-memory cache manager with TTL support, invalidation patterns, and LRU evictio
 Features:
 - TTL-based entry expiration with lazy cleanup
 - Glob pattern-based key invalidation
+- Dependency tags per entry (e.g. "signals", "client:123") with tag invalidation
 - Thread-safe operations with RLock
 - LRU eviction when max size reached
 - Namespace support (e.g., "client:123", "intelligence:portfolio")
@@ -14,6 +15,7 @@ import fnmatch
 import logging
 import threading
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
@@ -42,7 +44,7 @@ class CacheStats:
 
 
 class CacheManager:
-    """Thread-safe in-memory cache with TTL, LRU eviction, and pattern invalidation."""
+    """Thread-safe in-memory cache with TTL, LRU eviction, and pattern/tag invalidation."""
 
     def __init__(self, max_size: int = 10000, default_ttl: int = 300):
         """
@@ -55,6 +57,9 @@ class CacheManager:
         self._cache: dict[
             str, tuple[Any, float, float]
         ] = {}  # key -> (value, expiry_time, access_time)
+        self._key_tags: dict[str, frozenset[str]] = {}  # key -> dependency tags
+        self._tag_keys: dict[str, set[str]] = {}  # tag -> keys carrying it
+        self._tag_versions: dict[str, int] = {}  # tag -> invalidation count
         self._lock = threading.RLock()
         self._max_size = max_size
         self._default_ttl = default_ttl
@@ -83,7 +88,7 @@ class CacheManager:
 
             # Check if expired
             if time.time() >= expiry_time:
-                del self._cache[key]
+                self._remove(key)
                 self._misses += 1
                 return None
 
@@ -92,7 +97,14 @@ class CacheManager:
             self._hits += 1
             return value
 
-    def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int | None = None,
+        tags: Iterable[str] | None = None,
+        tag_versions: dict[str, int] | None = None,
+    ) -> bool:
         """
         Set value in cache with TTL.
 
@@ -100,20 +112,39 @@ class CacheManager:
             key: Cache key
             value: Value to cache
             ttl_seconds: TTL in seconds. If None, uses default_ttl.
+            tags: Dependency tags; invalidate_tags() on any of them drops the entry.
+            tag_versions: Result of tag_versions() taken before computing value.
+                If any tag was invalidated since, the value was computed from
+                data that has changed and is not stored.
+
+        Returns:
+            True if the value was stored
         """
         if ttl_seconds is None:
             ttl_seconds = self._default_ttl
+        tags = frozenset(tags or ())
 
         with self._lock:
+            if tag_versions is not None and any(
+                self._tag_versions.get(tag, 0) != version for tag, version in tag_versions.items()
+            ):
+                return False
+
             now = time.time()
             expiry_time = now + ttl_seconds
 
             # Set the value
+            self._remove(key)
             self._cache[key] = (value, expiry_time, now)
+            if tags:
+                self._key_tags[key] = tags
+                for tag in tags:
+                    self._tag_keys.setdefault(tag, set()).add(key)
 
             # Evict LRU entry if cache is full
             if len(self._cache) > self._max_size:
                 self._evict_lru()
+            return True
 
     def delete(self, key: str) -> None:
         """
@@ -123,8 +154,7 @@ class CacheManager:
             key: Cache key to delete
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+            self._remove(key)
 
     def invalidate_pattern(self, pattern: str) -> int:
         """
@@ -145,14 +175,45 @@ class CacheManager:
             keys_to_delete = [key for key in self._cache.keys() if fnmatch.fnmatch(key, pattern)]
 
             for key in keys_to_delete:
-                del self._cache[key]
+                self._remove(key)
+
+            return len(keys_to_delete)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Invalidate all entries carrying any of the given dependency tags.
+
+        Also bumps each tag's version so values computed before this call are
+        not stored afterwards (see set(tag_versions=...)).
+
+        Args:
+            tags: Tags such as "signals" or "client:123"
+
+        Returns:
+            Number of keys invalidated
+        """
+        with self._lock:
+            keys_to_delete = set()
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+                keys_to_delete.update(self._tag_keys.get(tag, ()))
+
+            for key in keys_to_delete:
+                self._remove(key)
 
             return len(keys_to_delete)
 
+    def tag_versions(self, tags: Iterable[str]) -> dict[str, int]:
+        """Current invalidation version of each tag, for set(tag_versions=...)."""
+        with self._lock:
+            return {tag: self._tag_versions.get(tag, 0) for tag in tags}
+
     def clear(self) -> None:
         """Clear entire cache."""
         with self._lock:
             self._cache.clear()
+            self._key_tags.clear()
+            self._tag_keys.clear()
 
     def stats(self) -> CacheStats:
         """
@@ -196,7 +257,7 @@ class CacheManager:
             self._cache.keys(),
             key=lambda k: self._cache[k][2],  # access_time is at index 2
         )
-        del self._cache[lru_key]
+        self._remove(lru_key)
         logger.debug(f"Evicted LRU key: {lru_key}")
 
     def cleanup_expired(self) -> int:
@@ -213,6 +274,20 @@ class CacheManager:
             ]
 
             for key in expired_keys:
-                del self._cache[key]
+                self._remove(key)
 
             return len(expired_keys)
+
+    def _remove(self, key: str) -> None:
+        """
+        Drop a key and its tag index entries.
+
+        Should only be called while holding the lock.
+        """
+        self._cache.pop(key, None)
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
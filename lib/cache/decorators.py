@@ -9,9 +9,10 @@ import asyncio
 import functools
 import hashlib
 import logging
+import os
 import sqlite3
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from .cache_manager import CacheManager
@@ -22,10 +23,39 @@ logger = logging.getLogger(__name__)
 _cache_instance: CacheManager | None = None
 _cache_lock = threading.Lock()
 
+CACHE_ENV_BACKEND = "MOH_CACHE_BACKEND"
+CACHE_ENV_PATH = "MOH_CACHE_PATH"
+
+
+def _create_cache() -> CacheManager:
+    """Build the configured backend: "memory" (default) or "sqlite" (shared file)."""
+    backend = os.environ.get(CACHE_ENV_BACKEND, "memory").strip().lower()
+    if backend == "memory":
+        return CacheManager()
+    if backend != "sqlite":
+        raise ValueError(
+            f"Unknown {CACHE_ENV_BACKEND}: {backend!r} (expected 'memory' or 'sqlite')"
+        )
+
+    from lib import paths
+
+    from .sqlite_cache import SQLiteCacheManager
+
+    path = os.environ.get(CACHE_ENV_PATH) or paths.data_dir() / "cache.db"
+    try:
+        return SQLiteCacheManager(path)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Shared cache at {path} unavailable, using in-process cache: {e}")
+        return CacheManager()
+
 
 def get_cache() -> CacheManager:
     """Get or create global cache instance.
 
+    The backend is chosen by MOH_CACHE_BACKEND: "memory" keeps a per-process
+    dict, "sqlite" shares one cache file (MOH_CACHE_PATH) between every API
+    worker and the daemon on the host.
+
     Thread-safe: uses double-checked locking.
     """
     global _cache_instance
@@ -33,7 +63,7 @@ def get_cache() -> CacheManager:
         return _cache_instance
     with _cache_lock:
         if _cache_instance is None:
-            _cache_instance = CacheManager()
+            _cache_instance = _create_cache()
         return _cache_instance
 
 
@@ -76,9 +106,17 @@ def _generate_cache_key(func_name: str, args: tuple, kwargs: dict) -> str:
     return f"{func_name}:{key_str}"
 
 
+def is_cacheable(value: Any) -> bool:
+    """False for HTTP error responses (status >= 400): never serve those as hits."""
+    status = getattr(value, "status_code", None)
+    return not (isinstance(status, int) and status >= 400)
+
+
 def cached(
     ttl: int = 300,
     key_func: Callable[..., str] | None = None,
+    tags: Iterable[str] | Callable[..., Iterable[str]] | None = None,
+    warm: bool = False,
 ) -> Callable:
     """
     Decorator to cache function results.
@@ -90,6 +128,12 @@ def cached(
         ttl: Time-to-live in seconds. Defaults to 300 (5 minutes).
         key_func: Optional function to generate custom cache key.
                  Should accept same args as decorated function and return string.
+        tags: Dependency tags for the entry, or a function taking the same
+              args that returns them. Publishing any of them (see
+              lib.cache.invalidation.publish) drops the entry.
+        warm: Register the entry with the cache warmer so it is recomputed
+              after its tags are published. Only for sync functions without
+              arguments.
 
     Returns:
         Decorated function
@@ -102,11 +146,31 @@ def cached(
         @cached(ttl=60, key_func=lambda client_id: f"client:{client_id}")
         def get_client_data(client_id):
             return db.query(client_id)
+
+        @cached(ttl=60, key_func=lambda: "signals:summary", tags=("signals",), warm=True)
+        def signal_summary():
+            return db.signal_counts()
     """
 
+    def entry_tags(args: tuple, kwargs: dict) -> frozenset[str]:
+        if tags is None:
+            return frozenset()
+        if callable(tags):
+            return frozenset(tags(*args, **kwargs))
+        return frozenset(tags)
+
     def decorator(func: Callable) -> Callable:
         is_async = asyncio.iscoroutinefunction(func)
 
+        if warm:
+            if is_async:
+                raise ValueError("cached(warm=True) supports sync functions only")
+            from .invalidation import get_warmer
+
+            warmer = get_warmer()
+            key = key_func() if key_func else _generate_cache_key(func.__name__, (), {})
+            warmer.register(key, func, entry_tags((), {}), ttl)
+
         if is_async:
 
             @functools.wraps(func)
@@ -118,6 +182,8 @@ def cached(
                     cache_key = key_func(*args, **kwargs)
                 else:
                     cache_key = _generate_cache_key(func.__name__, args, kwargs)
+                if warm:
+                    warmer.touch(cache_key)
 
                 # Try to get from cache
                 cached_value = cache.get(cache_key)
@@ -126,10 +192,15 @@ def cached(
                     return cached_value
 
                 # Call function
+                key_tags = entry_tags(args, kwargs)
+                versions = cache.tag_versions(key_tags)
                 result = await func(*args, **kwargs)
 
-                # Store in cache
-                cache.set(cache_key, result, ttl_seconds=ttl)
+                # Store in cache (skipped if a tag was invalidated meanwhile)
+                if is_cacheable(result):
+                    cache.set(
+                        cache_key, result, ttl_seconds=ttl, tags=key_tags, tag_versions=versions
+                    )
                 return result
 
             return async_wrapper
@@ -144,6 +215,8 @@ def cached(
                     cache_key = key_func(*args, **kwargs)
                 else:
                     cache_key = _generate_cache_key(func.__name__, args, kwargs)
+                if warm:
+                    warmer.touch(cache_key)
 
                 # Try to get from cache
                 cached_value = cache.get(cache_key)
@@ -152,10 +225,15 @@ def cached(
                     return cached_value
 
                 # Call function
+                key_tags = entry_tags(args, kwargs)
+                versions = cache.tag_versions(key_tags)
                 result = func(*args, **kwargs)
 
-                # Store in cache
-                cache.set(cache_key, result, ttl_seconds=ttl)
+                # Store in cache (skipped if a tag was invalidated meanwhile)
+                if is_cacheable(result):
+                    cache.set(
+                        cache_key, result, ttl_seconds=ttl, tags=key_tags, tag_versions=versions
+                    )
                 return result
 
             return sync_wrapper
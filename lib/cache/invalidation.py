@@ -0,0 +1,240 @@
+"""
+Tag-based invalidation events and a background cache warmer.
+
+Writers publish the dependency tags they touched; publish() drops every
+cached entry carrying one of those tags and notifies subscribers.
+
+Tags in use:
+- table names written through StateStore ("tasks", "invoices", ...)
+- "client:<id>" for rows belonging to a client
+- the intelligence outputs written by AutonomousLoop and the daemon's
+  intelligence stage: "scores", "signals", "patterns", "proposals"
+
+The CacheWarmer keeps a registry of warmable keys (cached(..., warm=True)).
+After a publish it waits for writes to go quiet, then recomputes the stale keys
+that were read recently, so the next dashboard read is a hit on fresh data
+rather than a cold recompute.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from .decorators import get_cache, is_cacheable
+
+logger = logging.getLogger(__name__)
+
+SCORES = "scores"
+SIGNALS = "signals"
+PATTERNS = "patterns"
+PROPOSALS = "proposals"
+
+_subscribers: list[Callable[[frozenset[str]], None]] = []
+_subscribers_lock = threading.Lock()
+
+
+def client_tag(client_id: str) -> str:
+    """Dependency tag for everything derived from one client."""
+    return f"client:{client_id}"
+
+
+def row_tags(table: str, rows: Iterable[dict] = ()) -> set[str]:
+    """Tags touched by writing *rows* to *table*: the table plus owning clients."""
+    tags = {table}
+    for row in rows:
+        client_id = row.get("id") if table == "clients" else row.get("client_id")
+        if client_id:
+            tags.add(client_tag(client_id))
+    return tags
+
+
+def subscribe(callback: Callable[[frozenset[str]], None]) -> None:
+    """Call *callback(tags)* after every publish."""
+    with _subscribers_lock:
+        if callback not in _subscribers:
+            _subscribers.append(callback)
+
+
+def unsubscribe(callback: Callable[[frozenset[str]], None]) -> None:
+    """Stop calling *callback* on publish."""
+    with _subscribers_lock:
+        if callback in _subscribers:
+            _subscribers.remove(callback)
+
+
+def publish(tags: Iterable[str]) -> int:
+    """
+    Invalidate cached entries tagged with any of *tags* and notify subscribers.
+
+    Returns:
+        Number of cache keys invalidated
+    """
+    tags = frozenset(tag for tag in tags if tag)
+    if not tags:
+        return 0
+
+    count = get_cache().invalidate_tags(tags)
+    if count:
+        logger.debug(f"Invalidated {count} cache keys for tags: {sorted(tags)}")
+
+    with _subscribers_lock:
+        callbacks = list(_subscribers)
+    for callback in callbacks:
+        try:
+            callback(tags)
+        except (sqlite3.Error, ValueError, OSError) as e:
+            logger.warning(f"Cache invalidation subscriber failed: {e}")
+    return count
+
+
+@dataclass
+class _WarmEntry:
+    compute: Callable[[], Any]
+    tags: frozenset[str]
+    ttl: int
+
+
+class CacheWarmer:
+    """
+    Recomputes registered hot keys after their tags are published.
+
+    Only keys read within hot_seconds are recomputed. Bursts of publishes are
+    coalesced: the worker waits until no publish has arrived for
+    debounce_seconds (but no longer than max_delay_seconds) and then recomputes
+    every stale key once.
+    """
+
+    def __init__(
+        self,
+        debounce_seconds: float = 2.0,
+        max_delay_seconds: float = 30.0,
+        hot_seconds: float = 900.0,
+    ):
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.hot_seconds = hot_seconds
+        self._entries: dict[str, _WarmEntry] = {}
+        self._last_read: dict[str, float] = {}
+        self._stale: set[str] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def register(self, key: str, compute: Callable[[], Any], tags: Iterable[str], ttl: int) -> None:
+        """Keep *key* warm: recompute it with *compute()* when any of *tags* is published."""
+        with self._lock:
+            self._entries[key] = _WarmEntry(compute=compute, tags=frozenset(tags), ttl=ttl)
+
+    def touch(self, key: str) -> None:
+        """Record a read of *key* (called by the cached wrapper)."""
+        self._last_read[key] = time.monotonic()
+
+    def notify(self, tags: frozenset[str]) -> None:
+        """Mark recently read keys depending on *tags* stale (publish subscriber)."""
+        cutoff = time.monotonic() - self.hot_seconds
+        with self._lock:
+            stale = {
+                key
+                for key, entry in self._entries.items()
+                if entry.tags & tags and self._last_read.get(key, float("-inf")) >= cutoff
+            }
+            self._stale |= stale
+        if stale:
+            self._wake.set()
+
+    def warm(self, keys: Iterable[str] | None = None) -> int:
+        """
+        Recompute stale keys (or *keys*) now and store them in the cache.
+
+        Returns:
+            Number of keys stored
+        """
+        with self._lock:
+            if keys is None:
+                keys, self._stale = self._stale, set()
+            else:
+                keys = set(keys)
+                self._stale -= keys
+            entries = {key: self._entries[key] for key in keys if key in self._entries}
+
+        cache = get_cache()
+        stored = 0
+        for key, entry in entries.items():
+            # Any failure is confined to its key: the warmer thread must keep running.
+            try:
+                versions = cache.tag_versions(entry.tags)
+                value = entry.compute()
+                if not is_cacheable(value):
+                    logger.warning(f"Cache warm for {key} returned an error response, not stored")
+                    continue
+                ok = cache.set(
+                    key, value, ttl_seconds=entry.ttl, tags=entry.tags, tag_versions=versions
+                )
+            except Exception as e:
+                logger.warning(f"Cache warm failed for {key}: {e}", exc_info=True)
+                continue
+            if ok:
+                stored += 1
+            else:
+                # Invalidated again while computing; the pending publish re-queues it.
+                logger.debug(f"Cache warm for {key} superseded by a newer publish")
+        if stored:
+            logger.info(f"Cache warmer refreshed {stored} keys")
+        return stored
+
+    def start(self) -> None:
+        """Subscribe to publishes and start the background worker (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="cache-warmer", daemon=True)
+        subscribe(self.notify)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Unsubscribe and stop the background worker."""
+        unsubscribe(self.notify)
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            # Wait for the burst of writes to settle before recomputing.
+            waited = 0.0
+            while waited < self.max_delay_seconds and not self._stop.is_set():
+                if not self._wake.wait(self.debounce_seconds):
+                    break
+                self._wake.clear()
+                waited += self.debounce_seconds
+            if not self._stop.is_set():
+                try:
+                    self.warm()
+                except Exception:
+                    logger.exception("Cache warmer pass failed")
+
+
+_warmer: CacheWarmer | None = None
+_warmer_lock = threading.Lock()
+
+
+def get_warmer() -> CacheWarmer:
+    """Get or create the global cache warmer."""
+    global _warmer
+    if _warmer is not None:
+        return _warmer
+    with _warmer_lock:
+        if _warmer is None:
+            _warmer = CacheWarmer()
+        return _warmer
@@ -0,0 +1,362 @@
+"""
+Shared SQLite-file cache backend.
+
+SQLiteCacheManager keeps the CacheManager API (TTL, LRU eviction, glob pattern
+and tag invalidation, tag versions) but stores entries in a SQLite file, so
+every API worker and the daemon on the host read the same entries and see
+each other's invalidations.
+
+- Values are pickled and zlib-compressed above COMPRESS_MIN_BYTES
+- Eviction is bounded by entry count (max_size) and payload bytes (max_bytes)
+- Access times are refreshed at most once per TOUCH_INTERVAL_S per key, so
+  hits stay read-only in the common case
+- Any sqlite3 error degrades to a miss / no-op; the cache never fails a request
+
+Select it with MOH_CACHE_BACKEND=sqlite (see get_cache()); the file defaults
+to <data_dir>/cache.db and can be moved with MOH_CACHE_PATH.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .cache_manager import CacheManager, CacheStats
+
+logger = logging.getLogger(__name__)
+
+COMPRESS_MIN_BYTES = 1024
+TOUCH_INTERVAL_S = 1.0
+
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS cache_entries (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        expires_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed ON cache_entries(accessed_at)",
+    "CREATE INDEX IF NOT EXISTS idx_cache_entries_expires ON cache_entries(expires_at)",
+    """
+    CREATE TABLE IF NOT EXISTS cache_tags (
+        tag TEXT NOT NULL,
+        key TEXT NOT NULL REFERENCES cache_entries(key) ON DELETE CASCADE,
+        PRIMARY KEY (tag, key)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_cache_tags_key ON cache_tags(key)",
+    """
+    CREATE TABLE IF NOT EXISTS cache_tag_versions (
+        tag TEXT PRIMARY KEY,
+        version INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+)
+
+
+def _dumps(value: Any) -> bytes:
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(data) >= COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(data, 1)
+        if len(compressed) < len(data):
+            return _ZLIB + compressed
+    return _RAW + data
+
+
+def _loads(blob: bytes) -> Any:
+    data = blob[1:]
+    if blob[:1] == _ZLIB:
+        data = zlib.decompress(data)
+    # The cache file is created 0600 under the app's data dir; only this
+    # user's processes write to it.
+    return pickle.loads(data)  # noqa: S301
+
+
+class SQLiteCacheManager(CacheManager):
+    """CacheManager whose entries live in a SQLite file shared across processes."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_size: int = 10000,
+        default_ttl: int = 300,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Initialize the shared cache, creating the file and tables if needed.
+
+        Args:
+            path: Cache database file
+            max_size: Maximum number of entries before LRU eviction. Defaults to 10000.
+            default_ttl: Default TTL in seconds. Defaults to 300 (5 minutes).
+            max_bytes: Maximum total serialized payload before LRU eviction.
+                Defaults to 256 MiB.
+        """
+        super().__init__(max_size=max_size, default_ttl=default_ttl)
+        self.path = Path(path)
+        self._max_bytes = max_bytes
+        self._local = threading.local()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.path.exists():
+            self.path.touch(mode=0o600)
+        conn = self._conn()
+        for statement in _SCHEMA:
+            conn.execute(statement)
+
+    def _conn(self) -> sqlite3.Connection:
+        """This thread's connection (reopened after fork)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                str(self.path), timeout=5.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get value from cache.
+
+        Returns None if key not found, expired, unreadable, or the cache file
+        is unavailable.
+        """
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT value, expires_at, accessed_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._count(hit=False)
+                return None
+
+            blob, expires_at, accessed_at = row
+            now = time.time()
+            if now >= expires_at:
+                conn.execute(
+                    "DELETE FROM cache_entries WHERE key = ? AND expires_at <= ?", (key, now)
+                )
+                self._count(hit=False)
+                return None
+
+            value = _loads(blob)
+            if now - accessed_at >= TOUCH_INTERVAL_S:
+                conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+        except (sqlite3.Error, pickle.UnpicklingError, zlib.error, EOFError) as e:
+            logger.warning(f"Shared cache read failed for {key}: {e}")
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int | None = None,
+        tags: Iterable[str] | None = None,
+        tag_versions: dict[str, int] | None = None,
+    ) -> bool:
+        """
+        Set value in cache with TTL; see CacheManager.set.
+
+        The tag version check and the write happen in one IMMEDIATE
+        transaction, so an invalidation from another process either lands
+        before (and the value is dropped) or after (and removes it).
+        """
+        if ttl_seconds is None:
+            ttl_seconds = self._default_ttl
+        tags = frozenset(tags or ())
+
+        try:
+            blob = _dumps(value)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.debug(f"Not caching unpicklable value for {key}: {e}")
+            return False
+
+        now = time.time()
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if tag_versions and self._tag_versions_changed(conn, tag_versions):
+                    conn.execute("ROLLBACK")
+                    return False
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, blob, len(blob), now + ttl_seconds, now),
+                )
+                if tags:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO cache_tags (tag, key) VALUES (?, ?)",
+                        [(tag, key) for tag in tags],
+                    )
+                self._evict(conn, now)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache write failed for {key}: {e}")
+            return False
+        return True
+
+    @staticmethod
+    def _read_tag_versions(conn: sqlite3.Connection, tags: list[str]) -> dict[str, int]:
+        placeholders = ", ".join("?" * len(tags))
+        sql = f"SELECT tag, version FROM cache_tag_versions WHERE tag IN ({placeholders})"  # noqa: S608 — placeholders only
+        return dict(conn.execute(sql, tags).fetchall())
+
+    def _tag_versions_changed(self, conn: sqlite3.Connection, tag_versions: dict[str, int]) -> bool:
+        current = self._read_tag_versions(conn, list(tag_versions))
+        return any(current.get(tag, 0) != version for tag, version in tag_versions.items())
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """
+        Drop expired entries, then least-recently-used ones until both the
+        entry and byte bounds hold. Called inside set()'s transaction.
+        """
+        count, total = conn.execute("SELECT COUNT(*), TOTAL(size) FROM cache_entries").fetchone()
+        if count <= self._max_size and total <= self._max_bytes:
+            return
+
+        conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        count, total = conn.execute("SELECT COUNT(*), TOTAL(size) FROM cache_entries").fetchone()
+
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM cache_entries ORDER BY accessed_at"):
+            if count <= self._max_size and total <= self._max_bytes:
+                break
+            victims.append((key,))
+            count -= 1
+            total -= size
+        if victims:
+            conn.executemany("DELETE FROM cache_entries WHERE key = ?", victims)
+            logger.debug(f"Evicted {len(victims)} LRU keys from shared cache")
+
+    def _write(self, sql: str, params: Iterable = ()) -> int:
+        try:
+            return self._conn().execute(sql, tuple(params)).rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache write failed: {e}")
+            return 0
+
+    def delete(self, key: str) -> None:
+        """Delete specific key from cache."""
+        self._write("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """
+        Invalidate all keys matching a glob pattern.
+
+        Uses SQLite GLOB, which has the same case-sensitive *, ? and [...]
+        semantics as fnmatch on POSIX.
+        """
+        return self._write("DELETE FROM cache_entries WHERE key GLOB ?", (pattern,))
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate all entries carrying any of the tags and bump their versions."""
+        tags = sorted(set(tags))
+        if not tags:
+            return 0
+        placeholders = ", ".join("?" * len(tags))
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "INSERT INTO cache_tag_versions (tag, version) VALUES (?, 1) "
+                    "ON CONFLICT(tag) DO UPDATE SET version = version + 1",
+                    [(tag,) for tag in tags],
+                )
+                count = conn.execute(
+                    "DELETE FROM cache_entries WHERE key IN "  # noqa: S608 — placeholders only
+                    f"(SELECT key FROM cache_tags WHERE tag IN ({placeholders}))",
+                    tags,
+                ).rowcount
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache tag invalidation failed: {e}")
+            return 0
+        return count
+
+    def tag_versions(self, tags: Iterable[str]) -> dict[str, int]:
+        """Current invalidation version of each tag, for set(tag_versions=...)."""
+        tags = list(tags)
+        if not tags:
+            return {}
+        try:
+            current = self._read_tag_versions(self._conn(), tags)
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache tag version read failed: {e}")
+            current = {}
+        return {tag: current.get(tag, 0) for tag in tags}
+
+    def clear(self) -> None:
+        """Clear entire cache (entries only; tag versions keep counting)."""
+        self._write("DELETE FROM cache_entries")
+
+    def cleanup_expired(self) -> int:
+        """Clean up all expired entries."""
+        return self._write("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+
+    def stats(self) -> CacheStats:
+        """
+        Get cache statistics.
+
+        hits/misses are this process's; size and oldest_entry_age are shared.
+        """
+        try:
+            size, oldest = (
+                self._conn()
+                .execute("SELECT COUNT(*), MIN(accessed_at) FROM cache_entries")
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache stats failed: {e}")
+            size, oldest = 0, None
+
+        with self._lock:
+            total_requests = self._hits + self._misses
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=size,
+                hit_rate=self._hits / total_requests if total_requests > 0 else 0.0,
+                oldest_entry_age=time.time() - oldest if oldest is not None else None,
+            )
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -15,6 +15,19 @@ from lib.state_store import get_store
 
 logger = logging.getLogger(__name__)
 
+# Scheduled minutes per (date, lane). The HH:MM parse only runs for blocks
+# written before time_blocks.start_min / end_min were populated.
+_SCHEDULED_MIN_SQL = """
+    SELECT date, lane, SUM(
+        COALESCE(end_min,
+            CAST(substr(end_time, 1, 2) AS INTEGER) * 60 + CAST(substr(end_time, 4, 2) AS INTEGER)) -
+        COALESCE(start_min,
+            CAST(substr(start_time, 1, 2) AS INTEGER) * 60 + CAST(substr(start_time, 4, 2) AS INTEGER))
+    ) as total_min
+    FROM time_blocks
+    WHERE date BETWEEN ? AND ? AND task_id IS NOT NULL
+"""
+
 
 @dataclass
 class LaneCapacity:
@@ -73,33 +86,46 @@ class CapacityCalculator:
         lane = self.get_lane(lane_id)
         if not lane:
             return None
+        return self._lane_capacity(lane)
 
+    def _lane_capacity(self, lane: dict) -> LaneCapacity:
+        """Effective capacity for a capacity_lanes row."""
         weekly_hours = lane.get("weekly_hours", 40)
         buffer_pct = lane.get("buffer_pct", 0.2)
         effective_hours = weekly_hours * (1 - buffer_pct)
         daily_hours = effective_hours / 5  # Assume 5 workdays
 
         return LaneCapacity(
-            lane_id=lane_id,
-            lane_name=lane.get("display_name", lane_id),
+            lane_id=lane["id"],
+            lane_name=lane.get("display_name", lane["id"]),
             weekly_hours=weekly_hours,
             buffer_pct=buffer_pct,
             effective_hours=effective_hours,
             daily_hours=daily_hours,
         )
 
-    def get_lane_utilization(self, lane_id: str, target_date: str | None = None) -> LaneUtilization:
+    def _scheduled_minutes(
+        self, start_date: str, end_date: str, lane_ids: list[str] | None = None
+    ) -> dict[tuple[str, str], int]:
+        """Scheduled minutes per (date, lane) in [start_date, end_date], one grouped query."""
+        sql = _SCHEDULED_MIN_SQL
+        params: list = [start_date, end_date]
+        if lane_ids is not None:
+            sql += f" AND lane IN ({', '.join('?' * len(lane_ids))})"
+            params.extend(lane_ids)
+        rows = self.store.query(sql + " GROUP BY date, lane", params)
+        return {(row["date"], row["lane"]): row["total_min"] or 0 for row in rows}
+
+    @staticmethod
+    def _utilization(
+        lane_id: str, target_date: str, capacity: LaneCapacity | None, scheduled_min: int
+    ) -> LaneUtilization:
         """
-        Calculate utilization for a lane on a specific date.
-
         Utilization = scheduled_time / effective_capacity
-        """
-        if not target_date:
-            target_date = date.today().isoformat()
 
-        capacity = self.get_lane_capacity(lane_id)
+        Unknown lanes report zero capacity and nothing scheduled.
+        """
         if not capacity:
-            # Unknown lane - return empty utilization
             return LaneUtilization(
                 lane_id=lane_id,
                 date=target_date,
@@ -110,23 +136,8 @@ class CapacityCalculator:
                 is_overloaded=False,
             )
 
-        # Get scheduled time from time_blocks for this lane
-        scheduled_blocks = self.store.query(
-            """
-            SELECT SUM(
-                (CAST(substr(end_time, 1, 2) AS INTEGER) * 60 + CAST(substr(end_time, 4, 2) AS INTEGER)) -
-                (CAST(substr(start_time, 1, 2) AS INTEGER) * 60 + CAST(substr(start_time, 4, 2) AS INTEGER))
-            ) as total_min
-            FROM time_blocks
-            WHERE date = ? AND lane = ? AND task_id IS NOT NULL
-        """,
-            [target_date, lane_id],
-        )
-
-        scheduled_min = scheduled_blocks[0]["total_min"] or 0
         capacity_min = int(capacity.daily_hours * 60)
         available_min = max(0, capacity_min - scheduled_min)
-
         utilization_pct = (scheduled_min / capacity_min * 100) if capacity_min > 0 else 0
 
         return LaneUtilization(
@@ -139,13 +150,50 @@ class CapacityCalculator:
             is_overloaded=utilization_pct > 100,
         )
 
+    def get_utilization_matrix(
+        self, start_date: str, end_date: str, lane_ids: list[str] | None = None
+    ) -> dict[str, list[LaneUtilization]]:
+        """
+        Utilization for every lane x date in [start_date, end_date].
+
+        Lane configuration and scheduled minutes for the whole range are
+        loaded once each. Returns {lane_id: [LaneUtilization per date]} with
+        dates ascending; lanes default to all configured lanes, in name order.
+        """
+        first = date.fromisoformat(start_date)
+        days = (date.fromisoformat(end_date) - first).days + 1
+        dates = [(first + timedelta(days=i)).isoformat() for i in range(days)]
+
+        capacities = {lane["id"]: self._lane_capacity(lane) for lane in self.get_lanes()}
+        if lane_ids is None:
+            lane_ids = list(capacities)
+        known = [lane_id for lane_id in lane_ids if lane_id in capacities]
+        scheduled = self._scheduled_minutes(start_date, end_date, known) if dates and known else {}
+
+        return {
+            lane_id: [
+                self._utilization(
+                    lane_id, d, capacities.get(lane_id), scheduled.get((d, lane_id), 0)
+                )
+                for d in dates
+            ]
+            for lane_id in lane_ids
+        }
+
+    def get_lane_utilization(self, lane_id: str, target_date: str | None = None) -> LaneUtilization:
+        """Calculate utilization for a lane on a specific date."""
+        if not target_date:
+            target_date = date.today().isoformat()
+
+        return self.get_utilization_matrix(target_date, target_date, [lane_id])[lane_id][0]
+
     def get_all_utilization(self, target_date: str = None) -> list[LaneUtilization]:
         """Get utilization for all lanes on a date."""
         if not target_date:
             target_date = date.today().isoformat()
 
-        lanes = self.get_lanes()
-        return [self.get_lane_utilization(lane["id"], target_date) for lane in lanes]
+        matrix = self.get_utilization_matrix(target_date, target_date)
+        return [days[0] for days in matrix.values()]
 
     def forecast_capacity(self, lane_id: str, days_ahead: int = 7) -> list[LaneUtilization]:
         """
@@ -153,15 +201,9 @@ class CapacityCalculator:
 
         Returns list of utilization for each day.
         """
-        results = []
         start = date.today()
-
-        for i in range(days_ahead):
-            forecast_date = (start + timedelta(days=i)).isoformat()
-            util = self.get_lane_utilization(lane_id, forecast_date)
-            results.append(util)
-
-        return results
+        end = start + timedelta(days=days_ahead - 1)
+        return self.get_utilization_matrix(start.isoformat(), end.isoformat(), [lane_id])[lane_id]
 
     def get_time_debt(self, lane_id: str) -> int:
         """
@@ -14,6 +14,7 @@ import sqlite3
 from datetime import datetime
 
 from lib.compat import UTC
+from lib.db import open_connection
 from lib.paths import db_path as canonical_db_path
 
 logger = logging.getLogger(__name__)
@@ -92,7 +93,7 @@ def bootstrap_lanes(
         {"created": N, "skipped": N, "lanes": [...], "dry_run": bool}
     """
     db = _get_db_path(db_path)
-    conn = sqlite3.connect(db)
+    conn = open_connection(db)
     conn.row_factory = sqlite3.Row
 
     now = datetime.now(UTC).isoformat()
@@ -169,7 +170,7 @@ def assign_tasks_to_lanes(
         {"assigned": N, "unmatched": N, "dry_run": bool}
     """
     db = _get_db_path(db_path)
-    conn = sqlite3.connect(db)
+    conn = open_connection(db)
     conn.row_factory = sqlite3.Row
 
     # Ensure lane_id column exists
@@ -246,7 +247,7 @@ def lane_load_report(db_path: str | None = None) -> dict:
         }
     """
     db = _get_db_path(db_path)
-    conn = sqlite3.connect(db)
+    conn = open_connection(db)
     conn.row_factory = sqlite3.Row
 
     # Get lanes
@@ -6,6 +6,7 @@ Usage:
     AUTH_DEBUG=1 uv run python -m lib.collectors.all_users_runner --since 2025-06-01 --until 2026-02-11
     AUTH_DEBUG=1 uv run python -m lib.collectors.all_users_runner --since 2025-06-01 --limit-users 2 --limit-per-user 10
     uv run python -m lib.collectors.all_users_runner --dry-run
+    uv run python -m lib.collectors.all_users_runner --since 2025-06-01 --workers 16
 """
 
 import argparse
@@ -14,15 +15,20 @@ import logging
 import os
 import sqlite3
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager, nullcontext
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from lib import paths
 from lib.collector_registry import CollectorLock
-from lib.collectors.resilience import COLLECTOR_ERRORS
+from lib.collectors.resilience import COLLECTOR_ERRORS, RateLimiter, SourceBudget
 from lib.compat import UTC
 from lib.credential_paths import google_sa_file
+from lib.db import open_connection
 
 logging.basicConfig(
     level=logging.INFO,
@@ -48,7 +54,7 @@ def _connect(db_path: Path) -> sqlite3.Connection:
     The runner historically used bare sqlite3.connect() (no timeout, no WAL),
     which corrupts cursors and raises under daemon+CLI concurrency.
     """
-    conn = sqlite3.connect(str(db_path), timeout=_DB_TIMEOUT_SECONDS)
+    conn = open_connection(str(db_path), timeout=_DB_TIMEOUT_SECONDS)
     conn.execute("PRAGMA journal_mode=WAL")
     return conn
 
@@ -65,6 +71,22 @@ DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
 # All supported services
 ALL_SERVICES = ["gmail", "calendar", "chat", "drive", "docs"]
 
+# Users processed at once by run_all_users (each user's services run as
+# separate pool tasks, so this is also the total number of in-flight API syncs).
+DEFAULT_SWEEP_WORKERS = 8
+
+# Per-service pacing for the sweep, shared across all users: max_concurrency caps
+# how many users one service syncs at once, requests_per_minute is a token
+# bucket over that service's API calls. Keeps a domain-wide sweep inside the
+# per-project API quotas.
+SERVICE_BUDGETS: dict[str, SourceBudget] = {
+    "gmail": SourceBudget(max_concurrency=8, requests_per_minute=1200),
+    "calendar": SourceBudget(max_concurrency=4, requests_per_minute=600),
+    "chat": SourceBudget(max_concurrency=4, requests_per_minute=600),
+    "drive": SourceBudget(max_concurrency=4, requests_per_minute=600),
+    "docs": SourceBudget(max_concurrency=4, requests_per_minute=300),
+}
+
 AUTH_DEBUG = os.environ.get("AUTH_DEBUG", "0") == "1"
 
 
@@ -185,6 +207,140 @@ def set_cursor(db_path: Path, service: str, subject: str, key: str, value: str)
     conn.close()
 
 
+class SweepState:
+    """Cursor and blocklist state, plus API pacing, for the per-user collectors.
+
+    Unbuffered (the default, used when a collect_*_for_user function is called on
+    its own) every read and write goes straight to the DB via get_cursor /
+    set_cursor / add_to_blocklist, exactly as before.
+
+    A buffered state, built with ``SweepState.load()`` at the start of a sweep,
+    reads both tables once, serves lookups from memory, queues cursor and
+    blocklist writes, and writes them in one transaction on ``flush()``. It is
+    shared by all sweep workers, so every method is thread-safe.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        buffered: bool = False,
+        budgets: dict[str, SourceBudget] | None = None,
+    ):
+        self.db_path = db_path
+        self.buffered = buffered
+        self._lock = threading.Lock()
+        self._cursors: dict[tuple[str, str, str], str | None] = {}
+        self._blocklist: dict[str, str] = {}
+        self._pending_cursors: dict[tuple[str, str, str], tuple[str, str]] = {}
+        self._pending_blocks: dict[str, tuple[str, str | None, str]] = {}
+        budgets = budgets or {}
+        self._limiters = {
+            service: RateLimiter(budget.requests_per_minute)
+            for service, budget in budgets.items()
+            if budget.requests_per_minute
+        }
+        self._slots = {
+            service: threading.BoundedSemaphore(budget.max_concurrency)
+            for service, budget in budgets.items()
+        }
+
+    @classmethod
+    def load(cls, db_path: Path, *, budgets: dict[str, SourceBudget] | None = None) -> "SweepState":
+        """Buffered state with every cursor and blocklist row read in one pass."""
+        state = cls(db_path, buffered=True, budgets=budgets)
+        conn = _connect(db_path)
+        try:
+            state._cursors = {
+                (service, subject, key): value
+                for service, subject, key, value in conn.execute(
+                    "SELECT service, subject, key, value FROM sync_cursor"
+                )
+            }
+            state._blocklist = dict(
+                conn.execute("SELECT subject, reason FROM subject_blocklist").fetchall()
+            )
+        finally:
+            conn.close()
+        return state
+
+    # -- cursors / blocklist -------------------------------------------------
+
+    def get_cursor(self, service: str, subject: str, key: str) -> str | None:
+        if not self.buffered:
+            return get_cursor(self.db_path, service, subject, key)
+        with self._lock:
+            return self._cursors.get((service, subject, key))
+
+    def set_cursor(self, service: str, subject: str, key: str, value: str) -> None:
+        if not self.buffered:
+            set_cursor(self.db_path, service, subject, key, value)
+            return
+        with self._lock:
+            self._cursors[(service, subject, key)] = value
+            self._pending_cursors[(service, subject, key)] = (
+                value,
+                datetime.now(UTC).isoformat(),
+            )
+
+    def blocklist_reason(self, subject: str) -> str | None:
+        """Blocklist reason for *subject*, or None when it is not blocklisted."""
+        if not self.buffered:
+            return is_blocklisted(self.db_path, subject)[1]
+        with self._lock:
+            return self._blocklist.get(subject)
+
+    def add_to_blocklist(self, subject: str, reason: str, error_detail: str | None = None) -> None:
+        if not self.buffered:
+            add_to_blocklist(self.db_path, subject, reason, error_detail)
+            return
+        with self._lock:
+            self._blocklist[subject] = reason
+            self._pending_blocks[subject] = (reason, error_detail, datetime.now(UTC).isoformat())
+
+    def flush(self) -> int:
+        """Write queued cursor and blocklist rows in one transaction; returns rows written."""
+        with self._lock:
+            cursors, self._pending_cursors = self._pending_cursors, {}
+            blocks, self._pending_blocks = self._pending_blocks, {}
+        if not cursors and not blocks:
+            return 0
+        conn = _connect(self.db_path)
+        try:
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO sync_cursor (service, subject, key, value, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [(*k, value, updated_at) for k, (value, updated_at) in cursors.items()],
+                )
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO subject_blocklist (subject, reason, error_detail, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    [(subject, *row) for subject, row in blocks.items()],
+                )
+        finally:
+            conn.close()
+        return len(cursors) + len(blocks)
+
+    # -- pacing --------------------------------------------------------------
+
+    def throttle(self, service: str) -> None:
+        """Block until *service*'s rate budget allows one more API call."""
+        limiter = self._limiters.get(service)
+        if limiter is None:
+            return
+        while not limiter.allow_request():
+            time.sleep(max(limiter.get_wait_time(), 0.01))
+
+    def slot(self, service: str) -> AbstractContextManager:
+        """Context manager holding one of *service*'s concurrency slots."""
+        return self._slots.get(service) or nullcontext()
+
+
 def get_gmail_service(user: str):
     """Get Gmail API service with SA+DWD."""
     from google.oauth2 import service_account
@@ -267,6 +423,7 @@ def collect_gmail_for_user(
     until: str,
     limit: int,
     db_path: Path,
+    state: SweepState | None = None,
 ) -> dict[str, Any]:
     """
     Collect Gmail for a single user with date range and pagination.
@@ -275,11 +432,13 @@ def collect_gmail_for_user(
     """
     result: dict[str, Any] = {"ok": False, "count": 0, "error": None, "is_invalid_subject": False}
 
+    state = state or SweepState(db_path)
+
     try:
         svc = get_gmail_service(user)
 
         # Check stored cursor - advance since if cursor is more recent
-        stored_cursor = get_cursor(db_path, "gmail", user, "last_until")
+        stored_cursor = state.get_cursor("gmail", user, "last_until")
         effective_since = since
 
         if stored_cursor:
@@ -326,6 +485,7 @@ def collect_gmail_for_user(
             if page_token:
                 request_params["pageToken"] = page_token
 
+            state.throttle("gmail")
             response = svc.users().messages().list(**request_params).execute()
             messages = response.get("messages", [])
             count_this_page = len(messages)
@@ -347,7 +507,7 @@ def collect_gmail_for_user(
         # Advancing on a zero-row range (transient/empty glitch) would mark
         # the range synced and the gap would never be re-fetched.
         if total_count > 0:
-            set_cursor(db_path, "gmail", user, "last_until", until)
+            state.set_cursor("gmail", user, "last_until", until)
             debug_print(f"CURSOR: gmail write new={until}")
         else:
             debug_print("CURSOR: gmail zero rows -- NOT advancing cursor")
@@ -363,7 +523,7 @@ def collect_gmail_for_user(
         # Detect invalid_grant (not a valid workspace user)
         if "invalid_grant" in error_str.lower():
             result["is_invalid_subject"] = True
-            add_to_blocklist(db_path, user, "invalid_grant", error_str[:500])
+            state.add_to_blocklist(user, "invalid_grant", error_str[:500])
         elif "403" in error_str or "401" in error_str:
             logger.error(f"Gmail auth error for {user}: {error_str}")
 
@@ -376,6 +536,7 @@ def collect_calendar_for_user(
     until: str,
     limit: int,
     db_path: Path,
+    state: SweepState | None = None,
 ) -> dict[str, Any]:
     """
     Collect Calendar events for ALL calendars for a single user.
@@ -390,11 +551,13 @@ def collect_calendar_for_user(
         "is_invalid_subject": False,
     }
 
+    state = state or SweepState(db_path)
+
     try:
         svc = get_calendar_service(user)
 
         # Check stored cursor - advance since if cursor is more recent
-        stored_cursor = get_cursor(db_path, "calendar", user, "last_until")
+        stored_cursor = state.get_cursor("calendar", user, "last_until")
         effective_since = since
 
         if stored_cursor:
@@ -430,6 +593,7 @@ def collect_calendar_for_user(
             if page_token:
                 list_params["pageToken"] = page_token
 
+            state.throttle("calendar")
             cal_response = svc.calendarList().list(**list_params).execute()
             items = cal_response.get("items", [])
 
@@ -474,6 +638,7 @@ def collect_calendar_for_user(
                     event_params["pageToken"] = page_token
 
                 try:
+                    state.throttle("calendar")
                     events_response = svc.events().list(**event_params).execute()
                     events = events_response.get("items", [])
                     cal_events += len(events)
@@ -495,13 +660,13 @@ def collect_calendar_for_user(
                     break
 
             # Store cursor per calendar (for per-calendar sync if needed later)
-            set_cursor(db_path, "calendar", user, f"calendar:{cal_id}:last_until", until)
+            state.set_cursor("calendar", user, f"calendar:{cal_id}:last_until", until)
 
         # S3.4: only advance the user-level cursor when events were fetched.
         # The user-level cursor gates whether the whole range is re-swept; a
         # zero-event range must stay un-advanced so the gap is re-fetched.
         if total_events > 0:
-            set_cursor(db_path, "calendar", user, "last_until", until)
+            state.set_cursor("calendar", user, "last_until", until)
             debug_print(f"CURSOR: calendar write new={until}")
         else:
             debug_print("CURSOR: calendar zero events -- NOT advancing cursor")
@@ -517,7 +682,7 @@ def collect_calendar_for_user(
         # Detect invalid_grant (not a valid workspace user)
         if "invalid_grant" in error_str.lower():
             result["is_invalid_subject"] = True
-            add_to_blocklist(db_path, user, "invalid_grant", error_str[:500])
+            state.add_to_blocklist(user, "invalid_grant", error_str[:500])
         elif "403" in error_str or "401" in error_str:
             logger.error(f"Calendar auth error for {user}: {error_str}")
 
@@ -530,6 +695,7 @@ def collect_chat_for_user(
     until: str,
     limit: int,
     db_path: Path,
+    state: SweepState | None = None,
 ) -> dict[str, Any]:
     """
     Collect Chat spaces and messages for a single user.
@@ -544,11 +710,13 @@ def collect_chat_for_user(
         "is_invalid_subject": False,
     }
 
+    state = state or SweepState(db_path)
+
     try:
         svc = get_chat_service(user)
 
         # Check stored cursor - advance since if cursor is more recent
-        stored_cursor = get_cursor(db_path, "chat", user, "last_until")
+        stored_cursor = state.get_cursor("chat", user, "last_until")
         effective_since = since
 
         if stored_cursor:
@@ -587,6 +755,7 @@ def collect_chat_for_user(
             if page_token:
                 list_params["pageToken"] = page_token
 
+            state.throttle("chat")
             response = svc.spaces().list(**list_params).execute()
             items = response.get("spaces", [])
             spaces.extend(items)
@@ -630,6 +799,7 @@ def collect_chat_for_user(
                     msg_params["pageToken"] = page_token
 
                 try:
+                    state.throttle("chat")
                     msg_response = svc.spaces().messages().list(**msg_params).execute()
                     messages = msg_response.get("messages", [])
                     pages_fetched += 1
@@ -668,7 +838,7 @@ def collect_chat_for_user(
         # a zero-row (empty/glitched) range is re-fetched next sweep rather than
         # silently marked synced.
         if total_messages > 0:
-            set_cursor(db_path, "chat", user, "last_until", until)
+            state.set_cursor("chat", user, "last_until", until)
             debug_print(f"CURSOR: chat write new={until}")
         else:
             debug_print("CURSOR: chat zero messages -- NOT advancing cursor")
@@ -683,7 +853,7 @@ def collect_chat_for_user(
 
         if "invalid_grant" in error_str.lower():
             result["is_invalid_subject"] = True
-            add_to_blocklist(db_path, user, "invalid_grant", error_str[:500])
+            state.add_to_blocklist(user, "invalid_grant", error_str[:500])
 
     return result
 
@@ -694,6 +864,7 @@ def collect_drive_for_user(
     until: str,
     limit: int,
     db_path: Path,
+    state: SweepState | None = None,
 ) -> dict[str, Any]:
     """
     Collect Drive files for a single user with date range and pagination.
@@ -709,11 +880,13 @@ def collect_drive_for_user(
         "is_invalid_subject": False,
     }
 
+    state = state or SweepState(db_path)
+
     try:
         svc = get_drive_service(user)
 
         # Check stored cursor - advance since if cursor is more recent
-        stored_cursor = get_cursor(db_path, "drive", user, "last_until")
+        stored_cursor = state.get_cursor("drive", user, "last_until")
         effective_since = since
 
         if stored_cursor:
@@ -757,6 +930,7 @@ def collect_drive_for_user(
             if page_token:
                 list_params["pageToken"] = page_token
 
+            state.throttle("drive")
             response = svc.files().list(**list_params).execute()
             items = response.get("files", [])
             files.extend(items)
@@ -778,7 +952,7 @@ def collect_drive_for_user(
         # zero-row (empty/glitched) range is re-fetched next sweep rather than
         # silently marked synced.
         if len(files) > 0:
-            set_cursor(db_path, "drive", user, "last_until", until)
+            state.set_cursor("drive", user, "last_until", until)
             debug_print(f"CURSOR: drive write new={until}")
         else:
             debug_print("CURSOR: drive zero files -- NOT advancing cursor")
@@ -795,7 +969,7 @@ def collect_drive_for_user(
 
         if "invalid_grant" in error_str.lower():
             result["is_invalid_subject"] = True
-            add_to_blocklist(db_path, user, "invalid_grant", error_str[:500])
+            state.add_to_blocklist(user, "invalid_grant", error_str[:500])
 
     return result
 
@@ -805,6 +979,7 @@ def collect_docs_for_user(
     doc_ids: list[str],
     limit: int,
     db_path: Path,
+    state: SweepState | None = None,
 ) -> dict[str, Any]:
     """
     Extract text content from Google Docs using drive.readonly export.
@@ -822,6 +997,8 @@ def collect_docs_for_user(
         result["ok"] = True
         return result
 
+    state = state or SweepState(db_path)
+
     try:
         svc = get_drive_service(user)  # Reuse drive.readonly for export
 
@@ -833,6 +1010,7 @@ def collect_docs_for_user(
         for doc_id in doc_ids[:limit]:
             try:
                 # Export as plain text
+                state.throttle("docs")
                 response = svc.files().export(fileId=doc_id, mimeType="text/plain").execute()
                 text = response.decode("utf-8") if isinstance(response, bytes) else str(response)
                 extracted_count += 1
@@ -957,6 +1135,7 @@ def run_all_users(
     limit_per_user: int = 50,
     dry_run: bool = False,
     services: list[str] | None = None,
+    workers: int = DEFAULT_SWEEP_WORKERS,
 ) -> dict[str, Any]:
     """
     Run collection for all internal users across specified services.
@@ -978,9 +1157,81 @@ def run_all_users(
             limit_per_user=limit_per_user,
             dry_run=dry_run,
             services=services,
+            workers=workers,
         )
 
 
+def _collect_one(
+    service: str,
+    user: str,
+    since: str,
+    until: str,
+    limit: int,
+    db_path: Path,
+    state: SweepState,
+    doc_ids: list[str] | None = None,
+) -> dict[str, Any]:
+    """Run one service's collection for one user inside that service's concurrency slot."""
+    with state.slot(service):
+        if service == "gmail":
+            return collect_gmail_for_user(user, since, until, limit, db_path, state=state)
+        if service == "calendar":
+            return collect_calendar_for_user(user, since, until, limit, db_path, state=state)
+        if service == "chat":
+            return collect_chat_for_user(user, since, until, limit, db_path, state=state)
+        if service == "drive":
+            return collect_drive_for_user(user, since, until, limit, db_path, state=state)
+        if service == "docs":
+            return collect_docs_for_user(user, doc_ids or [], limit, db_path, state=state)
+    raise ValueError(f"Unknown service: {service}")
+
+
+def _sweep_users(
+    users: list[str],
+    services: list[str],
+    since: str,
+    until: str,
+    limit: int,
+    db_path: Path,
+    state: SweepState,
+    workers: int,
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Collect every (user, service) pair on a bounded worker pool.
+
+    Returns {user: {service: result}}. Docs extraction needs the doc ids found
+    by that user's drive sync, so it is submitted when the drive result lands.
+    """
+    results: dict[str, dict[str, dict[str, Any]]] = {user: {} for user in users}
+    sweep_services = [s for s in services if s != "docs"]
+
+    pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="all-users")
+    try:
+        pending: dict[Future, tuple[str, str]] = {}
+        for i, user in enumerate(users):
+            logger.info(f"[{i + 1}/{len(users)}] Processing: {user}")
+            for service in sweep_services:
+                future = pool.submit(
+                    _collect_one, service, user, since, until, limit, db_path, state
+                )
+                pending[future] = (user, service)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                user, service = pending.pop(future)
+                result = future.result()
+                results[user][service] = result
+                doc_ids = result.get("doc_ids") if result["ok"] else None
+                if service == "drive" and "docs" in services and doc_ids:
+                    future = pool.submit(
+                        _collect_one, "docs", user, since, until, limit, db_path, state, doc_ids
+                    )
+                    pending[future] = (user, "docs")
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    return results
+
+
 def _run_all_users_locked(
     since: str,
     until: str,
@@ -988,8 +1239,15 @@ def _run_all_users_locked(
     limit_per_user: int = 50,
     dry_run: bool = False,
     services: list[str] | None = None,
+    workers: int = DEFAULT_SWEEP_WORKERS,
 ) -> dict[str, Any]:
-    """Body of run_all_users, executed while holding the all_users lock."""
+    """Body of run_all_users, executed while holding the all_users lock.
+
+    Users and their services are collected concurrently (up to ``workers``
+    at once, each service within its SERVICE_BUDGETS pacing). Cursors and the
+    blocklist are read once up front and all cursor/blocklist writes land in a
+    single transaction when the sweep ends.
+    """
     db_path = paths.db_path()
     ensure_tables(db_path)
 
@@ -1007,13 +1265,15 @@ def _run_all_users_locked(
         f"Running collection for {len(users)} users, services={services}, since={since}, until={until}"
     )
 
+    state = SweepState.load(db_path, budgets=SERVICE_BUDGETS)
+
     if dry_run:
         # Check blocklist status for each user
         blocklisted = []
         active = []
         for u in users:
-            blocked, reason = is_blocklisted(db_path, u)
-            if blocked:
+            reason = state.blocklist_reason(u)
+            if reason is not None:
                 blocklisted.append({"email": u, "reason": reason})
             else:
                 active.append(u)
@@ -1056,10 +1316,21 @@ def _run_all_users_locked(
         },
     }
 
+    # Check blocklist first
+    block_reasons = {user: state.blocklist_reason(user) for user in users}
+    active_users = [user for user in users if block_reasons[user] is None]
+
+    try:
+        outcomes = _sweep_users(
+            active_users, services, since, until, limit_per_user, db_path, state, workers
+        )
+    finally:
+        # Persist whatever cursor/blocklist progress was made, even on a crash.
+        state.flush()
+
     for i, user in enumerate(users):
-        # Check blocklist first
-        blocked, block_reason = is_blocklisted(db_path, user)
-        if blocked:
+        block_reason = block_reasons[user]
+        if block_reason is not None:
             logger.info(f"[{i + 1}/{len(users)}] SKIP (blocklisted): {user} - {block_reason}")
             report["per_user"][user] = {
                 "status": "skipped",
@@ -1068,17 +1339,16 @@ def _run_all_users_locked(
             report["totals"]["skipped_invalid_subject_count"] += 1
             continue
 
-        logger.info(f"[{i + 1}/{len(users)}] Processing: {user}")
         report["totals"]["attempted_count"] += 1
+        outcome = outcomes[user]
 
         user_report: dict[str, Any] = {"status": "attempted"}
         is_invalid = False
         any_success = False
-        doc_ids: list[str] = []
 
         # Gmail collection
-        if "gmail" in services:
-            gmail_result = collect_gmail_for_user(user, since, until, limit_per_user, db_path)
+        if "gmail" in outcome:
+            gmail_result = outcome["gmail"]
             user_report["gmail"] = {
                 "ok": gmail_result["ok"],
                 "count": gmail_result["count"],
@@ -1091,8 +1361,8 @@ def _run_all_users_locked(
                 report["totals"]["gmail_count"] += gmail_result["count"]
 
         # Calendar collection
-        if "calendar" in services:
-            calendar_result = collect_calendar_for_user(user, since, until, limit_per_user, db_path)
+        if "calendar" in outcome:
+            calendar_result = outcome["calendar"]
             user_report["calendar"] = {
                 "ok": calendar_result["ok"],
                 "count": calendar_result["count"],
@@ -1105,8 +1375,8 @@ def _run_all_users_locked(
                 report["totals"]["calendar_event_count"] += calendar_result["count"]
 
         # Chat collection
-        if "chat" in services:
-            chat_result = collect_chat_for_user(user, since, until, limit_per_user, db_path)
+        if "chat" in outcome:
+            chat_result = outcome["chat"]
             user_report["chat"] = {
                 "ok": chat_result["ok"],
                 "count": chat_result["count"],
@@ -1121,8 +1391,8 @@ def _run_all_users_locked(
                 report["totals"]["chat_space_count"] += chat_result.get("spaces_count", 0)
 
         # Drive collection
-        if "drive" in services:
-            drive_result = collect_drive_for_user(user, since, until, limit_per_user, db_path)
+        if "drive" in outcome:
+            drive_result = outcome["drive"]
             user_report["drive"] = {
                 "ok": drive_result["ok"],
                 "count": drive_result["count"],
@@ -1134,11 +1404,10 @@ def _run_all_users_locked(
             elif drive_result["ok"]:
                 any_success = True
                 report["totals"]["drive_file_count"] += drive_result["count"]
-                doc_ids = drive_result.get("doc_ids", [])
 
-        # Docs extraction (depends on drive results)
-        if "docs" in services and doc_ids:
-            docs_result = collect_docs_for_user(user, doc_ids, limit_per_user, db_path)
+        # Docs extraction (only run when drive found docs)
+        if "docs" in outcome:
+            docs_result = outcome["docs"]
             user_report["docs"] = {
                 "ok": docs_result["ok"],
                 "count": docs_result["count"],
@@ -1188,6 +1457,12 @@ def main():
     parser.add_argument(
         "--dry-run", action="store_true", help="Print planned users without calling APIs"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_SWEEP_WORKERS,
+        help="Concurrent user/service syncs (1 = serial)",
+    )
 
     args = parser.parse_args()
 
@@ -1205,6 +1480,7 @@ def main():
         limit_per_user=args.limit_per_user,
         dry_run=args.dry_run,
         services=services,
+        workers=args.workers,
     )
 
     if report:
@@ -70,6 +70,7 @@ class AsanaCollector(BaseCollector):
                 proj_name = proj.get("name", "Unknown")
                 if not proj_gid:
                     return []
+                self._check_cancelled()
                 tasks = list_tasks_in_project(proj_gid, opt_fields=TASK_OPT_FIELDS)
                 for task in tasks:
                     task["_project_name"] = proj_name
@@ -100,45 +101,54 @@ class AsanaCollector(BaseCollector):
                 f"(skipping {len(all_tasks) - len(incomplete_tasks)} completed)"
             )
 
-            for task in incomplete_tasks:
-                task_gid = task.get("gid")
-                if not task_gid:
-                    continue
+            # Each task's pulls run as one unit; tasks are fetched concurrently within
+            # the source's max_concurrency budget and merged back in task order.
+            def _fetch_expanded(task_gid: str, num_subtasks: int) -> dict[str, list]:
+                expanded: dict[str, list] = {}
 
                 # Pull subtasks if task has them
-                num_subtasks = task.get("num_subtasks", 0)
                 if num_subtasks > 0:
                     try:
-                        subtasks = list_subtasks(task_gid)
-                        if subtasks:
-                            subtasks_by_parent[task_gid] = subtasks
+                        expanded["subtasks"] = list_subtasks(task_gid)
                     except COLLECTOR_ERRORS as e:
                         self.logger.warning(f"Failed to fetch subtasks for {task_gid}: {e}")
 
                 # Pull stories (comments) - optional, don't block
                 try:
-                    stories = list_stories(task_gid)
-                    if stories:
-                        stories_by_task[task_gid] = stories
+                    expanded["stories"] = list_stories(task_gid)
                 except COLLECTOR_ERRORS as e:
                     self.logger.warning(f"Failed to fetch stories for {task_gid}: {e}")
 
                 # Pull dependencies - optional
                 try:
-                    deps = list_task_dependencies(task_gid)
-                    if deps:
-                        dependencies_by_task[task_gid] = deps
+                    expanded["deps"] = list_task_dependencies(task_gid)
                 except COLLECTOR_ERRORS as e:
                     self.logger.warning(f"Failed to fetch dependencies for {task_gid}: {e}")
 
                 # Pull attachments - optional
                 try:
-                    attachments = list_task_attachments(task_gid)
-                    if attachments:
-                        attachments_by_task[task_gid] = attachments
+                    expanded["attachments"] = list_task_attachments(task_gid)
                 except COLLECTOR_ERRORS as e:
                     self.logger.warning(f"Failed to fetch attachments for {task_gid}: {e}")
 
+                return expanded
+
+            expand_items = [
+                (task["gid"], task.get("num_subtasks", 0))
+                for task in incomplete_tasks
+                if task.get("gid")
+            ]
+            expanded_results = self._fetch_all(lambda item: _fetch_expanded(*item), expand_items)
+            for (task_gid, _), expanded in zip(expand_items, expanded_results, strict=True):
+                if expanded.get("subtasks"):
+                    subtasks_by_parent[task_gid] = expanded["subtasks"]
+                if expanded.get("stories"):
+                    stories_by_task[task_gid] = expanded["stories"]
+                if expanded.get("deps"):
+                    dependencies_by_task[task_gid] = expanded["deps"]
+                if expanded.get("attachments"):
+                    attachments_by_task[task_gid] = expanded["attachments"]
+
             # Pull portfolios and goals — track fetch errors explicitly
             # so sync() can surface them via escalate_to_partial().
             portfolios = []
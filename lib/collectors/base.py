@@ -10,14 +10,28 @@ Every collector MUST:
 import json
 import logging
 import subprocess
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, TypeVar
 
 from ..state_store import StateStore, get_store
-from .resilience import COLLECTOR_ERRORS, CircuitBreaker, RetryConfig, retry_with_backoff
+from .resilience import (
+    COLLECTOR_ERRORS,
+    CircuitBreaker,
+    CollectorCancelled,
+    RateLimiter,
+    RetryConfig,
+    SourceBudget,
+    retry_with_backoff,
+)
 from .result import CollectorResult, CollectorStatus, classify_error
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class BaseCollector(ABC):
     """Base class for all data collectors."""
@@ -55,6 +69,18 @@ class BaseCollector(ABC):
             "partial_failures": 0,
         }
 
+        # Fetch budget (max_concurrency / requests_per_minute / timeout_seconds in
+        # sources.yaml) and the cancellation flag the async orchestrator sets when
+        # the sync overruns its timeout.
+        self.budget = SourceBudget.from_config(config)
+        self.cancel_event = threading.Event()
+        self._rate_limiter = (
+            RateLimiter(self.budget.requests_per_minute)
+            if self.budget.requests_per_minute
+            else None
+        )
+        self._worker_state = threading.local()
+
     @property
     @abstractmethod
     def source_name(self) -> str:
@@ -225,6 +251,67 @@ class BaseCollector(ABC):
             )
             return result.to_dict()
 
+    # ------------------------------------------------------------------ #
+    # Budgeted, cancellable fetching                                     #
+    # ------------------------------------------------------------------ #
+
+    def _check_cancelled(self) -> None:
+        """Raise CollectorCancelled if this sync has been cancelled."""
+        if self.cancel_event.is_set():
+            raise CollectorCancelled(f"{self.source_name} sync cancelled")
+
+    def _throttle(self) -> None:
+        """Wait for a rate-limit token (no-op without requests_per_minute)."""
+        if self._rate_limiter is None:
+            return
+        while not self._rate_limiter.allow_request():
+            if self.cancel_event.wait(max(self._rate_limiter.get_wait_time(), 0.01)):
+                self._check_cancelled()
+
+    def _fetch_all(self, fetch: Callable[[T], R], items: Sequence[T]) -> list[R]:
+        """Run ``fetch(item)`` for every item under this source's budget.
+
+        Up to ``budget.max_concurrency`` calls run at once (serially when it is 1).
+        Every call first checks for cancellation and takes a rate-limit token.
+        Results come back in item order; the first exception raised by a call is
+        re-raised after pending calls are dropped. ``fetch`` should handle its own
+        per-item errors when one bad item must not fail the rest.
+        """
+
+        def call(item: T) -> R:
+            self._check_cancelled()
+            self._throttle()
+            return fetch(item)
+
+        workers = min(self.budget.max_concurrency, len(items))
+        if workers <= 1:
+            return [call(item) for item in items]
+
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self.source_name)
+        try:
+            futures = [pool.submit(call, item) for item in items]
+            return [f.result() for f in futures]
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _build_service(self) -> Any:
+        """Build a fresh API client for a fetch worker thread.
+
+        Google API clients wrap a non-thread-safe httplib2.Http, so concurrent
+        fetches each need their own. Collectors that fetch concurrently override
+        this; the default reuses ``_get_service()``.
+        """
+        return self._get_service()
+
+    def _worker_service(self) -> Any:
+        """API client for the calling thread (shared one when fetching serially)."""
+        if self.budget.max_concurrency <= 1:
+            return self._get_service()
+        service = getattr(self._worker_state, "service", None)
+        if service is None:
+            service = self._worker_state.service = self._build_service()
+        return service
+
     def should_sync(self) -> bool:
         """Check if this collector needs to sync."""
         if not self.last_sync:
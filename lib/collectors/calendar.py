@@ -8,6 +8,7 @@ DWD allowlist has `calendar.readonly` authorized (verified from admin CSV export
 import json
 import logging
 import os
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -47,6 +48,11 @@ class CalendarCollector(BaseCollector):
         if self._service:
             return self._service
 
+        self._service = self._build_service(user)
+        return self._service
+
+    def _build_service(self, user: str = DEFAULT_USER):
+        """Build a new Calendar API service (one per fetch worker when concurrent)."""
         try:
             from google.oauth2 import service_account
             from googleapiclient.discovery import build
@@ -55,8 +61,7 @@ class CalendarCollector(BaseCollector):
                 str(_sa_file()), scopes=SCOPES
             )
             creds = creds.with_subject(user)
-            self._service = build("calendar", "v3", credentials=creds)
-            return self._service
+            return build("calendar", "v3", credentials=creds)
         except COLLECTOR_ERRORS as e:
             self.logger.error(f"Failed to get Calendar service: {e}")
             raise
@@ -82,16 +87,25 @@ class CalendarCollector(BaseCollector):
             calendar_items = calendars_result.get("items", [])
             logger.debug(f"STATUS: 200 OK, {len(calendar_items)} calendars")
 
-            # Step 2: Fetch events from each calendar
+            # Step 2: Fetch events from each calendar (concurrently, within the
+            # source's max_concurrency / requests_per_minute budget)
             per_calendar_limit = max(1, max_results // max(1, len(calendar_items)))
-
-            for calendar in calendar_items:
+            fetched = [0]  # events fetched so far (calendars start in list order)
+            fetched_lock = threading.Lock()
+
+            def fetch_calendar(calendar: dict) -> list[dict]:
+                # Stop once enough events are in hand. Only calendars earlier in the
+                # list can have finished, so anything skipped here would be cut by
+                # the max_results truncation below anyway.
+                if fetched[0] >= max_results:
+                    return []
                 calendar_id = calendar.get("id", "primary")
                 logger.debug(f"ENDPOINT: calendar.events.list(calendarId='{calendar_id}')")
 
                 try:
                     results = (
-                        service.events()
+                        self._worker_service()
+                        .events()
                         .list(
                             calendarId=calendar_id,
                             timeMin=time_min,
@@ -103,22 +117,20 @@ class CalendarCollector(BaseCollector):
                         )
                         .execute()
                     )
-
-                    events = results.get("items", [])
-                    logger.debug(f"STATUS: 200 OK, {len(events)} events from {calendar_id}")
-
-                    for event in events:
-                        event_copy = event.copy()
-                        event_copy["calendar_id"] = calendar_id
-                        all_events.append(event_copy)
-
-                        # Stop if we've collected enough total events
-                        if len(all_events) >= max_results:
-                            return {"events": all_events[:max_results]}
-
                 except COLLECTOR_ERRORS as e:
                     self.logger.warning(f"Failed to fetch events from calendar {calendar_id}: {e}")
-                    continue
+                    return []
+
+                events = results.get("items", [])
+                logger.debug(f"STATUS: 200 OK, {len(events)} events from {calendar_id}")
+                with fetched_lock:
+                    fetched[0] += len(events)
+                return [{**event, "calendar_id": calendar_id} for event in events]
+
+            # Merge in calendar order; the max_results cut keeps the same events a
+            # serial walk that stopped at max_results would have kept.
+            for events in self._fetch_all(fetch_calendar, calendar_items):
+                all_events.extend(events)
 
             return {"events": all_events[:max_results]}
 
@@ -54,6 +54,11 @@ class ChatCollector(BaseCollector):
         if self._service:
             return self._service
 
+        self._service = self._build_service(user)
+        return self._service
+
+    def _build_service(self, user: str = DEFAULT_USER):
+        """Build a new Chat API service (one per fetch worker when concurrent)."""
         try:
             from google.oauth2 import service_account
             from googleapiclient.discovery import build
@@ -62,8 +67,7 @@ class ChatCollector(BaseCollector):
                 str(_sa_file()), scopes=SCOPES
             )
             creds = creds.with_subject(user)
-            self._service = build("chat", "v1", credentials=creds)
-            return self._service
+            return build("chat", "v1", credentials=creds)
         except COLLECTOR_ERRORS as e:
             self.logger.error(f"Failed to get Chat service: {e}")
             raise
@@ -98,22 +102,44 @@ class ChatCollector(BaseCollector):
             # (the spaces that DID succeed are still collected and stored).
             partial_failures: list[dict[str, str]] = []
 
-            # For each space, collect messages, metadata, and members
-            for space in spaces:
-                space_name = space.get("name", "")
-                if not space_name:
-                    continue
+            # For each space, collect messages and members (spaces fetched
+            # concurrently, within the source's max_concurrency /
+            # requests_per_minute budget)
+            def fetch_space(space_name: str) -> dict[str, Any]:
+                worker_service = self._worker_service()
+                messages, msg_error = self._list_messages(
+                    worker_service, space_name, max_messages_per_space
+                )
+                try:
+                    members, members_error = self._list_members(worker_service, space_name), None
+                except COLLECTOR_ERRORS as e:
+                    self.logger.warning(f"Failed to fetch members for {space_name}: {e}")
+                    members, members_error = [], str(e)
+                return {
+                    "messages": messages,
+                    "messages_error": msg_error,
+                    "members": members,
+                    "members_error": members_error,
+                }
+
+            named_spaces = [space for space in spaces if space.get("name", "")]
+            fetched = self._fetch_all(fetch_space, [space["name"] for space in named_spaces])
+
+            # Merge in space order
+            for space, space_data in zip(named_spaces, fetched, strict=True):
+                space_name = space["name"]
 
                 # Collect space metadata
                 space_metadata[space_name] = space
 
-                # Collect messages
-                messages, msg_error = self._list_messages(
-                    service, space_name, max_messages_per_space
-                )
-                if msg_error is not None:
+                messages = space_data["messages"]
+                if space_data["messages_error"] is not None:
                     partial_failures.append(
-                        {"space": space_name, "component": "messages", "error": msg_error}
+                        {
+                            "space": space_name,
+                            "component": "messages",
+                            "error": space_data["messages_error"],
+                        }
                     )
                 for msg in messages:
                     msg["_space_name"] = space_name
@@ -121,16 +147,16 @@ class ChatCollector(BaseCollector):
                     msg["_space_type"] = space.get("spaceType", "UNKNOWN")
                 all_messages.extend(messages)
 
-                # Collect space members
-                try:
-                    members = self._list_members(service, space_name)
-                    if members:
-                        space_members_by_space[space_name] = members
-                except COLLECTOR_ERRORS as e:
-                    self.logger.warning(f"Failed to fetch members for {space_name}: {e}")
+                if space_data["members_error"] is not None:
                     partial_failures.append(
-                        {"space": space_name, "component": "members", "error": str(e)}
+                        {
+                            "space": space_name,
+                            "component": "members",
+                            "error": space_data["members_error"],
+                        }
                     )
+                elif space_data["members"]:
+                    space_members_by_space[space_name] = space_data["members"]
 
             result: dict[str, Any] = {
                 "messages": all_messages,
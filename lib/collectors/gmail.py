@@ -48,6 +48,11 @@ class GmailCollector(BaseCollector):
         if self._service:
             return self._service
 
+        self._service = self._build_service(user)
+        return self._service
+
+    def _build_service(self, user: str = DEFAULT_USER):
+        """Build a new Gmail API service (one per fetch worker when concurrent)."""
         try:
             from google.oauth2 import service_account
             from googleapiclient.discovery import build
@@ -56,8 +61,7 @@ class GmailCollector(BaseCollector):
                 str(_sa_file()), scopes=SCOPES
             )
             creds = creds.with_subject(user)
-            self._service = build("gmail", "v1", credentials=creds)
-            return self._service
+            return build("gmail", "v1", credentials=creds)
         except COLLECTOR_ERRORS as e:
             self.logger.error(f"Failed to get Gmail service: {e}")
             raise
@@ -104,7 +108,6 @@ class GmailCollector(BaseCollector):
         """
         try:
             service = self._get_service()
-            all_threads = []
             max_results = self.config.get("max_results", 500)
             since = self.config.get("since")  # ISO date for backfill
 
@@ -130,6 +133,7 @@ class GmailCollector(BaseCollector):
                 if page_token:
                     list_params["pageToken"] = page_token
 
+                self._check_cancelled()
                 results = service.users().threads().list(**list_params).execute()
                 thread_refs.extend(results.get("threads", []))
 
@@ -142,39 +146,41 @@ class GmailCollector(BaseCollector):
 
             self.logger.info(f"Found {len(thread_refs)} thread refs to fetch")
 
-            # Fetch full thread details with all message data
-            for ref in thread_refs[:max_results] if max_results else thread_refs:
+            # Fetch full thread details with all message data (concurrently, within
+            # the source's max_concurrency / requests_per_minute budget)
+            def fetch_thread(ref: dict) -> dict | None:
                 try:
                     thread = (
-                        service.users()
+                        self._worker_service()
+                        .users()
                         .threads()
                         .get(userId="me", id=ref["id"], format="full")
                         .execute()
                     )
-
-                    messages = thread.get("messages", [])
-                    if not messages:
-                        continue
-
-                    first_msg = messages[0]
-                    headers = first_msg.get("payload", {}).get("headers", [])
-
-                    all_threads.append(
-                        {
-                            "id": thread["id"],
-                            "messages": messages,  # Store all messages for participant/attachment extraction
-                            "subject": self._get_header(headers, "Subject"),
-                            "from": self._get_header(headers, "From"),
-                            "to": self._get_header(headers, "To"),
-                            "date": self._get_header(headers, "Date"),
-                            "snippet": thread.get("snippet", ""),
-                            "body": self._extract_body(first_msg),
-                            "labels": first_msg.get("labelIds", []),
-                        }
-                    )
                 except COLLECTOR_ERRORS as e:
                     self.logger.warning(f"Failed to fetch thread {ref['id']}: {e}")
-                    continue
+                    return None
+
+                messages = thread.get("messages", [])
+                if not messages:
+                    return None
+
+                first_msg = messages[0]
+                headers = first_msg.get("payload", {}).get("headers", [])
+                return {
+                    "id": thread["id"],
+                    "messages": messages,  # Store all messages for participant/attachment extraction
+                    "subject": self._get_header(headers, "Subject"),
+                    "from": self._get_header(headers, "From"),
+                    "to": self._get_header(headers, "To"),
+                    "date": self._get_header(headers, "Date"),
+                    "snippet": thread.get("snippet", ""),
+                    "body": self._extract_body(first_msg),
+                    "labels": first_msg.get("labelIds", []),
+                }
+
+            refs = thread_refs[:max_results] if max_results else thread_refs
+            all_threads = [t for t in self._fetch_all(fetch_thread, refs) if t is not None]
 
             self.logger.info(f"Collected {len(all_threads)} threads")
             return {"threads": all_threads}
@@ -6,6 +6,7 @@ All collection goes through class-based collectors in lib/collectors/.
 No legacy scripts, no gog CLI, no importlib hacks.
 """
 
+import asyncio
 import logging
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -15,7 +16,7 @@ import yaml
 
 from lib import paths
 from lib.collector_registry import COLLECTOR_REGISTRY, CollectorLock, get_collector_map
-from lib.collectors.resilience import COLLECTOR_ERRORS
+from lib.collectors.resilience import COLLECTOR_ERRORS, CollectorCancelled
 from lib.collectors.result import CollectorResult, CollectorStatus, classify_error
 from lib.state_tracker import mark_collected
 
@@ -52,6 +53,13 @@ logger = logging.getLogger(__name__)
 # Per-collector timeout in seconds
 COLLECTOR_TIMEOUT_SECONDS = 300
 
+# How sync_all fans out over collectors, from `orchestration.mode` in sources.yaml:
+#   threads - one pool thread per collector (default)
+#   async   - asyncio.gather over collectors, each bounded by its own
+#             timeout_seconds budget and cancelled when it overruns
+ORCHESTRATION_MODES = ("threads", "async")
+DEFAULT_ORCHESTRATION_MODE = "threads"
+
 # Default inbox-enrichment batch size per collect cycle. Read at call time from
 # MOH_INBOX_ENRICH_LIMIT so backlogs don't drain at a fixed 20/cycle (and so the
 # env override is honored without a module reload).
@@ -89,6 +97,15 @@ def _resolve_collector_map() -> dict[str, type]:
     return resolved
 
 
+def _event_loop_running() -> bool:
+    """True when called from inside a running asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 class CollectorOrchestrator:
     """
     Orchestrates all data collectors.
@@ -223,6 +240,12 @@ class CollectorOrchestrator:
                 )
                 return cr.to_dict()
 
+            # A flag left set by an earlier, timed-out run must not cancel this one.
+            # Cleared only once the lock is held, i.e. after that run has exited.
+            cancel_event = getattr(collector, "cancel_event", None)
+            if cancel_event is not None:
+                cancel_event.clear()
+
             try:
                 result: dict[str, Any] = collector.sync()
                 # Mark collected for SUCCESS or PARTIAL — both wrote primary data
@@ -230,6 +253,15 @@ class CollectorOrchestrator:
                     mark_collected(name)
                     self._record_freshness(name, result.get("stored", 0) or 0)
                 return result
+            except CollectorCancelled as e:
+                self.logger.error("Sync cancelled for %s: %s", name, e)
+                cr = CollectorResult(
+                    source=name,
+                    status=CollectorStatus.FAILED,
+                    error=str(e),
+                    error_type="timeout",
+                )
+                return cr.to_dict()
             except COLLECTOR_ERRORS as e:
                 self.logger.error("Sync failed for %s: %s", name, e)
                 cr = CollectorResult(
@@ -297,18 +329,67 @@ class CollectorOrchestrator:
 
         # All sources in parallel
         sources_to_sync = list(self.collectors.keys())
-        results = {}
 
         if force:
             self.logger.info("Force mode: breaking all collector locks")
 
-        self.logger.info(f"Starting parallel sync of {len(sources_to_sync)} collectors")
+        mode = self._orchestration_mode()
+        if mode == "async" and not _event_loop_running():
+            self.logger.info(f"Starting async sync of {len(sources_to_sync)} collectors")
+            results = asyncio.run(self._sync_all_async(sources_to_sync, force=force))
+        else:
+            if mode == "async":
+                self.logger.warning("Event loop already running; using threaded sync instead")
+            self.logger.info(f"Starting parallel sync of {len(sources_to_sync)} collectors")
+            results = self._sync_all_threaded(sources_to_sync, force=force)
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {
-                executor.submit(self._sync_one, name, force=force): name for name in sources_to_sync
+        # Surface collectors that failed to initialize (and did not recover via
+        # the reinit above) under a reserved _init_failures key, so a full-sync
+        # caller sees them as explicit failures rather than silently missing
+        # collectors. Omitted entirely when there are no init failures.
+        remaining_init_failures = getattr(self, "init_failures", None)
+        if remaining_init_failures:
+            results["_init_failures"] = {
+                name: {"success": False, "error": error}
+                for name, error in remaining_init_failures.items()
             }
 
+        # Post-collection: entity linking
+        self._run_entity_linking(results)
+
+        # Post-collection: communication -> client attribution (after linking,
+        # which sets the communications.client_id it prefers)
+        self._run_attribution(results)
+
+        # Post-collection: inbox enrichment
+        self._run_inbox_enrichment(results)
+
+        return results
+
+    def _orchestration_mode(self) -> str:
+        """`orchestration.mode` from sources.yaml, falling back to threads."""
+        config = getattr(self, "config", None) or {}
+        mode = (config.get("orchestration") or {}).get("mode", DEFAULT_ORCHESTRATION_MODE)
+        if mode not in ORCHESTRATION_MODES:
+            self.logger.warning("Unknown orchestration mode %r; using threads", mode)
+            return DEFAULT_ORCHESTRATION_MODE
+        return mode
+
+    def _timeout_result(self, name: str, timeout: float) -> dict[str, Any]:
+        cr = CollectorResult(
+            source=name,
+            status=CollectorStatus.FAILED,
+            error=f"timeout after {timeout:g}s",
+            error_type="timeout",
+        )
+        return cr.to_dict()
+
+    def _sync_all_threaded(self, names: list[str], *, force: bool) -> dict[str, Any]:
+        """Sync *names* on a thread pool, one thread per collector."""
+        results: dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = {executor.submit(self._sync_one, name, force=force): name for name in names}
+
             # NOTE: future.result(timeout=...) frees this waiting caller but
             # does NOT kill a wedged worker thread. SIGALRM (watchdog.py) can't
             # interrupt a pool worker either (it only fires on the main thread).
@@ -322,13 +403,7 @@ class CollectorOrchestrator:
                     self.logger.error(
                         "Collector %s timed out after %ds", name, COLLECTOR_TIMEOUT_SECONDS
                     )
-                    cr = CollectorResult(
-                        source=name,
-                        status=CollectorStatus.FAILED,
-                        error=f"timeout after {COLLECTOR_TIMEOUT_SECONDS}s",
-                        error_type="timeout",
-                    )
-                    results[name] = cr.to_dict()
+                    results[name] = self._timeout_result(name, COLLECTOR_TIMEOUT_SECONDS)
                 except COLLECTOR_ERRORS as e:
                     self.logger.warning("Collector %s failed: %s", name, e)
                     cr = CollectorResult(
@@ -338,25 +413,59 @@ class CollectorOrchestrator:
                         error_type=classify_error(e),
                     )
                     results[name] = cr.to_dict()
+        return results
 
-        # Surface collectors that failed to initialize (and did not recover via
-        # the reinit above) under a reserved _init_failures key, so a full-sync
-        # caller sees them as explicit failures rather than silently missing
-        # collectors. Omitted entirely when there are no init failures.
-        remaining_init_failures = getattr(self, "init_failures", None)
-        if remaining_init_failures:
-            results["_init_failures"] = {
-                name: {"success": False, "error": error}
-                for name, error in remaining_init_failures.items()
-            }
-
-        # Post-collection: entity linking
-        self._run_entity_linking(results)
+    async def _sync_all_async(self, names: list[str], *, force: bool) -> dict[str, Any]:
+        """Sync *names* concurrently on the event loop, each under its own timeout.
 
-        # Post-collection: inbox enrichment
-        self._run_inbox_enrichment(results)
+        Collectors are blocking code, so each runs on a dedicated executor thread;
+        the loop only awaits them. The executor is shut down without waiting so a
+        collector that ignores cancellation cannot hold up the cycle.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, len(names)), thread_name_prefix="collector"
+        )
+        try:
+            synced = await asyncio.gather(
+                *(self._sync_one_async(name, executor, force=force) for name in names)
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return dict(zip(names, synced, strict=True))
+
+    async def _sync_one_async(
+        self, name: str, executor: ThreadPoolExecutor, *, force: bool
+    ) -> dict[str, Any]:
+        """Run _sync_one for *name* on *executor*, cancelling it on timeout.
+
+        Python threads cannot be killed, so cancellation is cooperative: the
+        collector's cancel_event is set and its fetch loop raises
+        CollectorCancelled at the next page/request boundary, releasing its
+        lock. This coroutine returns the timeout result immediately either way.
+        """
+        collector = self.collectors.get(name)
+        budget = getattr(collector, "budget", None)
+        timeout = budget.timeout_seconds if budget is not None else COLLECTOR_TIMEOUT_SECONDS
 
-        return results
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(executor, lambda: self._sync_one(name, force=force))
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except TimeoutError:
+            self.logger.error("Collector %s timed out after %gs; cancelling", name, timeout)
+            cancel_event = getattr(collector, "cancel_event", None)
+            if cancel_event is not None:
+                cancel_event.set()
+            return self._timeout_result(name, timeout)
+        except COLLECTOR_ERRORS as e:
+            self.logger.warning("Collector %s failed: %s", name, e)
+            cr = CollectorResult(
+                source=name,
+                status=CollectorStatus.FAILED,
+                error=str(e),
+                error_type=classify_error(e),
+            )
+            return cr.to_dict()
 
     def _run_entity_linking(self, results: dict) -> None:
         """Run entity linking after collection."""
@@ -370,6 +479,17 @@ class CollectorOrchestrator:
             self.logger.warning("Entity linking failed: %s", e)
             results["entity_linking"] = {"error": str(e)}
 
+    def _run_attribution(self, results: dict) -> None:
+        """Attribute new and changed communications to clients after collection."""
+        try:
+            from lib.comm_attribution import sync_attribution
+
+            self.logger.info("Running communication attribution")
+            results["attribution"] = self.store.transaction(sync_attribution)
+        except COLLECTOR_ERRORS as e:
+            self.logger.warning("Communication attribution failed: %s", e)
+            results["attribution"] = {"error": str(e)}
+
     def _run_inbox_enrichment(self, results: dict) -> None:
         """Run inbox enrichment after collection."""
         try:
@@ -12,9 +12,9 @@ approved S608 suppression) — no f-string SQL and no per-call noqa here.
 """
 
 import logging
-import sqlite3
 
 from lib import safe_sql
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +55,7 @@ def tombstone_missing(
     # defaults foreign_keys OFF per-connection, matching the rest of the codebase's
     # delete paths (the Xero source-replace likewise does not enforce it). Cleaning
     # up dependent time_blocks for upstream-deleted tasks is a separate follow-up.
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = open_connection(db_path, timeout=30.0)
     try:
         cur = conn.execute(sql, params)
         conn.commit()
@@ -5,6 +5,8 @@ Provides:
 - RetryConfig: Configuration for retry behavior
 - CircuitBreaker: Fail-fast pattern for cascading failures
 - RateLimiter: Token bucket rate limiting
+- SourceBudget: Per-source concurrency / rate / timeout budget from sources.yaml
+- CollectorCancelled: Raised inside a collector whose sync was cancelled
 - retry_with_backoff: Decorator/function for exponential backoff with jitter
 """
 
@@ -73,6 +75,45 @@ class RetryConfig:
     exponential_base: float = 2.0
 
 
+# Default wall-clock budget for one collector sync, in seconds.
+DEFAULT_SYNC_TIMEOUT_SECONDS = 300
+
+
+@dataclass
+class SourceBudget:
+    """Per-source fetch budget, read from the source's block in sources.yaml.
+
+    max_concurrency:     API page/detail fetches a collector may run at once
+                         within one sync (1 = serial).
+    requests_per_minute: Token-bucket ceiling shared by those fetches
+                         (None = unlimited).
+    timeout_seconds:     Wall-clock limit for the whole sync; the async
+                         orchestrator cancels the collector when it is exceeded.
+    """
+
+    max_concurrency: int = 1
+    requests_per_minute: int | None = None
+    timeout_seconds: float = DEFAULT_SYNC_TIMEOUT_SECONDS
+
+    @classmethod
+    def from_config(cls, config: dict) -> "SourceBudget":
+        rpm = config.get("requests_per_minute")
+        return cls(
+            max_concurrency=max(1, int(config.get("max_concurrency", 1))),
+            requests_per_minute=int(rpm) if rpm else None,
+            timeout_seconds=float(config.get("timeout_seconds", DEFAULT_SYNC_TIMEOUT_SECONDS)),
+        )
+
+
+class CollectorCancelled(Exception):
+    """Raised inside a collector once its sync has been cancelled.
+
+    Deliberately NOT part of COLLECTOR_ERRORS: the per-item ``except
+    COLLECTOR_ERRORS`` handlers inside collectors must not swallow it, so it
+    unwinds the whole sync at the next page boundary.
+    """
+
+
 class CircuitBreakerState:
     """Circuit breaker states."""
 
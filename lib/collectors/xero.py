@@ -498,8 +498,17 @@ class XeroCollector:
             # Atomically replace all xero invoices in ONE transaction: the DELETE
             # and every reinsert commit together, so a failure rolls back and the
             # prior receivables are retained (never a half-cleared table).
+            # only_changed: invoices whose content (minus the per-sync timestamps)
+            # is unchanged are left as-is, so a steady-state re-sync writes nothing.
             try:
-                self.store.replace_source_rows("invoices", "source", "xero", invoice_rows)
+                self.store.replace_source_rows(
+                    "invoices",
+                    "source",
+                    "xero",
+                    invoice_rows,
+                    only_changed=True,
+                    ignore_columns=("created_at", "updated_at"),
+                )
             except COLLECTOR_ERRORS as e:
                 logger.error("Atomic invoice replace failed; prior data retained: %s", e)
                 self.circuit_breaker.record_failure()
@@ -0,0 +1,179 @@
+"""
+Communication → client attribution.
+
+Resolves each communication to at most one client and persists the result in
+communication_client_attribution, so readers join on an indexed key instead of
+matching every subject against every client name with LIKE.
+
+Rules:
+- A communication the normalizer already linked (communications.client_id,
+  from client identities) keeps that client (method 'linked').
+- Otherwise the longest client name found in the subject wins (method
+  'subject'). Names match case-insensitively at word boundaries, using the
+  EntityPatternIndex from the v4 ingest pipeline, so the subject is scanned
+  once regardless of how many clients exist.
+- Everything else gets a row with client_id NULL (method 'none'), which records
+  that it was evaluated.
+
+sync_attribution() is incremental. It re-attributes only communications that
+are new or whose subject/client_id changed since their row was written, plus
+those a client add, rename or removal can affect, and drops rows for deleted
+communications. CollectorOrchestrator runs it after every full sync (the
+daemon's collect stage), and the Normalizer in the on-demand loop.
+"""
+
+import logging
+import sqlite3
+from datetime import datetime, timezone
+
+from lib.v4.pattern_matcher import EntityPatternIndex
+
+logger = logging.getLogger(__name__)
+
+# Shorter names match too much incidental subject text.
+MIN_NAME_LENGTH = 3
+
+METHOD_LINKED = "linked"
+METHOD_SUBJECT = "subject"
+METHOD_NONE = "none"
+
+_BATCH = 1000
+
+
+def _client_patterns(conn: sqlite3.Connection) -> dict[str, str]:
+    """client_id -> lowercased name for every client with a usable name."""
+    patterns = {}
+    for client_id, name in conn.execute("SELECT id, name FROM clients ORDER BY id"):
+        pattern = (name or "").strip().lower()
+        if len(pattern) >= MIN_NAME_LENGTH:
+            patterns[client_id] = pattern
+    return patterns
+
+
+def _best_match(index: EntityPatternIndex, subject: str | None) -> tuple[str, str] | None:
+    """(client_id, pattern) of the longest client name in *subject*, if any."""
+    if not subject:
+        return None
+    best = None
+    for client_id, pattern in index.match(subject.lower()):
+        if best is None or len(pattern) > len(best[1]):
+            best = (client_id, pattern)
+    return best
+
+
+def attribute(
+    index: EntityPatternIndex, subject: str | None, linked_client_id: str | None
+) -> tuple[str | None, str, str | None]:
+    """(client_id, method, matched_pattern) for one communication."""
+    if linked_client_id:
+        return linked_client_id, METHOD_LINKED, None
+    match = _best_match(index, subject)
+    if match:
+        return match[0], METHOD_SUBJECT, match[1]
+    return None, METHOD_NONE, None
+
+
+def sync_attribution(conn: sqlite3.Connection, full: bool = False) -> dict:
+    """
+    Bring communication_client_attribution up to date.
+
+    Runs inside the caller's transaction; the caller commits. With full=True
+    every communication is re-attributed. Returns counts of attributed and
+    removed rows and of clients whose name changed.
+    """
+    patterns = _client_patterns(conn)
+    index = EntityPatternIndex(min_length=MIN_NAME_LENGTH)
+    index.sync({cid: [pattern] for cid, pattern in patterns.items()})
+
+    if full:
+        conn.execute("DELETE FROM communication_client_attribution")
+    old_patterns = dict(
+        conn.execute("SELECT client_id, pattern FROM communication_attribution_patterns")
+    )
+    first_run = not conn.execute(
+        "SELECT 1 FROM communication_client_attribution LIMIT 1"
+    ).fetchone()
+
+    # New communications, or ones whose subject / linked client moved on.
+    todo: dict[str, tuple[str | None, str | None]] = {
+        row[0]: (row[1], row[2])
+        for row in conn.execute("""
+            SELECT m.id, m.subject, m.client_id
+            FROM communications m
+            LEFT JOIN communication_client_attribution a ON a.communication_id = m.id
+            WHERE a.communication_id IS NULL
+               OR a.subject IS NOT m.subject
+               OR a.linked_client_id IS NOT m.client_id
+        """)
+    }
+
+    # Clients renamed or removed since the last sync, and names that are new.
+    stale = sorted(cid for cid, pattern in old_patterns.items() if patterns.get(cid) != pattern)
+    new_patterns = {
+        pattern for cid, pattern in patterns.items() if old_patterns.get(cid) != pattern
+    }
+    changed = len(stale) + len(patterns.keys() - old_patterns.keys())
+
+    if not first_run:
+        # Rows attributed by subject to a renamed/removed client must be redone.
+        for start in range(0, len(stale), _BATCH):
+            chunk = stale[start : start + _BATCH]
+            for row in conn.execute(
+                f"""
+                SELECT m.id, m.subject, m.client_id
+                FROM communication_client_attribution a
+                JOIN communications m ON m.id = a.communication_id
+                WHERE a.method = '{METHOD_SUBJECT}'
+                AND a.client_id IN ({", ".join("?" for _ in chunk)})
+            """,  # noqa: S608 — constant method, placeholders only
+                chunk,
+            ):
+                todo[row[0]] = (row[1], row[2])
+
+        # New or renamed names can take over unlinked subjects; scan them with an
+        # index holding only the new names.
+        if new_patterns:
+            new_index = EntityPatternIndex(min_length=MIN_NAME_LENGTH)
+            new_index.sync({pattern: [pattern] for pattern in sorted(new_patterns)})
+            for comm_id, subject in conn.execute("""
+                SELECT m.id, m.subject
+                FROM communications m
+                WHERE m.client_id IS NULL AND m.subject IS NOT NULL
+            """):
+                if comm_id not in todo and new_index.find(subject.lower()):
+                    todo[comm_id] = (subject, None)
+
+    now = datetime.now(timezone.utc).isoformat()
+    rows = []
+    for comm_id, (subject, linked_client_id) in todo.items():
+        client_id, method, pattern = attribute(index, subject, linked_client_id)
+        rows.append((comm_id, client_id, method, pattern, subject, linked_client_id, now))
+    for start in range(0, len(rows), _BATCH):
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO communication_client_attribution
+                (communication_id, client_id, method, matched_pattern, subject,
+                 linked_client_id, attributed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+            rows[start : start + _BATCH],
+        )
+
+    removed = conn.execute("""
+        DELETE FROM communication_client_attribution
+        WHERE communication_id NOT IN (SELECT id FROM communications)
+    """).rowcount
+
+    if old_patterns != patterns:
+        conn.execute("DELETE FROM communication_attribution_patterns")
+        conn.executemany(
+            "INSERT INTO communication_attribution_patterns (client_id, pattern) VALUES (?, ?)",
+            patterns.items(),
+        )
+
+    if rows or removed:
+        logger.info(
+            f"Communication attribution: {len(rows)} attributed, {removed} removed, "
+            f"{changed} clients changed"
+        )
+    return {"attributed": len(rows), "removed": removed, "clients_changed": changed}
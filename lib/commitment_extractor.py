@@ -12,6 +12,7 @@ import sqlite3
 from datetime import date, datetime, timedelta, timezone
 
 from lib import paths
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +62,7 @@ TIME_PATTERNS = {
 
 
 def get_conn():
-    conn = sqlite3.connect(str(paths.db_path()))
+    conn = open_connection(str(paths.db_path()))
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -13,6 +13,7 @@ import os
 import sqlite3
 
 from lib import paths
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +51,7 @@ JSON output (array only, no explanation):"""
 
 
 def get_conn():
-    conn = sqlite3.connect(str(paths.db_path()))
+    conn = open_connection(str(paths.db_path()))
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -14,9 +14,10 @@ This contract is bound to the frontend UI spec v2.9.0.
 Any schema changes must be coordinated with frontend.
 """
 
-from typing import Literal
+from functools import lru_cache
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, create_model, field_validator, model_validator
 
 # =============================================================================
 # CONTRACT VERSION — MUST MATCH FRONTEND UI SPEC
@@ -320,3 +321,25 @@ def validate_snapshot_shape(snapshot: dict) -> AgencySnapshotContract:
         Validated AgencySnapshotContract instance
     """
     return AgencySnapshotContract.model_validate(snapshot)
+
+
+@lru_cache(maxsize=64)
+def partial_snapshot_contract(trusted_sections: frozenset[str]) -> type[AgencySnapshotContract]:
+    """
+    AgencySnapshotContract with *trusted_sections* accepted as-is.
+
+    Used for incremental snapshots: sections reused unchanged from a snapshot
+    that already passed validation are typed Any, so only recomputed sections
+    (plus meta/trust and the model validators) are validated again. The key
+    set and extra="forbid" are unchanged.
+    """
+    if not trusted_sections:
+        return AgencySnapshotContract
+    unknown = trusted_sections - AgencySnapshotContract.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown snapshot sections: {sorted(unknown)}")
+    return create_model(
+        "PartialAgencySnapshotContract",
+        __base__=AgencySnapshotContract,
+        **dict.fromkeys(sorted(trusted_sections), (Any, ...)),
+    )
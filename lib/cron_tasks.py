@@ -4,13 +4,14 @@ Cron task handlers for MOH Time OS.
 These are called by system cron jobs:
 - daily_sync: Sync from Xero/Asana (06:00)
 - daily_backup: Create backup (03:00)
+- wal_archive: Archive WAL frames between backups (every 15m)
 - health_check: Run health check (every 6h)
 """
 
 import logging
 import sqlite3
 
-from .backup import create_backup, prune_backups
+from .backup import archive_wal, create_backup, prune_backups
 from .classify import run_auto_classification
 from .health import health_check, self_heal
 from .maintenance import fix_item_priorities
@@ -93,17 +94,18 @@ def cron_daily_backup() -> dict:
     results["self_heal"] = heal_actions
 
     # Create backup
-    success, path = create_backup(tag="daily")
+    path = create_backup(label="daily")
+    success = path is not None
     results["backup"] = {
         "success": success,
-        "path": path if success else None,
-        "error": None if success else path,
+        "path": str(path) if success else None,
+        "error": None if success else "create_backup failed (see log)",
     }
 
     if success:
         log.info(f"Backup created: {path}")
     else:
-        log.error(f"Backup failed: {path}")
+        log.error("Backup failed")
 
     # Prune old backups
     deleted = prune_backups(keep=7)
@@ -113,6 +115,23 @@ def cron_daily_backup() -> dict:
     return results
 
 
+def cron_wal_archive() -> dict:
+    """
+    Archive WAL frames committed since the last run.
+
+    Called every 15 minutes. Between daily backups this gives point-in-time
+    restore at 15-minute granularity; when the WAL chain cannot continue a new
+    full backup is taken instead.
+    """
+    result = archive_wal()
+    if "segment" in result:
+        result["segment"] = str(result["segment"])
+    if result.get("backup") is not None:
+        result["backup"] = str(result["backup"])
+    log.info(f"WAL archive: {result['status']} ({result['frames']} frames)")
+    return result
+
+
 def cron_health_check() -> dict:
     """
     Run periodic health check.
@@ -262,6 +281,12 @@ def get_cron_config() -> dict:
             "task": "Backup database and prune old backups",
             "handler": "cron_daily_backup",
         },
+        "wal_archive": {
+            "schedule": "*/15 * * * *",  # Every 15 minutes
+            "timezone": "Asia/Dubai",
+            "task": "Archive WAL frames for point-in-time restore",
+            "handler": "cron_wal_archive",
+        },
         "health_check": {
             "schedule": "0 */6 * * *",  # Every 6 hours
             "timezone": "Asia/Dubai",
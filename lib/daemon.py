@@ -171,7 +171,7 @@ class TimeOSDaemon:
     def _register_default_jobs(self):
         """Register the standard Time OS jobs."""
 
-        # 8-stage pipeline (wiring remediation — activates detection + intelligence)
+        # 9-stage pipeline (wiring remediation — activates detection + intelligence)
         # Stage 1: Collect data from all sources
         self.register_job(
             JobConfig(
@@ -217,7 +217,16 @@ class TimeOSDaemon:
             )
         )
 
-        # Stage 6: Generate agency snapshot
+        # Stage 6: Full priority pass (rescore every open item → priority_queue)
+        self.register_job(
+            JobConfig(
+                name="priorities",
+                interval_minutes=30,
+                command=None,
+            )
+        )
+
+        # Stage 7: Generate agency snapshot
         self.register_job(
             JobConfig(
                 name="snapshot",
@@ -226,7 +235,7 @@ class TimeOSDaemon:
             )
         )
 
-        # Stage 7: Morning brief (daily detection digest via Google Chat)
+        # Stage 8: Morning brief (daily detection digest via Google Chat)
         self.register_job(
             JobConfig(
                 name="morning_brief",
@@ -235,7 +244,7 @@ class TimeOSDaemon:
             )
         )
 
-        # Stage 8: Send notifications
+        # Stage 9: Send notifications
         self.register_job(
             JobConfig(
                 name="notify",
@@ -455,6 +464,8 @@ class TimeOSDaemon:
                 self._handle_detection()
             elif job_name == "intelligence":
                 self._handle_intelligence()
+            elif job_name == "priorities":
+                self._handle_priorities()
             elif job_name == "snapshot":
                 self._handle_snapshot()
             elif job_name == "morning_brief":
@@ -587,6 +598,7 @@ class TimeOSDaemon:
 
         db_path_str = str(paths.db_path())
         db_path_obj = Path(db_path_str)
+        changed_clients: set[str] = set()  # clients whose signals may have changed
 
         # Step 1: Detect signals from current data.
         # MOH_INTELLIGENCE_FULL_MODE gates full-catalog detection. Default (unset/"0")
@@ -601,14 +613,42 @@ class TimeOSDaemon:
             "true",
             "yes",
         )
+        # Detection is incremental by default: only entities whose tasks, invoices or
+        # communications changed since their last evaluation are re-run.
+        # MOH_INTELLIGENCE_FULL_RESCAN=1 forces every entity to be re-evaluated.
+        full_rescan = os.environ.get("MOH_INTELLIGENCE_FULL_RESCAN", "0").strip().lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        # MOH_INTELLIGENCE_WORKERS > 1 fans the per-entity evaluation out over that many
+        # worker processes (opt-in; unset or invalid keeps the serial loop).
+        try:
+            workers = max(1, int(os.environ.get("MOH_INTELLIGENCE_WORKERS", "1")))
+        except ValueError:
+            workers = 1
         mode_label = "full (all signals)" if full_mode else "quick (threshold-only)"
-        self.logger.info("Running signal detection in %s mode...", mode_label)
+        self.logger.info(
+            "Running signal detection in %s mode (%s)...",
+            mode_label,
+            "full rescan" if full_rescan else "incremental",
+        )
         try:
             from lib.intelligence.signals import detect_all_signals, update_signal_state
 
-            detection = detect_all_signals(db_path_obj, quick=not full_mode)
+            detection = detect_all_signals(
+                db_path_obj, quick=not full_mode, incremental=not full_rescan, workers=workers
+            )
             detected_signals = detection.get("signals", [])
-            self.logger.info(f"Signals detected: {len(detected_signals)}")
+            changed_clients.update(
+                sig["entity_id"] for sig in detected_signals if sig.get("entity_type") == "client"
+            )
+            self.logger.info(
+                "Signals detected: %d (%d entities evaluated, %d reused)",
+                len(detected_signals),
+                detection.get("entities_evaluated", 0),
+                detection.get("entities_reused", 0),
+            )
 
             # Step 2: Update signal state (persist new/ongoing/escalated/cleared)
             if detected_signals:
@@ -620,6 +660,12 @@ class TimeOSDaemon:
                     f"Signal state: {new_count} new, {escalated_count} escalated, "
                     f"{cleared_count} cleared"
                 )
+                self._publish_signal_events(state_update, db_path_obj)
+                changed_clients.update(
+                    sig["entity_id"]
+                    for sig in state_update.get("cleared_signals", [])
+                    if sig.get("entity_type") == "client"
+                )
             else:
                 self.logger.info("No signals detected, skipping state update")
         except (sqlite3.Error, ValueError, OSError) as e:
@@ -639,8 +685,57 @@ class TimeOSDaemon:
         except (sqlite3.Error, ValueError, OSError, ImportError) as e:
             self.logger.warning(f"V4 proposal generation skipped: {e}")
 
+        # signal_state and proposals_v4 are written through their own connections,
+        # not StateStore, so publish their cache tags here. With the shared
+        # (MOH_CACHE_BACKEND=sqlite) cache this invalidates the API's entries.
+        from lib.cache.invalidation import PROPOSALS, SIGNALS, client_tag, publish
+
+        publish([SIGNALS, PROPOSALS, *map(client_tag, sorted(changed_clients))])
+
+    def _publish_signal_events(self, state_update: dict, db_path) -> None:
+        """Record new and escalated critical/warning signals as intelligence events.
+
+        IntelligenceEventStore mirrors them into the event log (signal_new,
+        signal_escalated), which the API streams to SSE clients.
+        """
+        from lib.intelligence.persistence import IntelligenceEventStore, event_from_signal_change
+
+        changes = [(sig, sig.get("severity"), "new") for sig in state_update.get("new_signals", [])]
+        changes += [
+            (sig, sig.get("new_severity"), "escalated")
+            for sig in state_update.get("escalated_signals", [])
+        ]
+        events = [
+            event_from_signal_change(
+                signal_id=sig["signal_id"],
+                entity_type=sig["entity_type"],
+                entity_id=sig["entity_id"],
+                severity=severity,
+                change_type=change_type,
+                details=sig,
+            )
+            for sig, severity, change_type in changes
+            if severity in ("critical", "warning")
+        ]
+        if events:
+            result = IntelligenceEventStore(db_path).publish_batch(events)
+            self.logger.info(f"Signal events: {result['published']} published")
+
+    def _handle_priorities(self):
+        """Stage 6: Rescore every open task and email and rewrite priority_queue.
+
+        The API only catches the stored queue up for items whose inputs changed;
+        scores that drift with the clock (days until due, email age) are
+        refreshed here.
+        """
+        from lib.analyzers.priority import PriorityAnalyzer
+
+        self.logger.info("Running full priority pass...")
+        items = PriorityAnalyzer().analyze()
+        self.logger.info(f"Priority queue: {len(items)} items scored")
+
     def _handle_morning_brief(self):
-        """Stage 7: Send morning brief if findings changed (daily, via Google Chat)."""
+        """Stage 8: Send morning brief if findings changed (daily, via Google Chat)."""
         import os
 
         webhook_url = os.environ.get("MOH_GCHAT_WEBHOOK_URL", "")
@@ -674,7 +769,7 @@ class TimeOSDaemon:
             self.logger.warning(f"Morning brief failed: {e}")
 
     def _handle_snapshot(self):
-        """Stage 6: Generate agency snapshot."""
+        """Stage 7: Generate agency snapshot."""
         import os
 
         from lib.agency_snapshot.generator import AgencySnapshotGenerator
@@ -722,13 +817,30 @@ class TimeOSDaemon:
             self.logger.info("Minimal snapshot saved")
 
     def _handle_notify(self):
-        """Stage 8: Log cycle completion. Outbound delivery is handled by morning_brief.
+        """Stage 9: Log cycle completion. Outbound delivery is handled by morning_brief.
 
         Per CANONICALIZATION.md: "cycle complete" messages are noise on the Google Chat
         channel. The morning brief is the canonical outbound. This stage just logs.
         """
         self.logger.info("Daemon cycle notification: all stages complete")
 
+    def _log_metric_refresh(self, results: dict[str, bool]) -> None:
+        """Tell SSE clients (in the API process) that dashboard data changed."""
+        from lib import event_log
+
+        try:
+            event_log.publish(
+                "metric_refresh",
+                {
+                    "jobs": list(results),
+                    "succeeded": sum(results.values()),
+                    "completed_at": datetime.now(timezone.utc).isoformat(),
+                },
+                source="daemon",
+            )
+        except sqlite3.Error as e:
+            self.logger.warning(f"metric_refresh event not logged: {e}")
+
     def run_once(self):
         """Run all jobs once in sequence and exit."""
         self.logger.info("=" * 50)
@@ -741,21 +853,20 @@ class TimeOSDaemon:
             "truth_cycle",
             "detection",
             "intelligence",
+            "priorities",
             "snapshot",
             "morning_brief",
             "notify",
         ]
-        succeeded = 0
-        failed = 0
-
+        results = {}
         for job_name in jobs_to_run:
             self.logger.info(f"\n--- Stage: {job_name} ---")
-            if self._run_job(job_name):
-                succeeded += 1
-            else:
-                failed += 1
+            results[job_name] = self._run_job(job_name)
+        succeeded = sum(results.values())
+        failed = len(results) - succeeded
 
         self._save_state()
+        self._log_metric_refresh(results)
         self.logger.info("\n--- Cycle Complete ---")
         self.logger.info(f"Succeeded: {succeeded}/{len(jobs_to_run)}")
         if failed > 0:
@@ -784,12 +895,15 @@ class TimeOSDaemon:
                     self.logger.info(f"⏰ Detected wake from sleep ({sleep_duration})")
 
                 # Check and run jobs
+                results = {}
                 for job_name in self.jobs:
                     if self._shutdown_event.is_set():
                         break
                     if self._should_run(job_name):
-                        self._run_job(job_name)
+                        results[job_name] = self._run_job(job_name)
                         self._save_state()
+                if results:
+                    self._log_metric_refresh(results)
 
                 # Log memory every 10 cycles (~5 minutes)
                 self._tick_count += 1
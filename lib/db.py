@@ -69,6 +69,24 @@ def get_db_path_str() -> str:
 # CONNECTION FACTORY
 # ============================================================
 
+# lib.backup.archive_wal() owns WAL checkpoints: it archives every frame before its
+# RESTART checkpoint resets the WAL. At SQLite's default of 1000 pages, a commit on
+# any connection can checkpoint and reset the WAL behind the archiver, which then
+# has to take a rebase backup. The limit is a backstop for deployments that do not
+# schedule the archiver.
+WAL_AUTOCHECKPOINT_PAGES = 25_000
+
+
+def open_connection(database: str | Path, **kwargs) -> sqlite3.Connection:
+    """
+    sqlite3.connect() with the app's WAL checkpoint policy.
+
+    Use instead of sqlite3.connect() for every connection to the app database.
+    """
+    conn = sqlite3.connect(database, **kwargs)
+    conn.execute(f"PRAGMA wal_autocheckpoint={WAL_AUTOCHECKPOINT_PAGES}")
+    return conn
+
 
 @contextmanager
 def get_connection(
@@ -84,7 +102,7 @@ def get_connection(
     db_path = get_db_path()
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = sqlite3.connect(str(db_path))
+    conn = open_connection(str(db_path))
     if row_factory:
         conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys=ON")
@@ -0,0 +1,197 @@
+"""
+Bounded thread pool for blocking database work called from async code.
+
+FastAPI runs ``async def`` handlers on the event loop, so a synchronous
+StateStore call inside one blocks every other request (SSE streams
+included) until SQLite returns. run() moves such work onto a dedicated,
+bounded pool of "db-worker" threads; each worker keeps its own long-lived
+StateStore reader connection, so queries reuse warm connections and
+statement caches.
+
+- ``await run(fn, *args, timeout=...)`` runs any blocking callable.
+- ``StateStore.aquery / acount / aget / arun`` are thin wrappers over it.
+- ``@offload`` turns a blocking route handler into an async one that runs on
+  the pool, which is how the API routers are written.
+
+Every call has a timeout (MOH_DB_TIMEOUT, default 30s) unless it passes
+``timeout=NO_TIMEOUT``, as long-running jobs such as a sync or a full cycle
+do. On expiry the call raises QueryTimeout (the API maps it to 504) and the
+worker's reader connection is interrupted, so a runaway SELECT stops instead
+of holding the worker. A call that has started writing (StateStore calls
+mark_write() when it takes the writer) is never interrupted: it finishes in
+the background rather than failing halfway through a mutation.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import math
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DB_ENV_THREADS = "MOH_DB_THREADS"
+DB_ENV_TIMEOUT = "MOH_DB_TIMEOUT"
+DEFAULT_THREADS = 8
+DEFAULT_TIMEOUT = 30.0
+NO_TIMEOUT = math.inf
+
+
+class QueryTimeout(TimeoutError):
+    """A call on the database pool exceeded its timeout."""
+
+
+class _Job:
+    """Tracks which worker thread runs a call, so a timeout can interrupt it."""
+
+    __slots__ = ("lock", "thread_id", "done", "wrote")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.thread_id: int | None = None
+        self.done = False
+        self.wrote = False
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_interrupters: list[Callable[[int], bool]] = []
+_current = threading.local()
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={os.environ.get(name)!r}")
+        return default
+
+
+def default_timeout() -> float:
+    """Per-call timeout in seconds (MOH_DB_TIMEOUT)."""
+    return _env_number(DB_ENV_TIMEOUT, DEFAULT_TIMEOUT)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get or create the shared database worker pool (MOH_DB_THREADS workers)."""
+    global _executor
+    if _executor is not None:
+        return _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = max(1, int(_env_number(DB_ENV_THREADS, DEFAULT_THREADS)))
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-worker")
+        return _executor
+
+
+def shutdown(wait: bool = True) -> None:
+    """Stop the worker pool; the next call creates a fresh one."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def register_interrupter(interrupt: Callable[[int], bool]) -> None:
+    """Register *interrupt(thread_id)*, called when a call on that worker times out."""
+    with _executor_lock:
+        if interrupt not in _interrupters:
+            _interrupters.append(interrupt)
+
+
+def mark_write() -> None:
+    """Record that the pool call running on this thread writes; it is no longer interrupted."""
+    job = getattr(_current, "job", None)
+    if job is not None:
+        with job.lock:
+            job.wrote = True
+
+
+def _call(job: _Job, fn: Callable[..., T], args, kwargs) -> T:
+    with job.lock:
+        job.thread_id = threading.get_ident()
+    _current.job = job
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _current.job = None
+        with job.lock:
+            job.done = True
+
+
+def _interrupt(job: _Job) -> None:
+    with job.lock:
+        if job.done or job.wrote or job.thread_id is None:
+            return
+        with _executor_lock:
+            interrupters = list(_interrupters)
+        for interrupt in interrupters:
+            interrupt(job.thread_id)
+
+
+async def run(fn: Callable[..., T], *args: Any, timeout: float | None = None, **kwargs: Any) -> T:
+    """
+    Run blocking *fn(*args, **kwargs)* on the database pool and await it.
+
+    Args:
+        timeout: Seconds before QueryTimeout (default MOH_DB_TIMEOUT), counted
+            from submission so time spent queued for a worker is included.
+            NO_TIMEOUT waits for the call however long it takes.
+    """
+    timeout = default_timeout() if timeout is None else timeout
+    job = _Job()
+    ctx = contextvars.copy_context()
+    future = get_executor().submit(ctx.run, _call, job, fn, args, kwargs)
+    wrapped = asyncio.wrap_future(future)
+    try:
+        done, _ = await asyncio.wait({wrapped}, timeout=None if timeout == NO_TIMEOUT else timeout)
+    except asyncio.CancelledError:
+        # The awaiting request went away; drop the call if it has not started.
+        future.cancel()
+        raise
+    if wrapped in done:
+        return wrapped.result()
+
+    if not future.cancel():
+        _interrupt(job)
+    wrapped.cancel()
+    name = getattr(fn, "__qualname__", repr(fn))
+    logger.warning(f"Database call {name} timed out after {timeout}s")
+    raise QueryTimeout(f"Database call timed out after {timeout}s")
+
+
+def offload(fn: Callable | None = None, *, timeout: float | None = None):
+    """
+    Decorator: run a blocking route handler on the database pool.
+
+    The wrapped function becomes a coroutine function with the same signature,
+    so FastAPI awaits it on the event loop while the body runs on a worker:
+
+        @router.get("/items")
+        @offload
+        def list_items(limit: int = 50):
+            return store.query("SELECT ...", [limit])
+
+    Long-running jobs use ``@offload(timeout=NO_TIMEOUT)``.
+    """
+
+    def decorate(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            raise TypeError(f"@offload expects a blocking function, got coroutine {func.__name__}")
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await run(func, *args, timeout=timeout, **kwargs)
+
+        return wrapper
+
+    return decorate(fn) if fn is not None else decorate
@@ -17,6 +17,8 @@ from collections.abc import Generator
 from contextlib import contextmanager
 from typing import Any
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,7 +78,7 @@ class SQLiteAdapter(DatabaseAdapter):
     def _connect(self) -> None:
         """Create database connection with proper configuration."""
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = open_connection(self.db_path)
             self.conn.row_factory = sqlite3.Row
             self.conn.execute("PRAGMA foreign_keys=ON")
             logger.debug(f"SQLiteAdapter connected to {self.db_path}")
@@ -14,6 +14,8 @@ import sqlite3
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -144,7 +146,7 @@ def ensure_indexes(db_path: str | Path) -> IndexReport:
         raise FileNotFoundError(f"Database not found: {db_path}")
 
     report = IndexReport()
-    conn = sqlite3.connect(str(db_path))
+    conn = open_connection(str(db_path))
 
     try:
         # Get existing indexes
@@ -208,7 +210,7 @@ def get_missing_indexes(db_path: str | Path) -> list[tuple[str, list[str]]]:
     if not db_path.exists():
         return []
 
-    conn = sqlite3.connect(str(db_path))
+    conn = open_connection(str(db_path))
 
     try:
         # Get existing indexes
@@ -246,7 +248,7 @@ def drop_index(db_path: str | Path, table: str, columns: list[str]) -> bool:
     if not db_path.exists():
         return False
 
-    conn = sqlite3.connect(str(db_path))
+    conn = open_connection(str(db_path))
 
     try:
         index_name = _index_name(table, columns)
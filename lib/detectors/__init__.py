@@ -17,6 +17,8 @@ import sqlite3
 from datetime import datetime, timezone
 from typing import Any
 
+from lib.db import open_connection
+
 from .bottleneck import BottleneckDetector
 from .collision import CollisionDetector
 from .correlator import FindingGroup, correlate
@@ -331,7 +333,7 @@ def run_all_detectors(
 
     # Store findings
     try:
-        conn = sqlite3.connect(db_path)
+        conn = open_connection(db_path)
         conn.row_factory = sqlite3.Row
         try:
             store_result = _store_findings(conn, table, groups, cycle_id)
@@ -350,7 +352,7 @@ def run_all_detectors(
 
     # Update sync_state
     try:
-        conn = sqlite3.connect(db_path)
+        conn = open_connection(db_path)
         try:
             now = datetime.now(timezone.utc).isoformat()
             conn.execute(
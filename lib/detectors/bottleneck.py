@@ -15,6 +15,8 @@ from dataclasses import asdict, dataclass, field
 from datetime import date, timedelta
 from typing import Any
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 COMPLETION_WINDOW_DAYS = 5
@@ -90,7 +92,7 @@ class BottleneckDetector:
         self.db_path = db_path
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -15,6 +15,8 @@ from dataclasses import asdict, dataclass, field
 from datetime import date, datetime, timedelta
 from typing import Any
 
+from lib.db import open_connection
+
 from .task_weight import TaskWeightEngine
 
 logger = logging.getLogger(__name__)
@@ -61,7 +63,7 @@ class CollisionDetector:
         self.weight_engine = TaskWeightEngine(db_path)
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
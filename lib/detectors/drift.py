@@ -12,6 +12,8 @@ from dataclasses import asdict, dataclass, field
 from datetime import date, datetime, timedelta
 from typing import Any
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 COMPLETION_WINDOW_DAYS = 5
@@ -55,7 +57,7 @@ class DriftDetector:
         self.db_path = db_path
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -18,6 +18,8 @@ import logging
 import sqlite3
 from datetime import datetime, timezone
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -139,7 +141,7 @@ def send_if_changed(
 
     # Check if brief already sent today
     try:
-        conn = sqlite3.connect(db_path)
+        conn = open_connection(db_path)
         conn.row_factory = sqlite3.Row
         try:
             cursor = conn.execute(_SQL_LAST_BRIEF)
@@ -160,7 +162,7 @@ def send_if_changed(
 
     # Gather findings
     try:
-        conn = sqlite3.connect(db_path)
+        conn = open_connection(db_path)
         conn.row_factory = sqlite3.Row
         try:
             new_findings = [dict(r) for r in conn.execute(_SQL_NEW_FINDINGS).fetchall()]
@@ -232,7 +234,7 @@ def send_if_changed(
 
     # Mark findings as notified + un-acknowledge worsened findings
     try:
-        conn = sqlite3.connect(db_path)
+        conn = open_connection(db_path)
         try:
             now_iso = now.isoformat()
             total_notified = 0
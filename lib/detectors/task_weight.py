@@ -17,6 +17,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 # Default patterns -- seeded into task_weight_rules on first run
@@ -60,7 +62,7 @@ class TaskWeightEngine:
         self._ensure_default_rules()
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
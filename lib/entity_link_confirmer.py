@@ -9,6 +9,8 @@ import sqlite3
 from datetime import datetime, timezone
 from typing import Any
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIRM_THRESHOLD = 0.85
@@ -30,7 +32,7 @@ def auto_confirm_links(
     Returns:
         Summary dict with counts.
     """
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     now = datetime.now(timezone.utc).isoformat()
 
     try:
@@ -93,7 +95,7 @@ def flag_low_confidence_links(
 
     Returns list of questionable links with context.
     """
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     conn.row_factory = sqlite3.Row
 
     try:
@@ -120,7 +122,7 @@ def link_confirmation_report(db_path: str) -> dict[str, Any]:
 
     Returns summary with counts and averages.
     """
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
 
     try:
         # Status distribution
@@ -19,6 +19,7 @@ from datetime import datetime
 
 from lib import paths
 from lib.compat import UTC
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -136,7 +137,7 @@ def detect_engagement_type(project_name: str) -> str:
 
 def get_connection():
     """Get database connection."""
-    conn = sqlite3.connect(str(paths.db_path()))
+    conn = open_connection(str(paths.db_path()))
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -0,0 +1,128 @@
+"""
+Event Log - durable, cross-process event stream.
+
+Producers in any process (the daemon, AutonomousLoop, API workers) append to
+the event_log table; each event gets a monotonic seq (AUTOINCREMENT, never
+reused, even after pruning). Readers tail the log by seq with a primary-key
+range scan. api/sse_router does this to push events to SSE clients and to
+resume a reconnecting client from its Last-Event-ID.
+
+Only the newest RETENTION_ROWS events are kept; older ones are pruned as new
+events are appended.
+
+Usage:
+    from lib import event_log
+
+    event_log.publish("signal_new", {"signal_id": "sig_1"}, source="daemon")
+    events = event_log.read_after(last_seq)
+"""
+
+import json
+import logging
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from lib.state_store import StateStore, get_store
+
+logger = logging.getLogger(__name__)
+
+RETENTION_ROWS = 10_000
+READ_BATCH = 500
+
+# Prune once every _PRUNE_EVERY appends rather than on each one.
+_PRUNE_EVERY = 500
+
+
+@dataclass
+class LogEvent:
+    """One event read back from the log."""
+
+    seq: int
+    event_type: str
+    data: dict
+    created_at: str
+    source: str | None = None
+
+
+def append(conn: sqlite3.Connection, event_type: str, data: dict, source: str | None = None) -> int:
+    """
+    Append one event; runs in the caller's transaction.
+
+    Returns:
+        The event's seq.
+    """
+    seq = conn.execute(
+        "INSERT INTO event_log (event_type, data, source, created_at) VALUES (?, ?, ?, ?)",
+        (
+            event_type,
+            json.dumps(data, default=str),
+            source,
+            datetime.now(timezone.utc).isoformat(),
+        ),
+    ).lastrowid
+    if seq % _PRUNE_EVERY == 0:
+        pruned = conn.execute(
+            "DELETE FROM event_log WHERE seq <= ?", (seq - RETENTION_ROWS,)
+        ).rowcount
+        if pruned:
+            logger.debug(f"Pruned {pruned} events from event_log")
+    return seq
+
+
+def publish(
+    event_type: str, data: dict, source: str | None = None, store: StateStore | None = None
+) -> int:
+    """Append one event in its own transaction; returns its seq."""
+    store = store or get_store()
+    return store.transaction(lambda conn: append(conn, event_type, data, source))
+
+
+def _row_to_event(row: dict) -> LogEvent:
+    try:
+        data = json.loads(row["data"])
+    except (json.JSONDecodeError, TypeError) as e:
+        logger.warning(f"event_log seq {row['seq']} has invalid data JSON: {e}")
+        data = {}
+    return LogEvent(
+        seq=row["seq"],
+        event_type=row["event_type"],
+        data=data,
+        created_at=row["created_at"],
+        source=row["source"],
+    )
+
+
+def read_after(
+    seq: int, limit: int = READ_BATCH, store: StateStore | None = None
+) -> list[LogEvent]:
+    """Events with seq greater than *seq*, oldest first, at most *limit*."""
+    store = store or get_store()
+    rows = store.query(
+        """
+        SELECT seq, event_type, data, source, created_at FROM event_log
+        WHERE seq > ? ORDER BY seq LIMIT ?
+    """,
+        [seq, limit],
+    )
+    return [_row_to_event(row) for row in rows]
+
+
+def recent(limit: int = 100, store: StateStore | None = None) -> list[LogEvent]:
+    """The newest *limit* events, oldest first."""
+    store = store or get_store()
+    rows = store.query(
+        """
+        SELECT seq, event_type, data, source, created_at FROM event_log
+        ORDER BY seq DESC LIMIT ?
+    """,
+        [limit],
+    )
+    return [_row_to_event(row) for row in reversed(rows)]
+
+
+def latest_seq(store: StateStore | None = None) -> int:
+    """seq of the newest event, 0 if the log is empty."""
+    store = store or get_store()
+    rows = store.query("SELECT MAX(seq) AS seq FROM event_log")
+    return (rows[0]["seq"] or 0) if rows else 0
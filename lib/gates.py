@@ -20,6 +20,7 @@ from pathlib import Path
 from typing import Any
 
 from lib import paths
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,7 @@ class GateEvaluator:
         self.db_path = db_path or str(paths.db_path())
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys=ON")  # Enable FK enforcement
         return conn
@@ -21,7 +21,9 @@ from lib.governance.data_export import (
     ExportFormat,
     ExportRequest,
     ExportResult,
+    TableExport,
 )
+from lib.governance.export_jobs import ExportJobManager
 from lib.governance.retention_engine import (
     ActionType,
     RetentionAction,
@@ -53,6 +55,8 @@ __all__ = [
     "ExportFormat",
     "ExportRequest",
     "ExportResult",
+    "TableExport",
+    "ExportJobManager",
     # Anonymization
     "Anonymizer",
     # Retention
@@ -17,6 +17,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,7 +52,7 @@ class AuditLog:
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys=ON")
         return conn
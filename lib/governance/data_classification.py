@@ -16,7 +16,7 @@ from enum import Enum
 from typing import TYPE_CHECKING
 
 from lib import safe_sql
-from lib.db import validate_identifier
+from lib.db import open_connection, validate_identifier
 
 if TYPE_CHECKING:
     from lib.governance.data_catalog import DataCatalog
@@ -262,7 +262,7 @@ class DataClassifier:
 
     def _get_connection(self):
         """Create a database connection."""
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
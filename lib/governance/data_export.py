@@ -7,15 +7,20 @@ Supports:
 - Date range filtering on timestamp columns
 - Optional PII anonymization
 - SHA-256 checksums for data integrity
-- Streaming for large tables
+- Streaming for large tables: rows are read with fetchmany, anonymized and
+  encoded one chunk at a time (optionally gzip-compressed), and the checksum
+  is computed as bytes are written, so memory stays flat whatever the size
 """
 
 import csv
 import hashlib
+import io
 import json
 import logging
 import sqlite3
 import tempfile
+import zlib
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -23,11 +28,19 @@ from pathlib import Path
 
 from lib import safe_sql
 from lib.data_lifecycle import get_lifecycle_manager
-from lib.db import validate_identifier
+from lib.db import open_connection, validate_identifier
 from lib.governance.anonymizer import Anonymizer
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched and encoded per chunk when streaming an export.
+EXPORT_CHUNK_ROWS = 1000
+
+
+def default_export_dir() -> Path:
+    """Export directory used when none is given."""
+    return Path(tempfile.gettempdir()) / "moh_exports"
+
 
 class ExportFormat(Enum):
     """Supported export formats."""
@@ -50,6 +63,18 @@ class ExportRequest:
     columns: dict[str, list[str]] | None = None  # {table: [col1, col2, ...]}
     requested_by: str | None = None
     reason: str | None = None
+    compress: bool = False  # gzip each table file
+
+
+@dataclass
+class TableExport:
+    """One exported table file."""
+
+    table: str
+    file_path: str
+    row_count: int
+    size_bytes: int
+    checksum_sha256: str
 
 
 @dataclass
@@ -85,15 +110,13 @@ class DataExporter:
     def __init__(self, db_path: str | Path, export_dir: str | Path | None = None):
         """Initialize exporter with database path and optional export directory."""
         self.db_path = Path(db_path)
-        if export_dir is None:
-            export_dir = Path(tempfile.gettempdir()) / "moh_exports"
-        self.export_dir = Path(export_dir)
+        self.export_dir = Path(export_dir) if export_dir is not None else default_export_dir()
         self.lifecycle = get_lifecycle_manager()
         self.anonymizer = Anonymizer()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys=ON")
         return conn
@@ -223,108 +246,166 @@ class DataExporter:
             logger.error(f"Error getting schema for {table}: {e}")
             return {"error": str(e)}
 
-    def export_table(
+    def iter_rows(
         self,
         table: str,
-        format: ExportFormat,
         filters: dict | None = None,
         columns: list[str] | None = None,
         anonymize: bool = False,
         date_range: tuple[str, str] | None = None,
-    ) -> str:
+        chunk_size: int = EXPORT_CHUNK_ROWS,
+    ) -> Iterator[list[dict]]:
         """
-        Export single table to file.
+        Yield the table's rows in chunks of at most chunk_size, anonymized if requested.
 
-        Returns path to exported file.
+        Raises ValueError up front if the table is not exportable or does not exist.
         """
         if not self.lifecycle.is_exportable(table):
             raise ValueError(f"Table {table} is not exportable")
 
-        # Get columns
-        if not columns:
-            columns = self._get_table_columns(table)
-
-        # Get PII columns if anonymizing
-        pii_columns = []
-        if anonymize:
-            pii_columns = self.lifecycle.get_pii_columns(table)
-
-        # Build query
         sql, params = self._build_query(table, filters, date_range, columns)
+        pii_columns = self.lifecycle.get_pii_columns(table) if anonymize else []
+        return self._fetch_chunks(sql, params, pii_columns, chunk_size)
 
-        # Execute query
+    def _fetch_chunks(
+        self, sql: str, params: list, pii_columns: list[str], chunk_size: int
+    ) -> Iterator[list[dict]]:
         conn = self._get_connection()
-        cursor = conn.execute(sql, params)
-        rows = cursor.fetchall()
-        conn.close()
+        try:
+            cursor = conn.execute(sql, params)
+            while rows := cursor.fetchmany(chunk_size):
+                if pii_columns:
+                    yield [self.anonymizer.anonymize_row(dict(row), pii_columns) for row in rows]
+                else:
+                    yield [dict(row) for row in rows]
+        finally:
+            conn.close()
 
-        # Convert to list of dicts
-        data = [dict(row) for row in rows]
+    def iter_export(
+        self,
+        table: str,
+        format: ExportFormat,
+        filters: dict | None = None,
+        columns: list[str] | None = None,
+        anonymize: bool = False,
+        date_range: tuple[str, str] | None = None,
+        compress: bool = False,
+        chunk_size: int = EXPORT_CHUNK_ROWS,
+        progress: dict | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Yield the encoded export of one table, chunk by chunk.
 
-        # Anonymize if requested
-        if anonymize:
-            data = [self.anonymizer.anonymize_row(row, pii_columns) for row in data]
+        Used both for files (write_table) and streamed HTTP downloads. If
+        progress is given, progress["rows"] is kept up to date.
+        """
+        if not columns:
+            columns = self._get_table_columns(table)
+        chunks = self.iter_rows(table, filters, columns, anonymize, date_range, chunk_size)
+        encoded = _encode(format, columns, chunks, progress if progress is not None else {})
+        if not compress:
+            return encoded
+        return _gzip(encoded)
+
+    def write_table(
+        self,
+        table: str,
+        format: ExportFormat,
+        filters: dict | None = None,
+        columns: list[str] | None = None,
+        anonymize: bool = False,
+        date_range: tuple[str, str] | None = None,
+        compress: bool = False,
+        file_stem: str | None = None,
+    ) -> TableExport:
+        """
+        Stream one table to a file in export_dir.
+
+        The file is written under a .part name and renamed when complete, so a
+        crashed export never leaves a truncated file behind under its final name.
+        """
+        progress = {"rows": 0}
+        chunks = self.iter_export(
+            table, format, filters, columns, anonymize, date_range, compress, progress=progress
+        )
 
-        # Export based on format
         self.export_dir.mkdir(exist_ok=True, parents=True)
+        if file_stem is None:
+            file_stem = f"{table}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
+        file_path = self.export_dir / f"{file_stem}.{format.value}{'.gz' if compress else ''}"
+        part_path = file_path.with_name(file_path.name + ".part")
+
+        sha256_hash = hashlib.sha256()
+        size = 0
+        with open(part_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                sha256_hash.update(chunk)
+                size += len(chunk)
+        part_path.replace(file_path)
+
+        return TableExport(
+            table=table,
+            file_path=str(file_path),
+            row_count=progress["rows"],
+            size_bytes=size,
+            checksum_sha256=sha256_hash.hexdigest(),
+        )
+
+    def export_table(
+        self,
+        table: str,
+        format: ExportFormat,
+        filters: dict | None = None,
+        columns: list[str] | None = None,
+        anonymize: bool = False,
+        date_range: tuple[str, str] | None = None,
+        compress: bool = False,
+    ) -> str:
+        """
+        Export single table to file.
 
-        filename = f"{table}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
-
-        if format == ExportFormat.JSON:
-            file_path = self.export_dir / f"{filename}.json"
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
-        elif format == ExportFormat.CSV:
-            file_path = self.export_dir / f"{filename}.csv"
-            with open(file_path, "w", newline="") as f:
-                if data:
-                    writer = csv.DictWriter(f, fieldnames=columns)
-                    writer.writeheader()
-                    writer.writerows(data)
-        elif format == ExportFormat.JSONL:
-            file_path = self.export_dir / f"{filename}.jsonl"
-            with open(file_path, "w") as f:
-                for row in data:
-                    f.write(json.dumps(row, default=str) + "\n")
-        else:
-            raise ValueError(f"Unsupported format: {format}")
-
-        return str(file_path)
+        Returns path to exported file.
+        """
+        return self.write_table(
+            table, format, filters, columns, anonymize, date_range, compress
+        ).file_path
 
     def export_tables(self, request: ExportRequest) -> ExportResult:
         """Export multiple tables as requested."""
-        result_files = {}
-        total_rows = 0
+        request_id = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        exports = []
 
-        # Validate tables
         for table in request.tables:
             if not self.lifecycle.is_exportable(table):
                 logger.warning(f"Table {table} is not exportable, skipping")
                 continue
-
             try:
-                file_path = self.export_table(
-                    table,
-                    request.format,
-                    filters=request.filters,
-                    columns=request.columns.get(table) if request.columns else None,
-                    anonymize=request.anonymize_pii,
-                    date_range=request.date_range,
-                )
-                result_files[table] = file_path
-
-                # Count rows
-                conn = self._get_connection()
-                cursor = conn.execute(safe_sql.select_count_bare(table))
-                count = cursor.fetchone()[0]
-                conn.close()
-                total_rows += count
-
+                exports.append(self.write_request_table(request, table))
             except (sqlite3.Error, ValueError, OSError) as e:
                 logger.error(f"Error exporting table {table}: {e}")
 
-        # Create manifest file
-        request_id = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        return self.write_manifest(request, request_id, exports)
+
+    def write_request_table(
+        self, request: ExportRequest, table: str, file_stem: str | None = None
+    ) -> TableExport:
+        """Export one table of an ExportRequest."""
+        return self.write_table(
+            table,
+            request.format,
+            filters=request.filters,
+            columns=request.columns.get(table) if request.columns else None,
+            anonymize=request.anonymize_pii,
+            date_range=request.date_range,
+            compress=request.compress,
+            file_stem=file_stem,
+        )
+
+    def write_manifest(
+        self, request: ExportRequest, request_id: str, exports: list[TableExport]
+    ) -> ExportResult:
+        """Write the manifest for a finished export and return its result."""
         manifest = {
             "request_id": request_id,
             "requested_at": datetime.now(timezone.utc).isoformat(),
@@ -332,10 +413,14 @@ class DataExporter:
             "reason": request.reason,
             "format": request.format.value,
             "anonymized": request.anonymize_pii,
-            "tables": list(result_files.keys()),
-            "files": result_files,
+            "compressed": request.compress,
+            "tables": [e.table for e in exports],
+            "files": {e.table: e.file_path for e in exports},
+            "row_counts": {e.table: e.row_count for e in exports},
+            "checksums_sha256": {e.table: e.checksum_sha256 for e in exports},
         }
 
+        self.export_dir.mkdir(exist_ok=True, parents=True)
         manifest_file = self.export_dir / f"manifest_{request_id}.json"
         with open(manifest_file, "w") as f:
             json.dump(manifest, f, indent=2)
@@ -350,13 +435,13 @@ class DataExporter:
             request_id=request_id,
             format=request.format,
             file_path=str(manifest_file),
-            row_count=total_rows,
-            table_count=len(result_files),
+            row_count=sum(e.row_count for e in exports),
+            table_count=len(exports),
             size_bytes=file_size,
             created_at=datetime.now(timezone.utc).isoformat(),
             checksum_sha256=checksum,
             anonymized=request.anonymize_pii,
-            tables_included=list(result_files.keys()),
+            tables_included=[e.table for e in exports],
         )
 
     def export_all(
@@ -381,3 +466,48 @@ class DataExporter:
             for chunk in iter(lambda: f.read(4096), b""):
                 sha256_hash.update(chunk)
         return sha256_hash.hexdigest()
+
+
+def _encode(
+    format: ExportFormat, columns: list[str], chunks: Iterator[list[dict]], progress: dict
+) -> Iterator[bytes]:
+    """Encode row chunks as JSON array, CSV (with header) or JSONL bytes."""
+    progress["rows"] = 0
+    if format == ExportFormat.JSON:
+        yield b"["
+        sep = "\n"
+        for rows in chunks:
+            parts = []
+            for row in rows:
+                parts.append(sep + json.dumps(row, default=str))
+                sep = ",\n"
+            progress["rows"] += len(rows)
+            yield "".join(parts).encode()
+        yield b"\n]\n"
+    elif format == ExportFormat.CSV:
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=columns)
+        writer.writeheader()
+        for rows in chunks:
+            writer.writerows(rows)
+            progress["rows"] += len(rows)
+            yield buf.getvalue().encode()
+            buf.seek(0)
+            buf.truncate()
+        if buf.tell():
+            yield buf.getvalue().encode()
+    elif format == ExportFormat.JSONL:
+        for rows in chunks:
+            progress["rows"] += len(rows)
+            yield "".join(json.dumps(row, default=str) + "\n" for row in rows).encode()
+    else:
+        raise ValueError(f"Unsupported format: {format}")
+
+
+def _gzip(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """gzip-compress a byte stream incrementally."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    for chunk in chunks:
+        if out := compressor.compress(chunk):
+            yield out
+    yield compressor.flush()
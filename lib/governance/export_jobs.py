@@ -0,0 +1,266 @@
+"""
+Export Jobs - Resumable background execution of bulk data exports.
+
+Each job's state lives in a JSON file under <export_dir>/jobs, so status is
+visible to every API worker and survives restarts. Tables are exported one
+at a time with DataExporter.write_table (streaming, constant memory) and the
+state file is updated after each, so a job interrupted by a crash or restart
+resumes at the first unfinished table instead of starting over.
+
+A job is claimed with an O_EXCL lock file holding the owner's PID and a
+token identifying that process start. A lock whose process is gone, or whose
+PID now belongs to a later process (PIDs repeat across container restarts,
+often as PID 1), is treated as stale and can be taken over.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+from lib.governance.data_export import (
+    DataExporter,
+    ExportFormat,
+    ExportRequest,
+    TableExport,
+    default_export_dir,
+)
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+def _request_to_dict(request: ExportRequest) -> dict:
+    data = asdict(request)
+    data["format"] = request.format.value
+    return data
+
+
+def _request_from_dict(data: dict) -> ExportRequest:
+    data = dict(data)
+    data["format"] = ExportFormat(data["format"])
+    if data.get("date_range"):
+        data["date_range"] = tuple(data["date_range"])
+    return ExportRequest(**data)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _process_token(pid: int) -> str | None:
+    """Boot id plus start time of *pid*, None where /proc is unavailable."""
+    try:
+        boot_id = Path("/proc/sys/kernel/random/boot_id").read_text().strip()
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return None
+    # starttime is field 22; fields are counted after the parenthesised command name
+    return f"{boot_id}:{stat.rsplit(')', 1)[1].split()[19]}"
+
+
+# Identifies this process start in the lock files it writes.
+_PROCESS_TOKEN = _process_token(os.getpid()) or uuid.uuid4().hex
+
+
+class ExportJobManager:
+    """
+    Runs ExportRequests as resumable jobs.
+
+    Usage:
+        jobs = ExportJobManager(db_path)
+        job_id = jobs.submit(request)            # runs in a background thread
+        jobs.get(job_id)["status"]               # pending/running/completed/failed
+        jobs.resume_incomplete()                 # at startup
+    """
+
+    def __init__(self, db_path: str | Path, export_dir: str | Path | None = None):
+        self.db_path = Path(db_path)
+        self.export_dir = Path(export_dir) if export_dir is not None else default_export_dir()
+        self.jobs_dir = self.export_dir / "jobs"
+
+    def _exporter(self) -> DataExporter:
+        return DataExporter(self.db_path, export_dir=self.export_dir)
+
+    def _state_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.json"
+
+    def _lock_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.lock"
+
+    def _save(self, state: dict) -> None:
+        state["updated_at"] = datetime.now(timezone.utc).isoformat()
+        path = self._state_path(state["job_id"])
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(state, f, indent=2)
+        tmp.replace(path)
+
+    def get(self, job_id: str) -> dict | None:
+        """Current state of a job, or None if unknown."""
+        if not job_id.replace("_", "").replace("-", "").isalnum():
+            return None
+        try:
+            with open(self._state_path(job_id)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def submit(self, request: ExportRequest, background: bool = True) -> str:
+        """
+        Create a job for request and start it.
+
+        With background=False the job runs in the calling thread and has
+        finished (completed or failed) when this returns.
+        """
+        now = datetime.now(timezone.utc)
+        job_id = f"{now.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self._save(
+            {
+                "job_id": job_id,
+                "status": PENDING,
+                "request": _request_to_dict(request),
+                "tables_done": {},
+                "created_at": now.isoformat(),
+                "error": None,
+                "result": None,
+            }
+        )
+        if background:
+            self._start(job_id)
+        else:
+            self.run(job_id)
+        return job_id
+
+    def resume(self, job_id: str) -> bool:
+        """Restart an unfinished or failed job in the background; False if not resumable."""
+        state = self.get(job_id)
+        if state is None or state["status"] == COMPLETED or self._locked(job_id):
+            return False
+        self._start(job_id)
+        return True
+
+    def resume_incomplete(self) -> list[str]:
+        """Resume every pending/running job not owned by a live process."""
+        if not self.jobs_dir.exists():
+            return []
+        resumed = []
+        for path in sorted(self.jobs_dir.glob("*.json")):
+            job_id = path.stem
+            state = self.get(job_id)
+            if state and state["status"] in (PENDING, RUNNING) and self.resume(job_id):
+                resumed.append(job_id)
+        if resumed:
+            logger.info(f"Resumed {len(resumed)} interrupted export jobs")
+        return resumed
+
+    def _start(self, job_id: str) -> None:
+        threading.Thread(
+            target=self.run, args=(job_id,), name=f"export-{job_id}", daemon=True
+        ).start()
+
+    def _locked(self, job_id: str) -> bool:
+        try:
+            owner = json.loads(self._lock_path(job_id).read_text() or "0")
+        except (FileNotFoundError, ValueError):
+            return False
+        if isinstance(owner, dict):
+            pid, token = owner.get("pid"), owner.get("token")
+        else:
+            pid, token = owner, None  # PID-only lock from an older version
+        if not isinstance(pid, int) or pid <= 0:
+            return False
+        if pid == os.getpid():
+            # Our PID, but only ours if written by this process start
+            return token == _PROCESS_TOKEN
+        if not _pid_alive(pid):
+            return False
+        current = _process_token(pid)
+        return token is None or current is None or current == token
+
+    def _claim(self, job_id: str) -> bool:
+        lock = self._lock_path(job_id)
+        for _ in range(2):
+            try:
+                fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            except FileExistsError:
+                if self._locked(job_id):
+                    return False
+                lock.unlink(missing_ok=True)  # stale: owner died
+                continue
+            with os.fdopen(fd, "w") as f:
+                json.dump({"pid": os.getpid(), "token": _PROCESS_TOKEN}, f)
+            return True
+        return False
+
+    def run(self, job_id: str) -> dict | None:
+        """
+        Run (or continue) a job in the calling thread.
+
+        Tables already recorded in tables_done are skipped. Returns the final
+        state, or None if the job is unknown or owned by another worker.
+        """
+        if self.get(job_id) is None or not self._claim(job_id):
+            return None
+        try:
+            state = self.get(job_id)
+            request = _request_from_dict(state["request"])
+            exporter = self._exporter()
+            state["status"] = RUNNING
+            state["error"] = None
+            self._save(state)
+
+            try:
+                for table in request.tables:
+                    if table in state["tables_done"]:
+                        continue
+                    if not exporter.lifecycle.is_exportable(table):
+                        logger.warning(f"Table {table} is not exportable, skipping")
+                        continue
+                    export = exporter.write_request_table(
+                        request, table, file_stem=f"{table}_{job_id}"
+                    )
+                    state["tables_done"][table] = asdict(export)
+                    self._save(state)
+
+                exports = [TableExport(**t) for t in state["tables_done"].values()]
+                result = exporter.write_manifest(request, job_id, exports)
+                state["status"] = COMPLETED
+                state["result"] = {
+                    "file_path": result.file_path,
+                    "row_count": result.row_count,
+                    "table_count": result.table_count,
+                    "size_bytes": result.size_bytes,
+                    "checksum_sha256": result.checksum_sha256,
+                    "tables": result.tables_included,
+                    "completed_at": result.created_at,
+                }
+            except (sqlite3.Error, ValueError, OSError) as e:
+                logger.error(f"Export job {job_id} failed: {e}")
+                state["status"] = FAILED
+                state["error"] = str(e)
+            except Exception as e:
+                # Anything else still ends the job, rather than leaving it "running"
+                logger.exception(f"Export job {job_id} failed unexpectedly")
+                state["status"] = FAILED
+                state["error"] = f"{type(e).__name__}: {e}"
+            self._save(state)
+            return state
+        finally:
+            self._lock_path(job_id).unlink(missing_ok=True)
@@ -30,7 +30,7 @@ from typing import Any
 
 from lib import safe_sql
 from lib.data_lifecycle import PROTECTED_TABLES, get_lifecycle_manager
-from lib.db import validate_identifier
+from lib.db import open_connection, validate_identifier
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +104,7 @@ class RetentionEngine:
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection with proper settings."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys=ON")
         return conn
@@ -14,6 +14,7 @@ import sqlite3
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from lib.db import open_connection
 from lib.governance.retention_engine import RetentionEngine, RetentionReport
 
 logger = logging.getLogger(__name__)
@@ -50,7 +51,7 @@ class RetentionScheduler:
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys=ON")
         return conn
@@ -8,7 +8,10 @@ Implements:
 - Data Portability for GDPR Article 20
 
 Features:
-- Search for all data related to a subject (email, name, client_id)
+- Search for all data related to a subject (email, name, phone, client_id)
+  using a precomputed table -> identifier-column map and one OR-combined
+  query per table, with optional indexes on the identifier columns
+- Search results reused across find/export/delete/anonymize in one session
 - Export subject's data in portable format
 - Delete subject's data (with audit trail)
 - Anonymize instead of delete (for data retention)
@@ -23,7 +26,10 @@ import os
 import re
 import sqlite3
 import tempfile
+import threading
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -31,12 +37,34 @@ from pathlib import Path
 
 from lib import safe_sql
 from lib.data_lifecycle import get_lifecycle_manager
-from lib.db import validate_identifier
+from lib.db import open_connection, validate_identifier
 from lib.governance.anonymizer import Anonymizer
 from lib.governance.audit_log import AuditLog
 
 logger = logging.getLogger(__name__)
 
+# Tables never searched for subject data (the SAR machinery's own records).
+_SYSTEM_TABLES = frozenset({"governance_audit_log", "subject_access_requests"})
+
+# Column-name fragments that mark a subject identifier column.
+_IDENTIFIER_PATTERNS = ("email", "address", "name", "phone", "client_id", "person_id")
+
+EMAIL = "email"
+NAME = "name"
+PHONE = "phone"
+ID = "id"
+
+
+def _identifier_kind(column: str) -> str | None:
+    """How a column is matched against a subject, or None if it is not an identifier."""
+    col = column.lower()
+    if not any(pattern in col for pattern in _IDENTIFIER_PATTERNS):
+        return None
+    for kind in (EMAIL, NAME, PHONE, ID):
+        if kind in col:
+            return kind
+    return None
+
 
 class RequestType(Enum):
     """Types of subject access requests."""
@@ -56,6 +84,21 @@ class RequestStatus(Enum):
     DENIED = "denied"
 
 
+@dataclass(frozen=True)
+class IdentifierColumn:
+    """A column that can hold a subject identifier, and how it is matched."""
+
+    name: str
+    kind: str  # email, name, phone, id
+
+    def predicate(self) -> str:
+        """WHERE term for this column; names match case-insensitively."""
+        col = validate_identifier(self.name)
+        if self.kind == NAME:
+            return f'LOWER("{col}") = LOWER(?)'
+        return f'"{col}" = ?'
+
+
 @dataclass
 class SubjectAccessRequest:
     """Subject Access Request tracking."""
@@ -114,11 +157,15 @@ class SubjectAccessManager:
         self.lifecycle = get_lifecycle_manager()
         self.anonymizer = Anonymizer()
         self.audit_log = AuditLog(db_path)
+        self._identifier_map: dict[str, list[IdentifierColumn]] | None = None
+        self._identifier_map_version: int | None = None
+        self._map_lock = threading.Lock()
+        self._local = threading.local()
         self._init_schema()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys=ON")
         return conn
@@ -214,85 +261,167 @@ class SubjectAccessManager:
             logger.error(f"Error creating subject access request: {e}")
             raise
 
-    def _find_identifier_columns(self, table: str) -> list[str]:
+    def identifier_map(self) -> dict[str, list[IdentifierColumn]]:
         """
-        Find columns that might contain subject identifiers.
+        Map every searchable table to its identifier columns.
 
-        Looks for email, name, and client_id patterns.
+        Built from one sqlite_master x pragma_table_info query and reused
+        until the schema changes (PRAGMA schema_version). Tables without
+        identifier columns map to an empty list.
         """
+        conn = self._get_connection()
         try:
-            conn = self._get_connection()
-            cursor = conn.execute(safe_sql.pragma_table_info(table))
-            columns = cursor.fetchall()
+            version = conn.execute("PRAGMA schema_version").fetchone()[0]
+            with self._map_lock:
+                if self._identifier_map is not None and self._identifier_map_version == version:
+                    return self._identifier_map
+
+                rows = conn.execute(
+                    """
+                    SELECT m.name AS table_name, p.name AS column_name
+                    FROM sqlite_master m
+                    JOIN pragma_table_info(m.name) p
+                    WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+                    ORDER BY m.rowid, p.cid
+                    """
+                ).fetchall()
+                mapping: dict[str, list[IdentifierColumn]] = {}
+                for row in rows:
+                    table = row["table_name"]
+                    if table in _SYSTEM_TABLES:
+                        continue
+                    columns = mapping.setdefault(table, [])
+                    kind = _identifier_kind(row["column_name"])
+                    if kind:
+                        columns.append(IdentifierColumn(row["column_name"], kind))
+
+                self._identifier_map = mapping
+                self._identifier_map_version = version
+                return mapping
+        finally:
             conn.close()
 
-            identifier_cols = []
-            for col in columns:
-                col_name = col[1].lower()
-                # Match email, name, id patterns
-                if any(
-                    pattern in col_name
-                    for pattern in ["email", "address", "name", "client_id", "person_id"]
-                ):
-                    identifier_cols.append(col[1])
-
-            return identifier_cols
+    def _find_identifier_columns(self, table: str) -> list[str]:
+        """
+        Find columns that might contain subject identifiers.
 
+        Looks for email, name, phone, and client_id patterns.
+        """
+        try:
+            return [c.name for c in self.identifier_map().get(table, [])]
         except (sqlite3.Error, ValueError, OSError) as e:
             logger.error(f"Error finding identifier columns in {table}: {e}")
             return []
 
-    def _search_table(self, table: str, subject_identifier: str) -> list[dict]:
+    def _subject_where(self, table: str, subject_identifier: str) -> tuple[str, list] | None:
+        """OR-combined WHERE clause matching the subject in any identifier column."""
+        columns = self.identifier_map().get(table, [])
+        if not columns:
+            return None
+        validate_identifier(table)
+        where_clause = " OR ".join(c.predicate() for c in columns)
+        return where_clause, [subject_identifier] * len(columns)
+
+    def _search_table(
+        self,
+        table: str,
+        subject_identifier: str,
+        conn: sqlite3.Connection | None = None,
+    ) -> list[dict]:
         """
         Search table for records matching subject identifier.
 
-        Uses email pattern matching, name matching, and ID matching.
+        One query per table: email, phone and ID columns match exactly, name
+        columns case-insensitively, all OR-combined so SQLite can use an
+        index per column (see ensure_identifier_indexes).
         """
+        own_conn = conn is None
         try:
-            identifier_cols = self._find_identifier_columns(table)
-
-            if not identifier_cols:
+            where = self._subject_where(table, subject_identifier)
+            if where is None:
                 return []
+            if own_conn:
+                conn = self._get_connection()
+            cursor = conn.execute(safe_sql.select(table, where=where[0]), where[1])
+            return [dict(row) for row in cursor.fetchall()]
 
-            validate_identifier(table)
-            conn = self._get_connection()
-
-            # Build WHERE clause for matching any identifier column
-            where_conditions = []
-            params = []
-
-            for col in identifier_cols:
-                safe_col = validate_identifier(col)
-                # Email match
-                if "email" in col.lower():
-                    where_conditions.append(f'"{safe_col}" = ?')
-                    params.append(subject_identifier)
-                # Name match (case-insensitive)
-                elif "name" in col.lower():
-                    where_conditions.append(f'LOWER("{safe_col}") = LOWER(?)')
-                    params.append(subject_identifier)
-                # ID match
-                elif "id" in col.lower():
-                    where_conditions.append(f'"{safe_col}" = ?')
-                    params.append(subject_identifier)
-
-            if not where_conditions:
+        except (sqlite3.Error, ValueError, OSError) as e:
+            logger.error(f"Error searching table {table}: {e}")
+            return []
+        finally:
+            if own_conn and conn is not None:
                 conn.close()
-                return []
 
-            where_clause = " OR ".join(where_conditions)
-            sql = safe_sql.select(table, where=where_clause)
+    def ensure_identifier_indexes(self) -> list[str]:
+        """
+        Create indexes backing subject searches; returns the names created.
 
-            cursor = conn.execute(sql, params)
-            rows = cursor.fetchall()
+        Optional: exact-match columns get a plain index unless one already
+        leads with the column; name columns get a LOWER(column) expression
+        index, the normalised form the search compares against.
+        """
+        created = []
+        conn = self._get_connection()
+        try:
+            for table, columns in self.identifier_map().items():
+                if not columns:
+                    continue
+                safe_table = validate_identifier(table)
+                leading = {
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT ii.name FROM pragma_index_list(?) il "
+                        "JOIN pragma_index_info(il.name) ii WHERE ii.seqno = 0",
+                        [table],
+                    )
+                }
+                existing = {
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ?",
+                        [table],
+                    )
+                }
+                for column in columns:
+                    if column.kind != NAME and column.name in leading:
+                        continue
+                    index_name = f"idx_sar_{safe_table}_{validate_identifier(column.name)}"
+                    if index_name in existing:
+                        continue
+                    expr = f'LOWER("{column.name}")' if column.kind == NAME else f'"{column.name}"'
+                    conn.execute(f'CREATE INDEX "{index_name}" ON "{safe_table}" ({expr})')
+                    created.append(index_name)
+            conn.commit()
+        finally:
             conn.close()
 
-            # Convert rows to dicts
-            return [dict(row) for row in rows]
+        if created:
+            logger.info(f"Created {len(created)} subject identifier indexes")
+        return created
 
-        except (sqlite3.Error, ValueError, OSError) as e:
-            logger.error(f"Error searching table {table}: {e}")
-            return []
+    @contextmanager
+    def session(self) -> Iterator["SubjectAccessManager"]:
+        """
+        Reuse subject searches within the block.
+
+        find_subject_data results are memoized per subject for the duration
+        of the outermost session on this thread, so export/delete/anonymize
+        after a find do not search again. Destructive writes drop the
+        memoized result for their subject.
+        """
+        outer = getattr(self._local, "searches", None)
+        if outer is None:
+            self._local.searches = {}
+        try:
+            yield self
+        finally:
+            if outer is None:
+                self._local.searches = None
+
+    def _forget_search(self, subject_identifier: str) -> None:
+        searches = getattr(self._local, "searches", None)
+        if searches is not None:
+            searches.pop(subject_identifier, None)
 
     def find_subject_data(self, subject_identifier: str) -> SubjectDataReport:
         """
@@ -301,39 +430,36 @@ class SubjectAccessManager:
         Searches:
         - Email columns (exact match)
         - Name columns (case-insensitive match)
+        - Phone columns (exact match)
         - Client ID columns (exact match)
 
         Returns:
             SubjectDataReport with all matching records
         """
-        try:
-            conn = self._get_connection()
-            cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            all_tables = [row[0] for row in cursor.fetchall()]
-            conn.close()
+        searches = getattr(self._local, "searches", None)
+        if searches is not None and subject_identifier in searches:
+            return searches[subject_identifier]
 
-            # Filter to known tables (skip sqlite internals)
-            all_tables = [
-                t
-                for t in all_tables
-                if not t.startswith("sqlite_")
-                and t not in ["governance_audit_log", "subject_access_requests"]
-            ]
+        try:
+            identifier_map = self.identifier_map()
+            all_tables = list(identifier_map)
 
             data_by_table = {}
             tables_with_data = []
             total_records = 0
 
-            for table in all_tables:
-                try:
-                    records = self._search_table(table, subject_identifier)
+            conn = self._get_connection()
+            try:
+                for table, columns in identifier_map.items():
+                    if not columns:
+                        continue
+                    records = self._search_table(table, subject_identifier, conn)
                     if records:
                         data_by_table[table] = records
                         tables_with_data.append(table)
                         total_records += len(records)
-                except (sqlite3.Error, ValueError, OSError) as e:
-                    logger.warning(f"Error searching {table}: {e}")
-                    continue
+            finally:
+                conn.close()
 
             timestamp = datetime.now(timezone.utc).isoformat()
 
@@ -349,7 +475,7 @@ class SubjectAccessManager:
                 },
             )
 
-            return SubjectDataReport(
+            report = SubjectDataReport(
                 subject_identifier=subject_identifier,
                 tables_searched=all_tables,
                 tables_with_data=tables_with_data,
@@ -357,6 +483,9 @@ class SubjectAccessManager:
                 data_by_table=data_by_table,
                 generated_at=timestamp,
             )
+            if searches is not None:
+                searches[subject_identifier] = report
+            return report
 
         except (sqlite3.Error, ValueError, OSError) as e:
             logger.error(f"Error finding subject data: {e}")
@@ -457,46 +586,41 @@ class SubjectAccessManager:
             audit_entries = []
             timestamp = datetime.now(timezone.utc).isoformat()
 
-            for table in report.tables_with_data:
-                # Skip protected tables
-                if self.lifecycle.is_protected(table):
-                    tables_skipped[table] = "Protected system table"
-                    continue
-
-                identifier_cols = self._find_identifier_columns(table)
-                if not identifier_cols:
-                    tables_skipped[table] = "No identifier columns found"
-                    continue
+            if dry_run:
+                tables = report.tables_with_data
+            else:
+                # Every identifiable table, not just the (possibly memoized)
+                # search's: rows may have appeared in others since
+                tables = [table for table, columns in self.identifier_map().items() if columns]
+
+            conn = None if dry_run else self._get_connection()
+            try:
+                for table in tables:
+                    # Skip protected tables
+                    if self.lifecycle.is_protected(table):
+                        if table in report.tables_with_data:
+                            tables_skipped[table] = "Protected system table"
+                        continue
+
+                    where = self._subject_where(table, subject_identifier)
+                    if where is None:
+                        tables_skipped[table] = "No identifier columns found"
+                        continue
+
+                    if dry_run:
+                        # The search used the same predicate; its matches are what would go
+                        rows_deleted += len(report.data_by_table[table])
+                        tables_affected.append(table)
+                        continue
 
-                # Build DELETE query with proper parameter binding
-                validate_identifier(table)
-                where_conditions = []
-                params = []
-
-                for col in identifier_cols:
-                    safe_col = validate_identifier(col)
-                    if "email" in col.lower():
-                        where_conditions.append(f'"{safe_col}" = ?')
-                        params.append(subject_identifier)
-                    elif "name" in col.lower():
-                        where_conditions.append(f'LOWER("{safe_col}") = LOWER(?)')
-                        params.append(subject_identifier)
-                    elif "id" in col.lower():
-                        where_conditions.append(f'"{safe_col}" = ?')
-                        params.append(subject_identifier)
-
-                where_clause = " OR ".join(where_conditions)
-
-                if not dry_run:
-                    # Execute delete
-                    conn = self._get_connection()
-                    conn.execute(
-                        safe_sql.delete(table, where=where_clause),
-                        params,
-                    )
-                    deleted = conn.total_changes
+                    # Delete with the predicate (not the found rows) so rows
+                    # written since the search are removed too
+                    deleted = conn.execute(
+                        safe_sql.delete(table, where=where[0]), where[1]
+                    ).rowcount
                     conn.commit()
-                    conn.close()
+                    if not deleted and table not in report.tables_with_data:
+                        continue
 
                     rows_deleted += deleted
                     tables_affected.append(table)
@@ -512,19 +636,10 @@ class SubjectAccessManager:
                         },
                     )
                     audit_entries.append(entry_id)
-                else:
-                    # Count rows that would be deleted
-                    conn = self._get_connection()
-                    cursor = conn.execute(
-                        safe_sql.select_count(table, where=where_clause),
-                        params,
-                    )
-                    count = cursor.fetchone()["c"]
+            finally:
+                if conn is not None:
                     conn.close()
-
-                    if count > 0:
-                        rows_deleted += count
-                        tables_affected.append(table)
+                    self._forget_search(subject_identifier)
 
             logger.info(
                 f"Subject deletion: subject={subject_identifier}, "
@@ -570,67 +685,62 @@ class SubjectAccessManager:
             audit_entries = []
             timestamp = datetime.now(timezone.utc).isoformat()
 
-            for table in report.tables_with_data:
-                # Skip protected tables
-                if self.lifecycle.is_protected(table):
-                    tables_skipped[table] = "Protected system table"
-                    continue
+            conn = None if dry_run else self._get_connection()
+            try:
+                for table in report.tables_with_data:
+                    # Skip protected tables
+                    if self.lifecycle.is_protected(table):
+                        tables_skipped[table] = "Protected system table"
+                        continue
 
-                records = report.data_by_table.get(table, [])
-                if not records:
-                    continue
+                    records = report.data_by_table.get(table, [])
+                    if not records:
+                        continue
 
-                table_rows_anonymized = 0
+                    if dry_run:
+                        # In dry-run, count anonymizable rows
+                        rows_anonymized += len(records)
+                        tables_affected.append(table)
+                        continue
 
-                for record in records:
-                    # Anonymize each PII field
+                    validate_identifier(table)
                     pii_columns = self.lifecycle.get_pii_columns(table)
-
-                    if not dry_run:
-                        # Build UPDATE query for this record
-                        validate_identifier(table)
-                        updates = []
-                        params = []
-
-                        for col, value in record.items():
-                            if col in pii_columns and value:
-                                safe_col = validate_identifier(col)
-                                anon_value = self.anonymizer.anonymize_value(value, "text")
-                                updates.append(f'"{safe_col}" = ?')
-                                params.append(anon_value)
-
-                        if updates:
-                            # Find primary key (usually 'id')
-                            pk_col = None
-                            for col in record.keys():
-                                if col in ["id", "pk", f"{table[:-1]}_id"]:
-                                    pk_col = col
-                                    break
-
-                            if pk_col and pk_col in record:
-                                safe_pk = validate_identifier(pk_col)
-                                params.append(record[pk_col])
-                                conn = self._get_connection()
-                                conn.execute(
-                                    safe_sql.update(
-                                        table,
-                                        [c.split(" ")[0].strip('"') for c in updates],
-                                        where=f'"{safe_pk}" = ?',
-                                    ),
-                                    params,
-                                )
-                                conn.commit()
-                                conn.close()
-                                rows_anonymized += 1
-                                table_rows_anonymized += 1
-                    else:
-                        # In dry-run, count anonymizable rows
-                        rows_anonymized += 1
+                    table_rows_anonymized = 0
+
+                    for record in records:
+                        # Anonymize each PII field
+                        columns = [
+                            col for col, value in record.items() if col in pii_columns and value
+                        ]
+                        if not columns:
+                            continue
+
+                        # Find primary key (usually 'id')
+                        pk_col = next(
+                            (col for col in record if col in ["id", "pk", f"{table[:-1]}_id"]),
+                            None,
+                        )
+                        if pk_col is None:
+                            continue
+
+                        params = [
+                            self.anonymizer.anonymize_value(record[col], "text") for col in columns
+                        ]
+                        params.append(record[pk_col])
+                        conn.execute(
+                            safe_sql.update(
+                                table,
+                                [validate_identifier(col) for col in columns],
+                                where=f'"{validate_identifier(pk_col)}" = ?',
+                            ),
+                            params,
+                        )
                         table_rows_anonymized += 1
 
-                if table_rows_anonymized > 0:
-                    tables_affected.append(table)
-                    if not dry_run:
+                    conn.commit()
+                    if table_rows_anonymized > 0:
+                        rows_anonymized += table_rows_anonymized
+                        tables_affected.append(table)
                         # Log anonymization
                         entry_id = self.audit_log.log(
                             action="DATA_ANONYMIZED",
@@ -642,6 +752,10 @@ class SubjectAccessManager:
                             },
                         )
                         audit_entries.append(entry_id)
+            finally:
+                if conn is not None:
+                    conn.close()
+                    self._forget_search(subject_identifier)
 
             logger.info(
                 f"Subject anonymization: subject={subject_identifier}, "
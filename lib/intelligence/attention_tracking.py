@@ -18,6 +18,8 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 # Attention budget: expected reviews per entity type per week
@@ -129,7 +131,7 @@ class AttentionTracker:
         self._ensure_table()
 
     def _ensure_table(self) -> None:
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -173,7 +175,7 @@ class AttentionTracker:
             notes=notes,
             created_at=datetime.now(timezone.utc).isoformat(),
         )
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -202,7 +204,7 @@ class AttentionTracker:
         entity_id: str,
     ) -> AttentionDebt:
         """Compute attention debt for an entity."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             week_ago = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
@@ -266,7 +268,7 @@ class AttentionTracker:
         days_back: int = 7,
     ) -> AttentionSummary:
         """Get summary of attention allocation."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             cutoff = (datetime.now(timezone.utc) - timedelta(days=days_back)).isoformat()
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from lib import safe_sql
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +60,7 @@ class AuditTrail:
         self._ensure_table()
 
     def _ensure_table(self) -> None:
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -119,7 +120,7 @@ class AuditTrail:
             error_message=error_message,
         )
 
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -156,7 +157,7 @@ class AuditTrail:
         limit: int = 100,
     ) -> list[AuditEntry]:
         """Query audit trail entries with optional filters."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             conditions = []
@@ -199,7 +200,7 @@ class AuditTrail:
         operation: str | None = None,
     ) -> dict[str, Any]:
         """Get performance statistics for operations."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             if operation:
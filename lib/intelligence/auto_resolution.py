@@ -25,6 +25,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from lib import paths
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -125,7 +126,7 @@ class AutoResolutionEngine:
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get database connection."""
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -848,7 +849,7 @@ class AutoResolutionEngine:
             return False
 
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = open_connection(str(self.db_path))
             conn.execute("PRAGMA journal_mode=WAL")
 
             # Ensure escalation table exists
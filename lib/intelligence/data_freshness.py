@@ -14,6 +14,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 # Freshness thresholds (hours) — how old data can be before quality degrades
@@ -104,7 +106,7 @@ class DataFreshnessTracker:
         self._ensure_table()
 
     def _ensure_table(self) -> None:
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -135,7 +137,7 @@ class DataFreshnessTracker:
     ) -> None:
         """Record that data was collected for an entity from a source."""
         ts = (collected_at or datetime.now(timezone.utc)).isoformat()
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -179,7 +181,7 @@ class DataFreshnessTracker:
         source: str | None = None,
     ) -> list[FreshnessRecord]:
         """Get freshness records for an entity."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             if source:
@@ -259,7 +261,7 @@ class DataFreshnessTracker:
         entity_type: str | None = None,
     ) -> list[FreshnessRecord]:
         """Get all stale data sources across entities."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             if entity_type:
@@ -303,7 +305,7 @@ class DataFreshnessTracker:
 
     def get_freshness_dashboard(self) -> dict[str, Any]:
         """Get overall freshness dashboard across all entities."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             rows = conn.execute("SELECT * FROM data_freshness").fetchall()
@@ -16,6 +16,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,7 +59,7 @@ class DecisionJournal:
         self._ensure_table()
 
     def _ensure_table(self) -> None:
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -108,7 +110,7 @@ class DecisionJournal:
             source=source,
         )
 
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -141,7 +143,7 @@ class DecisionJournal:
         outcome_score: float | None = None,
     ) -> None:
         """Update a decision with its outcome."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -162,7 +164,7 @@ class DecisionJournal:
         limit: int = 50,
     ) -> list[Decision]:
         """Get decisions for a specific entity."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             rows = conn.execute(
@@ -184,7 +186,7 @@ class DecisionJournal:
         limit: int = 100,
     ) -> list[Decision]:
         """Get all decisions of a given type."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             rows = conn.execute(
@@ -206,7 +208,7 @@ class DecisionJournal:
         days_back: int = 30,
     ) -> dict[str, int]:
         """Get distribution of action types over the last N days."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             cutoff = datetime.now(timezone.utc).isoformat()[:10]
@@ -239,7 +241,7 @@ class DecisionJournal:
 
     def get_effectiveness_report(self) -> dict[str, Any]:
         """Analyze decision outcomes for effectiveness."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             total = conn.execute("SELECT COUNT(*) as cnt FROM decision_log").fetchone()["cnt"]
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from lib import safe_sql
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -96,7 +97,7 @@ class DriftDetector:
         variance = sum((v - mean) ** 2 for v in values) / (len(values) - 1)
         stddev = sqrt(variance) if variance > 0 else 0.001  # Avoid zero division
 
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -135,7 +136,7 @@ class DriftDetector:
 
         Returns DriftAlert if drift detected, None otherwise.
         """
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             row = conn.execute(
@@ -220,7 +221,7 @@ class DriftDetector:
         limit: int = 50,
     ) -> list[DriftAlert]:
         """Get recent drift alerts."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             conditions = []
@@ -249,7 +250,7 @@ class DriftDetector:
 
     def get_drift_summary(self) -> dict[str, Any]:
         """Get summary of drift detection activity."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             total = conn.execute("SELECT COUNT(*) as cnt FROM drift_alerts").fetchone()["cnt"]
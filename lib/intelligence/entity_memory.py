@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from lib import safe_sql
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +104,7 @@ class EntityMemory:
         self._ensure_table()
 
     def _ensure_table(self) -> None:
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -156,7 +157,7 @@ class EntityMemory:
             source=source,
         )
 
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -188,7 +189,7 @@ class EntityMemory:
         entity_id: str,
     ) -> EntityMemoryState:
         """Get aggregated memory state for an entity."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             # Counts by type
@@ -260,7 +261,7 @@ class EntityMemory:
         interaction_types: list[str] | None = None,
     ) -> list[EntityInteraction]:
         """Get interaction timeline for an entity."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             if interaction_types:
@@ -296,7 +297,7 @@ class EntityMemory:
         days_threshold: int = 30,
     ) -> list[EntityMemoryState]:
         """Find entities with no interaction in the last N days."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             cutoff = (datetime.now(timezone.utc) - timedelta(days=days_threshold)).isoformat()
@@ -327,7 +328,7 @@ class EntityMemory:
         days_back: int = 30,
     ) -> dict[str, Any]:
         """Get summary of interactions over the last N days."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             cutoff = (datetime.now(timezone.utc) - timedelta(days=days_back)).isoformat()
@@ -19,6 +19,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 
+from lib.db import open_connection
 from lib.paths import db_path as get_db_path_from_lib
 
 logger = logging.getLogger(__name__)
@@ -74,7 +75,7 @@ def ensure_notification_table(db_path: Path | None = None) -> None:
     """
     db = _get_db_path(db_path)
 
-    conn = sqlite3.connect(str(db))
+    conn = open_connection(str(db))
     try:
         conn.execute("""
             CREATE TABLE IF NOT EXISTS notification_queue (
@@ -132,7 +133,7 @@ def queue_notification(notification: Notification, db_path: Path | None = None)
 
     notification_id = notification.id or str(uuid.uuid4())
 
-    conn = sqlite3.connect(str(db))
+    conn = open_connection(str(db))
     try:
         conn.execute(
             """
@@ -170,7 +171,7 @@ def get_pending_notifications(limit: int = 50, db_path: Path | None = None) -> l
     db = _get_db_path(db_path)
     ensure_notification_table(db_path)
 
-    conn = sqlite3.connect(str(db))
+    conn = open_connection(str(db))
     conn.row_factory = sqlite3.Row
     try:
         cursor = conn.execute(
@@ -217,7 +218,7 @@ def mark_delivered(notification_id: str, db_path: Path | None = None) -> None:
     """Mark a notification as delivered."""
     db = _get_db_path(db_path)
 
-    conn = sqlite3.connect(str(db))
+    conn = open_connection(str(db))
     try:
         conn.execute(
             """
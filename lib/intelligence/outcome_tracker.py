@@ -19,6 +19,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,7 +77,7 @@ class OutcomeTracker:
 
     def _ensure_table(self) -> None:
         """Create signal_outcomes table if it doesn't exist."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -155,7 +157,7 @@ class OutcomeTracker:
             created_at=datetime.now(timezone.utc).isoformat(),
         )
 
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -197,7 +199,7 @@ class OutcomeTracker:
         limit: int = 100,
     ) -> list[SignalOutcome]:
         """Retrieve outcomes for an entity in past N days."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             rows = conn.execute(
@@ -221,7 +223,7 @@ class OutcomeTracker:
         limit: int = 100,
     ) -> list[SignalOutcome]:
         """Retrieve outcomes for a signal type across all entities."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             rows = conn.execute(
@@ -245,7 +247,7 @@ class OutcomeTracker:
         limit: int = 100,
     ) -> list[SignalOutcome]:
         """Get outcomes filtered by how they were resolved."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             rows = conn.execute(
@@ -269,7 +271,7 @@ class OutcomeTracker:
         Returns breakdown by resolution type, improvement rate,
         and per-signal-type metrics.
         """
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             rows = conn.execute(
@@ -14,6 +14,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from statistics import mean
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -146,7 +148,7 @@ class PatternTrendAnalyzer:
 
         Returns dict mapping pattern_key -> PatternTrendAnalysis.
         """
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             # Get distinct pattern keys for this entity
@@ -197,7 +199,7 @@ class PatternTrendAnalyzer:
 
         Returns dict: pattern_key -> PatternTrendAnalysis.
         """
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             # Get all distinct pattern keys
@@ -19,7 +19,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from lib import paths
+from lib import event_log, paths
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -131,7 +132,7 @@ class PatternPersistence:
         self.db_path = db_path or paths.db_path()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -292,7 +293,7 @@ class CostPersistence:
         self.db_path = db_path or paths.db_path()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -430,14 +431,50 @@ class CostPersistence:
 # =============================================================================
 
 
+# Intelligence event types renamed on the SSE stream; others keep their name.
+STREAM_EVENT_TYPES = {
+    "signal_fired": "signal_new",
+    "signal_detected": "signal_new",
+}
+
+
+def _append_to_stream(conn: sqlite3.Connection, event: IntelligenceEvent) -> None:
+    """
+    Mirror *event* into the cross-process event log for SSE subscribers.
+
+    Best effort: a database without the event_log table (not yet migrated)
+    still records the intelligence event itself.
+    """
+    try:
+        event_log.append(
+            conn,
+            STREAM_EVENT_TYPES.get(event.event_type, event.event_type),
+            {
+                "id": event.id,
+                "event_type": event.event_type,
+                "severity": event.severity,
+                "entity_type": event.entity_type,
+                "entity_id": event.entity_id,
+                "data": event.event_data,
+            },
+            source=event.source_module,
+        )
+    except sqlite3.OperationalError as e:
+        logger.warning("Event %s not added to event_log: %s", event.id, e)
+
+
 class IntelligenceEventStore:
-    """Publish and consume intelligence events."""
+    """Publish and consume intelligence events.
+
+    Published events are also appended to the event log (lib/event_log.py) in
+    the same transaction, which is how the API process streams them over SSE.
+    """
 
     def __init__(self, db_path: Path | None = None):
         self.db_path = db_path or paths.db_path()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -461,6 +498,7 @@ class IntelligenceEventStore:
                     event.created_at,
                 ),
             )
+            _append_to_stream(conn, event)
             conn.commit()
         except sqlite3.Error as e:
             logger.error("Failed to publish event %s: %s", event.event_type, e)
@@ -492,6 +530,7 @@ class IntelligenceEventStore:
                             ev.created_at,
                         ),
                     )
+                    _append_to_stream(conn, ev)
                     published += 1
                 except sqlite3.Error as e:
                     logger.error("Failed to publish event: %s", e)
@@ -24,6 +24,7 @@ import json
 import logging
 import sqlite3
 
+from lib.db import open_connection
 from lib.paths import db_path as canonical_db_path
 
 logger = logging.getLogger(__name__)
@@ -58,7 +59,7 @@ def signal_distribution_report(db_path: str | None = None) -> dict:
         }
     """
     db = _get_db_path(db_path)
-    conn = sqlite3.connect(db)
+    conn = open_connection(db)
     conn.row_factory = sqlite3.Row
 
     by_severity = {"critical": 0, "high": 0, "medium": 0, "low": 0}
@@ -166,7 +167,7 @@ def recalibrate_active_signals(
     db = _get_db_path(db_path)
     before = signal_distribution_report(db)
 
-    conn = sqlite3.connect(db)
+    conn = open_connection(db)
     conn.row_factory = sqlite3.Row
 
     rows = conn.execute(
@@ -253,7 +254,7 @@ def update_priority_weights(
         {"updates": [{"signal_type": ..., "old_weight": ..., "new_weight": ...}], "dry_run": bool}
     """
     db = _get_db_path(db_path)
-    conn = sqlite3.connect(db)
+    conn = open_connection(db)
     conn.row_factory = sqlite3.Row
 
     rows = conn.execute(
@@ -559,6 +559,7 @@ import json  # noqa: E402 — conditional import
 import sqlite3  # noqa: E402 — conditional import
 
 from lib import paths  # noqa: E402 — conditional import
+from lib.db import open_connection  # noqa: E402
 
 
 def record_score(scorecard: dict, db_path: Path | None = None) -> bool:
@@ -582,7 +583,7 @@ def record_score(scorecard: dict, db_path: Path | None = None) -> bool:
     now = datetime.now(timezone.utc)
 
     try:
-        conn = sqlite3.connect(str(db))
+        conn = open_connection(str(db))
         cursor = conn.cursor()
 
         cursor.execute(
@@ -688,7 +689,7 @@ def get_score_trend(
     cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
 
     try:
-        conn = sqlite3.connect(str(db))
+        conn = open_connection(str(db))
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -781,7 +782,7 @@ def get_score_history_summary(db_path: Path | None = None) -> dict:
     db = db_path or paths.db_path()
 
     try:
-        conn = sqlite3.connect(str(db))
+        conn = open_connection(str(db))
         cursor = conn.cursor()
 
         # Total records
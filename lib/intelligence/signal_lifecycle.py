@@ -19,6 +19,7 @@ from enum import Enum
 from pathlib import Path
 
 from lib import paths
+from lib.db import open_connection
 from lib.intelligence.temporal import BusinessCalendar
 
 logger = logging.getLogger(__name__)
@@ -113,7 +114,7 @@ class SignalLifecycleTracker:
         self.calendar = calendar or BusinessCalendar()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         return conn
 
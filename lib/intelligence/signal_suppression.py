@@ -20,6 +20,8 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 # Suppression configuration
@@ -87,7 +89,7 @@ class SignalSuppression:
 
     def is_suppressed(self, signal_key: str) -> bool:
         """Check if a signal is currently suppressed."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             now = datetime.now(timezone.utc).isoformat()
             row = conn.execute(
@@ -118,7 +120,7 @@ class SignalSuppression:
         - 1-2 dismissals: 7 days
         - 3+ dismissals: 30 days
         """
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             # Count previous dismissals for this signal
             prev_count = conn.execute(
@@ -206,7 +208,7 @@ class SignalSuppression:
         entity_id: str,
     ) -> None:
         """Record that a signal was raised (for dismiss rate tracking)."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             conn.execute(
                 """
@@ -228,7 +230,7 @@ class SignalSuppression:
 
     def get_dismiss_stats(self, signal_key: str) -> SignalDismissStats:
         """Get dismiss statistics for a signal."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             raised = conn.execute(
                 "SELECT COUNT(*) FROM signal_dismiss_log WHERE signal_key = ? AND event_type = 'raised'",
@@ -274,7 +276,7 @@ class SignalSuppression:
 
     def expire_suppressions(self) -> int:
         """Deactivate expired suppressions. Returns count expired."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         try:
             now = datetime.now(timezone.utc).isoformat()
             cursor = conn.execute(
@@ -296,7 +298,7 @@ class SignalSuppression:
         entity_id: str | None = None,
     ) -> list[SuppressionRecord]:
         """Get all active (non-expired) suppressions."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             now = datetime.now(timezone.utc).isoformat()
@@ -326,7 +328,7 @@ class SignalSuppression:
 
     def get_suppression_summary(self) -> dict[str, Any]:
         """Get summary of all suppressions."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = open_connection(str(self.db_path))
         conn.row_factory = sqlite3.Row
         try:
             now = datetime.now(timezone.utc).isoformat()
@@ -888,11 +888,21 @@ apply_thresholds()
 # SIGNAL DETECTION - Condition Evaluators
 # =============================================================================
 
+import hashlib  # noqa: E402 — conditional import
+import json  # noqa: E402 — conditional import
 import logging  # noqa: E402 — conditional import
+import multiprocessing  # noqa: E402 — conditional import
+import sqlite3  # noqa: E402 — conditional import
 import statistics  # noqa: E402 — conditional import
+from concurrent.futures import (  # noqa: E402 — conditional import
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from datetime import datetime, timedelta, timezone  # noqa: E402 — conditional import
 from pathlib import Path  # noqa: E402 — conditional import
 
+from lib.db import open_connection  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 
@@ -989,7 +999,7 @@ class DetectionCache:
         from lib import paths
 
         db = self.db_path or paths.db_path()
-        conn = sqlite3.connect(str(db))
+        conn = open_connection(str(db))
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -1005,6 +1015,14 @@ class DetectionCache:
         self._overdue_counts = {row["client_id"]: row["overdue_count"] for row in cursor.fetchall()}
         conn.close()
 
+    def prime(self) -> None:
+        """Load every lazily batch-loaded map now (before sharing the cache)."""
+        _ = self.clients, self.projects, self.persons
+        if self._overdue_counts is None:
+            self._load_overdue_counts()
+        if self._last_comm_days is None:
+            self._load_last_comm_days()
+
     def get_days_since_last_comm(self, client_id: str) -> int | None:
         """Get days since last communication for a client (batch loaded on first access)."""
         if self._last_comm_days is None:
@@ -1018,7 +1036,7 @@ class DetectionCache:
         from lib import paths
 
         db = self.db_path or paths.db_path()
-        conn = sqlite3.connect(str(db))
+        conn = open_connection(str(db))
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -1772,7 +1790,11 @@ def detect_all_client_signals(
 
 
 def detect_all_signals(
-    db_path: Path | None = None, quick: bool = False, categories: list[SignalCategory] | None = None
+    db_path: Path | None = None,
+    quick: bool = False,
+    categories: list[SignalCategory] | None = None,
+    incremental: bool = False,
+    workers: int = 1,
 ) -> dict:
     """
     Run the signal catalog against the full database.
@@ -1781,6 +1803,11 @@ def detect_all_signals(
         db_path: Optional database path
         quick: If True, only evaluate THRESHOLD signals (fast)
         categories: Optional list of categories to evaluate
+        incremental: If True, only re-evaluate entities whose inputs changed since
+                     their last evaluation (see _EntityFingerprints); the rest reuse
+                     their persisted signals. False = full re-evaluation.
+        workers: Number of parallel evaluators for the client/project/person
+                 loops (1 = serial). See _evaluate_entities.
 
     Returns comprehensive detection results INCLUDING ERRORS.
     Errors are tracked, not swallowed.
@@ -1838,38 +1865,42 @@ def detect_all_signals(
     # In quick mode, skip slow signals (fast_only=True)
     fast_only = quick
 
-    # Clients - use cached data
-    for client in cache.clients:
-        client_id = client.get("client_id")
-        if client_id:
-            detected = detect_signals_for_entity(
-                "client", client_id, db_path, cats, cache, fast_only, error_collector
-            )
-            for d in detected:
-                d["entity_name"] = client.get("client_name", "Unknown")
-            all_detected.extend(detected)
-
-    # Projects - use cached data
-    for project in cache.projects:
-        project_id = project.get("project_id")
-        if project_id:
-            detected = detect_signals_for_entity(
-                "project", project_id, db_path, cats, cache, fast_only, error_collector
-            )
-            for d in detected:
-                d["entity_name"] = project.get("project_name", "Unknown")
-            all_detected.extend(detected)
+    # Clients, projects, persons - use cached data. In incremental mode, entities
+    # whose input fingerprint is unchanged since their last evaluation reuse the
+    # signals persisted then instead of re-running the catalog.
+    fingerprints = None
+    if incremental:
+        fingerprints = _EntityFingerprints(db_path, cache, _detection_mode_key(cats, fast_only))
+
+    universe = _entity_universe(cache)
+    results: list[list[dict] | None] = [None] * len(universe)
+    dirty: list[int] = []
+    for idx, (entity_type, entity_id, _name, row) in enumerate(universe):
+        if fingerprints is not None:
+            reused = fingerprints.reusable(entity_type, entity_id, row)
+            if reused is not None:
+                results[idx] = reused
+                continue
+        dirty.append(idx)
 
-    # Persons - use cached data
-    for person in cache.persons:
-        person_id = person.get("person_id")
-        if person_id:
-            detected = detect_signals_for_entity(
-                "person", person_id, db_path, cats, cache, fast_only, error_collector
-            )
-            for d in detected:
-                d["entity_name"] = person.get("person_name", "Unknown")
-            all_detected.extend(detected)
+    evaluated = _evaluate_entities(
+        [universe[idx][:3] for idx in dirty], db_path, cats, cache, fast_only, workers
+    )
+    for idx, (detected, errors) in zip(dirty, evaluated, strict=True):
+        results[idx] = detected
+        for error in errors:
+            error_collector.add(error)
+        # An entity whose evaluation raised is left dirty so the next run retries it.
+        if fingerprints is not None and not errors:
+            fingerprints.record(universe[idx][0], universe[idx][1], detected)
+
+    for detected in results:
+        all_detected.extend(detected)
+    entities_evaluated = len(dirty)
+    entities_reused = len(universe) - len(dirty)
+
+    if fingerprints is not None:
+        fingerprints.save()
 
     # Portfolio (single entity)
     portfolio_signals = get_signals_by_entity_type("portfolio")
@@ -1910,16 +1941,323 @@ def detect_all_signals(
         "errors": [e.to_dict() for e in errors],
         "by_severity": {k: len(v) for k, v in by_severity.items()},
         "by_entity_type": {k: len(v) for k, v in by_entity_type.items()},
+        "incremental": incremental,
+        "entities_evaluated": entities_evaluated,
+        "entities_reused": entities_reused,
         "signals": all_detected,
     }
 
 
 # =============================================================================
-# SIGNAL STATE TRACKING
+# PARALLEL EVALUATION - fan the per-entity loops out over workers
 # =============================================================================
 
-import json  # noqa: E402 — conditional import
-import sqlite3  # noqa: E402 — conditional import
+# Chunks per worker; more than one so a slow chunk does not leave the others idle.
+_CHUNKS_PER_WORKER = 4
+
+# Cache shared with forked worker processes. Set in the parent just before the pool
+# starts, so children inherit the primed snapshot copy-on-write instead of having
+# it pickled to them.
+_WORKER_CACHE: DetectionCache | None = None
+
+
+def _evaluate_entity_chunk(
+    chunk: list[tuple[str, str, str]],
+    db_path: Path | None,
+    categories: list[SignalCategory] | None,
+    fast_only: bool,
+    cache: DetectionCache | None = None,
+) -> list[tuple[list[dict], list[SignalEvaluationError]]]:
+    """Evaluate (entity_type, entity_id, entity_name) entities in order.
+
+    Returns one (detected signals, evaluation errors) pair per entity. Each entity
+    gets its own error collector so callers can tell which entities failed.
+    """
+    cache = cache if cache is not None else _WORKER_CACHE
+    out = []
+    for entity_type, entity_id, entity_name in chunk:
+        collector = EvaluationErrorCollector()
+        detected = detect_signals_for_entity(
+            entity_type, entity_id, db_path, categories, cache, fast_only, collector
+        )
+        for d in detected:
+            d["entity_name"] = entity_name
+        out.append((detected, collector.get_all()))
+    return out
+
+
+def _evaluate_entities(
+    entities: list[tuple[str, str, str]],
+    db_path: Path | None,
+    categories: list[SignalCategory] | None,
+    cache: DetectionCache,
+    fast_only: bool,
+    workers: int = 1,
+) -> list[tuple[list[dict], list[SignalEvaluationError]]]:
+    """
+    Evaluate entities serially or across a worker pool.
+
+    With workers > 1 the entity list is split into contiguous chunks evaluated by a
+    process pool (fork start method, so workers share the primed DetectionCache
+    read-only) or, where fork is unavailable, a thread pool sharing the same cache.
+    Chunk results are concatenated in submission order, so the output — and the
+    order of detected signals and errors built from it — is identical to a serial
+    run regardless of which worker finishes first.
+    """
+    global _WORKER_CACHE
+
+    if workers <= 1 or len(entities) < 2:
+        return _evaluate_entity_chunk(entities, db_path, categories, fast_only, cache)
+
+    # Load the lazily batch-loaded maps once here rather than once per worker.
+    cache.prime()
+
+    n_chunks = min(len(entities), workers * _CHUNKS_PER_WORKER)
+    size = -(-len(entities) // n_chunks)
+    chunks = [entities[i : i + size] for i in range(0, len(entities), size)]
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        _WORKER_CACHE = cache
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("fork")
+            ) as pool:
+                futures = [
+                    pool.submit(_evaluate_entity_chunk, chunk, db_path, categories, fast_only)
+                    for chunk in chunks
+                ]
+                parts = [f.result() for f in futures]
+        finally:
+            _WORKER_CACHE = None
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_evaluate_entity_chunk, chunk, db_path, categories, fast_only, cache)
+                for chunk in chunks
+            ]
+            parts = [f.result() for f in futures]
+
+    return [pair for part in parts for pair in part]
+
+
+# =============================================================================
+# INCREMENTAL DETECTION - per-entity input fingerprints
+# =============================================================================
+
+# (entity_type, DetectionCache attribute, id key, name key) for the per-entity loops.
+_ENTITY_SOURCES = (
+    ("client", "clients", "client_id", "client_name"),
+    ("project", "projects", "project_id", "project_name"),
+    ("person", "persons", "person_id", "person_name"),
+)
+
+# Keys that change on every build without the underlying data changing.
+_VOLATILE_KEYS = frozenset({"scored_at", "computed_at", "generated_at"})
+
+# Grouped "last touched" watermarks per input table. Each query yields
+# (group key, *watermark columns); a change in row count or latest
+# updated_at/created_at for an entity's group marks that entity dirty.
+_WATERMARK_QUERIES = {
+    "client_tasks": """
+        SELECT COALESCE(t.client_id, p.client_id), COUNT(*),
+               MAX(COALESCE(t.updated_at, t.created_at))
+        FROM tasks t LEFT JOIN projects p ON t.project_id = p.id
+        GROUP BY 1
+    """,
+    "client_invoices": """
+        SELECT client_id, COUNT(*), MAX(COALESCE(updated_at, created_at)), TOTAL(amount)
+        FROM invoices GROUP BY client_id
+    """,
+    "client_communications": """
+        SELECT client_id, COUNT(*), MAX(COALESCE(updated_at, created_at))
+        FROM communications GROUP BY client_id
+    """,
+    "project_tasks": """
+        SELECT project_id, COUNT(*), MAX(COALESCE(updated_at, created_at))
+        FROM tasks GROUP BY project_id
+    """,
+    "person_tasks": """
+        SELECT LOWER(assignee), COUNT(*), MAX(COALESCE(updated_at, created_at))
+        FROM tasks GROUP BY LOWER(assignee)
+    """,
+    "entity_links": """
+        SELECT to_entity_type || ':' || to_entity_id, COUNT(*),
+               MAX(COALESCE(updated_at, created_at))
+        FROM entity_links GROUP BY to_entity_type, to_entity_id
+    """,
+}
+
+
+def _entity_universe(cache: DetectionCache) -> list[tuple[str, str, str, dict]]:
+    """(entity_type, entity_id, entity_name, cached row) for every evaluable entity."""
+    universe = []
+    for entity_type, attr, id_key, name_key in _ENTITY_SOURCES:
+        for row in getattr(cache, attr):
+            entity_id = row.get(id_key)
+            if entity_id:
+                universe.append((entity_type, entity_id, row.get(name_key, "Unknown"), row))
+    return universe
+
+
+def _stable_json(value) -> str:
+    """Deterministic JSON for fingerprinting, minus build-time timestamp keys."""
+
+    def strip(v):
+        if isinstance(v, dict):
+            return {k: strip(x) for k, x in v.items() if k not in _VOLATILE_KEYS}
+        if isinstance(v, list | tuple):
+            return [strip(x) for x in v]
+        return v
+
+    return json.dumps(strip(value), sort_keys=True, default=str)
+
+
+def _detection_mode_key(categories: list[SignalCategory] | None, fast_only: bool) -> str:
+    """Key for one detection mode: category filter, fast_only and the live catalog.
+
+    Folding the catalog (including thresholds applied from thresholds.yaml) into the
+    key means editing a signal or threshold invalidates every stored fingerprint.
+    """
+    from dataclasses import asdict
+
+    cats = sorted(c.value for c in categories) if categories is not None else None
+    catalog = [asdict(s) for _, s in sorted(SIGNAL_CATALOG.items())]
+    payload = _stable_json({"categories": cats, "fast_only": fast_only, "catalog": catalog})
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class _EntityFingerprints:
+    """
+    Per-entity input fingerprints backing detect_all_signals(incremental=True).
+
+    An entity's fingerprint hashes everything its signals read: the entity's cached
+    aggregate row, the watermarks of its tasks/invoices/communications/entity_links,
+    the primed scorecard and trajectory (non-quick mode), and today's date (overdue
+    and days-since conditions move with the calendar). When the fingerprint matches
+    the one stored for the same mode_key, the signals detected at that evaluation are
+    reused; otherwise the entity is re-evaluated and its row is rewritten.
+
+    Missing tables degrade to a full evaluation rather than failing detection.
+    """
+
+    def __init__(self, db_path: Path | None, cache: DetectionCache, mode_key: str):
+        self.db_path = _get_db_path(db_path)
+        self.cache = cache
+        self.mode_key = mode_key
+        self.today = datetime.now(timezone.utc).date().isoformat()
+        self._pending: list[tuple] = []
+        self._current: dict[tuple[str, str], str] = {}
+        self._available = True
+
+        conn = open_connection(str(self.db_path))
+        try:
+            self._watermarks = {
+                name: self._load_watermarks(conn, sql) for name, sql in _WATERMARK_QUERIES.items()
+            }
+            self._stored = self._load_stored(conn)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _load_watermarks(conn: sqlite3.Connection, sql: str) -> dict:
+        try:
+            return {row[0]: list(row[1:]) for row in conn.execute(sql)}
+        except sqlite3.OperationalError as e:
+            logger.debug("Incremental detection watermark skipped: %s", e)
+            return {}
+
+    def _load_stored(self, conn: sqlite3.Connection) -> dict:
+        try:
+            rows = conn.execute(
+                """SELECT entity_type, entity_id, fingerprint, detected_json
+                   FROM signal_entity_fingerprints WHERE mode_key = ?""",
+                (self.mode_key,),
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            logger.warning("Incremental detection unavailable, evaluating all entities: %s", e)
+            self._available = False
+            return {}
+        return {(r[0], r[1]): (r[2], r[3]) for r in rows}
+
+    def fingerprint(self, entity_type: str, entity_id: str, row: dict) -> str:
+        wm = self._watermarks
+        inputs: dict = {
+            "today": self.today,
+            "row": row,
+            "links": wm["entity_links"].get(f"{entity_type}:{entity_id}"),
+        }
+        if entity_type == "client":
+            inputs["tasks"] = wm["client_tasks"].get(entity_id)
+            inputs["invoices"] = wm["client_invoices"].get(entity_id)
+            inputs["communications"] = wm["client_communications"].get(entity_id)
+            if self.cache.score_map is not None:
+                inputs["score"] = self.cache.score_map.get(entity_id)
+        elif entity_type == "project":
+            inputs["tasks"] = wm["project_tasks"].get(entity_id)
+        elif entity_type == "person":
+            inputs["tasks"] = wm["person_tasks"].get((row.get("person_name") or "").lower())
+        if self.cache.trajectory_map is not None:
+            inputs["trajectory"] = self.cache.trajectory_map.get(entity_type, {}).get(entity_id)
+        digest = hashlib.blake2b(_stable_json(inputs).encode(), digest_size=16)
+        fp = digest.hexdigest()
+        self._current[(entity_type, entity_id)] = fp
+        return fp
+
+    def reusable(self, entity_type: str, entity_id: str, row: dict) -> list[dict] | None:
+        """Signals from the last evaluation if the entity is clean, else None."""
+        fp = self.fingerprint(entity_type, entity_id, row)
+        stored = self._stored.get((entity_type, entity_id))
+        if stored is None or stored[0] != fp:
+            return None
+        try:
+            return json.loads(stored[1])
+        except (ValueError, TypeError):
+            return None
+
+    def record(self, entity_type: str, entity_id: str, detected: list[dict]) -> None:
+        fp = self._current.get((entity_type, entity_id))
+        if fp is None:
+            return
+        self._pending.append(
+            (entity_type, entity_id, self.mode_key, fp, json.dumps(detected, default=str))
+        )
+
+    def save(self) -> None:
+        """Persist re-evaluated entities and drop rows for entities that are gone."""
+        if not self._available:
+            return
+        stale = [
+            (et, eid, self.mode_key) for et, eid in self._stored if (et, eid) not in self._current
+        ]
+        if not self._pending and not stale:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        conn = open_connection(str(self.db_path))
+        try:
+            with conn:
+                conn.executemany(
+                    """INSERT OR REPLACE INTO signal_entity_fingerprints
+                       (entity_type, entity_id, mode_key, fingerprint, detected_json,
+                        evaluated_at)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    [(*p, now) for p in self._pending],
+                )
+                conn.executemany(
+                    """DELETE FROM signal_entity_fingerprints
+                       WHERE entity_type = ? AND entity_id = ? AND mode_key = ?""",
+                    stale,
+                )
+        except sqlite3.Error as e:
+            # Fingerprints are an optimisation; losing them only costs a full pass.
+            logger.warning("Failed to persist signal fingerprints: %s", e)
+        finally:
+            conn.close()
+        self._pending = []
+
+
+# =============================================================================
+# SIGNAL STATE TRACKING
+# =============================================================================
 
 
 def _get_db_path(db_path: Path | None = None) -> Path:
@@ -1980,6 +2318,11 @@ def update_signal_state(detected_signals: list[dict], db_path: Path | None = Non
     - If active and cooldown has passed: UPDATE status to 'cleared'
     - If within cooldown: leave as active
 
+    Runs as a batch reconciler: all active rows are loaded in one query and keyed
+    by (signal_id, entity_type, entity_id), the transitions are computed in memory,
+    and the resulting INSERT/UPDATE sets are applied with executemany in a single
+    transaction.
+
     Returns:
     {
         "new_signals": [...],
@@ -1989,7 +2332,7 @@ def update_signal_state(detected_signals: list[dict], db_path: Path | None = Non
     }
     """
     db = _get_db_path(db_path)
-    conn = sqlite3.connect(db)
+    conn = open_connection(db)
     conn.row_factory = sqlite3.Row
     now = datetime.now(timezone.utc).isoformat()
 
@@ -2001,27 +2344,40 @@ def update_signal_state(detected_signals: list[dict], db_path: Path | None = Non
     }
 
     try:
-        # Build set of detected signal keys
+        # One read of the active state, keyed like the detected signals
+        active: dict[tuple, dict] = {}
+        for row in conn.execute("SELECT * FROM signal_state WHERE status = 'active' ORDER BY id"):
+            record = dict(row)
+            active.setdefault(
+                (record["signal_id"], record["entity_type"], record["entity_id"]), record
+            )
+
         detected_keys = set()
-        for sig in detected_signals:
-            key = (sig["signal_id"], sig["entity_type"], sig["entity_id"])
-            detected_keys.add(key)
+        inserts: dict[tuple, list] = {}  # key -> INSERT params (pending new rows)
+        updates: dict[int, dict] = {}  # signal_state.id -> record with pending changes
 
-        # Process each detected signal
         for sig in detected_signals:
             signal_id = sig["signal_id"]
             entity_type = sig["entity_type"]
             entity_id = sig["entity_id"]
             severity = sig["severity"]
-            evidence_json = json.dumps(sig.get("evidence", {}))
+            key = (signal_id, entity_type, entity_id)
+            detected_keys.add(key)
 
-            # Check if already active in state table
-            existing = conn.execute(
-                """SELECT * FROM signal_state
-                   WHERE signal_id = ? AND entity_type = ? AND entity_id = ? AND status = 'active'""",
-                (signal_id, entity_type, entity_id),
-            ).fetchone()
+            if key in inserts:
+                # Repeat of a signal inserted earlier in this batch - counts as ongoing
+                inserts[key][-1] += 1
+                result["ongoing_signals"].append(
+                    {
+                        "signal_id": signal_id,
+                        "entity_type": entity_type,
+                        "entity_id": entity_id,
+                        "evaluation_count": inserts[key][-1],
+                    }
+                )
+                continue
 
+            existing = active.get(key)
             if existing:
                 # Already active - update evaluation count and timestamp
                 new_count = existing["evaluation_count"] + 1
@@ -2030,17 +2386,13 @@ def update_signal_state(detected_signals: list[dict], db_path: Path | None = Non
                 signal_def = get_signal(signal_id)
                 new_severity = None
                 if signal_def:
-                    new_severity = _check_escalation(dict(existing), signal_def)
+                    new_severity = _check_escalation(existing, signal_def)
 
+                existing["evaluation_count"] = new_count
+                existing["last_evaluated_at"] = now
                 if new_severity:
-                    # Escalate
-                    conn.execute(
-                        """UPDATE signal_state
-                           SET last_evaluated_at = ?, evaluation_count = ?,
-                               severity = ?, escalated_at = ?
-                           WHERE id = ?""",
-                        (now, new_count, new_severity, now, existing["id"]),
-                    )
+                    existing["severity"] = new_severity
+                    existing["escalated_at"] = now
                     result["escalated_signals"].append(
                         {
                             "signal_id": signal_id,
@@ -2051,13 +2403,6 @@ def update_signal_state(detected_signals: list[dict], db_path: Path | None = Non
                         }
                     )
                 else:
-                    # Ongoing, no escalation
-                    conn.execute(
-                        """UPDATE signal_state
-                           SET last_evaluated_at = ?, evaluation_count = ?
-                           WHERE id = ?""",
-                        (now, new_count, existing["id"]),
-                    )
                     result["ongoing_signals"].append(
                         {
                             "signal_id": signal_id,
@@ -2066,24 +2411,20 @@ def update_signal_state(detected_signals: list[dict], db_path: Path | None = Non
                             "evaluation_count": new_count,
                         }
                     )
+                updates[existing["id"]] = existing
             else:
                 # New signal - insert
-                conn.execute(
-                    """INSERT INTO signal_state
-                       (signal_id, entity_type, entity_id, severity, original_severity,
-                        status, evidence_json, first_detected_at, last_evaluated_at, evaluation_count)
-                       VALUES (?, ?, ?, ?, ?, 'active', ?, ?, ?, 1)""",
-                    (
-                        signal_id,
-                        entity_type,
-                        entity_id,
-                        severity,
-                        severity,
-                        evidence_json,
-                        now,
-                        now,
-                    ),
-                )
+                inserts[key] = [
+                    signal_id,
+                    entity_type,
+                    entity_id,
+                    severity,
+                    severity,
+                    json.dumps(sig.get("evidence", {})),
+                    now,
+                    now,
+                    1,
+                ]
                 result["new_signals"].append(
                     {
                         "signal_id": signal_id,
@@ -2093,46 +2434,67 @@ def update_signal_state(detected_signals: list[dict], db_path: Path | None = Non
                     }
                 )
 
-        # Check for signals that should be cleared (active but not detected)
-        active_signals = conn.execute(
-            "SELECT * FROM signal_state WHERE status = 'active'"
-        ).fetchall()
+        # Signals that should be cleared (active but not detected)
+        clears = []
+        for key, record in active.items():
+            if key in detected_keys:
+                continue
+            # Signal not detected this time - check cooldown
+            signal_def = get_signal(record["signal_id"])
+            cooldown_hours = signal_def.cooldown_hours if signal_def else 24
+
+            last_eval = record["last_evaluated_at"]
+            try:
+                last_dt = datetime.fromisoformat(last_eval)
+                hours_since = (datetime.now(timezone.utc) - last_dt).total_seconds() / 3600
+            except (ValueError, TypeError):
+                hours_since = 0
+
+            if hours_since >= cooldown_hours:
+                # Cooldown passed - clear the signal
+                clears.append((now, record["id"]))
+                result["cleared_signals"].append(
+                    {
+                        "signal_id": record["signal_id"],
+                        "entity_type": record["entity_type"],
+                        "entity_id": record["entity_id"],
+                        "was_active_for_days": (
+                            datetime.now(timezone.utc)
+                            - datetime.fromisoformat(record["first_detected_at"])
+                        ).days,
+                    }
+                )
 
-        for record in active_signals:
-            key = (record["signal_id"], record["entity_type"], record["entity_id"])
-            if key not in detected_keys:
-                # Signal not detected this time - check cooldown
-                signal_def = get_signal(record["signal_id"])
-                cooldown_hours = signal_def.cooldown_hours if signal_def else 24
-
-                last_eval = record["last_evaluated_at"]
-                try:
-                    last_dt = datetime.fromisoformat(last_eval)
-                    hours_since = (datetime.now(timezone.utc) - last_dt).total_seconds() / 3600
-                except (ValueError, TypeError):
-                    hours_since = 0
-
-                if hours_since >= cooldown_hours:
-                    # Cooldown passed - clear the signal
-                    conn.execute(
-                        """UPDATE signal_state
-                           SET status = 'cleared', cleared_at = ?
-                           WHERE id = ?""",
-                        (now, record["id"]),
-                    )
-                    result["cleared_signals"].append(
-                        {
-                            "signal_id": record["signal_id"],
-                            "entity_type": record["entity_type"],
-                            "entity_id": record["entity_id"],
-                            "was_active_for_days": (
-                                datetime.now(timezone.utc)
-                                - datetime.fromisoformat(record["first_detected_at"])
-                            ).days,
-                        }
+        with conn:
+            conn.executemany(
+                """UPDATE signal_state
+                   SET last_evaluated_at = ?, evaluation_count = ?,
+                       severity = ?, escalated_at = ?
+                   WHERE id = ?""",
+                [
+                    (
+                        r["last_evaluated_at"],
+                        r["evaluation_count"],
+                        r["severity"],
+                        r["escalated_at"],
+                        r["id"],
                     )
-
-        conn.commit()
+                    for r in updates.values()
+                ],
+            )
+            conn.executemany(
+                """INSERT INTO signal_state
+                   (signal_id, entity_type, entity_id, severity, original_severity,
+                    status, evidence_json, first_detected_at, last_evaluated_at, evaluation_count)
+                   VALUES (?, ?, ?, ?, ?, 'active', ?, ?, ?, ?)""",
+                list(inserts.values()),
+            )
+            conn.executemany(
+                """UPDATE signal_state
+                   SET status = 'cleared', cleared_at = ?
+                   WHERE id = ?""",
+                clears,
+            )
     finally:
         conn.close()
 
@@ -2151,7 +2513,7 @@ def get_active_signals(
     Returns list of active signal records with full state info.
     """
     db = _get_db_path(db_path)
-    conn = sqlite3.connect(db)
+    conn = open_connection(db)
     conn.row_factory = sqlite3.Row
 
     try:
@@ -2187,7 +2549,7 @@ def get_signal_history(
     Enables: 'What has happened with this client over the past 6 months?'
     """
     db = _get_db_path(db_path)
-    conn = sqlite3.connect(db)
+    conn = open_connection(db)
     conn.row_factory = sqlite3.Row
 
     try:
@@ -2214,7 +2576,7 @@ def acknowledge_signal(signal_state_id: int, db_path: Path | None = None) -> boo
     Acknowledged signals remain active but won't be surfaced as 'new'.
     """
     db = _get_db_path(db_path)
-    conn = sqlite3.connect(db)
+    conn = open_connection(db)
     now = datetime.now(timezone.utc).isoformat()
 
     try:
@@ -2237,7 +2599,7 @@ def get_signal_summary(db_path: Path | None = None) -> dict:
     Returns counts by severity, entity type, and recent changes.
     """
     db = _get_db_path(db_path)
-    conn = sqlite3.connect(db)
+    conn = open_connection(db)
     conn.row_factory = sqlite3.Row
 
     # Time windows
@@ -2305,7 +2667,7 @@ def clear_all_signal_state(db_path: Path | None = None) -> int:
     Returns number of rows deleted.
     """
     db = _get_db_path(db_path)
-    conn = sqlite3.connect(db)
+    conn = open_connection(db)
 
     try:
         cursor = conn.execute("DELETE FROM signal_state")
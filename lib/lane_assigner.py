@@ -10,6 +10,7 @@ import re
 import sqlite3
 
 from lib import paths
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -116,7 +117,7 @@ LANE_RULES = [
 
 
 def get_conn():
-    conn = sqlite3.connect(str(paths.db_path()))
+    conn = open_connection(str(paths.db_path()))
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -12,6 +12,7 @@ from datetime import date
 from pathlib import Path
 
 from lib import paths
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +42,7 @@ class MovesEngine:
         self.today = date.today()
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -5,6 +5,7 @@ Per MASTER_SPEC.md §4:
 - Writes: projects.client_id (from brand, NULL if internal)
 - Writes: tasks.brand_id, client_id, project_link_status, client_link_status
 - Writes: communications.from_domain, client_id, link_status
+- Writes: communication_client_attribution (incremental, see lib/comm_attribution.py)
 - Writes: invoices.aging_bucket (only for valid AR)
 - Runs: AFTER collect, BEFORE truth modules
 """
@@ -15,6 +16,7 @@ from datetime import date
 from pathlib import Path
 
 from lib import paths
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +28,7 @@ class Normalizer:
         self.db_path = db_path or str(paths.db_path())
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys=ON")  # Enable FK enforcement
         return conn
@@ -38,6 +40,7 @@ class Normalizer:
             "tasks_project_bridge": self._bridge_task_project_ids(),  # NEW: bridge project→project_id
             "tasks": self._normalize_tasks(),
             "communications": self._normalize_communications(),
+            "communication_attribution": self._attribute_communications(),
             "invoices": self._normalize_invoices(),
         }
 
@@ -327,6 +330,18 @@ class Normalizer:
         finally:
             conn.close()
 
+    def _attribute_communications(self) -> int:
+        """Update communication_client_attribution for new/changed comms and clients."""
+        from lib.comm_attribution import sync_attribution
+
+        conn = self._get_conn()
+        try:
+            result = sync_attribution(conn)
+            conn.commit()
+            return result["attributed"] + result["removed"]
+        finally:
+            conn.close()
+
     def _normalize_invoices(self) -> int:
         """Derive aging_bucket for valid AR invoices."""
         conn = self._get_conn()
@@ -13,6 +13,7 @@ from enum import Enum
 
 from lib import paths
 from lib.compat import UTC
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -149,7 +150,7 @@ class HealthChecker:
         """Check database connectivity."""
         try:
             db_path = paths.db_path()
-            conn = sqlite3.connect(str(db_path), timeout=5)
+            conn = open_connection(str(db_path), timeout=5)
             cursor = conn.cursor()
             cursor.execute("SELECT 1")
             conn.close()
@@ -175,7 +176,7 @@ class HealthChecker:
             from lib.schema import SCHEMA_VERSION as expected
 
             db_path = paths.db_path()
-            conn = sqlite3.connect(str(db_path), timeout=5)
+            conn = open_connection(str(db_path), timeout=5)
             cursor = conn.cursor()
             cursor.execute("PRAGMA user_version")
             version = cursor.fetchone()[0]
@@ -263,7 +264,7 @@ class HealthChecker:
         """Check if collectors ran recently (last sync < 2x interval)."""
         try:
             db_path = paths.db_path()
-            conn = sqlite3.connect(str(db_path), timeout=5)
+            conn = open_connection(str(db_path), timeout=5)
             cursor = conn.cursor()
 
             # Check if there's a recent collector state
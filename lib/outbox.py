@@ -40,6 +40,7 @@ import threading
 from datetime import datetime, timezone
 
 from lib import db as db_module
+from lib.db import open_connection
 from lib.schema_engine import _build_create_sql
 
 logger = logging.getLogger(__name__)
@@ -69,7 +70,7 @@ class SideEffectOutbox:
         self._ensure_schema()
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
         return conn
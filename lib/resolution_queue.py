@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Any
 
 from lib import paths
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +26,7 @@ class ResolutionQueue:
         self.db_path = db_path or str(paths.db_path())
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
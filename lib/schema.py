@@ -17,7 +17,7 @@ from collections import OrderedDict
 # =============================================================================
 # Schema version — bump when you change this file
 # =============================================================================
-SCHEMA_VERSION = 23
+SCHEMA_VERSION = 29
 
 # =============================================================================
 # Table Definitions
@@ -300,6 +300,52 @@ TABLES["communications"] = {
     ],
 }
 
+# Pre-resolved communication -> client attribution, maintained incrementally by
+# lib/comm_attribution.py. subject / linked_client_id mirror the communication
+# row at attribution time so changed rows can be found with a join.
+TABLES["communication_client_attribution"] = {
+    "columns": [
+        ("communication_id", "TEXT PRIMARY KEY"),
+        ("client_id", "TEXT"),
+        ("method", "TEXT NOT NULL"),
+        ("matched_pattern", "TEXT"),
+        ("subject", "TEXT"),
+        ("linked_client_id", "TEXT"),
+        ("attributed_at", "TEXT NOT NULL"),
+    ],
+}
+
+# Client name patterns the attribution table was last built from, so renamed,
+# added and removed clients can be diffed on the next sync.
+TABLES["communication_attribution_patterns"] = {
+    "columns": [
+        ("client_id", "TEXT PRIMARY KEY"),
+        ("pattern", "TEXT NOT NULL"),
+    ],
+}
+
+# Materialised priority queue, one row per open task / email needing a
+# response, written by PriorityAnalyzer (lib/analyzers/priority_queue.py).
+# The *_key columns are the normalised filter/sort keys; input_sig mirrors the
+# scoring inputs of the source row so changed items can be found with a join.
+TABLES["priority_queue"] = {
+    "columns": [
+        ("item_type", "TEXT NOT NULL"),
+        ("item_id", "TEXT NOT NULL"),
+        ("score", "REAL NOT NULL"),
+        ("title_key", "TEXT NOT NULL DEFAULT ''"),
+        ("due_key", "TEXT NOT NULL"),
+        ("assignee_key", "TEXT NOT NULL DEFAULT ''"),
+        ("project_key", "TEXT NOT NULL DEFAULT ''"),
+        ("status", "TEXT"),
+        ("tags_key", "TEXT"),
+        ("item_json", "TEXT NOT NULL"),
+        ("input_sig", "TEXT"),
+        ("scored_at", "TEXT NOT NULL"),
+    ],
+    "primary_key": ["item_type", "item_id"],
+}
+
 # ---------------------------------------------------------------------------
 # §12 Core: people
 # ---------------------------------------------------------------------------
@@ -910,6 +956,10 @@ TABLES["time_blocks"] = {
         ("date", "TEXT NOT NULL"),
         ("start_time", "TEXT NOT NULL"),
         ("end_time", "TEXT NOT NULL"),
+        # Minutes since midnight for start_time / end_time, written with the
+        # block so capacity sums do not re-parse HH:MM on every row.
+        ("start_min", "INTEGER"),
+        ("end_min", "INTEGER"),
         ("lane", "TEXT NOT NULL"),
         ("task_id", "TEXT REFERENCES tasks(id)"),
         ("is_protected", "INTEGER DEFAULT 0"),
@@ -1353,6 +1403,19 @@ TABLES["intelligence_events"] = {
     ],
 }
 
+# Append-only event stream shared by all processes (lib/event_log.py). seq is
+# AUTOINCREMENT so ids stay monotonic and are never reused after pruning; SSE
+# clients resume from it via Last-Event-ID.
+TABLES["event_log"] = {
+    "columns": [
+        ("seq", "INTEGER PRIMARY KEY AUTOINCREMENT"),
+        ("event_type", "TEXT NOT NULL"),
+        ("data", "TEXT NOT NULL DEFAULT '{}'"),
+        ("source", "TEXT"),
+        ("created_at", "TEXT NOT NULL"),
+    ],
+}
+
 TABLES["intelligence_events_archive"] = {
     "columns": [
         ("id", "TEXT PRIMARY KEY"),
@@ -1458,6 +1521,7 @@ INDEXES: list[tuple[str, str, str, str | None]] = [
     ("idx_tasks_project_link_status", "tasks", "project_link_status", None),
     ("idx_tasks_client_link_status", "tasks", "client_link_status", None),
     ("idx_tasks_assignee", "tasks", "assignee_id", None),
+    ("idx_tasks_created", "tasks", "created_at, id", None),  # keyset pagination
     # Communications
     ("idx_communications_priority", "communications", "priority DESC", None),
     ("idx_communications_client", "communications", "client_id", None),
@@ -1465,6 +1529,16 @@ INDEXES: list[tuple[str, str, str, str | None]] = [
     ("idx_communications_content_hash", "communications", "content_hash", None),
     ("idx_communications_from_email", "communications", "from_email", None),
     ("idx_communications_from_domain", "communications", "from_domain", None),
+    ("idx_communications_thread", "communications", "thread_id", None),
+    ("idx_comm_attribution_client", "communication_client_attribution", "client_id", None),
+    # Priority queue (keyset pagination: sort key, then item_type, item_id)
+    ("idx_priority_queue_score", "priority_queue", "score, item_type, item_id", None),
+    ("idx_priority_queue_due", "priority_queue", "due_key, item_type, item_id", None),
+    ("idx_priority_queue_title", "priority_queue", "title_key, item_type, item_id", None),
+    ("idx_priority_queue_assignee", "priority_queue", "assignee_key, item_type, item_id", None),
+    ("idx_priority_queue_status", "priority_queue", "status, score, item_type, item_id", None),
+    # Clients
+    ("idx_clients_created", "clients", "created_at, id", None),  # keyset pagination
     # Projects
     ("idx_projects_brand", "projects", "brand_id", None),
     ("idx_projects_client", "projects", "client_id", None),
@@ -1473,9 +1547,17 @@ INDEXES: list[tuple[str, str, str, str | None]] = [
     ("idx_invoices_status", "invoices", "status", None),
     ("idx_invoices_due_at", "invoices", "due_at", None),
     ("idx_invoices_client", "invoices", "client_id", None),
+    ("idx_invoices_created", "invoices", "COALESCE(created_at, ''), id", None),  # keyset pagination
     # Events
     ("idx_events_start", "events", "start_time", None),
     ("idx_events_start_at", "events", "start_at", None),
+    # Time blocks (scheduled-minutes range scans in CapacityCalculator)
+    (
+        "idx_time_blocks_scheduled",
+        "time_blocks",
+        "date, lane, start_min, end_min",
+        "task_id IS NOT NULL",
+    ),
     # Commitments
     ("idx_commitments_source", "commitments", "source_id", None),
     ("idx_commitments_client", "commitments", "client_id", None),
@@ -1500,6 +1582,7 @@ INDEXES: list[tuple[str, str, str, str | None]] = [
     ("idx_signals_v29_client", "signals_v29", "client_id", None),
     ("idx_signals_v29_source", "signals_v29", "source, source_id", None),
     ("idx_signals_v29_observed", "signals_v29", "observed_at", None),
+    ("idx_signals_v29_client_observed", "signals_v29", "client_id, observed_at, id", None),
     ("idx_suppression_v29_key", "inbox_suppression_rules_v29", "suppression_key", None),
     ("idx_suppression_v29_expires", "inbox_suppression_rules_v29", "expires_at", None),
     # Legacy
@@ -1530,6 +1613,7 @@ INDEXES: list[tuple[str, str, str, str | None]] = [
     ("idx_signals_status", "signals", "status", None),
     ("idx_signals_severity", "signals", "severity", None),
     ("idx_signals_detected", "signals", "detected_at", None),
+    ("idx_signals_created", "signals", "created_at, signal_id", None),  # keyset pagination
     # governance_history
     ("idx_governance_history_created", "governance_history", "created_at DESC", None),
     ("idx_governance_history_decision", "governance_history", "decision_id", None),
@@ -1615,6 +1699,21 @@ TABLES["signal_state"] = {
     "unique": [("signal_id", "entity_type", "entity_id", "status")],
 }
 
+# Per-entity input fingerprints for incremental signal detection. One row per
+# entity per detection mode; detected_json holds the signals found the last time
+# the entity was evaluated so clean entities can be reused without re-running.
+TABLES["signal_entity_fingerprints"] = {
+    "columns": [
+        ("entity_type", "TEXT NOT NULL"),
+        ("entity_id", "TEXT NOT NULL"),
+        ("mode_key", "TEXT NOT NULL"),
+        ("fingerprint", "TEXT NOT NULL"),
+        ("detected_json", "TEXT NOT NULL DEFAULT '[]'"),
+        ("evaluated_at", "TEXT NOT NULL"),
+    ],
+    "unique": [("entity_type", "entity_id", "mode_key")],
+}
+
 TABLES["artifacts"] = {
     "columns": [
         ("artifact_id", "TEXT PRIMARY KEY"),
@@ -5,6 +5,7 @@ All components read from and write to this single source of truth.
 
 import json
 import logging
+import os
 import re
 import sqlite3
 import threading
@@ -14,7 +15,9 @@ from pathlib import Path
 from typing import Any
 
 from lib import db as db_module
-from lib import paths, safe_sql
+from lib import db_executor, paths, safe_sql
+from lib.bulk_write import DEFAULT_CHUNK_SIZE, BulkWriteResult, write_rows
+from lib.cache.invalidation import client_tag, publish, row_tags
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +48,21 @@ _WRITE_KEYWORDS = frozenset(
 _LEADING_COMMENT_RE = re.compile(r"^\s*(?:--[^\n]*\n|/\*.*?\*/)", re.DOTALL)
 _FIRST_WORD_RE = re.compile(r"[A-Za-z_]+")
 
+# Target table of a DML statement, used to publish cache invalidation tags for
+# raw execute_write() calls: INSERT [OR x] INTO t / REPLACE INTO t / UPDATE [OR x] t
+# / DELETE FROM t.
+_DML_TABLE_RE = re.compile(
+    r"^\s*(?:(?:INSERT|REPLACE)(?:\s+OR\s+\w+)?\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)"
+    r"\s+[\"`\[]?(\w+)",
+    re.IGNORECASE,
+)
+
+
+def _written_table(sql: str) -> str:
+    """Return the table a DML statement writes to, or "" when it is not simple DML."""
+    match = _DML_TABLE_RE.match(_LEADING_COMMENT_RE.sub("", sql))
+    return match.group(1) if match else ""
+
 
 def _first_sql_keyword(sql: str) -> str:
     """Return the uppercased first SQL keyword, ignoring leading whitespace/comments.
@@ -62,6 +80,223 @@ def _first_sql_keyword(sql: str) -> str:
     return match.group(0).upper() if match else ""
 
 
+# Pragmas applied once when a pooled connection is opened. journal_mode/foreign_keys
+# match the historical per-call setup; the rest are throughput tuning that is safe
+# under WAL: synchronous=NORMAL only risks the last commits on power loss (never
+# corruption), temp_store keeps sorter/temp b-trees off disk, and cache_size /
+# mmap_size let hot pages survive between queries instead of being re-read.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # negative = KiB -> 64 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped reads
+)
+
+# Per-connection prepared-statement cache (sqlite3 default is 128). The store issues
+# a small, stable set of statement shapes, so a larger cache means repeat queries
+# skip sqlite3_prepare entirely.
+_STATEMENT_CACHE_SIZE = 512
+
+
+def _db_file_identity(db_path: str) -> tuple[int, int] | None:
+    """Return (st_dev, st_ino) for *db_path*, or None if it does not exist yet.
+
+    Part of a pooled connection's key: if the file is replaced underneath us
+    (restore, test fixtures recreating a path) the identity changes and the stale
+    connection is discarded instead of silently reading the old inode.
+    """
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+class _ConnectionPool:
+    """Long-lived SQLite connections for one StateStore.
+
+    - One reader connection per thread (autocommit, so every SELECT sees the
+      latest committed WAL state and no read transaction is ever left open).
+    - One writer connection shared by all threads and serialized by the store's
+      write lock, so in-process writers queue on the lock rather than on
+      SQLite's busy handler.
+
+    Connections are keyed on (pid, db_path, file identity) and transparently
+    reopened when any of those change, which covers fork()ed workers, a store
+    whose ``db_path`` is re-pointed, and a database file replaced on disk.
+    """
+
+    def __init__(self, write_lock: threading.RLock):
+        self._write_lock = write_lock
+        self._local = threading.local()
+        self._registry_lock = threading.Lock()
+        # thread ident -> (thread, connection, opening pid); lets close_all()/stats()
+        # see every reader and lets readers of finished threads be reclaimed.
+        self._readers: dict[int, tuple[threading.Thread, sqlite3.Connection, int]] = {}
+        self._writer: sqlite3.Connection | None = None
+        self._writer_key: tuple | None = None
+        self._writer_depth = 0
+        # Connections inherited across fork(): never closed in the child (the
+        # parent still owns them), only kept referenced so GC cannot close them.
+        self._fork_orphans: list[sqlite3.Connection] = []
+        self._stats = {
+            "reader_checkouts": 0,
+            "writer_checkouts": 0,
+            "connections_opened": 0,
+            "connections_reopened": 0,
+            "connections_reclaimed": 0,
+        }
+
+    # ---- connection lifecycle ----
+
+    @staticmethod
+    def _key(db_path: str) -> tuple:
+        return (os.getpid(), db_path, _db_file_identity(db_path))
+
+    def _open(self, db_path: str, *, autocommit: bool) -> sqlite3.Connection:
+        conn = db_module.open_connection(
+            db_path,
+            timeout=30.0,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        if autocommit:
+            conn.isolation_level = None
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        with self._registry_lock:
+            self._stats["connections_opened"] += 1
+        return conn
+
+    def _discard(self, conn: sqlite3.Connection, old_key: tuple | None) -> None:
+        """Drop a stale connection, closing it unless it was inherited via fork()."""
+        if old_key is not None and old_key[0] != os.getpid():
+            self._fork_orphans.append(conn)
+        else:
+            self._close_quietly(conn)
+        with self._registry_lock:
+            self._stats["connections_reopened"] += 1
+
+    @staticmethod
+    def _close_quietly(conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            logger.debug("StateStore pool: error closing connection: %s", e)
+
+    def reader(self, db_path: str) -> sqlite3.Connection:
+        """Return this thread's reader connection for *db_path*."""
+        key = self._key(db_path)
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.key != key:
+            self._discard(conn, self._local.key)
+            conn = None
+        if conn is None:
+            conn = self._open(db_path, autocommit=True)
+            self._local.conn = conn
+            self._local.key = key
+            # The file may have been created by this very connect().
+            if key[2] is None:
+                self._local.key = self._key(db_path)
+            self._register_reader(conn)
+        with self._registry_lock:
+            self._stats["reader_checkouts"] += 1
+        return conn
+
+    def _register_reader(self, conn: sqlite3.Connection) -> None:
+        current = threading.current_thread()
+        pid = os.getpid()
+        with self._registry_lock:
+            self._readers[current.ident] = (current, conn, pid)
+            dead = [ident for ident, (t, _, _) in self._readers.items() if not t.is_alive()]
+            reclaimed = [self._readers.pop(ident) for ident in dead]
+            self._stats["connections_reclaimed"] += len(reclaimed)
+        for _, stale, opened_in in reclaimed:
+            if opened_in == pid:
+                self._close_quietly(stale)
+            else:
+                self._fork_orphans.append(stale)
+
+    @contextmanager
+    def writer(self, db_path: str):
+        """Yield the shared writer connection under the write lock.
+
+        The outermost caller commits on success and rolls back on error. Nested
+        use (e.g. a ``transaction()`` callback calling ``insert()``) joins the
+        enclosing transaction instead of committing it early.
+        """
+        db_executor.mark_write()
+        with self._write_lock:
+            if self._writer_depth == 0:
+                key = self._key(db_path)
+                if self._writer is not None and self._writer_key != key:
+                    self._discard(self._writer, self._writer_key)
+                    self._writer = None
+                if self._writer is None:
+                    self._writer = self._open(db_path, autocommit=False)
+                    self._writer_key = key if key[2] is not None else self._key(db_path)
+            conn = self._writer
+            with self._registry_lock:
+                self._stats["writer_checkouts"] += 1
+            self._writer_depth += 1
+            try:
+                yield conn
+                if self._writer_depth == 1:
+                    conn.commit()
+            except BaseException:
+                if self._writer_depth == 1:
+                    conn.rollback()
+                raise
+            finally:
+                self._writer_depth -= 1
+
+    def interrupt(self, thread_id: int) -> bool:
+        """Abort the statement running on *thread_id*'s reader connection, if any."""
+        with self._registry_lock:
+            entry = self._readers.get(thread_id)
+        if entry is None or entry[2] != os.getpid():
+            return False
+        entry[1].interrupt()
+        return True
+
+    def close_all(self) -> None:
+        """Close every pooled connection; they reopen lazily on next use."""
+        with self._write_lock:
+            pid = os.getpid()
+            if self._writer is not None:
+                if self._writer_key[0] == pid:
+                    self._close_quietly(self._writer)
+                else:
+                    self._fork_orphans.append(self._writer)
+                self._writer = None
+                self._writer_key = None
+            with self._registry_lock:
+                readers = list(self._readers.values())
+                self._readers.clear()
+            for _, conn, opened_in in readers:
+                if opened_in == pid:
+                    self._close_quietly(conn)
+                else:
+                    self._fork_orphans.append(conn)
+            # Fresh thread-local storage drops every thread's cached handle, so
+            # each thread opens a new reader on its next checkout.
+            self._local = threading.local()
+
+    def stats(self) -> dict:
+        with self._registry_lock:
+            stats = dict(self._stats)
+            stats["reader_connections"] = len(self._readers)
+        stats["writer_connections"] = 1 if self._writer is not None else 0
+        checkouts = stats["reader_checkouts"] + stats["writer_checkouts"]
+        stats["reuse_ratio"] = (
+            round(1 - stats["connections_opened"] / checkouts, 4) if checkouts else 0.0
+        )
+        return stats
+
+
 class StateStore:
     """
     Central state store. SQLite for persistence, in-memory cache for speed.
@@ -81,6 +316,13 @@ class StateStore:
       ``replace_source_rows`` remain the preferred typed API for single-table
       mutations.
 
+    CONNECTIONS
+    -----------
+    Reads run on a long-lived per-thread reader connection; writes share one
+    long-lived writer connection serialized by ``_write_lock``. Pragmas are set
+    once per connection (see ``_CONNECTION_PRAGMAS``) and ``pool_stats()``
+    reports checkout/reuse counters.
+
     PROHIBITED:
     - Opening a raw ``sqlite3.connect`` outside this class to mutate the DB
       (bypasses the write lock and the typed helpers).
@@ -113,8 +355,8 @@ class StateStore:
         self._cache: dict[str, Any] = {}
         self._cache_timestamps: dict[str, datetime] = {}
 
-        # Serializes writes/DDL routed through execute_write() and transaction().
-        # Reentrant so a transaction() callback (which already holds the lock) can
+        # Serializes every write (CRUD helpers, execute_write(), transaction()) on
+        # the pooled writer connection. Reentrant so a transaction() callback (which already holds the lock) can
         # call execute_write() without deadlocking. SQLite still does its own
         # file-level locking; this guards the in-process write path.
         self._write_lock = threading.RLock()
@@ -126,23 +368,49 @@ class StateStore:
 
         logger.info("StateStore ready, DB path: %s", self.db_path)
 
+    @property
+    def _pool(self) -> _ConnectionPool:
+        """Lazily created connection pool (also covers stores built via __new__)."""
+        pool = self.__dict__.get("_conn_pool")
+        if pool is None:
+            with StateStore._lock:
+                pool = self.__dict__.get("_conn_pool")
+                if pool is None:
+                    if "_write_lock" not in self.__dict__:
+                        self._write_lock = threading.RLock()
+                    pool = _ConnectionPool(self._write_lock)
+                    self._conn_pool = pool
+                    db_executor.register_interrupter(pool.interrupt)
+        return pool
+
     @contextmanager
     def _get_conn(self):
-        """Thread-safe connection context with WAL mode and busy timeout.
+        """Writer connection context: pooled, serialized, committed on exit.
 
-        Uses timeout=30 so concurrent readers/writers wait instead of
-        raising 'database is locked' immediately. WAL mode allows
-        concurrent reads while a write is in progress.
+        Every mutation shares one long-lived writer connection guarded by
+        ``_write_lock``; the outermost caller commits on success and rolls back
+        on error. The connection uses timeout=30 so a writer in another process
+        waits instead of raising 'database is locked' immediately.
         """
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
-        try:
+        with self._pool.writer(self.db_path) as conn:
             yield conn
-            conn.commit()
-        finally:
-            conn.close()
+
+    def _read_conn(self) -> sqlite3.Connection:
+        """This thread's long-lived reader connection (autocommit, WAL snapshot per query)."""
+        return self._pool.reader(self.db_path)
+
+    def pool_stats(self) -> dict:
+        """Connection pool counters: checkouts, opens/reopens, live connections, reuse ratio."""
+        return self._pool.stats()
+
+    def close_connections(self) -> None:
+        """Close all pooled connections. They reopen lazily on the next call.
+
+        Call before replacing the database file on disk (e.g. restore).
+        """
+        pool = self.__dict__.get("_conn_pool")
+        if pool is not None:
+            pool.close_all()
 
     # ==================== CRUD Operations ====================
 
@@ -158,29 +426,92 @@ class StateStore:
             sql = safe_sql.insert_or_replace(table, columns)
             conn.execute(sql, values)
 
+        publish(row_tags(table, [data]))
         return data.get("id", "")
 
-    def insert_many(self, table: str, items: list[dict]) -> int:
-        """Insert multiple rows. Returns count."""
-        if not items:
-            return 0
+    def insert_many(
+        self,
+        table: str,
+        items: list[dict],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        only_changed: bool = False,
+        key_column: str = "id",
+        ignore_columns: tuple[str, ...] = (),
+    ) -> int:
+        """Insert multiple rows in one transaction. Returns count.
 
+        Rows are written with ``executemany`` in ``chunk_size`` batches. With
+        ``only_changed`` rows whose stored content (keyed on ``key_column``,
+        excluding ``ignore_columns``) already matches are skipped; see
+        ``bulk_write()`` for the full result counters.
+        """
+        return self.bulk_write(
+            table,
+            items,
+            chunk_size=chunk_size,
+            only_changed=only_changed,
+            key_column=key_column,
+            ignore_columns=ignore_columns,
+        ).rows
+
+    def bulk_write(
+        self,
+        table: str,
+        rows: list[dict],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        only_changed: bool = False,
+        key_column: str = "id",
+        ignore_columns: tuple[str, ...] = (),
+        scope_where: str | None = None,
+        scope_params: list | None = None,
+    ) -> BulkWriteResult:
+        """Bulk INSERT OR REPLACE in a single transaction; returns write counters.
+
+        ``scope_where``/``scope_params`` turn the write into an atomic replace of
+        that scope (see ``lib.bulk_write.write_rows``). Any failure rolls back the
+        whole unit, including the scope delete.
+        """
         db_module.validate_identifier(table)
-        columns = list(items[0].keys())
-        for col in columns:
-            db_module.validate_identifier(col)
-
-        sql = safe_sql.insert_or_replace(table, columns)
+        if not rows and scope_where is None:
+            return BulkWriteResult()
 
         with self._get_conn() as conn:
-            for item in items:
-                values = [json.dumps(v) if isinstance(v, dict | list) else v for v in item.values()]
-                conn.execute(sql, values)
-
-        return len(items)
+            result = write_rows(
+                conn,
+                table,
+                rows,
+                chunk_size=chunk_size,
+                only_changed=only_changed,
+                key_column=key_column,
+                ignore_columns=ignore_columns,
+                scope_where=scope_where,
+                scope_params=scope_params,
+            )
+        publish(row_tags(table, rows))
+        if only_changed:
+            logger.debug(
+                "bulk_write %s: %d rows, %d written, %d unchanged, %d deleted",
+                table,
+                result.rows,
+                result.written,
+                result.unchanged,
+                result.deleted,
+            )
+        return result
 
     def replace_source_rows(
-        self, table: str, source_column: str, source_value: str, rows: list[dict]
+        self,
+        table: str,
+        source_column: str,
+        source_value: str,
+        rows: list[dict],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        only_changed: bool = False,
+        key_column: str = "id",
+        ignore_columns: tuple[str, ...] = (),
     ) -> int:
         """Atomically replace all rows for a source: DELETE then INSERT, one txn.
 
@@ -190,44 +521,42 @@ class StateStore:
         constraint), the whole operation is rolled back so the DELETE is undone
         and the prior rows are retained — never a half-cleared table.
 
-        This exists because each plain CRUD call opens its own connection and
-        commits independently, so a DELETE followed by a per-row insert loop
-        commits the DELETE standalone; a mid-loop failure would erase the prior
-        data with no rollback. Callers that do destructive delete-then-reinsert
-        (e.g. the Xero collector) must use this instead.
+        This exists because each plain CRUD call commits independently, so a
+        DELETE followed by a per-row insert loop commits the DELETE standalone;
+        a mid-loop failure would erase the prior data with no rollback. Callers
+        that do destructive delete-then-reinsert (e.g. the Xero collector) must
+        use this instead.
+
+        With ``only_changed`` the end state is the same but only stale keys are
+        deleted and only new/changed rows are rewritten.
 
         Returns the number of rows inserted. Passing an empty *rows* list just
         clears the source (callers needing a "never wipe on empty fetch" guard
         must check upstream before calling — see the Xero ACCREC guard).
         """
-        db_module.validate_identifier(table)
         db_module.validate_identifier(source_column)
-
-        insert_sql = None
-        if rows:
-            columns = list(rows[0].keys())
-            for col in columns:
-                db_module.validate_identifier(col)
-            insert_sql = safe_sql.insert_or_replace(table, columns)
-
-        delete_sql = safe_sql.delete(table, where=f"{source_column} = ?")
-
-        with self._get_conn() as conn:
-            try:
-                conn.execute(delete_sql, [source_value])
-                if insert_sql is not None:
-                    for row in rows:
-                        values = [
-                            json.dumps(v) if isinstance(v, dict | list) else v for v in row.values()
-                        ]
-                        conn.execute(insert_sql, values)
-            except Exception:
-                conn.rollback()
-                raise
-
+        self.bulk_write(
+            table,
+            rows,
+            chunk_size=chunk_size,
+            only_changed=only_changed,
+            key_column=key_column,
+            ignore_columns=ignore_columns,
+            scope_where=f"{source_column} = ?",
+            scope_params=[source_value],
+        )
         return len(rows)
 
-    def replace_all_rows(self, table: str, rows: list[dict]) -> int:
+    def replace_all_rows(
+        self,
+        table: str,
+        rows: list[dict],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        only_changed: bool = False,
+        key_column: str = "id",
+        ignore_columns: tuple[str, ...] = (),
+    ) -> int:
         """Atomically replace EVERY row in *table*: DELETE all then INSERT, one txn.
 
         Like replace_source_rows but for a wholly-owned table that has no source
@@ -235,41 +564,25 @@ class StateStore:
         sync). DELETE + reinserts share one transaction; any failure rolls back so
         the table is never left empty/half-cleared. Returns rows inserted.
         """
-        db_module.validate_identifier(table)
-
-        insert_sql = None
-        if rows:
-            columns = list(rows[0].keys())
-            for col in columns:
-                db_module.validate_identifier(col)
-            insert_sql = safe_sql.insert_or_replace(table, columns)
-
-        # `where="1=1"` is a constant literal (no user data) -> full-table delete
-        # via the validated builder, so no f-string SQL and no new suppression.
-        delete_sql = safe_sql.delete(table, where="1=1")
-
-        with self._get_conn() as conn:
-            try:
-                conn.execute(delete_sql)
-                if insert_sql is not None:
-                    for row in rows:
-                        values = [
-                            json.dumps(v) if isinstance(v, dict | list) else v for v in row.values()
-                        ]
-                        conn.execute(insert_sql, values)
-            except Exception:
-                conn.rollback()
-                raise
-
+        # `scope_where="1=1"` is a constant literal (no user data) -> full-table
+        # delete via the validated builder, so no f-string SQL and no new suppression.
+        self.bulk_write(
+            table,
+            rows,
+            chunk_size=chunk_size,
+            only_changed=only_changed,
+            key_column=key_column,
+            ignore_columns=ignore_columns,
+            scope_where="1=1",
+        )
         return len(rows)
 
     def get(self, table: str, id: str) -> dict | None:
         """Get a single row by ID."""
         db_module.validate_identifier(table)
-        with self._get_conn() as conn:
-            sql = safe_sql.select(table, where="id = ?")
-            row = conn.execute(sql, [id]).fetchone()
-            return dict(row) if row else None
+        sql = safe_sql.select(table, where="id = ?")
+        row = self._read_conn().execute(sql, [id]).fetchone()
+        return dict(row) if row else None
 
     def update(self, table: str, id: str, data: dict) -> bool:
         """Update a row."""
@@ -285,7 +598,11 @@ class StateStore:
         with self._get_conn() as conn:
             sql = safe_sql.update(table, list(data.keys()))
             result = conn.execute(sql, values)
-            return result.rowcount > 0
+            updated = result.rowcount > 0
+
+        if updated:
+            publish(self._id_tags(table, id, data))
+        return updated
 
     def delete(self, table: str, id: str) -> bool:
         """Delete a row."""
@@ -293,7 +610,19 @@ class StateStore:
         with self._get_conn() as conn:
             sql = safe_sql.delete(table)
             result = conn.execute(sql, [id])
-            return result.rowcount > 0
+            deleted = result.rowcount > 0
+
+        if deleted:
+            publish(self._id_tags(table, id))
+        return deleted
+
+    @staticmethod
+    def _id_tags(table: str, id: str, data: dict | None = None) -> set[str]:
+        """Cache tags for a write to row *id*; see lib.cache.invalidation."""
+        tags = row_tags(table, [data or {}])
+        if table == "clients":
+            tags.add(client_tag(id))
+        return tags
 
     def query(self, sql: str, params: list = None) -> list[dict]:
         """Execute a read-only query. Returns list of dicts.
@@ -310,8 +639,30 @@ class StateStore:
 
     def _raw_query(self, sql: str, params: list = None) -> list[sqlite3.Row]:
         """Internal SELECT executor shared by query() and read helpers."""
-        with self._get_conn() as conn:
-            return conn.execute(sql, params or []).fetchall()
+        return self._read_conn().execute(sql, params or []).fetchall()
+
+    # ==================== Async access ====================
+    # For async code (FastAPI handlers): the blocking call runs on the bounded
+    # db_executor pool, with that worker's own reader connection, and raises
+    # db_executor.QueryTimeout after *timeout* seconds (default MOH_DB_TIMEOUT).
+
+    async def aquery(self, sql: str, params: list = None, *, timeout: float = None) -> list[dict]:
+        """``query()`` without blocking the event loop."""
+        return await db_executor.run(self.query, sql, params, timeout=timeout)
+
+    async def aget(self, table: str, id: str, *, timeout: float = None) -> dict | None:
+        """``get()`` without blocking the event loop."""
+        return await db_executor.run(self.get, table, id, timeout=timeout)
+
+    async def acount(
+        self, table: str, where: str = None, params: list = None, *, timeout: float = None
+    ) -> int:
+        """``count()`` without blocking the event loop."""
+        return await db_executor.run(self.count, table, where, params, timeout=timeout)
+
+    async def arun(self, fn, *args, timeout: float = None, **kwargs):
+        """Run any blocking ``fn(*args, **kwargs)`` (reads or writes) on the DB pool."""
+        return await db_executor.run(fn, *args, timeout=timeout, **kwargs)
 
     def execute_write(self, sql: str, params: list = None) -> int:
         """Execute a single write/DDL statement under the write lock.
@@ -321,9 +672,14 @@ class StateStore:
         in-process write path is serialized via ``_write_lock``; SQLite's own
         file locking handles cross-process safety.
         """
-        with self._write_lock, self._get_conn() as conn:
+        with self._get_conn() as conn:
             result = conn.execute(sql, params or [])
-            return result.rowcount
+            rowcount = result.rowcount
+
+        table = _written_table(sql)
+        if table and rowcount:
+            publish([table])
+        return rowcount
 
     def transaction(self, fn):
         """Run ``fn(conn)`` inside a single transaction under the write lock.
@@ -334,29 +690,15 @@ class StateStore:
         transaction is rolled back and the exception propagates (nothing
         persists).
         """
-        with self._write_lock:
-            conn = sqlite3.connect(self.db_path, timeout=30.0)
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA foreign_keys=ON")
-            try:
-                result = fn(conn)
-                conn.commit()
-                return result
-            except BaseException:
-                conn.rollback()
-                raise
-            finally:
-                conn.close()
+        with self._get_conn() as conn:
+            return fn(conn)
 
     def count(self, table: str, where: str = None, params: list = None) -> int:
         """Count rows."""
         db_module.validate_identifier(table)
         sql = safe_sql.select_count(table, where=where)
-
-        with self._get_conn() as conn:
-            row = conn.execute(sql, params or []).fetchone()
-            return row["c"] if row else 0
+        row = self._read_conn().execute(sql, params or []).fetchone()
+        return row["c"] if row else 0
 
     # ==================== Cache Operations ====================
 
@@ -244,6 +244,8 @@ def _execute_transition(proposal: TransitionProposal) -> bool:
     """Execute a status transition."""
     import sqlite3
 
+    from lib.db import open_connection
+
     # Create change bundle for rollback
     create_status_change_bundle(
         proposal.item_id,
@@ -255,7 +257,7 @@ def _execute_transition(proposal: TransitionProposal) -> bool:
     # Update the item in the database
     db_path = paths.db_path()
     try:
-        conn = sqlite3.connect(db_path)
+        conn = open_connection(db_path)
         cursor = conn.cursor()
 
         # Determine table based on item_id prefix or proposal context
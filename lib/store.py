@@ -6,6 +6,7 @@ from contextlib import contextmanager
 
 from lib import paths, safe_sql
 from lib.clock import now_iso
+from lib.db import open_connection
 
 log = logging.getLogger("moh_time_os")
 
@@ -180,7 +181,7 @@ def init_db() -> None:
 @contextmanager
 def get_connection():
     """Get database connection with auto-commit/rollback."""
-    conn = sqlite3.connect(_db_path(), timeout=30.0)
+    conn = open_connection(_db_path(), timeout=30.0)
     conn.row_factory = sqlite3.Row
     try:
         yield conn
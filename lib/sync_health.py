@@ -19,6 +19,7 @@ from pathlib import Path
 import yaml
 
 from lib.compat import UTC
+from lib.db import open_connection
 from lib.paths import db_path as canonical_db_path
 from lib.paths import project_root
 
@@ -162,7 +163,7 @@ def _get_last_run_times(db_path: str | None = None) -> dict[str, datetime]:
     if db_path is None:
         db_path = str(canonical_db_path())
 
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     conn.row_factory = sqlite3.Row
     last_runs: dict[str, datetime] = {}
 
@@ -15,12 +15,14 @@ Invariants:
 - Protected blocks (meetings) are immutable by system
 """
 
+from .allocator import BlockAllocator
 from .block_manager import BlockManager
 from .calendar_sync import CalendarSync
 from .rollover import Rollover
 from .scheduler import Scheduler
 
 __all__ = [
+    "BlockAllocator",
     "BlockManager",
     "CalendarSync",
     "Scheduler",
@@ -0,0 +1,220 @@
+"""
+Block Allocator - In-memory batch allocation of tasks to free time blocks.
+
+Loads every available block for a set of dates in one query, keeps them per
+(date, lane) in a size-ordered index plus a max-duration segment tree over
+start order, and hands out blocks without further round-trips:
+
+- first_fit: earliest block (by start time) long enough for the task
+- best_fit: shortest block long enough for the task
+- largest: the longest remaining block, for tasks nothing fits
+
+Assignments are buffered and written by commit() in a single transaction,
+re-checking that each block and task are still free so a concurrent writer
+can never double-book either side.
+"""
+
+import bisect
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from lib.time_truth.block_manager import BlockManager, TimeBlock
+
+logger = logging.getLogger(__name__)
+
+FIRST_FIT = "first_fit"
+BEST_FIT = "best_fit"
+
+
+@dataclass
+class Allocation:
+    task_id: str
+    block: TimeBlock
+    committed: bool = False
+    message: str = ""
+
+
+class LaneBlocks:
+    """
+    Free blocks for one (date, lane), ordered by start time.
+
+    _tree[i] holds the longest free duration under node i (-1 once taken),
+    so the earliest block of at least N minutes is an O(log n) descent.
+    _by_size holds (duration, index) for the free blocks for best-fit and
+    largest-block lookups by bisection.
+    """
+
+    def __init__(self, blocks: list[TimeBlock]):
+        self.blocks = sorted(blocks, key=lambda b: b.start_time)
+        self._size = 1
+        while self._size < len(self.blocks):
+            self._size *= 2
+        self._tree = [-1] * (2 * self._size)
+        self._by_size = []
+        for i, block in enumerate(self.blocks):
+            self._tree[self._size + i] = block.duration_min
+            self._by_size.append((block.duration_min, i))
+        for node in range(self._size - 1, 0, -1):
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+        self._by_size.sort()
+
+    def __len__(self) -> int:
+        return len(self._by_size)
+
+    def first_fit(self, duration_min: int) -> int | None:
+        """Index of the earliest free block of at least *duration_min*."""
+        if self._tree[1] < duration_min:
+            return None
+        node = 1
+        while node < self._size:
+            node = 2 * node if self._tree[2 * node] >= duration_min else 2 * node + 1
+        return node - self._size
+
+    def best_fit(self, duration_min: int) -> int | None:
+        """Index of the shortest free block of at least *duration_min*."""
+        pos = bisect.bisect_left(self._by_size, (duration_min, -1))
+        return self._by_size[pos][1] if pos < len(self._by_size) else None
+
+    def largest(self) -> int | None:
+        """Index of the longest free block (earliest on ties)."""
+        if not self._by_size:
+            return None
+        longest = self._by_size[-1][0]
+        return self._by_size[bisect.bisect_left(self._by_size, (longest, -1))][1]
+
+    def take(self, index: int) -> TimeBlock:
+        """Remove block *index* from the free set and return it."""
+        block = self.blocks[index]
+        del self._by_size[bisect.bisect_left(self._by_size, (block.duration_min, index))]
+        node = self._size + index
+        self._tree[node] = -1
+        node //= 2
+        while node:
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+            node //= 2
+        return block
+
+
+class BlockAllocator:
+    """
+    Allocates tasks to free blocks across a horizon of dates.
+
+    Usage:
+        allocator = BlockAllocator(store)
+        allocator.load(["2026-03-02", "2026-03-03"])
+        allocation = allocator.allocate(task_id, "ops", 60)
+        allocator.commit()
+    """
+
+    def __init__(self, store, strategy: str = FIRST_FIT):
+        if strategy not in (FIRST_FIT, BEST_FIT):
+            raise ValueError(f"Unknown allocation strategy: {strategy}")
+        self.store = store
+        self.strategy = strategy
+        self.block_manager = BlockManager(store)
+        self.dates: list[str] = []
+        self._lanes: dict[tuple[str, str], LaneBlocks] = {}
+        self._pending: list[Allocation] = []
+
+    def load(self, dates: list[str], lanes: list[str] | None = None) -> int:
+        """Load free blocks for *dates* (optionally only *lanes*); returns the count."""
+        self.dates = sorted(dates)
+        self._lanes = {}
+        self._pending = []
+        if not self.dates:
+            return 0
+
+        query = f"""
+            SELECT * FROM time_blocks
+            WHERE date IN ({", ".join("?" * len(self.dates))})
+            AND is_protected = 0
+            AND task_id IS NULL
+        """  # noqa: S608 — only placeholders are interpolated
+        params = list(self.dates)
+        if lanes:
+            query += f" AND lane IN ({', '.join('?' * len(lanes))})"
+            params.extend(lanes)
+
+        grouped: dict[tuple[str, str], list[TimeBlock]] = {}
+        for row in self.store.query(query, params):
+            block = self.block_manager._row_to_block(row)
+            grouped.setdefault((block.date, block.lane), []).append(block)
+        self._lanes = {key: LaneBlocks(blocks) for key, blocks in grouped.items()}
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def available(self, lane: str) -> int:
+        """Free blocks left in *lane* across the loaded horizon."""
+        return sum(len(self._lanes.get((d, lane), ())) for d in self.dates)
+
+    def allocate(self, task_id: str, lane: str, duration_min: int) -> Allocation | None:
+        """
+        Reserve a block in *lane* for a task.
+
+        Takes the first date in the horizon with a block long enough
+        (first-fit or best-fit within that date). If no date has one, falls
+        back to the largest block on the earliest date with any free block.
+        Returns None when the lane has no free blocks left.
+        """
+        days = [self._lanes[(d, lane)] for d in self.dates if self._lanes.get((d, lane))]
+        if not days:
+            return None
+
+        for blocks in days:
+            if self.strategy == BEST_FIT:
+                index = blocks.best_fit(duration_min)
+            else:
+                index = blocks.first_fit(duration_min)
+            if index is not None:
+                break
+        else:
+            blocks = days[0]
+            index = blocks.largest()
+
+        allocation = Allocation(task_id=task_id, block=blocks.take(index))
+        self._pending.append(allocation)
+        return allocation
+
+    def commit(self) -> list[Allocation]:
+        """
+        Write all pending allocations in one transaction.
+
+        Each assignment is guarded on the block still being free and the task
+        still unscheduled; allocations that lose that race are left
+        uncommitted with a message instead of failing the batch.
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return []
+        now = datetime.now(timezone.utc).isoformat()
+
+        def write(conn):
+            for allocation in pending:
+                block_id = allocation.block.id
+                claimed = conn.execute(
+                    "UPDATE time_blocks SET task_id = ?, updated_at = ? "
+                    "WHERE id = ? AND task_id IS NULL AND is_protected = 0",
+                    [allocation.task_id, now, block_id],
+                ).rowcount
+                if not claimed:
+                    allocation.message = f"Block {block_id} is no longer available"
+                    continue
+                linked = conn.execute(
+                    "UPDATE tasks SET scheduled_block_id = ?, updated_at = ? "
+                    "WHERE id = ? AND (scheduled_block_id IS NULL OR scheduled_block_id = '')",
+                    [block_id, now, allocation.task_id],
+                ).rowcount
+                if not linked:
+                    conn.execute(
+                        "UPDATE time_blocks SET task_id = NULL, updated_at = ? WHERE id = ?",
+                        [allocation.block.updated_at, block_id],
+                    )
+                    allocation.message = "Task not found or already scheduled"
+                    continue
+                allocation.committed = True
+                allocation.message = f"Task scheduled in block {block_id}"
+
+        self.store.transaction(write)
+        committed = sum(a.committed for a in pending)
+        logger.info(f"Committed {committed}/{len(pending)} block allocations")
+        return pending
@@ -253,6 +253,8 @@ class BlockManager:
                 "date": date,
                 "start_time": start_time,
                 "end_time": end_time,
+                "start_min": start.hour * 60 + start.minute,
+                "end_min": end.hour * 60 + end.minute,
                 "lane": lane,
                 "is_protected": 1 if is_protected else 0,
                 "is_buffer": 1 if is_buffer else 0,
@@ -8,9 +8,10 @@ Assigns pending tasks to available blocks based on priority and constraints.
 import logging
 import sqlite3
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 
 from lib.state_store import get_store
+from lib.time_truth.allocator import FIRST_FIT, BlockAllocator
 from lib.time_truth.block_manager import BlockManager
 from lib.time_truth.calendar_sync import CalendarSync
 
@@ -57,12 +58,20 @@ class Scheduler:
         self.block_manager = BlockManager(self.store)
         self.calendar_sync = CalendarSync(self.store)
 
-    def schedule_unscheduled(self, target_date: str = None) -> list[ScheduleResult]:
+    def schedule_unscheduled(
+        self, target_date: str = None, days: int = 1, strategy: str = FIRST_FIT
+    ) -> list[ScheduleResult]:
         """
-        Schedule all unscheduled tasks for a date.
+        Schedule all unscheduled tasks into blocks from target_date onward.
+
+        Free blocks for the whole horizon are loaded once into a BlockAllocator;
+        tasks are placed in priority order and every assignment is committed
+        in one transaction.
 
         Args:
-            target_date: Date to schedule for (defaults to today)
+            target_date: First date to schedule for (defaults to today)
+            days: Number of consecutive dates in the horizon
+            strategy: FIRST_FIT (earliest block that fits) or BEST_FIT
 
         Returns:
             List of ScheduleResult for each task attempted
@@ -70,27 +79,47 @@ class Scheduler:
         if not target_date:
             target_date = date.today().isoformat()
 
-        # Ensure blocks exist for this date
-        self.calendar_sync.generate_available_blocks(target_date)
+        start = date.fromisoformat(target_date)
+        horizon = [(start + timedelta(days=i)).isoformat() for i in range(max(days, 1))]
+
+        # Ensure blocks exist for every date in the horizon
+        for day in horizon:
+            self.calendar_sync.generate_available_blocks(day)
 
         # Get unscheduled tasks, prioritized
         tasks = self._get_schedulable_tasks(target_date)
 
-        results = []
+        allocator = BlockAllocator(self.store, strategy=strategy)
+        allocator.load(horizon)
+        return self._allocate(allocator, tasks)
 
+    def _allocate(self, allocator: BlockAllocator, tasks: list[dict]) -> list[ScheduleResult]:
+        """Place *tasks* in order with *allocator* and commit the batch."""
+        placed = []
         for task in tasks:
-            result = self._schedule_task(task, target_date)
-            results.append(result)
+            lane = task.get("lane") or "ops"
+            placed.append(
+                (task, lane, allocator.allocate(task["id"], lane, task.get("duration_min") or 60))
+            )
 
-            if not result.success:
-                # If we can't schedule, might be out of blocks
-                available = self.block_manager.get_available_blocks(
-                    target_date, task.get("lane", "ops")
-                )
-                if not available:
-                    # No more blocks for this lane, skip remaining tasks in this lane
-                    pass
+        allocator.commit()
 
+        results = []
+        for task, lane, allocation in placed:
+            if allocation is None:
+                block_id, success, message = None, False, f"No available blocks in lane '{lane}'"
+            else:
+                success, message = allocation.committed, allocation.message
+                block_id = allocation.block.id if success else None
+            results.append(
+                ScheduleResult(
+                    task_id=task["id"],
+                    task_title=(task.get("title") or "")[:50],
+                    block_id=block_id,
+                    success=success,
+                    message=message,
+                )
+            )
         return results
 
     def _get_schedulable_tasks(self, target_date: str) -> list[dict]:
@@ -124,44 +153,9 @@ class Scheduler:
         """
         Attempt to schedule a single task.
         """
-        task_id = task["id"]
-        task_title = task.get("title", "")[:50]
-        task_lane = task.get("lane", "ops")
-        task_duration = task.get("duration_min", 60)
-
-        # Get available blocks for this lane
-        available_blocks = self.block_manager.get_available_blocks(target_date, task_lane)
-
-        if not available_blocks:
-            return ScheduleResult(
-                task_id=task_id,
-                task_title=task_title,
-                block_id=None,
-                success=False,
-                message=f"No available blocks in lane '{task_lane}'",
-            )
-
-        # Find a block that fits the task duration
-        suitable_block = None
-        for block in available_blocks:
-            if block.duration_min >= task_duration:
-                suitable_block = block
-                break
-
-        if not suitable_block:
-            # Use the largest available block even if smaller than ideal
-            suitable_block = max(available_blocks, key=lambda b: b.duration_min)
-
-        # Schedule the task
-        success, message = self.block_manager.schedule_task(task_id, suitable_block.id)
-
-        return ScheduleResult(
-            task_id=task_id,
-            task_title=task_title,
-            block_id=suitable_block.id if success else None,
-            success=success,
-            message=message,
-        )
+        allocator = BlockAllocator(self.store)
+        allocator.load([target_date], [task.get("lane") or "ops"])
+        return self._allocate(allocator, [task])[0]
 
     def schedule_specific_task(
         self, task_id: str, block_id: str = None, target_date: str = None
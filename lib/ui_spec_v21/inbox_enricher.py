@@ -18,6 +18,8 @@ import re
 import sqlite3
 from typing import Any
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 # Check for Anthropic API
@@ -412,7 +414,7 @@ def run_enrichment_batch(use_llm: bool = True, limit: int = 50) -> dict[str, int
     """
     from lib import paths
 
-    conn = sqlite3.connect(str(paths.db_path()))
+    conn = open_connection(str(paths.db_path()))
     conn.row_factory = sqlite3.Row
 
     try:
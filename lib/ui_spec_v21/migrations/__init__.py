@@ -9,6 +9,8 @@ import logging
 import sqlite3
 from pathlib import Path
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -247,7 +249,7 @@ def create_database(db_path: str, verbose: bool = True) -> sqlite3.Connection:
     """
     if verbose:
         logger.info(f"Creating database: {db_path}")
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     conn.execute("PRAGMA foreign_keys=ON")
 
     run_migrations(conn, verbose)
@@ -263,7 +265,7 @@ def migrate_existing(db_path: str, verbose: bool = True) -> list[str]:
     """
     if verbose:
         logger.info(f"Migrating database: {db_path}")
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     conn.execute("PRAGMA foreign_keys=ON")
 
     applied = run_migrations(conn, verbose)
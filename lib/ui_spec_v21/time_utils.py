@@ -11,6 +11,8 @@ import sqlite3
 from datetime import date, datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
+from lib.db import open_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -764,7 +766,7 @@ if __name__ == "__main__":
 
     db_path = paths.db_path()
     if db_path.exists():
-        conn = sqlite3.connect(str(db_path))
+        conn = open_connection(str(db_path))
         logger.info(f"\nRunning timestamp canary on {db_path.name}...")
         run_timestamp_canary(conn)
         conn.close()
@@ -18,6 +18,7 @@ from typing import Any
 from cryptography.fernet import Fernet
 
 from lib import paths
+from lib.db import open_connection
 
 log = logging.getLogger("moh_time_os.v4.artifact_service")
 
@@ -109,7 +110,7 @@ class ArtifactService:
         self.db_path = db_path or str(paths.db_path())
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path, timeout=30)
+        return open_connection(self.db_path, timeout=30)
 
     def _hash_content(self, content: str) -> str:
         """Generate SHA256 hash of content."""
@@ -14,10 +14,12 @@ from datetime import datetime, timezone
 from typing import Any
 
 from lib import paths
+from lib.db import open_connection
 
 from .artifact_service import decrypt_blob_payload, get_artifact_service
 from .entity_link_service import get_entity_link_service
 from .identity_service import get_identity_service
+from .pattern_matcher import EntityPatternIndex
 
 log = logging.getLogger("moh_time_os.v4.hooks")
 
@@ -44,16 +46,23 @@ class CollectorHooks:
         self.artifact_svc = get_artifact_service()
         self.identity_svc = get_identity_service()
         self.link_svc = get_entity_link_service()
+        self._client_index = EntityPatternIndex(min_length=3)
+        self._task_name_index = EntityPatternIndex(min_length=6)
         self._load_entity_patterns()
 
     def _get_conn(self):
-        return sqlite3.connect(str(paths.db_path()), timeout=30)
+        return open_connection(str(paths.db_path()), timeout=30)
 
     def _load_entity_patterns(self):
         """Load client/project/task patterns for entity matching."""
         self.client_patterns = {}
         self.project_patterns = {}
         self.task_patterns = {}
+        # Lookup indexes maintained alongside the pattern dicts
+        self._project_by_asana_gid: dict[str, str] = {}
+        self._task_by_asana_gid: dict[str, str] = {}
+        self._task_keyword_index: dict[str, list[str]] = {}  # keyword -> task_ids
+        self._task_rank: dict[str, int] = {}
 
         conn = self._get_conn()
         cursor = conn.cursor()
@@ -87,6 +96,8 @@ class CollectorHooks:
                     "client_id": client_id,
                     "asana_project_id": asana_pid,
                 }
+                if asana_pid:
+                    self._project_by_asana_gid.setdefault(asana_pid, pid)
 
             # Load tasks from items table
             cursor.execute("""
@@ -109,6 +120,11 @@ class CollectorHooks:
                     "client_id": client_id,
                     "project_id": project_id,
                 }
+                self._task_rank[task_id] = len(self._task_rank)
+                if source_ref:
+                    self._task_by_asana_gid.setdefault(source_ref, task_id)
+                for keyword in set(keywords):
+                    self._task_keyword_index.setdefault(keyword, []).append(task_id)
 
             log.info(
                 f"Loaded patterns: {len(self.client_patterns)} clients, "
@@ -117,28 +133,28 @@ class CollectorHooks:
         finally:
             conn.close()
 
+        # Incremental: only clients/tasks whose patterns changed since the last load are re-indexed
+        self._client_index.sync({cid: d["patterns"] for cid, d in self.client_patterns.items()})
+        self._task_name_index.sync(
+            {tid: [d["name_normalized"]] for tid, d in self.task_patterns.items()}
+        )
+
     def _match_client_in_text(self, text: str) -> list[tuple]:
         """Match client mentions in text. Returns [(client_id, confidence, reason)]"""
         if not text:
             return []
-        text_lower = text.lower()
         matches = []
 
-        for client_id, data in self.client_patterns.items():
-            for pattern in data["patterns"]:
-                if pattern and len(pattern) > 2 and pattern in text_lower:
-                    conf = 0.9 if pattern == data["patterns"][0] else 0.75
-                    matches.append((client_id, conf, f"Pattern match: {pattern}"))
-                    break
+        # One scan of the text against every client pattern longer than 2 chars
+        for client_id, pattern in self._client_index.match(text.lower()):
+            conf = 0.9 if pattern == self.client_patterns[client_id]["patterns"][0] else 0.75
+            matches.append((client_id, conf, f"Pattern match: {pattern}"))
 
         return matches
 
     def _match_project_by_asana_gid(self, asana_gid: str) -> str | None:
         """Find project ID by Asana GID."""
-        for pid, data in self.project_patterns.items():
-            if data.get("asana_project_id") == asana_gid:
-                return pid
-        return None
+        return self._project_by_asana_gid.get(asana_gid)
 
     def _match_task_in_text(
         self, text: str, min_keyword_matches: int = 2
@@ -148,7 +164,8 @@ class CollectorHooks:
         Returns [(task_id, confidence, reason)]
 
         Matching strategies:
-        1. Exact task name match (high confidence)
+        1. Exact task name match at word boundaries (high confidence); a name
+           inside a longer word ("flow" in "flows") falls through to strategy 2
         2. Keyword overlap (medium confidence based on match ratio)
         3. Asana GID in URL (very high confidence)
         """
@@ -158,37 +175,41 @@ class CollectorHooks:
         text_lower = text.lower()
         text_keywords = {w for w in re.split(r"\W+", text_lower) if len(w) >= 3}
         matches = []
-        seen_tasks = set()
 
-        for task_id, data in self.task_patterns.items():
-            if task_id in seen_tasks:
-                continue
+        # Strategy 1: Whole-word name match (names longer than 5 chars)
+        name_hits = {task_id for task_id, _ in self._task_name_index.match(text_lower)}
 
-            task_name = data.get("name_normalized", "")
-            task_keywords = set(data.get("keywords", []))
+        # Strategy 2: Keyword overlap. The inverted index yields only tasks sharing
+        # at least one keyword with the text; count shared keywords per task.
+        overlaps: dict[str, list[str]] = {}
+        for keyword in text_keywords:
+            for task_id in self._task_keyword_index.get(keyword, ()):
+                overlaps.setdefault(task_id, []).append(keyword)
 
-            # Strategy 1: Exact or near-exact name match
-            if task_name and len(task_name) > 5 and task_name in text_lower:
+        candidates = name_hits | {
+            task_id
+            for task_id, shared in overlaps.items()
+            if len(shared) >= min_keyword_matches and task_id not in name_hits
+        }
+        for task_id in sorted(candidates, key=self._task_rank.__getitem__):
+            data = self.task_patterns[task_id]
+            if task_id in name_hits:
                 matches.append((task_id, 0.92, f"Task name match: {data['name'][:50]}"))
-                seen_tasks.add(task_id)
                 continue
 
-            # Strategy 2: Keyword overlap
-            if task_keywords and text_keywords:
-                overlap = task_keywords & text_keywords
-                if len(overlap) >= min_keyword_matches:
-                    # Confidence based on overlap ratio
-                    ratio = len(overlap) / len(task_keywords)
-                    if ratio >= 0.5:  # At least half the keywords match
-                        conf = min(0.85, 0.5 + ratio * 0.4)
-                        matches.append(
-                            (
-                                task_id,
-                                conf,
-                                f"Keyword match ({len(overlap)}/{len(task_keywords)}): {', '.join(list(overlap)[:3])}",
-                            )
-                        )
-                        seen_tasks.add(task_id)
+            task_keywords = set(data.get("keywords", []))
+            overlap = set(overlaps[task_id])
+            # Confidence based on overlap ratio
+            ratio = len(overlap) / len(task_keywords)
+            if ratio >= 0.5:  # At least half the keywords match
+                conf = min(0.85, 0.5 + ratio * 0.4)
+                matches.append(
+                    (
+                        task_id,
+                        conf,
+                        f"Keyword match ({len(overlap)}/{len(task_keywords)}): {', '.join(list(overlap)[:3])}",
+                    )
+                )
 
         # Sort by confidence descending, return top matches
         matches.sort(key=lambda x: -x[1])
@@ -196,10 +217,7 @@ class CollectorHooks:
 
     def _match_task_by_asana_gid(self, asana_gid: str) -> str | None:
         """Find task ID by Asana GID."""
-        for task_id, data in self.task_patterns.items():
-            if data.get("asana_gid") == asana_gid:
-                return task_id
-        return None
+        return self._task_by_asana_gid.get(asana_gid)
 
     def _extract_asana_task_gids(self, text: str) -> list[str]:
         """
@@ -6,12 +6,12 @@ They show "why" entities are related via shared signals/evidence.
 """
 
 import json
-import sqlite3
 import threading
 import uuid
 from typing import Any
 
 from lib import paths
+from lib.db import open_connection
 
 
 class CouplingService:
@@ -28,7 +28,7 @@ class CouplingService:
         self.db_path = db_path or str(paths.db_path())
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path, timeout=30)
+        return open_connection(self.db_path, timeout=30)
 
     def _generate_id(self, prefix: str = "cpl") -> str:
         return f"{prefix}_{uuid.uuid4().hex[:16]}"
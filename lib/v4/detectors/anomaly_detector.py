@@ -8,9 +8,10 @@ Detects anomalous patterns:
 """
 
 import json
-import sqlite3
 from typing import Any
 
+from lib.db import open_connection
+
 from .base import BaseDetector
 
 
@@ -46,7 +47,7 @@ class AnomalyDetector(BaseDetector):
         signals = []
         protocol_violations = []  # Track violations for protocol_violations table
 
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -12,6 +12,7 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 from lib import paths
+from lib.db import open_connection
 
 from ..signal_service import get_signal_service
 
@@ -38,7 +39,7 @@ class BaseDetector(ABC):
         self._register()
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path)
+        return open_connection(self.db_path)
 
     def _register(self):
         """Register this detector version."""
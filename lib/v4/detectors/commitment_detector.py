@@ -13,6 +13,8 @@ import sqlite3
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from lib.db import open_connection
+
 from ..artifact_service import decrypt_blob_payload
 from .base import BaseDetector
 
@@ -137,7 +139,7 @@ class CommitmentDetector(BaseDetector):
         """Run commitment detection."""
         signals = []
 
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -8,10 +8,11 @@ Detects client/project health signals:
 - Project health degradation
 """
 
-import sqlite3
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from lib.db import open_connection
+
 from ..artifact_service import get_artifact_service
 from .base import BaseDetector
 
@@ -54,7 +55,7 @@ class HealthDetector(BaseDetector):
         signals = []
         artifact_svc = get_artifact_service()
 
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         cursor = conn.cursor()
 
         try:
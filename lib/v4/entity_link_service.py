@@ -6,12 +6,12 @@ Provides confidence scoring and Fix Data queue generation.
 """
 
 import json
-import sqlite3
 import threading
 import uuid
 from typing import Any
 
 from lib import paths
+from lib.db import open_connection
 
 
 class EntityLinkService:
@@ -49,7 +49,7 @@ class EntityLinkService:
         self.db_path = db_path or str(paths.db_path())
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path, timeout=30)
+        return open_connection(self.db_path, timeout=30)
 
     def _generate_id(self, prefix: str = "lnk") -> str:
         return f"{prefix}_{uuid.uuid4().hex[:16]}"
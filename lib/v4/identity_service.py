@@ -13,6 +13,7 @@ import uuid
 from typing import Any
 
 from lib import paths, safe_sql
+from lib.db import open_connection
 
 
 class IdentityService:
@@ -35,7 +36,7 @@ class IdentityService:
         self.db_path = db_path or str(paths.db_path())
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path, timeout=30)
+        return open_connection(self.db_path, timeout=30)
 
     def _generate_id(self, prefix: str = "idp") -> str:
         return f"{prefix}_{uuid.uuid4().hex[:16]}"
@@ -13,10 +13,12 @@ from datetime import datetime, timezone
 from typing import Any
 
 from lib import paths
+from lib.db import open_connection
 
 from .artifact_service import get_artifact_service
 from .entity_link_service import get_entity_link_service
 from .identity_service import get_identity_service
+from .pattern_matcher import EntityPatternIndex
 
 logger = logging.getLogger(__name__)
 
@@ -41,10 +43,12 @@ class IngestPipeline:
         self.link_svc = get_entity_link_service()
 
         # Load client/project recognizers
+        self._client_index = EntityPatternIndex()
+        self._project_index = EntityPatternIndex()
         self._load_recognizers()
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path, timeout=30)
+        return open_connection(self.db_path, timeout=30)
 
     def _load_recognizers(self):
         """Load entity recognizers from database."""
@@ -81,6 +85,10 @@ class IngestPipeline:
         finally:
             conn.close()
 
+        # Incremental: only clients/projects whose patterns changed are re-indexed
+        self._client_index.sync({cid: d["patterns"] for cid, d in self.client_patterns.items()})
+        self._project_index.sync({pid: [d["pattern"]] for pid, d in self.project_patterns.items()})
+
     def _match_entity_in_text(self, text: str) -> list[tuple[str, str, float, str]]:
         """
         Match entities mentioned in text.
@@ -91,19 +99,15 @@ class IngestPipeline:
         text_lower = text.lower()
         matches = []
 
-        # Check clients
-        for client_id, data in self.client_patterns.items():
-            for pattern in data["patterns"]:
-                if pattern and pattern in text_lower:
-                    # Higher confidence for exact match, lower for partial
-                    conf = 0.9 if pattern == data["patterns"][0] else 0.75
-                    matches.append(("client", client_id, conf, f"Name match: {pattern}"))
-                    break
+        # Check clients (one scan of the text against every client pattern)
+        for client_id, pattern in self._client_index.match(text_lower):
+            # Higher confidence for exact match, lower for partial
+            conf = 0.9 if pattern == self.client_patterns[client_id]["patterns"][0] else 0.75
+            matches.append(("client", client_id, conf, f"Name match: {pattern}"))
 
         # Check projects
-        for project_id, data in self.project_patterns.items():
-            if data["pattern"] and data["pattern"] in text_lower:
-                matches.append(("project", project_id, 0.85, f"Project name: {data['pattern']}"))
+        for project_id, pattern in self._project_index.match(text_lower):
+            matches.append(("project", project_id, 0.85, f"Project name: {pattern}"))
 
         return matches
 
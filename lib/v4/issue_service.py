@@ -13,6 +13,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from lib import paths, safe_sql
+from lib.db import open_connection
 
 from .proposal_service import get_proposal_service
 from .signal_service import get_signal_service
@@ -37,7 +38,7 @@ class IssueService:
         self.signal_svc = get_signal_service()
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path, timeout=30)
+        return open_connection(self.db_path, timeout=30)
 
     def _generate_id(self, prefix: str = "iss") -> str:
         return f"{prefix}_{uuid.uuid4().hex[:16]}"
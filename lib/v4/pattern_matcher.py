@@ -0,0 +1,154 @@
+"""
+Time OS V4 - Entity Pattern Matcher
+
+Multi-pattern index for recognising client aliases and project names in
+message and event text.
+
+Each pattern is anchored on its first word (first run of ``\\w`` characters).
+Scanning a text walks its word tokens once, looks each token up in a hash of
+anchors, and verifies only the handful of patterns anchored on that word, so
+the cost is linear in the text and independent of how many patterns are
+loaded. Matches respect word boundaries: "acme" matches "acme corp" and
+"ops@acme.com" but not "acmes".
+
+The index is maintained incrementally: ``sync()`` diffs the new
+entity → patterns mapping against the current one and only re-indexes
+entities whose patterns changed.
+"""
+
+import re
+
+_WORD = re.compile(r"\w+")
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class EntityPatternIndex:
+    """
+    Word-anchored multi-pattern index over entity patterns.
+
+    Entities are kept in the order they were last synced; ``match()`` returns
+    them in that order together with the first of their patterns (in the order
+    given) that occurs in the text.
+    """
+
+    def __init__(self, min_length: int = 1):
+        self.min_length = min_length
+        self._entity_patterns: dict[str, tuple[str, ...]] = {}
+        self._rank: dict[str, int] = {}
+        # pattern -> {entity_id: position of the pattern in that entity's list}
+        self._owners: dict[str, dict[str, int]] = {}
+        # first word -> {pattern: offset of that word within the pattern}
+        self._anchors: dict[str, dict[str, int]] = {}
+        # patterns with no word characters at all; checked with a plain substring test
+        self._unanchored: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._entity_patterns)
+
+    # -- maintenance ---------------------------------------------------------
+
+    def _index_pattern(self, pattern: str) -> None:
+        first = _WORD.search(pattern)
+        if first is None:
+            self._unanchored.add(pattern)
+        else:
+            self._anchors.setdefault(first.group(), {})[pattern] = first.start()
+
+    def _unindex_pattern(self, pattern: str) -> None:
+        first = _WORD.search(pattern)
+        if first is None:
+            self._unanchored.discard(pattern)
+            return
+        bucket = self._anchors.get(first.group())
+        if bucket is not None:
+            bucket.pop(pattern, None)
+            if not bucket:
+                del self._anchors[first.group()]
+
+    def _add_entity(self, entity_id: str, patterns: tuple[str, ...]) -> None:
+        for pos, pattern in enumerate(patterns):
+            if not pattern or len(pattern) < self.min_length:
+                continue
+            owners = self._owners.get(pattern)
+            if owners is None:
+                owners = self._owners[pattern] = {}
+                self._index_pattern(pattern)
+            owners.setdefault(entity_id, pos)
+
+    def _remove_entity(self, entity_id: str, patterns: tuple[str, ...]) -> None:
+        for pattern in set(patterns):
+            owners = self._owners.get(pattern)
+            if owners is None:
+                continue
+            owners.pop(entity_id, None)
+            if not owners:
+                del self._owners[pattern]
+                self._unindex_pattern(pattern)
+
+    def sync(self, entities: dict[str, list[str]]) -> int:
+        """Bring the index in line with *entities* (entity_id -> ordered patterns).
+
+        Only entities whose pattern list changed are re-indexed. Returns the number
+        of entities added, removed or changed.
+        """
+        changed = 0
+        for entity_id in [e for e in self._entity_patterns if e not in entities]:
+            self._remove_entity(entity_id, self._entity_patterns.pop(entity_id))
+            changed += 1
+
+        for entity_id, patterns in entities.items():
+            new = tuple(patterns)
+            old = self._entity_patterns.get(entity_id)
+            if old == new:
+                continue
+            if old is not None:
+                self._remove_entity(entity_id, old)
+            self._add_entity(entity_id, new)
+            self._entity_patterns[entity_id] = new
+            changed += 1
+
+        self._rank = {entity_id: i for i, entity_id in enumerate(entities)}
+        return changed
+
+    # -- lookup --------------------------------------------------------------
+
+    def find(self, text: str) -> set[str]:
+        """Distinct indexed patterns occurring in *text* at word boundaries."""
+        found = set()
+        if not text:
+            return found
+        anchors = self._anchors
+        n = len(text)
+        for token in _WORD.finditer(text):
+            bucket = anchors.get(token.group())
+            if not bucket:
+                continue
+            for pattern, offset in bucket.items():
+                if pattern in found:
+                    continue
+                start = token.start() - offset
+                if start < 0 or not text.startswith(pattern, start):
+                    continue
+                end = start + len(pattern)
+                if end < n and _is_word_char(pattern[-1]) and _is_word_char(text[end]):
+                    continue
+                found.add(pattern)
+        for pattern in self._unanchored:
+            if pattern in text:
+                found.add(pattern)
+        return found
+
+    def match(self, text: str) -> list[tuple[str, str]]:
+        """(entity_id, first matching pattern) for every entity mentioned in *text*."""
+        best: dict[str, int] = {}
+        for pattern in self.find(text):
+            for entity_id, pos in self._owners[pattern].items():
+                if pos < best.get(entity_id, len(self._entity_patterns[entity_id])):
+                    best[entity_id] = pos
+        return [
+            (entity_id, self._entity_patterns[entity_id][best[entity_id]])
+            for entity_id in sorted(best, key=self._rank.__getitem__)
+        ]
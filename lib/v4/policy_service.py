@@ -6,12 +6,12 @@ Provides governance layer for the executive OS.
 """
 
 import json
-import sqlite3
 import threading
 import uuid
 from typing import Any
 
 from lib import paths
+from lib.db import open_connection
 
 
 class PolicyService:
@@ -58,7 +58,7 @@ class PolicyService:
         self._ensure_defaults()
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path, timeout=30)
+        return open_connection(self.db_path, timeout=30)
 
     def _generate_id(self, prefix: str = "pol") -> str:
         return f"{prefix}_{uuid.uuid4().hex[:16]}"
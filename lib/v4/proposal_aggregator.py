@@ -16,6 +16,7 @@ from collections import defaultdict
 from typing import Any
 
 from lib import paths
+from lib.db import open_connection
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +27,7 @@ LEGACY_OVERDUE_THRESHOLD_DAYS = 365
 
 def get_db_connection(db_path: str = None) -> sqlite3.Connection:
     """Get database connection with row factory."""
-    conn = sqlite3.connect(db_path or str(paths.db_path()), timeout=30)
+    conn = open_connection(db_path or str(paths.db_path()), timeout=30)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -7,12 +7,12 @@ They bundle related signals into actionable briefings with proof.
 
 import json
 import logging
-import sqlite3
 import threading
 import uuid
 from typing import Any
 
 from lib import paths
+from lib.db import open_connection
 
 from .signal_service import get_signal_service
 
@@ -36,7 +36,7 @@ class ProposalService:
         self.signal_svc = get_signal_service()
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path, timeout=30)
+        return open_connection(self.db_path, timeout=30)
 
     def _generate_id(self, prefix: str = "prop") -> str:
         return f"{prefix}_{uuid.uuid4().hex[:16]}"
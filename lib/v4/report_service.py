@@ -7,13 +7,13 @@ Reports are evidence-backed and reproducible.
 
 import hashlib
 import json
-import sqlite3
 import threading
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from lib import paths
+from lib.db import open_connection
 
 from .issue_service import get_issue_service
 from .proposal_service import get_proposal_service
@@ -68,7 +68,7 @@ class ReportService:
         self._ensure_templates()
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path, timeout=30)
+        return open_connection(self.db_path, timeout=30)
 
     def _generate_id(self, prefix: str = "rpt") -> str:
         return f"{prefix}_{uuid.uuid4().hex[:16]}"
@@ -13,6 +13,7 @@ import logging
 import sqlite3
 
 from lib import paths
+from lib.db import open_connection
 
 from .identity_service import get_identity_service
 
@@ -21,7 +22,7 @@ logger = logging.getLogger(__name__)
 
 def seed_identities_from_clients():
     """Create org identity profiles from clients table."""
-    conn = sqlite3.connect(str(paths.db_path()), timeout=30)
+    conn = open_connection(str(paths.db_path()), timeout=30)
     cursor = conn.cursor()
     ident = get_identity_service()
 
@@ -75,7 +76,7 @@ def seed_identities_from_clients():
 
 def seed_identities_from_people():
     """Create person identity profiles from people table."""
-    conn = sqlite3.connect(str(paths.db_path()), timeout=30)
+    conn = open_connection(str(paths.db_path()), timeout=30)
     cursor = conn.cursor()
     ident = get_identity_service()
 
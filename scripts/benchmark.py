@@ -2,28 +2,47 @@
 """
 Performance benchmark suite.
 
-Measures and enforces performance budgets for critical operations:
-- Normalization functions
-- Schema validation
-- Collector loop
-- API response times
+Two suites:
+- micro:  performance budgets for small, hot helpers (normalization, JSON
+          parsing, schema validation).
+- system: the intelligence, autonomous-loop and API hot paths, run against a
+          synthetic database (scripts/benchmark_data.py) at a chosen scale
+          (1k / 10k / 100k tasks, communications and invoices). Hot paths that
+          fail on a database built from lib/schema.py are listed in
+          EXCLUDED_SYSTEM_BENCHMARKS instead of being timed.
+
+Results can be saved as JSON baselines and compared later; a benchmark whose
+median is slower than its baseline by more than its regression threshold is
+reported as a regression.
 
 Usage:
-    uv run python scripts/benchmark.py [--save] [--compare FILE]
+    uv run python scripts/benchmark.py [--save FILE] [--compare FILE]
+    uv run python scripts/benchmark.py --suite system --scale 10k \
+        --compare benchmarks/baselines/10k.json --fail-on-regression
 
 Output:
-    JSON results with timing data and budget status.
+    JSON results with timing data, budget status and regression thresholds.
 """
 
 import argparse
 import json
+import logging
+import os
+import secrets
 import statistics
 import sys
+import tempfile
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
+REPO_ROOT = Path(__file__).parent.parent
+# Add repo root to path
+sys.path.insert(0, str(REPO_ROOT))
+
+BASELINE_DIR = REPO_ROOT / "benchmarks" / "baselines"
+
 # Performance budgets (in milliseconds)
 BUDGETS = {
     "normalize_client_id": 0.1,  # 0.1ms per call
@@ -34,6 +53,42 @@ BUDGETS = {
     "json_parse_safe": 0.5,  # 0.5ms per JSON parse
 }
 
+# Allowed slowdown of the median vs. the baseline before a benchmark counts as
+# a regression, in percent. System benchmarks touch SQLite and the filesystem
+# and are noisier than the micro ones.
+DEFAULT_REGRESSION_PCT = 10.0
+SYSTEM_REGRESSION_PCT = 25.0
+REGRESSION_THRESHOLDS: dict[str, float] = {
+    "api.overview": 35.0,
+    "api.priorities_advanced": 35.0,
+    "api.capacity_utilization": 35.0,
+    "api.capacity_forecast": 35.0,
+    "api.intelligence_portfolio_overview": 35.0,
+    "api.intelligence_snapshot": 35.0,
+}
+
+# Hot paths left out of the system suite, and why. Each fails outright on a
+# database built from lib/schema.py, so there is nothing to time until it is
+# fixed; add it back to _system_cases() then.
+EXCLUDED_SYSTEM_BENCHMARKS = {
+    "snapshot.agency_snapshot_generate": (
+        "the commitments query reads commitment_id/commitment_text/scope_ref_*/due_at, "
+        "which lib/schema.py's commitments table does not have; past that, the Page 10/12 "
+        "sections do not match AgencySnapshotContract"
+    ),
+    "api.clients": (
+        "filters and sorts on clients.financial_ar_total/financial_ar_aging_bucket, "
+        "which lib/schema.py's clients table does not have"
+    ),
+}
+
+# Measured iterations per system benchmark, by scale (plus one warmup run). Above
+# 10k a single run of the heavier paths takes minutes to hours, so it is timed
+# once, without a warmup.
+_SYSTEM_ITERATIONS = ((1_000, 5), (10_000, 3))
+_SYSTEM_ITERATIONS_LARGE = 1
+_SYSTEM_WARMUP_LIMIT = 10_000
+
 
 @dataclass
 class BenchmarkResult:
@@ -46,6 +101,8 @@ class BenchmarkResult:
     stddev_ms: float
     budget_ms: float | None
     passed: bool
+    threshold_pct: float = DEFAULT_REGRESSION_PCT
+    error: str | None = None
 
     def to_dict(self) -> dict:
         return {
@@ -58,6 +115,8 @@ class BenchmarkResult:
             "stddev_ms": round(self.stddev_ms, 4),
             "budget_ms": self.budget_ms,
             "passed": self.passed,
+            "threshold_pct": self.threshold_pct,
+            "error": self.error,
         }
 
 
@@ -66,17 +125,26 @@ def benchmark(
     func: Callable,
     iterations: int = 100,
     warmup: int = 10,
+    setup: Callable | None = None,
+    threshold_pct: float = DEFAULT_REGRESSION_PCT,
 ) -> BenchmarkResult:
-    """Run a benchmark and return results."""
+    """Run a benchmark and return results.
+
+    ``setup`` runs before every warmup and measured call, outside the timing.
+    """
     budget = BUDGETS.get(name)
 
     # Warmup
     for _ in range(warmup):
+        if setup:
+            setup()
         func()
 
     # Measure
     times_ms = []
     for _ in range(iterations):
+        if setup:
+            setup()
         start = time.perf_counter()
         func()
         elapsed = (time.perf_counter() - start) * 1000
@@ -95,11 +163,12 @@ def benchmark(
         stddev_ms=statistics.stdev(times_ms) if len(times_ms) > 1 else 0,
         budget_ms=budget,
         passed=passed,
+        threshold_pct=REGRESSION_THRESHOLDS.get(name, threshold_pct),
     )
 
 
 def run_benchmarks() -> list[BenchmarkResult]:
-    """Run all benchmarks."""
+    """Run the micro benchmarks."""
     results = []
 
     # Benchmark: normalize_client_id
@@ -162,6 +231,170 @@ def run_benchmarks() -> list[BenchmarkResult]:
     return results
 
 
+def system_iterations(scale: int) -> int:
+    """Default measured iterations for a system benchmark at *scale*."""
+    for limit, iterations in _SYSTEM_ITERATIONS:
+        if scale <= limit:
+            return iterations
+    return _SYSTEM_ITERATIONS_LARGE
+
+
+def system_warmup(scale: int) -> int:
+    """Default warmup runs for a system benchmark at *scale*."""
+    return 1 if scale <= _SYSTEM_WARMUP_LIMIT else 0
+
+
+def _failed_result(name: str, error: Exception) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name,
+        iterations=0,
+        mean_ms=0.0,
+        median_ms=0.0,
+        min_ms=0.0,
+        max_ms=0.0,
+        stddev_ms=0.0,
+        budget_ms=None,
+        passed=False,
+        threshold_pct=REGRESSION_THRESHOLDS.get(name, SYSTEM_REGRESSION_PCT),
+        error=f"{type(error).__name__}: {error}",
+    )
+
+
+def _system_cases(db_path: Path, home: Path, api_key: str) -> list[tuple[str, Callable, Callable]]:
+    """(name, func, setup) for every system benchmark, bound to *db_path*.
+
+    Imports happen here, after the environment points the app at the synthetic
+    database, because several modules capture paths and keys at import time.
+    """
+    from fastapi.testclient import TestClient
+
+    from api import auth as api_auth
+    from api import server as api_server
+    from lib.autonomous_loop import AutonomousLoop
+    from lib.cache.decorators import get_cache
+    from lib.intelligence.patterns import detect_all_patterns
+    from lib.intelligence.scorecard import score_all_clients
+    from lib.intelligence.signals import detect_all_signals
+
+    def no_setup() -> None:
+        return None
+
+    cases: list[tuple[str, Callable, Callable]] = [
+        (
+            "intelligence.detect_all_signals",
+            lambda: detect_all_signals(db_path, incremental=False),
+            no_setup,
+        ),
+        (
+            "intelligence.detect_all_signals_incremental",
+            lambda: detect_all_signals(db_path, incremental=True),
+            no_setup,
+        ),
+        ("intelligence.detect_all_patterns", lambda: detect_all_patterns(db_path), no_setup),
+        ("intelligence.score_all_clients", lambda: score_all_clients(db_path), no_setup),
+    ]
+
+    loop = AutonomousLoop(config_path=str(home / "config"))
+    for phase in (
+        "_normalize_data",
+        "_check_gates",
+        "_process_time_truth",
+        "_process_commitment_truth",
+        "_process_capacity_truth",
+        "_process_client_truth",
+    ):
+        cases.append((f"loop.{phase.lstrip('_')}", getattr(loop, phase), no_setup))
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    client = TestClient(api_server.app)
+    # auth captures the key at import; prefer it in case api was imported earlier.
+    headers = {"Authorization": f"Bearer {api_auth._API_KEY or api_key}"}
+
+    def get(path: str) -> Callable:
+        def call() -> None:
+            response = client.get(path, headers=headers)
+            if response.status_code != 200:
+                raise RuntimeError(f"GET {path} -> {response.status_code}")
+
+        return call
+
+    # Endpoint caches are cleared before every call so the cold path is measured.
+    for name, path in (
+        ("api.overview", "/api/overview"),
+        ("api.priorities_advanced", "/api/priorities/advanced"),
+        ("api.capacity_utilization", "/api/capacity/utilization"),
+        ("api.capacity_forecast", "/api/capacity/forecast?days=14"),
+        ("api.intelligence_portfolio_overview", "/api/v2/intelligence/portfolio/overview"),
+        ("api.intelligence_snapshot", "/api/v2/intelligence/snapshot"),
+    ):
+        cases.append((name, get(path), get_cache().clear))
+    return cases
+
+
+def run_system_benchmarks(
+    scale: int,
+    iterations: int | None = None,
+    warmup: int | None = None,
+    only: list[str] | None = None,
+) -> list[BenchmarkResult]:
+    """Generate a synthetic database at *scale* and time the system hot paths.
+
+    The app is pointed at a throwaway home directory and database, so the live
+    database is never touched. A benchmark that raises is reported as failed
+    and the rest still run.
+    """
+    from scripts.benchmark_data import generate
+
+    iterations = iterations or system_iterations(scale)
+    warmup = system_warmup(scale) if warmup is None else warmup
+    home = Path(tempfile.mkdtemp(prefix="moh_bench_"))
+    db_path = home / "data" / "moh_time_os.db"
+    db_path.parent.mkdir(parents=True)
+
+    print(f"🧪 Generating synthetic data (scale={scale:,}) in {home}")
+    generated = generate(db_path, scale)
+    print(f"   {sum(generated['rows'].values()):,} rows")
+
+    api_key = secrets.token_urlsafe(24)
+    os.environ["MOH_TIME_OS_HOME"] = str(home)
+    os.environ["MOH_TIME_OS_DB"] = str(db_path)
+    os.environ["MOH_TIME_OS_API_KEY"] = api_key
+
+    from lib.state_store import StateStore
+
+    StateStore._instance = None
+
+    results = []
+    try:
+        cases = _system_cases(db_path, home, api_key)
+    except Exception as e:
+        print(f"⚠️  system benchmarks unavailable: {e}")
+        return [_failed_result("system.setup", e)]
+
+    for name, reason in EXCLUDED_SYSTEM_BENCHMARKS.items():
+        print(f"   ⊘  {name} not benchmarked: {reason}")
+
+    for name, func, setup in cases:
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        print(f"   ⏱  {name}")
+        try:
+            results.append(
+                benchmark(
+                    name,
+                    func,
+                    iterations=iterations,
+                    warmup=warmup,
+                    setup=setup,
+                    threshold_pct=SYSTEM_REGRESSION_PCT,
+                )
+            )
+        except Exception as e:
+            print(f"⚠️  {name} failed: {e}")
+            results.append(_failed_result(name, e))
+    return results
+
+
 def print_results(results: list[BenchmarkResult]) -> None:
     """Print benchmark results."""
     print("\n📊 Benchmark Results")
@@ -171,6 +404,10 @@ def print_results(results: list[BenchmarkResult]) -> None:
         status = "✅" if r.passed else "❌"
         budget_str = f" (budget: {r.budget_ms}ms)" if r.budget_ms else ""
         print(f"{status} {r.name}")
+        if r.error:
+            print(f"   Error: {r.error}")
+            print()
+            continue
         print(f"   Mean: {r.mean_ms:.4f}ms | Median: {r.median_ms:.4f}ms{budget_str}")
         print(f"   Min: {r.min_ms:.4f}ms | Max: {r.max_ms:.4f}ms | Stddev: {r.stddev_ms:.4f}ms")
         print()
@@ -180,21 +417,35 @@ def print_results(results: list[BenchmarkResult]) -> None:
     print(f"Summary: {passed}/{total} benchmarks within budget")
 
 
-def save_results(results: list[BenchmarkResult], path: Path) -> None:
+def save_results(results: list[BenchmarkResult], path: Path, scale: int | None = None) -> None:
     """Save results to JSON file."""
     data = {
         "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "scale": scale,
         "results": [r.to_dict() for r in results],
     }
-    path.write_text(json.dumps(data, indent=2))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2) + "\n")
     print(f"✅ Saved results to {path}")
 
 
-def compare_results(current: list[BenchmarkResult], baseline_path: Path) -> None:
-    """Compare current results to baseline."""
+def compare_results(
+    current: list[BenchmarkResult],
+    baseline_path: Path,
+    selected: Callable[[str], bool] | None = None,
+) -> list[str]:
+    """Compare current medians to a baseline; returns the names that regressed.
+
+    Each baseline entry carries its own ``threshold_pct`` (older baselines
+    without one use the default). A benchmark that failed to run, or a
+    baseline entry the run did not produce, counts as a regression; *selected*
+    limits the latter to the benchmarks this run was asked for (--suite,
+    --only). New benchmarks and ones that failed in the baseline are not
+    compared.
+    """
     if not baseline_path.exists():
         print(f"⚠️  Baseline not found: {baseline_path}")
-        return
+        return []
 
     baseline = json.loads(baseline_path.read_text())
     baseline_by_name = {r["name"]: r for r in baseline["results"]}
@@ -204,47 +455,91 @@ def compare_results(current: list[BenchmarkResult], baseline_path: Path) -> None
 
     regressions = []
     for r in current:
-        if r.name in baseline_by_name:
-            old = baseline_by_name[r.name]["mean_ms"]
-            diff_pct = ((r.mean_ms - old) / old) * 100
-
-            if diff_pct > 10:
-                status = "🔴"
-                regressions.append(r.name)
-            elif diff_pct > 0:
-                status = "🟡"
-            else:
-                status = "🟢"
+        entry = baseline_by_name.get(r.name)
+        if r.error and entry is not None:
+            print(f"🔴 {r.name}: failed ({r.error})")
+            regressions.append(r.name)
+            continue
+        if entry is None or r.error or entry.get("error") or not entry.get("median_ms"):
+            continue
+        old = entry["median_ms"]
+        threshold = entry.get("threshold_pct", DEFAULT_REGRESSION_PCT)
+        diff_pct = ((r.median_ms - old) / old) * 100
+
+        if diff_pct > threshold:
+            status = "🔴"
+            regressions.append(r.name)
+        elif diff_pct > 0:
+            status = "🟡"
+        else:
+            status = "🟢"
+
+        print(
+            f"{status} {r.name}: {r.median_ms:.4f}ms vs {old:.4f}ms "
+            f"({diff_pct:+.1f}%, threshold {threshold:g}%)"
+        )
 
-            print(f"{status} {r.name}: {r.mean_ms:.4f}ms vs {old:.4f}ms ({diff_pct:+.1f}%)")
+    ran = {r.name for r in current}
+    for name in baseline_by_name:
+        if name not in ran and (selected is None or selected(name)):
+            print(f"🔴 {name}: missing from this run")
+            regressions.append(name)
 
     if regressions:
         print(f"\n❌ Regressions detected: {', '.join(regressions)}")
     else:
         print("\n✅ No significant regressions")
+    return regressions
 
 
 def main() -> int:
+    from scripts.benchmark_data import SCALES, parse_scale
+
     parser = argparse.ArgumentParser(description="Run performance benchmarks")
+    parser.add_argument(
+        "--suite", choices=["micro", "system", "all"], default="micro", help="Suite to run"
+    )
+    parser.add_argument(
+        "--scale",
+        type=parse_scale,
+        default=SCALES["1k"],
+        help=f"System suite data scale ({', '.join(SCALES)} or an integer)",
+    )
+    parser.add_argument("--iterations", type=int, help="Measured runs per system benchmark")
+    parser.add_argument(
+        "--only", action="append", help="Only run system benchmarks with this name prefix"
+    )
     parser.add_argument("--save", type=Path, help="Save results to JSON file")
     parser.add_argument("--compare", type=Path, help="Compare to baseline file")
     parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 on regression")
     args = parser.parse_args()
 
     print("🏃 Running benchmarks...")
-    results = run_benchmarks()
+    results = []
+    if args.suite in ("micro", "all"):
+        results.extend(run_benchmarks())
+    if args.suite in ("system", "all"):
+        results.extend(run_system_benchmarks(args.scale, args.iterations, only=args.only))
     print_results(results)
 
     if args.save:
-        save_results(results, args.save)
+        save_results(results, args.save, scale=args.scale if args.suite != "micro" else None)
+
+    def selected(name: str) -> bool:
+        system = "." in name  # micro benchmark names are undotted
+        if (system and args.suite == "micro") or (not system and args.suite == "system"):
+            return False
+        return not (system and args.only) or any(name.startswith(p) for p in args.only)
 
-    if args.compare:
-        compare_results(results, args.compare)
+    regressions = compare_results(results, args.compare, selected) if args.compare else []
 
     # Check if all passed
     all_passed = all(r.passed for r in results)
     if not all_passed:
-        print("\n❌ Some benchmarks exceeded budget")
+        print("\n❌ Some benchmarks exceeded budget or failed")
+        return 1
+
+    if regressions and args.fail_on_regression:
         return 1
 
     return 0
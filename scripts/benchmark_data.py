@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+Synthetic data generator for the benchmark suite.
+
+Builds a SQLite database with the full schema from lib/schema.py (via
+schema_engine.create_fresh) and fills the core tables with deterministic,
+realistically-shaped data at a chosen scale. The scale is the number of tasks,
+communications and invoices; clients, projects, people, events and
+commitments are derived from it.
+
+Every generated row is checked against the column list in lib/schema.py, so
+the generator fails loudly when the schema drifts instead of silently writing
+a stale shape.
+
+Usage:
+    uv run python scripts/benchmark_data.py --scale 10k --out /tmp/bench_10k.db
+"""
+
+import argparse
+import json
+import random
+import sqlite3
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib import schema, schema_engine  # noqa: E402
+from lib.comm_attribution import sync_attribution  # noqa: E402
+
+# Named scales: tasks / communications / invoices per scale.
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+DEFAULT_SEED = 20260101
+
+_BATCH = 5_000
+
+_LANES = ["ops", "creative", "finance", "growth", "admin"]
+_TASK_STATUSES = ["active", "active", "active", "pending", "blocked", "completed", "done"]
+_PROJECT_STATUSES = ["active", "active", "active", "on_hold", "completed"]
+_PROJECT_HEALTH = ["green", "green", "yellow", "red"]
+_INVOICE_STATUSES = ["paid", "paid", "sent", "sent", "overdue", "draft"]
+_TIERS = ["A", "B", "B", "C", "C", "C"]
+_WORDS = (
+    "launch review brief campaign proposal invoice renewal contract shoot edit "
+    "deck report strategy budget timeline approval feedback assets copy social "
+    "website audit retainer kickoff sprint roadmap"
+).split()
+
+
+@dataclass
+class Plan:
+    """Row counts for one generated dataset."""
+
+    tasks: int
+    communications: int
+    invoices: int
+    clients: int
+    projects: int
+    team: int
+    contacts: int
+    events: int
+    commitments: int
+
+    @classmethod
+    def for_scale(cls, n: int) -> "Plan":
+        clients = min(2_000, max(20, n // 50))
+        return cls(
+            tasks=n,
+            communications=n,
+            invoices=n,
+            clients=clients,
+            projects=clients * 3,
+            team=min(200, max(8, n // 250)),
+            contacts=clients * 2,
+            events=max(50, n // 5),
+            commitments=max(20, n // 10),
+        )
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+def _iso(dt: datetime) -> str:
+    return dt.replace(microsecond=0).isoformat()
+
+
+def _phrase(rng: random.Random, words: int = 4) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize()
+
+
+def _insert(conn: sqlite3.Connection, table: str, rows: list[dict]) -> int:
+    """Insert rows after checking every column exists in lib/schema.py."""
+    if not rows:
+        return 0
+    columns = list(rows[0])
+    known = {name for name, _ in schema.TABLES[table]["columns"]}
+    unknown = [c for c in columns if c not in known]
+    if unknown:
+        raise ValueError(f"{table}: columns not in lib/schema.py: {unknown}")
+    sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) "  # noqa: S608 — names checked above
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+    for start in range(0, len(rows), _BATCH):
+        conn.executemany(sql, [tuple(r[c] for c in columns) for r in rows[start : start + _BATCH]])
+    return len(rows)
+
+
+def _clients(rng: random.Random, plan: Plan, now: datetime) -> list[dict]:
+    rows = []
+    for i in range(plan.clients):
+        name = f"{rng.choice(_WORDS).capitalize()} {rng.choice(_WORDS).capitalize()} {i}"
+        annual = round(rng.uniform(20_000, 2_000_000), 2)
+        rows.append(
+            {
+                "id": f"client-{i:05d}",
+                "name": name,
+                "name_normalized": name.lower(),
+                "tier": rng.choice(_TIERS),
+                "health_score": round(rng.uniform(20, 100), 1),
+                "type": "agency_client",
+                "financial_annual_value": annual,
+                "financial_ar_outstanding": round(annual * rng.uniform(0, 0.3), 2),
+                "relationship_health": rng.choice(["good", "good", "fair", "poor"]),
+                "relationship_trend": rng.choice(["improving", "stable", "declining"]),
+                "relationship_last_interaction": _iso(now - timedelta(days=rng.randint(0, 90))),
+                "prior_year_revenue": round(annual * rng.uniform(0.6, 1.2), 2),
+                "ytd_revenue": round(annual * rng.uniform(0.2, 0.9), 2),
+                "lifetime_revenue": round(annual * rng.uniform(1, 5), 2),
+            }
+        )
+    return rows
+
+
+def _brands(clients: list[dict]) -> list[dict]:
+    return [
+        {"id": f"brand-{c['id'][7:]}", "client_id": c["id"], "name": f"{c['name']} Brand"}
+        for c in clients
+    ]
+
+
+def _client_identities(clients: list[dict]) -> list[dict]:
+    return [
+        {
+            "id": f"ident-{c['id'][7:]}",
+            "client_id": c["id"],
+            "identity_type": "domain",
+            "identity_value": f"{c['id']}.example.com",
+        }
+        for c in clients
+    ]
+
+
+def _projects(rng: random.Random, plan: Plan, clients: list[dict], today: date) -> list[dict]:
+    rows = []
+    for i in range(plan.projects):
+        client = clients[i % len(clients)]
+        name = f"{client['name']} {_phrase(rng, 2)} {i}"
+        rows.append(
+            {
+                "id": f"project-{i:05d}",
+                "source": "asana",
+                "source_id": f"asana-p-{i}",
+                "name": name,
+                "name_normalized": name.lower(),
+                "brand_id": f"brand-{client['id'][7:]}",
+                "client_id": client["id"],
+                "status": rng.choice(_PROJECT_STATUSES),
+                "health": rng.choice(_PROJECT_HEALTH),
+                "owner": f"Team Member {i % plan.team}",
+                "deadline": (today + timedelta(days=rng.randint(-30, 120))).isoformat(),
+                "start_date": (today - timedelta(days=rng.randint(10, 300))).isoformat(),
+                "value": round(rng.uniform(5_000, 250_000), 2),
+                "asana_project_id": f"asana-p-{i}",
+            }
+        )
+    return rows
+
+
+def _people(rng: random.Random, plan: Plan, clients: list[dict], now: datetime) -> list[dict]:
+    rows = []
+    for i in range(plan.team):
+        name = f"Team Member {i}"
+        rows.append(
+            {
+                "id": f"person-team-{i:04d}",
+                "name": name,
+                "name_normalized": name.lower(),
+                "email": f"member{i}@agency.example.com",
+                "role": rng.choice(["designer", "strategist", "producer", "account lead"]),
+                "type": "internal",
+                "last_contact": _iso(now - timedelta(days=rng.randint(0, 14))),
+            }
+        )
+    for i in range(plan.contacts):
+        client = clients[i % len(clients)]
+        name = f"Contact {i}"
+        rows.append(
+            {
+                "id": f"person-ext-{i:05d}",
+                "name": name,
+                "name_normalized": name.lower(),
+                "email": f"contact{i}@{client['id']}.example.com",
+                "role": "client contact",
+                "type": "external",
+                "last_contact": _iso(now - timedelta(days=rng.randint(0, 120))),
+            }
+        )
+    return rows
+
+
+def _team_members(plan: Plan) -> list[dict]:
+    return [
+        {
+            "id": f"tm-{i:04d}",
+            "name": f"Team Member {i}",
+            "email": f"member{i}@agency.example.com",
+            "asana_gid": f"asana-u-{i}",
+            "default_lane": _LANES[i % len(_LANES)],
+        }
+        for i in range(plan.team)
+    ]
+
+
+def _tasks(rng: random.Random, plan: Plan, projects: list[dict], now: datetime) -> list[dict]:
+    today = now.date()
+    rows = []
+    for i in range(plan.tasks):
+        project = projects[rng.randrange(len(projects))]
+        member = rng.randrange(plan.team)
+        status = rng.choice(_TASK_STATUSES)
+        due = today + timedelta(days=rng.randint(-45, 60))
+        created = now - timedelta(days=rng.randint(1, 200))
+        rows.append(
+            {
+                "id": f"task-{i:06d}",
+                "source": "asana",
+                "source_id": f"asana-t-{i}",
+                "title": f"{_phrase(rng)} #{i}",
+                "status": status,
+                "priority": rng.randint(10, 95),
+                "project_id": project["id"],
+                "brand_id": project["brand_id"],
+                "client_id": project["client_id"],
+                "project_link_status": "linked",
+                "client_link_status": "linked",
+                "assignee_id": f"person-team-{member:04d}",
+                "assignee": f"Team Member {member}",
+                "assignee_name": f"Team Member {member}",
+                "lane": rng.choice(_LANES),
+                "due_date": due.isoformat() if rng.random() < 0.85 else None,
+                "duration_min": rng.choice([30, 60, 90, 120, 240]),
+                "project": project["name"],
+                "completed_at": _iso(created + timedelta(days=rng.randint(0, 30)))
+                if status in ("completed", "done")
+                else None,
+                "last_activity_at": _iso(now - timedelta(days=rng.randint(0, 40))),
+                "created_at": _iso(created),
+                "updated_at": _iso(now - timedelta(days=rng.randint(0, 30))),
+            }
+        )
+    return rows
+
+
+def _communications(
+    rng: random.Random, plan: Plan, clients: list[dict], now: datetime
+) -> list[dict]:
+    rows = []
+    for i in range(plan.communications):
+        client = clients[rng.randrange(len(clients))]
+        received = now - timedelta(hours=rng.randint(0, 24 * 120))
+        subject = f"Re: {_phrase(rng)} for {client['name']}"
+        rows.append(
+            {
+                "id": f"comm-{i:06d}",
+                "source": "gmail",
+                "source_id": f"gmail-{i}",
+                "thread_id": f"thread-{i // 3:06d}",
+                "from_email": f"contact{i % plan.contacts}@{client['id']}.example.com",
+                "from_domain": f"{client['id']}.example.com",
+                "to_emails": f"member{i % plan.team}@agency.example.com",
+                "subject": subject,
+                "snippet": f"{_phrase(rng, 8)}. Can you send the update by Friday?",
+                "body_text": f"Hi team, {_phrase(rng, 12)}. We will deliver the {_phrase(rng, 2)} next week.",
+                "received_at": _iso(received),
+                "client_id": client["id"],
+                "link_status": "linked",
+                "priority": rng.randint(10, 95),
+                "requires_response": int(rng.random() < 0.3),
+                "sentiment": rng.choice(["positive", "neutral", "neutral", "negative"]),
+                "is_read": int(rng.random() < 0.7),
+                "labels": json.dumps(["INBOX", "IMPORTANT"] if rng.random() < 0.2 else ["INBOX"]),
+                "created_at": _iso(received),
+                "updated_at": _iso(received),
+            }
+        )
+    return rows
+
+
+def _artifacts_and_links(communications: list[dict]) -> tuple[list[dict], list[dict]]:
+    artifacts = []
+    links = []
+    for comm in communications:
+        artifact_id = f"art-{comm['id']}"
+        artifacts.append(
+            {
+                "artifact_id": artifact_id,
+                "type": "message",
+                "source": "gmail",
+                "occurred_at": comm["received_at"],
+            }
+        )
+        links.append(
+            {
+                "link_id": f"link-{comm['id']}",
+                "from_artifact_id": artifact_id,
+                "to_entity_type": "client",
+                "to_entity_id": comm["client_id"],
+                "method": "domain",
+                "confidence": 0.9,
+                "status": "confirmed",
+            }
+        )
+    return artifacts, links
+
+
+def _invoices(rng: random.Random, plan: Plan, projects: list[dict], today: date) -> list[dict]:
+    rows = []
+    for i in range(plan.invoices):
+        project = projects[rng.randrange(len(projects))]
+        issued = today - timedelta(days=rng.randint(0, 365))
+        due = issued + timedelta(days=30)
+        status = rng.choice(_INVOICE_STATUSES)
+        if status == "sent" and due < today:
+            status = "overdue"
+        paid = (
+            (issued + timedelta(days=rng.randint(5, 75))).isoformat() if status == "paid" else None
+        )
+        amount = round(rng.uniform(500, 60_000), 2)
+        days_late = (today - due).days
+        aging = (
+            None
+            if status == "paid" or days_late <= 0
+            else "1-30"
+            if days_late <= 30
+            else "31-60"
+            if days_late <= 60
+            else "61-90"
+            if days_late <= 90
+            else "90+"
+        )
+        rows.append(
+            {
+                "id": f"inv-{i:06d}",
+                "source": "xero",
+                "source_id": f"xero-{i}",
+                "external_id": f"INV-{i:06d}",
+                "client_id": project["client_id"],
+                "brand_id": project["brand_id"],
+                "project_id": project["id"],
+                "amount": amount,
+                "total": amount,
+                "amount_due": 0.0 if status == "paid" else amount,
+                "currency": "AED",
+                "issue_date": issued.isoformat(),
+                "due_date": due.isoformat(),
+                "paid_date": paid,
+                "payment_date": paid,
+                "status": status,
+                "aging_bucket": aging,
+            }
+        )
+    return rows
+
+
+def _events(rng: random.Random, plan: Plan, now: datetime) -> list[dict]:
+    rows = []
+    for i in range(plan.events):
+        start = (now + timedelta(hours=rng.randint(-24 * 30, 24 * 30))).replace(minute=0, second=0)
+        end = start + timedelta(minutes=rng.choice([30, 60, 90]))
+        attendees = rng.randint(2, 8)
+        rows.append(
+            {
+                "id": f"event-{i:06d}",
+                "source": "calendar",
+                "source_id": f"gcal-{i}",
+                "title": f"{_phrase(rng, 3)} sync",
+                "start_time": _iso(start),
+                "end_time": _iso(end),
+                "start_at": _iso(start),
+                "end_at": _iso(end),
+                "status": "confirmed",
+                "organizer_email": f"member{i % plan.team}@agency.example.com",
+                "attendee_count": attendees,
+                "accepted_count": attendees - 1,
+                "created_at": _iso(start - timedelta(days=7)),
+                "updated_at": _iso(start - timedelta(days=1)),
+            }
+        )
+    return rows
+
+
+def _commitments(
+    rng: random.Random, plan: Plan, communications: list[dict], today: date
+) -> list[dict]:
+    rows = []
+    for i in range(plan.commitments):
+        comm = communications[rng.randrange(len(communications))]
+        rows.append(
+            {
+                "id": f"commit-{i:06d}",
+                "source_type": "communication",
+                "source_id": comm["id"],
+                "text": f"We will deliver the {_phrase(rng, 2)} by next week",
+                "type": rng.choice(["promise", "request"]),
+                "confidence": round(rng.uniform(0.5, 0.99), 2),
+                "deadline": (today + timedelta(days=rng.randint(-20, 30))).isoformat(),
+                "client_id": comm["client_id"],
+                "status": rng.choice(["open", "open", "fulfilled", "broken"]),
+            }
+        )
+    return rows
+
+
+def generate(db_path: str | Path, scale: int, seed: int = DEFAULT_SEED) -> dict:
+    """Create a fresh database at *db_path* holding a synthetic dataset of *scale*.
+
+    Returns {table: rows_inserted} plus the plan used.
+    """
+    plan = Plan.for_scale(scale)
+    rng = random.Random(seed)  # noqa: S311 — deterministic benchmark data
+    now = datetime.now(timezone.utc)
+    today = now.date()
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        schema_engine.create_fresh(conn)
+        # Maintenance mode allows writes without a write_context (as in fixture_db).
+        conn.execute("INSERT OR IGNORE INTO maintenance_mode_v1 (id, flag) VALUES (1, 1)")
+
+        clients = _clients(rng, plan, now)
+        projects = _projects(rng, plan, clients, today)
+        communications = _communications(rng, plan, clients, now)
+        artifacts, links = _artifacts_and_links(communications)
+
+        counts = {}
+        with conn:
+            counts["clients"] = _insert(conn, "clients", clients)
+            counts["brands"] = _insert(conn, "brands", _brands(clients))
+            counts["client_identities"] = _insert(
+                conn, "client_identities", _client_identities(clients)
+            )
+            counts["projects"] = _insert(conn, "projects", projects)
+            counts["people"] = _insert(conn, "people", _people(rng, plan, clients, now))
+            counts["team_members"] = _insert(conn, "team_members", _team_members(plan))
+            counts["tasks"] = _insert(conn, "tasks", _tasks(rng, plan, projects, now))
+            counts["communications"] = _insert(conn, "communications", communications)
+            counts["artifacts"] = _insert(conn, "artifacts", artifacts)
+            counts["entity_links"] = _insert(conn, "entity_links", links)
+            counts["invoices"] = _insert(conn, "invoices", _invoices(rng, plan, projects, today))
+            counts["events"] = _insert(conn, "events", _events(rng, plan, now))
+            counts["commitments"] = _insert(
+                conn, "commitments", _commitments(rng, plan, communications, today)
+            )
+            # Filled at ingest on a live database
+            counts["communication_client_attribution"] = sync_attribution(conn, full=True)[
+                "attributed"
+            ]
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+    return {"scale": scale, "seed": seed, "plan": plan.to_dict(), "rows": counts}
+
+
+def parse_scale(value: str) -> int:
+    """'10k' / '10000' -> 10000."""
+    if value in SCALES:
+        return SCALES[value]
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"scale must be one of {', '.join(SCALES)} or an integer"
+        ) from None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic benchmark database")
+    parser.add_argument("--scale", type=parse_scale, default=SCALES["1k"])
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--out", type=Path, required=True, help="Database file to create")
+    args = parser.parse_args()
+
+    if args.out.exists():
+        args.out.unlink()
+    result = generate(args.out, args.scale, seed=args.seed)
+    for table, count in result["rows"].items():
+        print(f"{table:>20}: {count:,}")
+    print(f"✅ Wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
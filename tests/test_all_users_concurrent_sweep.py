@@ -0,0 +1,171 @@
+"""Concurrent all-users sweep: users and services run on a bounded pool, cursor
+and blocklist state is loaded once, and all state writes land in one flush."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from lib.collectors import all_users_runner as runner
+
+USERS = ["a@x.co", "b@x.co", "c@x.co", "d@x.co"]
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    path = tmp_path / "sweep.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE people (email TEXT, type TEXT)")
+    conn.executemany("INSERT INTO people VALUES (?, 'internal')", [(u,) for u in USERS])
+    conn.commit()
+    conn.close()
+    runner.ensure_tables(path)
+    monkeypatch.setattr(runner.paths, "db_path", lambda: path)
+    return path
+
+
+def _rows(db, sql):
+    conn = sqlite3.connect(str(db))
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def fake_collectors(monkeypatch):
+    """Replace the per-service collectors with fakes that use the shared state."""
+    calls = []
+    lock = threading.Lock()
+
+    def fake(service, count):
+        def collect(user, since, until, limit, db_path, state=None):
+            with lock:
+                calls.append((service, user, state))
+            if user == "c@x.co" and service == "gmail":
+                state.add_to_blocklist(user, "invalid_grant", "bad subject")
+                return {
+                    "ok": False,
+                    "count": 0,
+                    "error": "invalid_grant",
+                    "is_invalid_subject": True,
+                }
+            state.set_cursor(service, user, "last_until", until)
+            result = {"ok": True, "count": count, "error": None}
+            if service == "drive":
+                result["doc_ids"] = [f"doc-{user}"]
+            return result
+
+        return collect
+
+    def fake_docs(user, doc_ids, limit, db_path, state=None):
+        with lock:
+            calls.append(("docs", user, state))
+        return {"ok": True, "count": len(doc_ids), "error": None}
+
+    monkeypatch.setattr(runner, "collect_gmail_for_user", fake("gmail", 3))
+    monkeypatch.setattr(runner, "collect_calendar_for_user", fake("calendar", 2))
+    monkeypatch.setattr(runner, "collect_chat_for_user", fake("chat", 1))
+    monkeypatch.setattr(runner, "collect_drive_for_user", fake("drive", 5))
+    monkeypatch.setattr(runner, "collect_docs_for_user", fake_docs)
+    return calls
+
+
+class TestSweepState:
+    def test_load_reads_cursors_and_blocklist_once(self, db):
+        runner.set_cursor(db, "gmail", "a@x.co", "last_until", "2026-01-01")
+        runner.add_to_blocklist(db, "b@x.co", "invalid_grant")
+
+        state = runner.SweepState.load(db)
+
+        assert state.get_cursor("gmail", "a@x.co", "last_until") == "2026-01-01"
+        assert state.get_cursor("gmail", "b@x.co", "last_until") is None
+        assert state.blocklist_reason("b@x.co") == "invalid_grant"
+        assert state.blocklist_reason("a@x.co") is None
+
+    def test_buffered_writes_wait_for_flush(self, db):
+        state = runner.SweepState.load(db)
+        state.set_cursor("chat", "a@x.co", "last_until", "2026-02-01")
+        state.add_to_blocklist("d@x.co", "invalid_grant", "detail")
+
+        assert state.get_cursor("chat", "a@x.co", "last_until") == "2026-02-01"
+        assert _rows(db, "SELECT * FROM sync_cursor") == []
+
+        assert state.flush() == 2
+        assert runner.get_cursor(db, "chat", "a@x.co", "last_until") == "2026-02-01"
+        assert runner.is_blocklisted(db, "d@x.co") == (True, "invalid_grant")
+        assert state.flush() == 0
+
+    def test_unbuffered_state_writes_through(self, db):
+        state = runner.SweepState(db)
+        state.set_cursor("drive", "a@x.co", "last_until", "2026-03-01")
+        assert runner.get_cursor(db, "drive", "a@x.co", "last_until") == "2026-03-01"
+
+
+class TestConcurrentSweep:
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_report_is_independent_of_worker_count(self, db, fake_collectors, workers):
+        runner.add_to_blocklist(db, "d@x.co", "invalid_grant")
+
+        report = runner._run_all_users_locked(
+            since="2026-01-01", until="2026-01-31", workers=workers
+        )
+
+        assert list(report["per_user"]) == USERS
+        assert report["per_user"]["a@x.co"]["status"] == "succeeded"
+        assert report["per_user"]["c@x.co"]["status"] == "invalid_subject"
+        assert report["per_user"]["d@x.co"]["status"] == "skipped"
+        totals = report["totals"]
+        assert totals["attempted_count"] == 3
+        assert totals["gmail_count"] == 6  # c@x.co failed
+        assert totals["drive_file_count"] == 15
+        assert totals["docs_extracted_count"] == 3
+        assert totals["blocklist_total"] == 2
+
+    def test_every_service_shares_one_buffered_state(self, db, fake_collectors):
+        runner._run_all_users_locked(since="2026-01-01", until="2026-01-31", workers=4)
+
+        states = {id(state) for _, _, state in fake_collectors}
+        assert len(states) == 1
+        assert fake_collectors[0][2].buffered
+        # Docs ran only after (and because of) each user's drive result.
+        assert sorted(u for s, u, _ in fake_collectors if s == "docs") == USERS
+
+    def test_cursor_writes_are_flushed_at_end(self, db, fake_collectors):
+        runner._run_all_users_locked(
+            since="2026-01-01", until="2026-01-31", services=["gmail", "chat"], workers=4
+        )
+
+        cursors = _rows(db, "SELECT service, subject FROM sync_cursor ORDER BY 1, 2")
+        expected = [("chat", u) for u in USERS] + [("gmail", u) for u in USERS if u != "c@x.co"]
+        assert cursors == expected
+        assert runner.is_blocklisted(db, "c@x.co")[0]
+
+    def test_service_slots_bound_concurrency(self, db, monkeypatch):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_gmail(user, since, until, limit, db_path, state=None):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return {"ok": True, "count": 0, "error": None}
+
+        monkeypatch.setattr(runner, "collect_gmail_for_user", slow_gmail)
+        monkeypatch.setattr(
+            runner,
+            "SERVICE_BUDGETS",
+            {"gmail": runner.SourceBudget(max_concurrency=2)},
+        )
+
+        runner._run_all_users_locked(
+            since="2026-01-01", until="2026-01-31", services=["gmail"], workers=4
+        )
+
+        assert peak == 2
@@ -0,0 +1,227 @@
+"""
+Tests for online backups and incremental WAL archiving.
+
+Runs against a real WAL-mode SQLite database:
+- create_backup uses the backup API and writes a compressed artifact
+- archive_wal appends committed frames to the active chain
+- restore_backup(until=...) replays the chain to an archived point
+- a WAL reset the archiver did not seal starts a new chain
+- with default pragmas, writes through the StateStore or lib.db connections
+  never reset the WAL behind the archiver, and rebase backups do not count
+  towards pruning
+"""
+
+import sqlite3
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from lib import backup
+from lib.db import get_connection
+from lib.state_store import StateStore
+
+
+@pytest.fixture
+def live_db(tmp_path, monkeypatch):
+    db = tmp_path / "data" / "live.db"
+    db.parent.mkdir()
+    monkeypatch.setenv("MOH_TIME_OS_DB", str(db))
+    conn = sqlite3.connect(str(db), isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA wal_autocheckpoint=0")
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    yield conn
+    conn.close()
+
+
+def _insert(conn, values):
+    for v in values:
+        conn.execute("INSERT INTO t VALUES (?)", (v,))
+
+
+def _rows():
+    conn = sqlite3.connect(str(backup.paths.db_path()))
+    try:
+        return [r[0] for r in conn.execute("SELECT x FROM t ORDER BY x")]
+    finally:
+        conn.close()
+
+
+def _tick():
+    """A timestamp strictly between two archive runs."""
+    time.sleep(0.01)
+    moment = datetime.now(timezone.utc)
+    time.sleep(0.01)
+    return moment
+
+
+def test_create_backup_is_compressed_and_starts_chain(live_db):
+    _insert(live_db, range(10))
+
+    path = backup.create_backup(label="test")
+
+    assert path.name.endswith("_test.db.gz")
+    manifest = backup._load_manifest(backup._chain_dir(path))
+    assert manifest["backup"] == path.name
+    assert manifest["segments"] == []
+    assert not manifest["broken"]
+
+
+def test_backups_in_the_same_second_get_distinct_names(live_db):
+    first = backup.create_backup()
+    second = backup.create_backup()
+
+    assert first != second
+    assert first.exists() and second.exists()
+
+
+def test_point_in_time_restore_replays_archived_segments(live_db):
+    _insert(live_db, range(5))
+    base = backup.create_backup()
+    _insert(live_db, range(5, 10))
+    assert backup.archive_wal()["status"] == "archived"
+    after_first = _tick()
+    live_db.execute("DELETE FROM t WHERE x < 3")
+    assert backup.archive_wal()["status"] == "archived"
+    assert backup.archive_wal()["status"] == "idle"
+    live_db.execute("DELETE FROM t")
+
+    assert backup.restore_backup(base, create_safety_backup=False, until=after_first)
+    assert _rows() == list(range(10))
+
+    assert backup.restore_backup(base, create_safety_backup=False, until=datetime.now(timezone.utc))
+    assert _rows() == list(range(3, 10))
+
+    assert backup.restore_backup(base, create_safety_backup=False)
+    assert _rows() == list(range(5))
+
+
+def test_chain_continues_across_sealed_wal_resets(live_db):
+    base = backup.create_backup()
+    for batch in range(3):
+        _insert(live_db, range(batch * 10, batch * 10 + 10))
+        assert backup.archive_wal()["status"] == "archived"
+
+    manifest = backup._load_manifest(backup._chain_dir(base))
+    generations = {s["generation"][0] for s in manifest["segments"]}
+    assert len(generations) == 3  # each archive sealed its generation
+
+    live_db.execute("DELETE FROM t")
+    assert backup.restore_backup(base, create_safety_backup=False, until=datetime.now(timezone.utc))
+    assert _rows() == list(range(30))
+
+
+def test_unsealed_wal_reset_starts_new_chain(live_db):
+    base = backup.create_backup()
+    _insert(live_db, [1])
+    backup.archive_wal()
+    _insert(live_db, [2])
+    live_db.execute("PRAGMA wal_checkpoint(TRUNCATE)")  # frame 2 never archived
+    _insert(live_db, [3])
+
+    result = backup.archive_wal()
+
+    assert result["status"] == "rebased"
+    assert backup._load_manifest(backup._chain_dir(base))["broken"]
+    assert backup.get_latest_backup() == result["backup"]
+
+
+def test_restore_until_before_backup_fails(live_db):
+    base = backup.create_backup()
+
+    assert not backup.restore_backup(
+        base, create_safety_backup=False, until=datetime(2000, 1, 1, tzinfo=timezone.utc)
+    )
+
+
+def test_prune_removes_wal_chains(live_db):
+    old = backup.create_backup()
+    _insert(live_db, [1])
+    backup.archive_wal()
+    backup.create_backup()
+
+    assert backup.prune_backups(keep=1) == 1
+    assert not old.exists()
+    assert not backup._chain_dir(old).exists()
+
+
+@pytest.fixture
+def pooled_store(tmp_path, monkeypatch):
+    """A StateStore on a WAL database opened with SQLite's default pragmas."""
+    db = tmp_path / "data" / "pooled.db"
+    db.parent.mkdir()
+    monkeypatch.setenv("MOH_TIME_OS_DB", str(db))
+    conn = sqlite3.connect(str(db))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.close()
+    StateStore._instance = None
+    store = StateStore(str(db))
+    yield store
+    store.close_connections()
+    StateStore._instance = None
+
+
+def test_archiver_owns_checkpoints_with_default_pragmas(pooled_store):
+    base = backup.create_backup()
+    for batch in range(3):
+        for v in range(batch * 1000, batch * 1000 + 1000):
+            pooled_store.execute_write("INSERT INTO t VALUES (?)", [v])
+        result = backup.archive_wal()
+        # Well past SQLite's default 1000-page auto-checkpoint each time
+        assert result["status"] == "archived"
+        assert result["frames"] >= 1000
+
+    assert backup.get_latest_backup() == base
+    pooled_store.execute_write("DELETE FROM t")
+    assert backup.restore_backup(base, create_safety_backup=False, until=datetime.now(timezone.utc))
+    assert _rows() == list(range(3000))
+
+
+def test_archiver_owns_checkpoints_for_direct_connections(pooled_store):
+    pooled_store.query("SELECT 1")  # the pool keeps the WAL open, as in the daemon
+    base = backup.create_backup()
+    for batch in range(3):
+        # One connection per commit, like the modules that open their own
+        for v in range(batch * 1000, batch * 1000 + 1000):
+            with get_connection() as conn:
+                conn.execute("INSERT INTO t VALUES (?)", (v,))
+        result = backup.archive_wal()
+        assert result["status"] == "archived"
+        assert result["frames"] >= 1000
+
+    assert backup.get_latest_backup() == base
+    assert backup.restore_backup(base, create_safety_backup=False, until=datetime.now(timezone.utc))
+    assert _rows() == list(range(3000))
+
+
+def test_prune_does_not_count_rebases(live_db):
+    first = backup.create_backup(label="daily")
+    time.sleep(0.01)
+    old_rebase = backup.create_backup(label=backup.REBASE_LABEL)
+    time.sleep(0.01)
+    second = backup.create_backup(label="daily")
+    time.sleep(0.01)
+    rebases = [backup.create_backup(label=backup.REBASE_LABEL) for _ in range(3)]
+
+    assert backup.prune_backups(keep=1) == 2
+
+    assert not first.exists() and not old_rebase.exists()
+    assert second.exists()
+    assert all(r.exists() for r in rebases)
+
+
+def test_reset_after_backup_without_wal_starts_new_chain(pooled_store):
+    pooled_store.close_connections()  # the last close removes the WAL
+    assert not backup._wal_path().exists()
+    base = backup.create_backup()
+    conn = sqlite3.connect(str(backup.paths.db_path()), isolation_level=None)
+    # Default auto-checkpoint: the WAL is reset with frames never archived
+    _insert(conn, range(3000))
+
+    result = backup.archive_wal()
+    conn.close()
+
+    assert result["status"] == "rebased"
+    assert backup._load_manifest(backup._chain_dir(base))["broken"]
@@ -0,0 +1,145 @@
+"""Tests for the system benchmark tooling.
+
+scripts/benchmark_data.py builds a deterministic synthetic database against the
+canonical schema; scripts/benchmark.py compares run medians to a saved
+baseline using each benchmark's own regression threshold.
+"""
+
+import argparse
+import json
+import sqlite3
+
+import pytest
+
+from scripts import benchmark_data
+from scripts.benchmark import (
+    BenchmarkResult,
+    benchmark,
+    compare_results,
+    save_results,
+    system_iterations,
+    system_warmup,
+)
+
+
+def _result(name, median_ms, threshold_pct=25.0, error=None):
+    return BenchmarkResult(
+        name=name,
+        iterations=3,
+        mean_ms=median_ms,
+        median_ms=median_ms,
+        min_ms=median_ms,
+        max_ms=median_ms,
+        stddev_ms=0.0,
+        budget_ms=None,
+        passed=error is None,
+        threshold_pct=threshold_pct,
+        error=error,
+    )
+
+
+class TestBenchmarkData:
+    def test_generates_planned_row_counts(self, tmp_path):
+        db = tmp_path / "bench.db"
+        generated = benchmark_data.generate(db, 200)
+        plan = benchmark_data.Plan.for_scale(200)
+
+        conn = sqlite3.connect(str(db))
+        try:
+            for table, expected in (
+                ("tasks", plan.tasks),
+                ("communications", plan.communications),
+                ("invoices", plan.invoices),
+                ("clients", plan.clients),
+                ("projects", plan.projects),
+            ):
+                assert conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == expected  # noqa: S608
+                assert generated["rows"][table] == expected
+        finally:
+            conn.close()
+
+    def test_same_seed_gives_same_data(self, tmp_path):
+        def snapshot(path):
+            benchmark_data.generate(path, 100, seed=7)
+            conn = sqlite3.connect(str(path))
+            try:
+                return conn.execute("SELECT id, title, status FROM tasks ORDER BY id").fetchall()
+            finally:
+                conn.close()
+
+        assert snapshot(tmp_path / "a.db") == snapshot(tmp_path / "b.db")
+
+    def test_fills_communication_attribution(self, tmp_path):
+        generated = benchmark_data.generate(tmp_path / "bench.db", 200)
+
+        assert generated["rows"]["communication_client_attribution"] > 0
+
+    def test_rejects_columns_missing_from_schema(self, tmp_path):
+        conn = sqlite3.connect(":memory:")
+        with pytest.raises(ValueError, match="not in lib/schema.py"):
+            benchmark_data._insert(conn, "tasks", [{"id": "t1", "no_such_column": 1}])
+
+    def test_parse_scale(self):
+        assert benchmark_data.parse_scale("10k") == 10_000
+        assert benchmark_data.parse_scale("2500") == 2_500
+        with pytest.raises(argparse.ArgumentTypeError):
+            benchmark_data.parse_scale("huge")
+
+
+class TestRegressionCheck:
+    def test_setup_runs_untimed_before_each_call(self):
+        calls = []
+        benchmark(
+            "x",
+            lambda: calls.append("run"),
+            iterations=2,
+            warmup=1,
+            setup=lambda: calls.append("setup"),
+        )
+        assert calls == ["setup", "run"] * 3
+
+    def test_large_scales_are_timed_once_without_warmup(self):
+        assert (system_iterations(10_000), system_warmup(10_000)) == (3, 1)
+        assert (system_iterations(100_000), system_warmup(100_000)) == (1, 0)
+
+    def test_uses_per_benchmark_threshold_from_baseline(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        save_results(
+            [_result("slow.path", 100.0, threshold_pct=25.0), _result("tight.path", 100.0, 5.0)],
+            baseline,
+            scale=1_000,
+        )
+        assert json.loads(baseline.read_text())["scale"] == 1_000
+
+        regressions = compare_results(
+            [_result("slow.path", 120.0), _result("tight.path", 110.0)], baseline
+        )
+
+        assert regressions == ["tight.path"]
+
+    def test_new_benchmarks_and_baseline_failures_are_not_compared(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        save_results([_result("a", 10.0), _result("b", 0.0, error="boom")], baseline)
+
+        current = [_result("a", 10.0), _result("b", 50.0), _result("c", 99.0)]
+
+        assert compare_results(current, baseline) == []
+
+    def test_failed_benchmark_is_a_regression(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        save_results([_result("a", 10.0), _result("b", 10.0)], baseline)
+
+        current = [_result("a", 0.0, error="broke"), _result("b", 10.0)]
+
+        assert compare_results(current, baseline) == ["a"]
+
+    def test_missing_benchmark_is_a_regression_unless_deselected(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        save_results([_result("api.a", 10.0), _result("loop.b", 10.0)], baseline)
+        current = [_result("api.a", 10.0)]
+
+        assert compare_results(current, baseline) == ["loop.b"]
+        assert compare_results(current, baseline, lambda name: name.startswith("api.")) == []
+
+    def test_missing_baseline_reports_nothing(self, tmp_path):
+        assert compare_results([_result("a", 1.0)], tmp_path / "missing.json") == []
@@ -0,0 +1,153 @@
+"""Tests for the batch block allocator behind Scheduler.schedule_unscheduled.
+
+Free blocks for the horizon are loaded once, tasks are placed in priority
+order (first-fit by start time, falling back to the largest block), and all
+assignments are committed in one guarded transaction.
+"""
+
+import sqlite3
+
+import pytest
+
+from lib import schema_engine
+from lib.state_store import StateStore
+from lib.time_truth import BlockAllocator, Scheduler
+from lib.time_truth.allocator import BEST_FIT, LaneBlocks
+from lib.time_truth.block_manager import TimeBlock
+
+DAY1 = "2026-03-02"
+DAY2 = "2026-03-03"
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "sched.db"
+    conn = sqlite3.connect(str(path))
+    schema_engine.create_fresh(conn)
+    conn.close()
+    StateStore._instance = None
+    s = StateStore(str(path))
+    yield s
+    s.close_connections()
+    StateStore._instance = None
+
+
+def _block(store, block_id, day, start, end, lane="ops", protected=False):
+    store.insert(
+        "time_blocks",
+        {
+            "id": block_id,
+            "date": day,
+            "start_time": start,
+            "end_time": end,
+            "lane": lane,
+            "is_protected": 1 if protected else 0,
+        },
+    )
+
+
+def _task(store, task_id, priority=50, duration=60, lane="ops"):
+    store.insert(
+        "tasks",
+        {
+            "id": task_id,
+            "title": task_id,
+            "status": "pending",
+            "priority": priority,
+            "duration_min": duration,
+            "lane": lane,
+        },
+    )
+
+
+def _assigned(store):
+    rows = store.query("SELECT id, task_id FROM time_blocks WHERE task_id IS NOT NULL")
+    return {row["task_id"]: row["id"] for row in rows}
+
+
+def test_lane_blocks_lookups():
+    blocks = LaneBlocks(
+        [
+            TimeBlock("c", DAY1, "13:00", "15:00", "ops"),
+            TimeBlock("a", DAY1, "09:00", "09:30", "ops"),
+            TimeBlock("b", DAY1, "10:00", "11:00", "ops"),
+        ]
+    )
+
+    assert blocks.blocks[blocks.first_fit(45)].id == "b"
+    assert blocks.blocks[blocks.best_fit(90)].id == "c"
+    assert blocks.first_fit(180) is None
+    assert blocks.blocks[blocks.largest()].id == "c"
+
+    blocks.take(blocks.first_fit(45))
+
+    assert blocks.blocks[blocks.first_fit(45)].id == "c"
+    assert len(blocks) == 2
+
+
+def test_schedules_backlog_in_priority_order(store):
+    _block(store, "b1", DAY1, "09:00", "10:00")
+    _block(store, "b2", DAY1, "10:00", "12:00")
+    _block(store, "meeting", DAY1, "12:00", "13:00", protected=True)
+    _task(store, "low", priority=10, duration=60)
+    _task(store, "high", priority=90, duration=90)
+    _task(store, "mid", priority=50, duration=30)
+
+    results = Scheduler(store).schedule_unscheduled(DAY1)
+
+    assert [r.task_id for r in results] == ["high", "mid", "low"]
+    assert [r.success for r in results] == [True, True, False]
+    assert results[2].message == "No available blocks in lane 'ops'"
+    assert _assigned(store) == {"high": "b2", "mid": "b1"}
+    assert store.get("tasks", "high")["scheduled_block_id"] == "b2"
+
+
+def test_falls_back_to_largest_block(store):
+    _block(store, "short", DAY1, "09:00", "09:30")
+    _block(store, "longer", DAY1, "10:00", "11:00")
+    _task(store, "big", duration=240)
+
+    results = Scheduler(store).schedule_unscheduled(DAY1)
+
+    assert results[0].block_id == "longer"
+
+
+def test_multi_day_horizon_spills_to_next_day(store):
+    _block(store, "d1", DAY1, "09:00", "10:00")
+    _block(store, "d2", DAY2, "09:00", "10:00")
+    _block(store, "d2_creative", DAY2, "10:00", "11:00", lane="creative")
+    _task(store, "t1", priority=90)
+    _task(store, "t2", priority=80)
+    _task(store, "t3", priority=70, lane="creative")
+
+    results = Scheduler(store).schedule_unscheduled(DAY1, days=2)
+
+    assert all(r.success for r in results)
+    assert _assigned(store) == {"t1": "d1", "t2": "d2", "t3": "d2_creative"}
+
+
+def test_best_fit_prefers_tightest_block(store):
+    _block(store, "wide", DAY1, "09:00", "12:00")
+    _block(store, "tight", DAY1, "13:00", "14:00")
+    _task(store, "t1", duration=60)
+
+    results = Scheduler(store).schedule_unscheduled(DAY1, strategy=BEST_FIT)
+
+    assert results[0].block_id == "tight"
+
+
+def test_commit_skips_blocks_claimed_since_load(store):
+    _block(store, "b1", DAY1, "09:00", "10:00")
+    _task(store, "mine")
+    _task(store, "theirs")
+
+    allocator = BlockAllocator(store)
+    allocator.load([DAY1])
+    allocation = allocator.allocate("mine", "ops", 60)
+    store.execute_write("UPDATE time_blocks SET task_id = 'theirs' WHERE id = 'b1'")
+
+    allocator.commit()
+
+    assert not allocation.committed
+    assert allocation.message == "Block b1 is no longer available"
+    assert not store.get("tasks", "mine")["scheduled_block_id"]
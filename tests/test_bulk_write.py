@@ -0,0 +1,170 @@
+"""Tests for the StateStore bulk write path (lib/bulk_write.py).
+
+insert_many / replace_source_rows / replace_all_rows now run through one
+executemany-based engine. These tests pin JSON encoding, chunking inside a
+single transaction, atomic rollback, and the only_changed content-hash mode.
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from lib import bulk_write
+from lib.state_store import StateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    StateStore._instance = None
+    s = StateStore(str(tmp_path / "bulk.db"))
+    s.execute_write(
+        "CREATE TABLE t (id TEXT PRIMARY KEY, source TEXT, amount REAL NOT NULL, "
+        "meta TEXT, note TEXT, updated_at TEXT)"
+    )
+    yield s
+    s.close_connections()
+    StateStore._instance = None
+
+
+def _rows(n, source="xero", amount=1.0, updated_at="t0"):
+    return [
+        {
+            "id": f"r{i}",
+            "source": source,
+            "amount": amount,
+            "meta": {"i": i},
+            "updated_at": updated_at,
+        }
+        for i in range(n)
+    ]
+
+
+class TestPrepareRows:
+    def test_json_encodes_only_dict_and_list_columns(self):
+        rows = [{"id": "a", "meta": {"k": 1}, "tags": None}, {"id": "b", "meta": None, "tags": [1]}]
+        prepared = bulk_write.prepare_rows(["id", "meta", "tags"], rows)
+        assert prepared == [("a", '{"k": 1}', None), ("b", None, "[1]")]
+
+    def test_uses_column_names_not_dict_order(self):
+        rows = [{"id": "a", "amount": 1}, {"amount": 2, "id": "b"}]
+        assert bulk_write.prepare_rows(["id", "amount"], rows) == [("a", 1), ("b", 2)]
+
+    def test_missing_column_raises_value_error(self):
+        with pytest.raises(ValueError, match="missing column"):
+            bulk_write.prepare_rows(["id", "amount"], [{"id": "a"}])
+
+    def test_content_hash_ignores_affinity_round_trip(self):
+        assert bulk_write.content_hash([1, True, "x"]) == bulk_write.content_hash([1.0, 1, "x"])
+        assert bulk_write.content_hash([None]) != bulk_write.content_hash([""])
+
+
+class TestInsertMany:
+    def test_chunks_share_one_transaction(self, store):
+        result = store.bulk_write("t", _rows(25), chunk_size=10)
+        assert result.chunks == 3
+        assert result.written == 25
+        assert store.count("t") == 25
+        assert json.loads(store.get("t", "r3")["meta"]) == {"i": 3}
+
+    def test_failure_in_later_chunk_rolls_back_all(self, store):
+        rows = _rows(25)
+        rows[22]["amount"] = None  # violates NOT NULL in the third chunk
+        with pytest.raises(sqlite3.IntegrityError):
+            store.insert_many("t", rows, chunk_size=10)
+        assert store.count("t") == 0
+
+    def test_only_changed_skips_identical_rows(self, store):
+        store.insert_many("t", _rows(10))
+        rows = _rows(10, updated_at="t1")
+        rows[4]["amount"] = 9.0
+
+        result = store.bulk_write("t", rows, only_changed=True, ignore_columns=("updated_at",))
+
+        assert (result.written, result.unchanged) == (1, 9)
+        assert store.get("t", "r4")["amount"] == 9.0
+        assert store.get("t", "r4")["updated_at"] == "t1"
+        assert store.get("t", "r0")["updated_at"] == "t0"
+
+    def test_only_changed_requires_key_column(self, store):
+        with pytest.raises(ValueError, match="key column"):
+            store.insert_many("t", [{"source": "x", "amount": 1.0}], only_changed=True)
+
+
+class TestReplace:
+    def test_replace_source_rows_only_changed_matches_full_replace(self, store):
+        store.insert_many("t", _rows(5))
+        store.insert("t", {"id": "other", "source": "asana", "amount": 2.0})
+        new_rows = _rows(3)  # r3, r4 disappeared upstream
+        new_rows[0]["amount"] = 5.0
+
+        inserted = store.replace_source_rows("t", "source", "xero", new_rows, only_changed=True)
+
+        assert inserted == 3
+        ids = {r["id"] for r in store.query("SELECT id FROM t")}
+        assert ids == {"r0", "r1", "r2", "other"}
+        assert store.get("t", "r0")["amount"] == 5.0
+
+    def test_unchanged_resync_writes_nothing(self, store):
+        store.replace_source_rows("t", "source", "xero", _rows(50))
+        result = store.bulk_write(
+            "t",
+            _rows(50, updated_at="t9"),
+            only_changed=True,
+            ignore_columns=("updated_at",),
+            scope_where="source = ?",
+            scope_params=["xero"],
+        )
+        assert (result.written, result.deleted, result.unchanged) == (0, 0, 50)
+
+    def test_replace_all_rows_only_changed_is_atomic(self, store):
+        store.insert_many("t", _rows(5))
+        bad = _rows(5)
+        bad[1]["amount"] = 3.0
+        bad[2]["amount"] = None
+        with pytest.raises(sqlite3.IntegrityError):
+            store.replace_all_rows("t", bad, only_changed=True)
+        assert store.count("t") == 5
+        assert store.get("t", "r1")["amount"] == 1.0
+
+    def test_replace_with_empty_rows_clears_scope(self, store):
+        store.insert_many("t", _rows(3))
+        assert store.replace_source_rows("t", "source", "xero", [], only_changed=True) == 0
+        assert store.count("t") == 0
+
+
+class TestUpdateRows:
+    def test_updates_only_changed_rows_and_given_columns(self, store):
+        store.insert_many("t", _rows(4))
+        updates = [
+            {"id": "r0", "amount": 1.0},  # unchanged
+            {"id": "r1", "amount": 7.0},
+            {"id": "missing", "amount": 3.0},  # no stored row: skipped, not inserted
+        ]
+
+        result = store.transaction(lambda conn: bulk_write.update_rows(conn, "t", updates))
+
+        assert (result.rows, result.written, result.unchanged) == (3, 1, 1)
+        assert store.get("t", "r1")["amount"] == 7.0
+        assert json.loads(store.get("t", "r1")["meta"]) == {"i": 1}  # untouched column
+        assert store.get("t", "missing") is None
+
+    def test_score_sink_flushes_in_one_transaction(self, store):
+        from lib.analyzers.score_sink import ScoreSink
+
+        store.insert_many("t", _rows(3))
+        sink = ScoreSink(store)
+        sink.update("t", "r0", {"amount": 1.0})
+        sink.update("t", "r1", {"amount": 2.0, "note": "x"})
+        sink.insert("t", {"id": "n1", "source": "sink", "amount": 4.0})
+        sink.insert("t", {"id": "n2", "source": "sink", "amount": None})
+
+        with pytest.raises(sqlite3.IntegrityError):
+            sink.flush()
+        assert store.get("t", "r1")["amount"] == 1.0
+        assert len(sink) == 0
+
+        sink.update("t", "r1", {"amount": 2.0, "note": "x"})
+        sink.insert("t", {"id": "n1", "source": "sink", "amount": 4.0})
+        result = sink.flush()
+        assert (result.updated, result.inserted, result.tables) == (1, 1, ["t"])
@@ -0,0 +1,233 @@
+"""
+Tests for tag-based cache invalidation and the background cache warmer.
+
+Tests cover:
+- Tag invalidation on CacheManager
+- Skipping stores that raced an invalidation
+- publish() reaching the cache and subscribers
+- StateStore writes publishing table and client tags
+- CacheWarmer recomputing hot keys only, surviving failures, skipping errors
+- @cached with tags
+"""
+
+import sqlite3
+import time
+
+import pytest
+from fastapi.responses import JSONResponse
+
+from lib import schema_engine
+from lib.cache import CacheManager, CacheWarmer, cached, get_cache, publish
+from lib.cache.invalidation import client_tag, row_tags, subscribe, unsubscribe
+from lib.state_store import StateStore
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    get_cache().clear()
+    yield
+    get_cache().clear()
+
+
+class TestTagInvalidation:
+    """Test tag bookkeeping on CacheManager."""
+
+    def test_invalidate_tags_drops_tagged_entries(self):
+        cache = CacheManager()
+        cache.set("a", 1, tags={"tasks"})
+        cache.set("b", 2, tags={"tasks", "client:c1"})
+        cache.set("c", 3, tags={"invoices"})
+
+        assert cache.invalidate_tags({"client:c1"}) == 1
+        assert cache.get("b") is None
+        assert cache.invalidate_tags({"tasks"}) == 1
+        assert cache.get("a") is None
+        assert cache.get("c") == 3
+
+    def test_set_skipped_when_tag_invalidated_during_compute(self):
+        cache = CacheManager()
+        versions = cache.tag_versions({"signals"})
+        cache.invalidate_tags({"signals"})
+
+        assert cache.set("summary", "stale", tags={"signals"}, tag_versions=versions) is False
+        assert cache.get("summary") is None
+        assert cache.set("summary", "fresh", tags={"signals"}) is True
+
+    def test_row_tags(self):
+        assert row_tags("tasks", [{"client_id": "c1"}, {"client_id": None}]) == {
+            "tasks",
+            client_tag("c1"),
+        }
+        assert row_tags("clients", [{"id": "c2"}]) == {"clients", "client:c2"}
+
+
+class TestPublish:
+    """Test publish() and StateStore integration."""
+
+    def test_publish_invalidates_and_notifies(self):
+        received = []
+        get_cache().set("intel", "x", tags={"signals"})
+        subscribe(received.append)
+        try:
+            assert publish(["signals", ""]) == 1
+        finally:
+            unsubscribe(received.append)
+
+        assert get_cache().get("intel") is None
+        assert received == [frozenset({"signals"})]
+
+    def test_state_store_writes_publish_tags(self, tmp_path):
+        path = tmp_path / "cache.db"
+        conn = sqlite3.connect(str(path))
+        schema_engine.create_fresh(conn)
+        conn.close()
+        StateStore._instance = None
+        store = StateStore(str(path))
+        try:
+            cache = get_cache()
+            cache.set("client", 1, tags={client_tag("c1")})
+            store.insert("tasks", {"id": "t1", "title": "T", "client_id": "c1"})
+            assert cache.get("client") is None
+
+            cache.set("invoices", 2, tags={"invoices"})
+            store.execute_write("DELETE FROM invoices WHERE id = ?", ["missing"])
+            assert cache.get("invoices") == 2  # nothing deleted, nothing published
+
+            cache.set("tasks", 3, tags={"tasks"})
+            store.update("tasks", "t1", {"title": "T2"})
+            assert cache.get("tasks") is None
+        finally:
+            store.close_connections()
+            StateStore._instance = None
+
+
+class TestCacheWarmer:
+    """Test hot-key recomputation."""
+
+    def test_warms_only_recently_read_keys(self):
+        calls = {"hot": 0, "cold": 0}
+
+        def compute(name):
+            def fn():
+                calls[name] += 1
+                return calls[name]
+
+            return fn
+
+        warmer = CacheWarmer()
+        warmer.register("hot", compute("hot"), {"signals"}, ttl=60)
+        warmer.register("cold", compute("cold"), {"signals"}, ttl=60)
+        warmer.touch("hot")
+
+        warmer.notify(frozenset({"signals"}))
+        assert warmer.warm() == 1
+
+        assert calls == {"hot": 1, "cold": 0}
+        assert get_cache().get("hot") == 1
+        assert warmer.warm() == 0  # nothing stale any more
+
+    def test_unrelated_tags_do_not_mark_stale(self):
+        warmer = CacheWarmer()
+        warmer.register("k", lambda: 1, {"signals"}, ttl=60)
+        warmer.touch("k")
+
+        warmer.notify(frozenset({"invoices"}))
+
+        assert warmer.warm() == 0
+
+    def test_failing_compute_only_skips_its_key(self):
+        def boom():
+            raise RuntimeError("bug in compute")
+
+        warmer = CacheWarmer()
+        warmer.register("boom", boom, {"signals"}, ttl=60)
+        warmer.register("ok", lambda: "fresh", {"signals"}, ttl=60)
+        warmer.touch("boom")
+        warmer.touch("ok")
+
+        warmer.notify(frozenset({"signals"}))
+
+        assert warmer.warm() == 1
+        assert get_cache().get("ok") == "fresh"
+        assert get_cache().get("boom") is None
+
+    def test_error_responses_are_not_stored(self):
+        warmer = CacheWarmer()
+        warmer.register("k", lambda: JSONResponse(status_code=500, content={}), {"signals"}, 60)
+        warmer.touch("k")
+
+        warmer.notify(frozenset({"signals"}))
+
+        assert warmer.warm() == 0
+        assert get_cache().get("k") is None
+
+    def test_worker_keeps_running_after_a_failed_pass(self, monkeypatch):
+        warmer = CacheWarmer(debounce_seconds=0.01, max_delay_seconds=0.05)
+        warmer.register("k", lambda: "fresh", {"signals"}, ttl=60)
+        warmer.touch("k")
+        real_warm = warmer.warm
+        passes = []
+
+        def flaky_warm(keys=None):
+            passes.append(1)
+            if len(passes) == 1:
+                raise RuntimeError("cache backend down")
+            return real_warm(keys)
+
+        monkeypatch.setattr(warmer, "warm", flaky_warm)
+        warmer.start()
+        try:
+            warmer.notify(frozenset({"signals"}))
+            deadline = time.monotonic() + 5
+            while len(passes) < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            warmer.notify(frozenset({"signals"}))
+            while get_cache().get("k") is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert warmer._thread.is_alive()
+            assert get_cache().get("k") == "fresh"
+        finally:
+            warmer.stop()
+
+
+class TestCachedWithTags:
+    """Test @cached(tags=...)."""
+
+    def test_publish_forces_recompute(self):
+        calls = []
+
+        @cached(
+            ttl=300,
+            key_func=lambda client_id: f"test:tags:{client_id}",
+            tags=lambda client_id: [client_tag(client_id)],
+        )
+        def load(client_id):
+            calls.append(client_id)
+            return len(calls)
+
+        assert load("c1") == 1
+        assert load("c1") == 1
+        publish([client_tag("c2")])
+        assert load("c1") == 1
+        publish([client_tag("c1")])
+        assert load("c1") == 2
+
+    def test_error_response_is_not_cached(self):
+        calls = []
+
+        @cached(ttl=300, key_func=lambda: "test:tags:error")
+        def load():
+            calls.append(1)
+            return JSONResponse(status_code=500, content={"error": "db down"})
+
+        load()
+        load()
+        assert len(calls) == 2
+
+    def test_warm_rejects_async(self):
+        with pytest.raises(ValueError):
+
+            @cached(tags=("signals",), warm=True)
+            async def summary():
+                return 1
@@ -134,7 +134,7 @@ def _called_names(method) -> set[str]:
 
 
 class TestDaemonPipelineOrder:
-    """Verify the daemon's run_once executes the canonical 8-stage pipeline."""
+    """Verify the daemon's run_once executes the canonical 9-stage pipeline."""
 
     def test_run_once_jobs_match_canonical_order(self):
         """The daemon's run_once job list matches CANONICALIZATION.md §F."""
@@ -151,6 +151,7 @@ class TestDaemonPipelineOrder:
             "truth_cycle",
             "detection",
             "intelligence",
+            "priorities",
             "snapshot",
             "morning_brief",
             "notify",
@@ -0,0 +1,97 @@
+"""Tests for CapacityCalculator.get_utilization_matrix.
+
+Utilisation for every lane x date in a range comes from one grouped query over
+time_blocks, using the precomputed start_min/end_min columns and falling back
+to parsing HH:MM for blocks written without them.
+"""
+
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+
+from lib import schema_engine
+from lib.capacity_truth import CapacityCalculator
+
+
+class _Store:
+    def __init__(self, conn):
+        self.conn = conn
+        self.queries = 0
+
+    def query(self, sql, params=None):
+        self.queries += 1
+        cursor = self.conn.execute(sql, params or [])
+        columns = [c[0] for c in cursor.description]
+        return [dict(zip(columns, row, strict=True)) for row in cursor.fetchall()]
+
+
+@pytest.fixture
+def store():
+    conn = sqlite3.connect(":memory:")
+    schema_engine.create_fresh(conn)
+    conn.executemany(
+        "INSERT INTO capacity_lanes (id, name, weekly_hours, buffer_pct) VALUES (?, ?, ?, ?)",
+        [("ops", "Ops", 40, 0.25), ("creative", "Creative", 20, 0.0)],
+    )
+    conn.executemany(
+        "INSERT INTO time_blocks (id, date, start_time, end_time, start_min, end_min, lane, task_id) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            ("b1", "2026-03-02", "09:00", "11:00", 540, 660, "ops", "t1"),
+            ("b2", "2026-03-02", "13:00", "14:30", None, None, "ops", "t2"),  # legacy row
+            ("b3", "2026-03-02", "15:00", "16:00", 900, 960, "ops", None),  # unassigned
+            ("b4", "2026-03-03", "09:00", "13:00", 540, 780, "creative", "t3"),
+        ],
+    )
+    yield _Store(conn)
+    conn.close()
+
+
+def test_matrix_covers_every_lane_and_date(store):
+    matrix = CapacityCalculator(store).get_utilization_matrix("2026-03-02", "2026-03-04")
+
+    assert list(matrix) == ["creative", "ops"]
+    assert [u.date for u in matrix["ops"]] == ["2026-03-02", "2026-03-03", "2026-03-04"]
+    assert [u.scheduled_min for u in matrix["ops"]] == [210, 0, 0]
+    assert [u.scheduled_min for u in matrix["creative"]] == [0, 240, 0]
+
+    ops = matrix["ops"][0]
+    assert ops.capacity_min == 360  # 40h * 0.75 / 5 days
+    assert ops.available_min == 150
+    assert ops.utilization_pct == 58.3
+
+    creative = matrix["creative"][1]
+    assert creative.capacity_min == 240
+    assert creative.utilization_pct == 100.0
+    assert not creative.is_overloaded
+
+
+def test_matrix_issues_two_queries_regardless_of_range(store):
+    CapacityCalculator(store).get_utilization_matrix("2026-03-01", "2026-03-31")
+
+    assert store.queries == 2
+
+
+def test_unknown_lane_reports_zero_capacity(store):
+    matrix = CapacityCalculator(store).get_utilization_matrix(
+        "2026-03-02", "2026-03-02", lane_ids=["nope"]
+    )
+
+    assert matrix["nope"][0].capacity_min == 0
+    assert matrix["nope"][0].scheduled_min == 0
+
+
+def test_single_lane_helpers_match_matrix(store):
+    calc = CapacityCalculator(store)
+    matrix = calc.get_utilization_matrix("2026-03-02", "2026-03-02")
+
+    assert calc.get_lane_utilization("ops", "2026-03-02") == matrix["ops"][0]
+    assert calc.get_all_utilization("2026-03-02") == [matrix["creative"][0], matrix["ops"][0]]
+
+
+def test_forecast_spans_days_ahead(store):
+    forecast = CapacityCalculator(store).forecast_capacity("ops", days_ahead=5)
+
+    today = date.today()
+    assert [u.date for u in forecast] == [(today + timedelta(days=i)).isoformat() for i in range(5)]
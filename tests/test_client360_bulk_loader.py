@@ -0,0 +1,127 @@
+"""Tests for the Client360 bulk portfolio loader.
+
+build_portfolio loads every client's score inputs (projects with overdue
+counts, valid AR buckets, next task/commitment dates) with grouped queries
+into ClientFrames, so the number of connections no longer grows with the
+number of clients. Single-client calls load a frame for just that client and
+must score identically.
+"""
+
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+
+from lib import schema_engine
+from lib.agency_snapshot.client360_page10 import Client360Page10Engine
+
+
+def _make_db(path, n_clients):
+    today = date.today()
+    conn = sqlite3.connect(str(path))
+    schema_engine.create_fresh(conn)
+    # The commitments health query reads the legacy commitment_id/due_at columns.
+    conn.execute("ALTER TABLE commitments ADD COLUMN commitment_id TEXT")
+    conn.execute("ALTER TABLE commitments ADD COLUMN due_at TEXT")
+    for i in range(n_clients):
+        cid = f"c{i}"
+        conn.execute(
+            "INSERT INTO clients (id, name, tier) VALUES (?, ?, ?)",
+            (cid, f"Client {i}", "ABC"[i % 3]),
+        )
+        conn.execute(
+            "INSERT INTO projects (id, name, client_id, status, is_internal, type) "
+            "VALUES (?, ?, ?, 'active', 0, ?)",
+            (f"p{i}", f"Project {i}", cid, "retainer" if i % 2 else "project"),
+        )
+        for k in range(i % 4):  # 0-3 overdue tasks
+            conn.execute(
+                "INSERT INTO tasks (id, source, title, status, project_id, due_date) "
+                "VALUES (?, 'asana', 'Late', 'active', ?, ?)",
+                (f"t{i}-{k}", f"p{i}", (today - timedelta(days=2 + k)).isoformat()),
+            )
+        conn.execute(
+            "INSERT INTO tasks (id, source, title, status, project_id, due_date) "
+            "VALUES (?, 'asana', 'Next', 'active', ?, ?)",
+            (f"n{i}", f"p{i}", (today + timedelta(days=1 + i)).isoformat()),
+        )
+        for k, bucket in enumerate(["current", "31-60", "90+"][: i % 4]):
+            conn.execute(
+                "INSERT INTO invoices (id, source, external_id, client_id, amount, status, "
+                "aging_bucket) VALUES (?, 'xero', ?, ?, ?, 'sent', ?)",
+                (f"i{i}-{k}", f"x{i}-{k}", cid, 1000.0 * (k + 1), bucket),
+            )
+    conn.execute(
+        "INSERT INTO clients (id, name, tier) VALUES ('internal', 'Us', 'C')",
+    )
+    conn.execute(
+        "INSERT INTO projects (id, name, client_id, status, is_internal) "
+        "VALUES ('pi', 'Ops', 'internal', 'active', 1)"
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _engine(db):
+    engine = Client360Page10Engine(db_path=str(db))
+    engine.connections = 0
+    get_conn = engine._get_conn
+
+    def counting_conn():
+        engine.connections += 1
+        return get_conn()
+
+    engine._get_conn = counting_conn
+    return engine
+
+
+@pytest.mark.parametrize("n_clients", [3, 30])
+def test_portfolio_connections_do_not_grow_with_clients(tmp_path, n_clients):
+    engine = _engine(_make_db(tmp_path / "c360.db", n_clients))
+
+    portfolio = engine.build_portfolio()
+
+    assert len(portfolio) == min(n_clients, engine.MAX_PORTFOLIO)
+    # eligible clients + bulk frames + max AR + comm threads + commitments
+    assert engine.connections == 5
+
+
+def test_bulk_scores_match_single_client_scores(tmp_path):
+    db = _make_db(tmp_path / "c360.db", 8)
+    bulk = _engine(db)
+    portfolio = {p.client_id: p for p in bulk.build_portfolio()}
+
+    for cid, item in portfolio.items():
+        single = Client360Page10Engine(db_path=str(db))
+        breakdown, health = single.compute_health_score(cid)
+        assert round(health, 1) == item.health_score
+        assert round(single.compute_value_score(cid), 3) == item.value_score
+        assert single.get_severe_ar_total(cid) == item.severe_ar_total
+        assert single._get_next_break_at(cid) == item.next_break_at
+        assert bulk.compute_health_score(cid)[0] == breakdown
+
+
+def test_domain_scores_from_frames(tmp_path):
+    engine = _engine(_make_db(tmp_path / "c360.db", 8))
+    engine.build_portfolio()
+
+    # c3: three overdue tasks -> RED (-40) and 15 overdue penalty
+    assert engine.compute_delivery_health("c3").score == 45.0
+    # c2: 1000 current + 2000 moderate -> 100/3 + 50*2/3
+    assert engine.compute_cash_health("c2").score == pytest.approx(200 / 3)
+    assert engine.get_severe_ar_total("c3") == 3000.0
+    # Internal-only client: delivery is healthy with high confidence
+    internal = engine.compute_delivery_health("internal")
+    assert (internal.score, internal.why_low) == (100.0, [])
+    assert "internal" not in {p.client_id for p in engine.build_portfolio()}
+
+
+def test_single_client_call_loads_only_that_client(tmp_path):
+    engine = _engine(_make_db(tmp_path / "c360.db", 8))
+
+    engine.compute_delivery_health("c1")
+    engine.compute_cash_health("c1")
+
+    assert set(engine._frames) == {"c1"}
+    assert engine.connections == 1
@@ -0,0 +1,176 @@
+"""Tests for budgeted collector fetching and async orchestration.
+
+Collectors fetch pages through BaseCollector._fetch_all under a per-source
+SourceBudget (max_concurrency / requests_per_minute / timeout_seconds from
+sources.yaml). In `orchestration.mode: async` the orchestrator gathers all
+collectors on an event loop, bounds each by its timeout_seconds and cancels
+an overrunning collector via its cancel_event.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lib.collectors.base import BaseCollector
+from lib.collectors.orchestrator import CollectorOrchestrator
+from lib.collectors.resilience import CollectorCancelled, SourceBudget
+
+
+class _Collector(BaseCollector):
+    source_name = "fake"
+    target_table = "fake"
+
+    def __init__(self, config=None, collect_fn=None):
+        super().__init__(config or {}, store=MagicMock())
+        self._collect_fn = collect_fn or (lambda: {"items": []})
+
+    def collect(self):
+        return self._collect_fn()
+
+    def transform(self, raw_data):
+        return []
+
+    def sync(self):
+        raw = self.collect()
+        return {"source": self.source_name, "status": "success", "stored": len(raw["items"])}
+
+
+class TestSourceBudget:
+    def test_defaults_are_serial_and_unlimited(self):
+        budget = SourceBudget.from_config({})
+        assert budget.max_concurrency == 1
+        assert budget.requests_per_minute is None
+        assert budget.timeout_seconds == 300
+
+    def test_reads_source_config(self):
+        budget = SourceBudget.from_config(
+            {"max_concurrency": 8, "requests_per_minute": 1200, "timeout_seconds": 45}
+        )
+        assert (budget.max_concurrency, budget.requests_per_minute) == (8, 1200)
+        assert budget.timeout_seconds == 45.0
+
+    def test_concurrency_floor_is_one(self):
+        assert SourceBudget.from_config({"max_concurrency": 0}).max_concurrency == 1
+
+
+class TestFetchAll:
+    def test_results_keep_item_order(self):
+        collector = _Collector({"max_concurrency": 4})
+
+        def fetch(i):
+            time.sleep(0.001 * (10 - i))  # later items finish first
+            return i * i
+
+        assert collector._fetch_all(fetch, list(range(10))) == [i * i for i in range(10)]
+
+    def test_runs_up_to_max_concurrency_at_once(self):
+        collector = _Collector({"max_concurrency": 3})
+        barrier = threading.Barrier(3, timeout=5)
+
+        # Deadlocks (BrokenBarrierError) unless three fetches overlap.
+        assert collector._fetch_all(lambda i: barrier.wait() >= 0, [1, 2, 3]) == [True] * 3
+
+    def test_serial_budget_stays_on_calling_thread(self):
+        collector = _Collector()
+        caller = threading.get_ident()
+        assert collector._fetch_all(lambda _: threading.get_ident(), [1, 2]) == [caller] * 2
+
+    def test_cancel_stops_remaining_fetches(self):
+        collector = _Collector()
+        calls = []
+
+        def fetch(i):
+            calls.append(i)
+            if i == 2:
+                collector.cancel_event.set()
+            return i
+
+        with pytest.raises(CollectorCancelled):
+            collector._fetch_all(fetch, [1, 2, 3, 4])
+        assert calls == [1, 2]
+
+    def test_worker_threads_get_their_own_service(self):
+        collector = _Collector({"max_concurrency": 2})
+        barrier = threading.Barrier(2, timeout=5)
+        collector._build_service = lambda: object()
+
+        def fetch(_):
+            service = collector._worker_service()
+            barrier.wait()
+            assert collector._worker_service() is service
+            return service
+
+        first, second = collector._fetch_all(fetch, [1, 2])
+        assert first is not second
+
+
+@contextmanager
+def _orchestrator(collectors, mode="async"):
+    with patch.object(CollectorOrchestrator, "__init__", lambda self, **kw: None):
+        orch = CollectorOrchestrator.__new__(CollectorOrchestrator)
+    orch.store = MagicMock()
+    orch.logger = MagicMock()
+    orch.config = {"orchestration": {"mode": mode}}
+    orch.collectors = collectors
+    lock = MagicMock(acquired=True)
+    lock.__enter__ = MagicMock(return_value=lock)
+    lock.__exit__ = MagicMock(return_value=False)
+    with (
+        patch("lib.collectors.orchestrator.CollectorLock", return_value=lock),
+        patch("lib.collectors.orchestrator.mark_collected"),
+        patch.object(CollectorOrchestrator, "_record_freshness"),
+        patch.object(CollectorOrchestrator, "_run_entity_linking"),
+        patch.object(CollectorOrchestrator, "_run_inbox_enrichment"),
+    ):
+        yield orch
+
+
+class TestAsyncOrchestration:
+    def test_async_mode_syncs_every_collector(self):
+        collectors = {
+            "a": _Collector(collect_fn=lambda: {"items": [1]}),
+            "b": _Collector(collect_fn=lambda: {"items": [1, 2]}),
+        }
+        with _orchestrator(collectors) as orch:
+            results = orch.sync_all()
+        assert results["a"]["stored"] == 1
+        assert results["b"]["stored"] == 2
+
+    def test_timeout_cancels_the_slow_collector_only(self):
+        stopped = threading.Event()
+        slow = _Collector({"timeout_seconds": 0.2})
+
+        def collect_slowly():
+            try:
+                while True:
+                    slow._fetch_all(lambda _: time.sleep(0.01), [1])
+            finally:
+                stopped.set()
+
+        slow._collect_fn = collect_slowly
+        fast = _Collector(collect_fn=lambda: {"items": [1]})
+
+        with _orchestrator({"slow": slow, "fast": fast}) as orch:
+            started = time.monotonic()
+            results = orch.sync_all()
+            elapsed = time.monotonic() - started
+
+        assert elapsed < 5
+        assert results["slow"]["status"] == "failed"
+        assert results["slow"]["error_type"] == "timeout"
+        assert results["fast"]["status"] == "success"
+        # The collector thread saw the cancellation and unwound.
+        assert stopped.wait(5)
+
+    def test_stale_cancel_flag_is_cleared_before_next_run(self):
+        collector = _Collector(collect_fn=lambda: {"items": [1]})
+        collector.cancel_event.set()
+        with _orchestrator({"a": collector}) as orch:
+            assert orch.sync_all()["a"]["status"] == "success"
+
+    def test_unknown_mode_falls_back_to_threads(self):
+        with _orchestrator({}, mode="fibers") as orch:
+            assert orch._orchestration_mode() == "threads"
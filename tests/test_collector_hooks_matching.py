@@ -0,0 +1,120 @@
+"""
+Tests for CollectorHooks entity matching indexes.
+
+Client aliases, task names/keywords and Asana GIDs are indexed when patterns
+load, so matching an email does not scan every client or task.
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from lib.v4.collector_hooks import CollectorHooks
+from lib.v4.pattern_matcher import EntityPatternIndex
+
+
+@pytest.fixture
+def hooks(tmp_path):
+    db = tmp_path / "hooks.db"
+    conn = sqlite3.connect(db)
+    conn.executescript("""
+        CREATE TABLE clients (id TEXT, name TEXT, name_normalized TEXT, aliases_json TEXT,
+                              identity_profile_id TEXT);
+        CREATE TABLE projects (id TEXT, name TEXT, name_normalized TEXT, client_id TEXT,
+                               asana_project_id TEXT);
+        CREATE TABLE items (id TEXT, what TEXT, source_ref TEXT, client_id TEXT,
+                            project_id TEXT, status TEXT);
+    """)
+    conn.executemany(
+        "INSERT INTO clients VALUES (?, ?, ?, ?, NULL)",
+        [
+            ("c1", "Acme Corp", "acme corp", json.dumps(["Acme", "AC"])),
+            ("c2", "Globex", "globex", "[]"),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO projects VALUES (?, ?, ?, ?, ?)",
+        [("p1", "Website", "website", "c1", "111"), ("p2", "Brand", "brand", "c2", "222")],
+    )
+    conn.executemany(
+        "INSERT INTO items VALUES (?, ?, ?, NULL, NULL, ?)",
+        [
+            ("t1", "Fix checkout payment flow", "9001", "open"),
+            ("t2", "Design homepage banner", "9002", "open"),
+            ("t3", "Review payment provider contract", "9003", "open"),
+            ("t4", "Old payment flow", "9004", "done"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    h = object.__new__(CollectorHooks)
+    h._get_conn = lambda: sqlite3.connect(db)
+    h._client_index = EntityPatternIndex(min_length=3)
+    h._task_name_index = EntityPatternIndex(min_length=6)
+    h._load_entity_patterns()
+    h.db = db
+    return h
+
+
+def test_client_aliases_match_with_confidence(hooks):
+    assert hooks._match_client_in_text("Call with ACME CORP today") == [
+        ("c1", 0.9, "Pattern match: acme corp")
+    ]
+    assert hooks._match_client_in_text("acme and globex") == [
+        ("c1", 0.75, "Pattern match: acme"),
+        ("c2", 0.9, "Pattern match: globex"),
+    ]
+    # "ac" is too short to match on its own
+    assert hooks._match_client_in_text("ac unit") == []
+
+
+def test_asana_gid_lookups(hooks):
+    assert hooks._match_project_by_asana_gid("222") == "p2"
+    assert hooks._match_project_by_asana_gid("999") is None
+    assert hooks._match_task_by_asana_gid("9003") == "t3"
+    assert hooks._match_task_by_asana_gid("9004") is None  # done tasks are not loaded
+
+
+def test_exact_task_name_beats_keywords(hooks):
+    matches = hooks._match_task_in_text("Re: fix checkout payment flow before launch")
+    assert matches[0][:2] == ("t1", 0.92)
+
+
+def test_keyword_overlap_requires_min_matches(hooks):
+    matches = hooks._match_task_in_text("the payment flow for checkout is broken")
+    assert [m[0] for m in matches] == ["t1"]
+    assert matches[0][2].startswith("Keyword match (3/4)")
+
+    # One shared keyword is below the default threshold
+    assert hooks._match_task_in_text("payment received") == []
+
+
+def test_reload_picks_up_new_aliases(hooks):
+    conn = sqlite3.connect(hooks.db)
+    conn.execute("UPDATE clients SET aliases_json = ? WHERE id = 'c2'", (json.dumps(["gbx"]),))
+    conn.execute(
+        "INSERT INTO items VALUES ('t5', 'Quarterly banner refresh', '9005', NULL, NULL, 'open')"
+    )
+    conn.commit()
+    conn.close()
+
+    hooks._load_entity_patterns()
+
+    assert hooks._match_client_in_text("gbx team")[0][0] == "c2"
+    assert hooks._match_task_by_asana_gid("9005") == "t5"
+    assert [m[0] for m in hooks._match_task_in_text("quarterly banner refresh")] == ["t5"]
+
+
+def test_task_name_matches_whole_words_only(hooks):
+    # The name must start and end on word boundaries: "flows" is not "flow",
+    # so this falls back to keyword overlap instead of a 0.92 name match.
+    matches = hooks._match_task_in_text("fix checkout payment flows")
+    assert [m[0] for m in matches] == ["t1"]
+    assert matches[0][1] < 0.92
+    assert matches[0][2].startswith("Keyword match")
+
+    assert hooks._match_task_in_text("prefix checkout payment flow")[0][2].startswith(
+        "Keyword match"
+    )
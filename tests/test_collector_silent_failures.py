@@ -54,7 +54,7 @@ class FakeStore:
         return len(rows)
 
     def replace_source_rows(
-        self, table: str, source_column: str, source_value: str, rows: list[dict]
+        self, table: str, source_column: str, source_value: str, rows: list[dict], **kwargs
     ) -> int:
         """Mimic StateStore.replace_source_rows: atomic delete-by-source + reinsert."""
         if self._fail_on_table and table == self._fail_on_table:
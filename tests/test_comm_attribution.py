@@ -0,0 +1,207 @@
+"""Tests for the persisted communication -> client attribution.
+
+sync_attribution resolves each communication to one client (identity link
+first, else the longest client name in the subject) and only re-attributes
+rows that are new, changed, or affected by a client rename.
+"""
+
+import sqlite3
+
+import pytest
+
+from lib import schema_engine
+from lib.comm_attribution import sync_attribution
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    schema_engine.create_fresh(conn)
+    conn.executemany(
+        "INSERT INTO clients (id, name) VALUES (?, ?)",
+        [("acme", "Acme"), ("acme-corp", "Acme Corp"), ("globex", "Globex"), ("x", "XY")],
+    )
+    conn.executemany(
+        "INSERT INTO communications (id, subject, client_id) VALUES (?, ?, ?)",
+        [
+            ("m1", "Re: ACME CORP renewal", None),
+            ("m2", "Invoice for acme", None),
+            ("m3", "Lunch plans", None),
+            ("m4", "Globex kickoff", "acme"),
+            ("m5", "Acmes are not Acme-adjacent? acmex", None),
+            ("m6", None, None),
+        ],
+    )
+    yield conn
+    conn.close()
+
+
+def _attribution(conn):
+    return {
+        row[0]: (row[1], row[2])
+        for row in conn.execute(
+            "SELECT communication_id, client_id, method FROM communication_client_attribution"
+        )
+    }
+
+
+def test_initial_sync_attributes_every_communication(conn):
+    result = sync_attribution(conn)
+
+    assert result["attributed"] == 6
+    assert _attribution(conn) == {
+        "m1": ("acme-corp", "subject"),  # longest name wins, case-insensitive
+        "m2": ("acme", "subject"),
+        "m3": (None, "none"),
+        "m4": ("acme", "linked"),  # identity link beats the subject
+        "m5": ("acme", "subject"),  # "Acme-adjacent" is a word match, "Acmes" is not
+        "m6": (None, "none"),
+    }
+
+
+def test_short_names_are_not_matched(conn):
+    conn.execute("INSERT INTO communications (id, subject) VALUES ('m7', 'XY follow-up')")
+    sync_attribution(conn)
+    assert _attribution(conn)["m7"] == (None, "none")
+
+
+def test_unchanged_resync_does_nothing(conn):
+    sync_attribution(conn)
+    assert sync_attribution(conn) == {"attributed": 0, "removed": 0, "clients_changed": 0}
+
+
+def test_only_new_and_changed_communications_are_redone(conn):
+    sync_attribution(conn)
+    conn.execute("UPDATE communications SET subject = 'Globex update' WHERE id = 'm3'")
+    conn.execute("UPDATE communications SET client_id = 'globex' WHERE id = 'm2'")
+    conn.execute("INSERT INTO communications (id, subject) VALUES ('m8', 'globex call')")
+    conn.execute("DELETE FROM communications WHERE id = 'm6'")
+
+    result = sync_attribution(conn)
+
+    assert (result["attributed"], result["removed"]) == (3, 1)
+    attribution = _attribution(conn)
+    assert attribution["m3"] == ("globex", "subject")
+    assert attribution["m2"] == ("globex", "linked")
+    assert attribution["m8"] == ("globex", "subject")
+    assert "m6" not in attribution
+
+
+def test_client_rename_reattributes_affected_rows(conn):
+    sync_attribution(conn)
+    conn.execute("UPDATE clients SET name = 'Acme Corporation' WHERE id = 'acme-corp'")
+    conn.execute("UPDATE clients SET name = 'Lunch' WHERE id = 'globex'")
+
+    result = sync_attribution(conn)
+
+    assert result["clients_changed"] == 2
+    attribution = _attribution(conn)
+    assert attribution["m1"] == ("acme", "subject")  # "acme corp" no longer a name
+    assert attribution["m3"] == ("globex", "subject")  # picked up by the new name
+    assert attribution["m4"] == ("acme", "linked")
+    assert result["attributed"] == 2
+
+
+def test_full_rebuild_matches_incremental(conn):
+    sync_attribution(conn)
+    conn.execute("UPDATE clients SET name = 'Lunch plans' WHERE id = 'x'")
+    sync_attribution(conn)
+    incremental = _attribution(conn)
+
+    sync_attribution(conn, full=True)
+
+    assert _attribution(conn) == incremental
+
+
+def test_snapshot_normalized_data_joins_attribution(tmp_path):
+    from lib.agency_snapshot.generator import AgencySnapshotGenerator
+
+    db = tmp_path / "snap.db"
+    conn = sqlite3.connect(str(db))
+    schema_engine.create_fresh(conn)
+    # _build_normalized_data reads the thread-scoped commitment columns.
+    for column in ("commitment_id", "commitment_text", "scope_ref_type", "scope_ref_id", "due_at"):
+        conn.execute(f"ALTER TABLE commitments ADD COLUMN {column} TEXT")
+    conn.execute("INSERT INTO clients (id, name) VALUES ('acme', 'Acme'), ('beta', 'Beta')")
+    conn.execute(
+        "INSERT INTO communications (id, thread_id, subject, received_at) VALUES "
+        "('m1', 't1', 'Acme and Beta sync', '2026-01-01'), "
+        "('m2', 't1', 'Re: Acme and Beta sync', '2026-01-02'), "
+        "('m3', 't2', 'Unrelated', '2026-01-02')"
+    )
+    conn.execute(
+        "INSERT INTO commitments (id, source_id, text, type, commitment_id, scope_ref_type, "
+        "scope_ref_id, status) VALUES ('k1', 'm1', 'Send deck', 'promise', 'k1', 'thread', 't1', 'open')"
+    )
+    sync_attribution(conn)  # done at ingest by the collector orchestrator
+    conn.commit()
+    conn.close()
+
+    normalized = AgencySnapshotGenerator(db_path=db)._build_normalized_data()
+
+    # One row per communication and per commitment, even with two matching names.
+    assert sorted((c["id"], c["client_id"]) for c in normalized.communications) == [
+        ("m1", "acme"),
+        ("m2", "acme"),
+        ("m3", None),
+    ]
+    assert [(c["commitment_id"], c["resolved_client_id"]) for c in normalized.commitments] == [
+        ("k1", "acme")
+    ]
+
+
+def test_client360_shows_identity_linked_mail_only(tmp_path):
+    from lib.agency_snapshot.client360_page10 import Client360Page10Engine
+
+    db = tmp_path / "c360.db"
+    conn = sqlite3.connect(str(db))
+    schema_engine.create_fresh(conn)
+    conn.execute("INSERT INTO clients (id, name) VALUES ('acme', 'Acme')")
+    conn.execute(
+        "INSERT INTO communications (id, subject, client_id, processed, received_at) VALUES "
+        "('m1', 'Weekly call', 'acme', 0, '2026-01-02'), "
+        "('m2', 'Acme renewal', NULL, 0, '2026-01-01')"
+    )
+    sync_attribution(conn)
+    conn.commit()
+    conn.close()
+
+    engine = Client360Page10Engine(db_path=db)
+
+    # m2 only names the client in its subject: not the client's mail, still unlinked
+    assert [t["thread_id"] for t in engine._build_comms_threads("acme")] == ["m1"]
+    triage = [move["move_id"] for move in engine._generate_unlinked_triage_moves()]
+    assert "move-triage-m2" in triage
+    assert "move-triage-m1" not in triage
+
+
+def test_full_collector_sync_attributes_communications(tmp_path):
+    from unittest.mock import patch
+
+    from lib.collectors.orchestrator import CollectorOrchestrator
+    from lib.state_store import StateStore
+
+    db = tmp_path / "ingest.db"
+    conn = sqlite3.connect(str(db))
+    schema_engine.create_fresh(conn)
+    conn.execute("INSERT INTO clients (id, name) VALUES ('acme', 'Acme')")
+    conn.execute("INSERT INTO communications (id, subject) VALUES ('m1', 'Acme renewal')")
+    conn.commit()
+    conn.close()
+    StateStore._instance = None
+    store = StateStore(str(db))
+    try:
+        with patch.object(CollectorOrchestrator, "_init_collectors"):
+            orch = CollectorOrchestrator(store=store)
+        with (
+            patch.object(CollectorOrchestrator, "_run_entity_linking"),
+            patch.object(CollectorOrchestrator, "_run_inbox_enrichment"),
+        ):
+            results = orch.sync_all()
+
+        assert results["attribution"]["attributed"] == 1
+        row = store.query("SELECT client_id, method FROM communication_client_attribution")
+        assert row == [{"client_id": "acme", "method": "subject"}]
+    finally:
+        store.close_connections()
+        StateStore._instance = None
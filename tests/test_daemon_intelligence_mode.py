@@ -74,3 +74,60 @@ def test_explicit_zero_is_quick(monkeypatch, patched_detection):
 
     _args, kwargs = patched_detection.call_args
     assert kwargs.get("quick") is True
+
+
+def test_detection_is_incremental_by_default(monkeypatch, patched_detection):
+    """Without MOH_INTELLIGENCE_FULL_RESCAN the daemon only re-evaluates dirty entities."""
+    monkeypatch.delenv("MOH_INTELLIGENCE_FULL_RESCAN", raising=False)
+    daemon = _make_daemon()
+
+    daemon._handle_intelligence()
+
+    _args, kwargs = patched_detection.call_args
+    assert kwargs.get("incremental") is True
+
+
+def test_full_rescan_env_disables_incremental(monkeypatch, patched_detection):
+    """MOH_INTELLIGENCE_FULL_RESCAN=1 forces a full re-evaluation of every entity."""
+    monkeypatch.setenv("MOH_INTELLIGENCE_FULL_RESCAN", "1")
+    daemon = _make_daemon()
+
+    daemon._handle_intelligence()
+
+    _args, kwargs = patched_detection.call_args
+    assert kwargs.get("incremental") is False
+
+
+def test_workers_env_is_passed_through(monkeypatch, patched_detection):
+    """MOH_INTELLIGENCE_WORKERS opts into parallel entity evaluation; default is serial."""
+    daemon = _make_daemon()
+
+    monkeypatch.delenv("MOH_INTELLIGENCE_WORKERS", raising=False)
+    daemon._handle_intelligence()
+    assert patched_detection.call_args.kwargs.get("workers") == 1
+
+    monkeypatch.setenv("MOH_INTELLIGENCE_WORKERS", "4")
+    daemon._handle_intelligence()
+    assert patched_detection.call_args.kwargs.get("workers") == 4
+
+    monkeypatch.setenv("MOH_INTELLIGENCE_WORKERS", "many")
+    daemon._handle_intelligence()
+    assert patched_detection.call_args.kwargs.get("workers") == 1
+
+
+def test_intelligence_publishes_cache_tags(monkeypatch, patched_detection):
+    """The daemon's signal/proposal writes invalidate the intelligence cache entries."""
+    from lib.cache import invalidation
+
+    patched_detection.return_value = {
+        "signals": [
+            {"signal_id": "sig_a", "entity_type": "client", "entity_id": "c1"},
+            {"signal_id": "sig_b", "entity_type": "project", "entity_id": "p1"},
+        ]
+    }
+    published = []
+    monkeypatch.setattr(invalidation, "_subscribers", [published.append])
+
+    _make_daemon()._handle_intelligence()
+
+    assert published == [frozenset({"signals", "proposals", "client:c1"})]
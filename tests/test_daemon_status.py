@@ -59,25 +59,26 @@ def test_status_drops_orphan_jobs(daemon_home):
     assert "collect" in status["jobs"]
 
 
-def test_status_keeps_all_eight_registered_stages(daemon_home):
-    """All 8 in-process stages survive the filter when present in state."""
+def test_status_keeps_all_registered_stages(daemon_home):
+    """All 9 in-process stages survive the filter when present in state."""
     from lib.daemon import TimeOSDaemon
 
-    eight = [
+    stages = [
         "collect",
         "lane_assignment",
         "truth_cycle",
         "detection",
         "intelligence",
+        "priorities",
         "snapshot",
         "morning_brief",
         "notify",
     ]
-    _write_state(daemon_home, {name: {"consecutive_failures": 0} for name in eight})
+    _write_state(daemon_home, {name: {"consecutive_failures": 0} for name in stages})
 
     status = TimeOSDaemon.status()
 
-    assert set(status["jobs"].keys()) == set(eight)
+    assert set(status["jobs"].keys()) == set(stages)
 
 
 def test_status_preserves_top_level_fields(daemon_home):
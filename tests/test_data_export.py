@@ -13,6 +13,7 @@ Tests the complete data export pipeline:
 """
 
 import csv
+import gzip
 import json
 import os
 import shutil
@@ -25,6 +26,7 @@ import pytest
 
 from lib.governance.anonymizer import Anonymizer
 from lib.governance.data_export import DataExporter, ExportFormat, ExportRequest
+from lib.governance.export_jobs import ExportJobManager
 
 
 class TestAnonymizer:
@@ -592,3 +594,110 @@ class TestIntegration:
             result = exporter.export_all(ExportFormat.JSON, anonymize=True)
 
             assert result.anonymized
+
+    def test_streamed_export_chunks_and_gzip(self, temp_db_with_data, temp_export_dir):
+        """Test chunked reads, gzip output and on-the-fly checksum."""
+        with patch("lib.governance.data_export.get_lifecycle_manager") as mock_mgr:
+            mock_mgr.return_value.is_exportable.return_value = True
+            mock_mgr.return_value.get_pii_columns.return_value = ["email"]
+
+            exporter = DataExporter(temp_db_with_data, export_dir=temp_export_dir)
+            chunks = list(exporter.iter_rows("people", anonymize=True, chunk_size=4))
+            assert [len(c) for c in chunks] == [4, 4, 2]
+            assert "person0@" not in chunks[0][0]["email"]
+
+            export = exporter.write_table("people", ExportFormat.CSV, compress=True)
+
+            assert export.file_path.endswith(".csv.gz")
+            assert export.row_count == 10
+            assert export.checksum_sha256 == DataExporter._calculate_checksum(export.file_path)
+            with gzip.open(export.file_path, "rt", newline="") as f:
+                rows = list(csv.DictReader(f))
+            assert len(rows) == 10
+            assert not any(p.endswith(".part") for p in os.listdir(temp_export_dir))
+
+    def test_streamed_json_is_valid_when_empty(self, temp_db_with_data, temp_export_dir):
+        """Test JSON stream framing with no rows."""
+        with patch("lib.governance.data_export.get_lifecycle_manager") as mock_mgr:
+            mock_mgr.return_value.is_exportable.return_value = True
+
+            exporter = DataExporter(temp_db_with_data, export_dir=temp_export_dir)
+            body = b"".join(exporter.iter_export("tasks", ExportFormat.JSON, filters={"id": "x"}))
+
+            assert json.loads(body) == []
+
+    def test_export_job_resumes_after_failure(self, temp_db_with_data, temp_export_dir):
+        """Test a failed job resumes at the first unfinished table."""
+        with patch("lib.governance.data_export.get_lifecycle_manager") as mock_mgr:
+            mock_mgr.return_value.is_exportable.return_value = True
+            mock_mgr.return_value.get_pii_columns.return_value = []
+
+            jobs = ExportJobManager(temp_db_with_data, export_dir=temp_export_dir)
+            request = ExportRequest(
+                tables=["tasks", "missing", "people"], format=ExportFormat.JSONL
+            )
+            job_id = jobs.submit(request, background=False)
+
+            state = jobs.get(job_id)
+            assert state["status"] == "failed"
+            assert list(state["tables_done"]) == ["tasks"]
+            tasks_file = state["tables_done"]["tasks"]["file_path"]
+
+            conn = sqlite3.connect(temp_db_with_data)
+            conn.execute("CREATE TABLE missing (id TEXT)")
+            conn.commit()
+            conn.close()
+
+            state = jobs.run(job_id)
+
+            assert state["status"] == "completed"
+            assert state["tables_done"]["tasks"]["file_path"] == tasks_file
+            assert state["result"]["row_count"] == 20
+            assert state["result"]["tables"] == ["tasks", "missing", "people"]
+            assert jobs.resume(job_id) is False
+
+    def test_export_job_lock_from_previous_process_start_is_stale(
+        self, temp_db_with_data, temp_export_dir
+    ):
+        """Test a lock with our PID but an earlier process start does not block resume."""
+        with patch("lib.governance.data_export.get_lifecycle_manager") as mock_mgr:
+            mock_mgr.return_value.is_exportable.return_value = True
+            mock_mgr.return_value.get_pii_columns.return_value = []
+
+            jobs = ExportJobManager(temp_db_with_data, export_dir=temp_export_dir)
+            job_id = jobs.submit(
+                ExportRequest(tables=["tasks"], format=ExportFormat.JSONL), background=False
+            )
+            state = jobs.get(job_id)
+            state["status"] = "running"
+            jobs._save(state)
+            lock = jobs._lock_path(job_id)
+
+            # Same PID after a container restart: a different process start
+            lock.write_text(json.dumps({"pid": os.getpid(), "token": "previous-start"}))
+            assert not jobs._locked(job_id)
+            lock.write_text(str(os.getpid()))  # PID-only lock from an older version
+            assert not jobs._locked(job_id)
+
+            assert jobs.run(job_id)["status"] == "completed"
+            assert not lock.exists()
+
+            jobs._claim(job_id)
+            assert jobs._locked(job_id)  # held by this process start
+
+    def test_export_job_unexpected_error_marks_failed(self, temp_db_with_data, temp_export_dir):
+        """Test an error outside the expected types still fails the job."""
+        with patch("lib.governance.data_export.get_lifecycle_manager") as mock_mgr:
+            mock_mgr.return_value.is_exportable.return_value = True
+            mock_mgr.return_value.get_pii_columns.return_value = []
+
+            jobs = ExportJobManager(temp_db_with_data, export_dir=temp_export_dir)
+            with patch.object(DataExporter, "write_manifest", side_effect=KeyError("tables")):
+                job_id = jobs.submit(
+                    ExportRequest(tables=["tasks"], format=ExportFormat.JSONL), background=False
+                )
+
+            state = jobs.get(job_id)
+            assert state["status"] == "failed"
+            assert state["error"].startswith("KeyError")
+            assert not jobs._lock_path(job_id).exists()
@@ -0,0 +1,156 @@
+"""Tests for the database worker pool and async StateStore access."""
+
+import asyncio
+import inspect
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from lib import db_executor, schema_engine
+from lib.db_executor import QueryTimeout, offload
+from lib.state_store import StateStore
+
+# Counts forever unless interrupted.
+_RUNAWAY_SQL = """
+    WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n)
+    SELECT COUNT(*) AS c FROM n
+"""
+# Counts to two million; well past a 0.05s timeout.
+_SLOW_SQL = """
+    WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 2000000)
+    SELECT COUNT(*) AS c FROM n
+"""
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "executor.db"
+    conn = sqlite3.connect(str(path))
+    schema_engine.create_fresh(conn)
+    conn.close()
+    StateStore._instance = None
+    store = StateStore(str(path))
+    store.insert("tasks", {"id": "t1", "title": "First", "status": "active"})
+    store.insert("tasks", {"id": "t2", "title": "Second", "status": "done"})
+    yield store
+    store.close_connections()
+    StateStore._instance = None
+    db_executor.shutdown()
+
+
+def test_async_reads_run_on_worker_threads(store):
+    async def scenario():
+        rows = await store.aquery("SELECT id FROM tasks WHERE status = ?", ["active"])
+        task = await store.aget("tasks", "t2")
+        count = await store.acount("tasks")
+        worker = await store.arun(lambda: threading.current_thread().name)
+        return rows, task, count, worker
+
+    rows, task, count, worker = asyncio.run(scenario())
+
+    assert [r["id"] for r in rows] == ["t1"]
+    assert task["title"] == "Second"
+    assert count == 2
+    assert worker.startswith("db-worker")
+
+
+def test_timeout_interrupts_running_query(store):
+    async def scenario():
+        started = time.monotonic()
+        with pytest.raises(QueryTimeout):
+            await store.aquery(_RUNAWAY_SQL, timeout=0.2)
+        elapsed = time.monotonic() - started
+        # The worker's connection was interrupted, so the pool is free again.
+        rows = await store.aquery("SELECT COUNT(*) AS c FROM tasks", timeout=5)
+        return elapsed, rows
+
+    elapsed, rows = asyncio.run(scenario())
+
+    assert elapsed < 5
+    assert rows[0]["c"] == 2
+
+
+def test_offload_keeps_signature_and_rejects_coroutines():
+    @offload
+    def handler(limit: int = 50, q: str | None = None):
+        """Docstring."""
+        return threading.current_thread().name, limit, q
+
+    assert inspect.iscoroutinefunction(handler)
+    assert list(inspect.signature(handler).parameters) == ["limit", "q"]
+    assert handler.__doc__ == "Docstring."
+    name, limit, q = asyncio.run(handler(5, q="x"))
+    assert name.startswith("db-worker")
+    assert (limit, q) == (5, "x")
+
+    with pytest.raises(TypeError):
+
+        @offload
+        async def already_async():
+            return None
+
+    db_executor.shutdown()
+
+
+def test_timeout_maps_to_504():
+    from fastapi import FastAPI
+    from fastapi.responses import JSONResponse
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+
+    @app.exception_handler(QueryTimeout)
+    async def on_timeout(request, exc):
+        return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+    @app.get("/slow")
+    @offload(timeout=0.05)
+    def slow():
+        time.sleep(0.5)
+        return {"ok": True}
+
+    @app.get("/fast")
+    @offload
+    def fast(n: int = 1):
+        return {"n": n}
+
+    client = TestClient(app)
+    assert client.get("/fast", params={"n": 3}).json() == {"n": 3}
+    assert client.get("/slow").status_code == 504
+    db_executor.shutdown()
+
+
+def test_no_timeout_waits_past_default(monkeypatch):
+    monkeypatch.setenv(db_executor.DB_ENV_TIMEOUT, "0.05")
+
+    @offload(timeout=db_executor.NO_TIMEOUT)
+    def long_job():
+        time.sleep(0.2)
+        return "done"
+
+    assert asyncio.run(long_job()) == "done"
+    db_executor.shutdown()
+
+
+def test_timeout_does_not_interrupt_a_call_that_wrote(store):
+    finished = threading.Event()
+    outcome = []
+
+    def mutate():
+        store.update("tasks", "t1", {"title": "Renamed"})
+        try:
+            # Still running on the reader when the timeout fires
+            outcome.append(store.query(_SLOW_SQL)[0]["c"])
+        finally:
+            finished.set()
+
+    async def scenario():
+        with pytest.raises(QueryTimeout):
+            await db_executor.run(mutate, timeout=0.05)
+
+    asyncio.run(scenario())
+
+    assert finished.wait(5)
+    assert outcome == [2_000_000]
@@ -0,0 +1,74 @@
+"""
+Tests for the V4 entity pattern index (lib/v4/pattern_matcher.py).
+
+Client aliases and project names are matched in one word-anchored scan of the
+text instead of one substring test per pattern.
+"""
+
+import random
+import re
+
+from lib.v4.pattern_matcher import EntityPatternIndex
+
+
+def _index(entities, **kwargs):
+    idx = EntityPatternIndex(**kwargs)
+    idx.sync(entities)
+    return idx
+
+
+def test_first_listed_pattern_wins_per_entity():
+    idx = _index({"c1": ["acme corp", "acme"], "c2": ["globex"]})
+    assert idx.match("re: acme corp invoice") == [("c1", "acme corp")]
+    assert idx.match("acme and globex") == [("c1", "acme"), ("c2", "globex")]
+
+
+def test_results_follow_entity_order_not_text_order():
+    idx = _index({"c1": ["beta"], "c2": ["alpha"]})
+    assert idx.match("alpha then beta") == [("c1", "beta"), ("c2", "alpha")]
+
+
+def test_word_boundaries():
+    idx = _index({"c1": ["acme"], "c2": ["a.b. co"]})
+    assert idx.match("ops@acme.com") == [("c1", "acme")]
+    assert idx.match("acmes are not acme-like? acme!") == [("c1", "acme")]
+    assert idx.match("acmes only") == []
+    assert idx.match("see a.b. co today") == [("c2", "a.b. co")]
+
+
+def test_min_length_and_empty_patterns_are_skipped():
+    idx = _index({"c1": [None, "", "ab", "abc"]}, min_length=3)
+    assert idx.match("ab abc") == [("c1", "abc")]
+
+
+def test_sync_is_incremental():
+    idx = _index({"c1": ["acme"], "c2": ["globex"]})
+    assert idx.sync({"c1": ["acme"], "c2": ["globex"]}) == 0
+    assert idx.sync({"c1": ["acme", "acme inc"], "c3": ["initech"]}) == 3
+    assert idx.match("globex initech acme inc") == [("c1", "acme"), ("c3", "initech")]
+
+
+def test_shared_pattern_survives_removal_of_one_owner():
+    idx = _index({"c1": ["shared"], "c2": ["shared"]})
+    idx.sync({"c2": ["shared"]})
+    assert idx.match("the shared account") == [("c2", "shared")]
+
+
+def test_matches_reference_scan():
+    rng = random.Random(7)  # noqa: S311 — deterministic test data
+    words = ["acme", "corp", "globex", "io", "initech", "umbrella", "x-ray", "blue", "sky"]
+    entities = {
+        f"c{i}": [" ".join(rng.sample(words, rng.randint(1, 2))) for _ in range(rng.randint(1, 3))]
+        for i in range(40)
+    }
+    idx = _index(entities)
+
+    for _ in range(50):
+        text = " ".join(rng.choices(words + ["acmes", "a", "the"], k=30))
+        expected = []
+        for cid, patterns in entities.items():
+            for p in patterns:
+                if re.search(rf"(?<!\w){re.escape(p)}(?!\w)", text):
+                    expected.append((cid, p))
+                    break
+        assert idx.match(text) == expected
@@ -0,0 +1,175 @@
+"""Tests for the cross-process event log and its SSE fan-out."""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from api.sse_router import Event, EventBus, EventLogTailer, _heartbeat_generator
+from lib import db_executor, event_log, schema_engine
+from lib.intelligence.persistence import IntelligenceEventStore, event_from_signal_change
+from lib.state_store import StateStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    path = tmp_path / "events.db"
+    conn = sqlite3.connect(str(path))
+    schema_engine.create_fresh(conn)
+    conn.commit()
+    conn.close()
+    StateStore._instance = None
+    store = StateStore(str(path))
+    # Readers that default to get_store() (the tailer, SSE replay) use it too
+    monkeypatch.setattr("lib.state_store._store", store)
+    yield store
+    store.close_connections()
+    StateStore._instance = None
+    db_executor.shutdown()
+
+
+def test_append_and_read_by_seq(store):
+    assert event_log.latest_seq(store) == 0
+    first = event_log.publish("signal_new", {"signal_id": "s1"}, source="daemon", store=store)
+    second = event_log.publish("metric_refresh", {"cycle": 3}, store=store)
+
+    assert second > first
+    assert event_log.latest_seq(store) == second
+    events = event_log.read_after(0, store=store)
+    assert [(e.seq, e.event_type) for e in events] == [
+        (first, "signal_new"),
+        (second, "metric_refresh"),
+    ]
+    assert events[0].data == {"signal_id": "s1"}
+    assert events[0].source == "daemon"
+    assert event_log.read_after(first, store=store)[0].seq == second
+    assert [e.seq for e in event_log.recent(1, store=store)] == [second]
+
+
+def test_prune_keeps_seq_monotonic(store, monkeypatch):
+    monkeypatch.setattr(event_log, "RETENTION_ROWS", 3)
+    monkeypatch.setattr(event_log, "_PRUNE_EVERY", 5)
+    seqs = [event_log.publish("tick", {"n": n}, store=store) for n in range(10)]
+
+    kept = [e.seq for e in event_log.read_after(0, store=store)]
+    assert kept == seqs[-3:]
+    assert event_log.publish("tick", {}, store=store) == seqs[-1] + 1
+
+
+def test_intelligence_events_reach_the_log(store):
+    events = IntelligenceEventStore(store.db_path)
+    events.publish(event_from_signal_change("sig_1", "client", "c1", "critical", change_type="new"))
+
+    (entry,) = event_log.read_after(0, store=store)
+    assert entry.event_type == "signal_new"
+    assert entry.source == "signals"
+    assert entry.data["event_type"] == "signal_fired"
+    assert entry.data["data"]["signal_id"] == "sig_1"
+
+
+def test_tailer_fans_out_other_process_writes(store):
+    async def scenario():
+        bus = EventBus()
+        tailer = EventLogTailer(bus)
+        await tailer.poll()  # starts at the end of the log
+        queue = await bus.subscribe()
+
+        # Written through another connection, as the daemon would
+        conn = sqlite3.connect(store.db_path)
+        with conn:
+            seq = event_log.append(conn, "signal_new", {"signal_id": "s2"})
+        conn.close()
+
+        assert await tailer.poll() == 1
+        event = queue.get_nowait()
+        return seq, event
+
+    seq, event = asyncio.run(scenario())
+    assert event.id == str(seq)
+    assert event.event_type == "signal_new"
+
+
+def test_stream_resumes_after_last_event_id(store):
+    seqs = [event_log.publish("signal_new", {"n": n}, store=store) for n in range(4)]
+
+    async def scenario():
+        bus = EventBus()
+        queue = await bus.subscribe()
+        # Already replayed from the log; must not be sent twice
+        duplicate = EventLogTailer(bus)
+        duplicate.last_seq = seqs[1]
+        await duplicate.poll()
+        gen = _heartbeat_generator(queue, bus, resume_after=seqs[1])
+        messages = [await gen.__anext__() for _ in range(2)]
+        # The queued copies are skipped; the next message is the next new event
+        await bus.publish(Event(str(seqs[3] + 1), "signal_new", {}, "2024-01-01T00:00:00"))
+        messages.append(await gen.__anext__())
+        await gen.aclose()
+        return messages
+
+    messages = asyncio.run(scenario())
+    assert [m.splitlines()[0] for m in messages] == [
+        f"id: {seqs[2]}",
+        f"id: {seqs[3]}",
+        f"id: {seqs[3] + 1}",
+    ]
+
+
+def test_slow_subscriber_is_disconnected(monkeypatch):
+    monkeypatch.setattr("api.sse_router.QUEUE_SIZE", 2)
+
+    async def scenario():
+        bus = EventBus()
+        queue = await bus.subscribe()
+        for n in range(3):
+            await bus.publish(Event(str(n + 1), "tick", {}, "2024-01-01T00:00:00"))
+        gen = _heartbeat_generator(queue, bus)
+        with pytest.raises(StopAsyncIteration):
+            await gen.__anext__()
+        return bus.subscriber_count
+
+    assert asyncio.run(scenario()) == 0
+
+
+def _daemon():
+    from unittest.mock import MagicMock
+
+    from lib.daemon import TimeOSDaemon
+
+    daemon = TimeOSDaemon.__new__(TimeOSDaemon)
+    daemon.logger = MagicMock()
+    return daemon
+
+
+def test_daemon_streams_new_signals(store, monkeypatch):
+    from pathlib import Path
+    from unittest.mock import MagicMock
+
+    signals = [
+        {"signal_id": "sig_a", "entity_type": "client", "entity_id": "c1", "severity": "warning"},
+        {"signal_id": "sig_b", "entity_type": "client", "entity_id": "c2", "severity": "watch"},
+    ]
+    monkeypatch.setattr("lib.daemon.paths.db_path", lambda: Path(store.db_path))
+    monkeypatch.setattr(
+        "lib.intelligence.signals.detect_all_signals", MagicMock(return_value={"signals": signals})
+    )
+    monkeypatch.setattr("lib.v4.proposal_service.ProposalService", MagicMock())
+
+    _daemon()._handle_intelligence()
+
+    events = event_log.read_after(0, store=store)
+    assert [(e.event_type, e.data["entity_id"]) for e in events] == [("signal_new", "c1")]
+
+
+def test_daemon_cycle_logs_metric_refresh(store, monkeypatch):
+    daemon = _daemon()
+    monkeypatch.setattr(daemon, "_run_job", lambda name: name != "collect", raising=False)
+    monkeypatch.setattr(daemon, "_save_state", lambda: None, raising=False)
+
+    daemon.run_once()
+
+    [event] = event_log.read_after(0, store=store)
+    assert event.event_type == "metric_refresh"
+    assert event.source == "daemon"
+    assert event.data["jobs"][0] == "collect"
+    assert event.data["succeeded"] == len(event.data["jobs"]) - 1
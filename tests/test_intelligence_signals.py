@@ -619,6 +619,63 @@ class TestSignalClearing:
         active = get_active_signals(entity_id="cool-client", db_path=fixture_db)
         assert len(active) == 1
 
+    def test_batch_reconcile_mixed_transitions(self, fixture_db):
+        """One batch mixes new, ongoing and cleared signals, applied in one pass."""
+        import sqlite3
+
+        def sig(i):
+            return {
+                "signal_id": "sig_batch",
+                "entity_type": "client",
+                "entity_id": f"batch-{i}",
+                "severity": "watch",
+                "evidence": {"i": i},
+            }
+
+        update_signal_state([sig(i) for i in range(300)], fixture_db)
+
+        # Age the first 100 past the cooldown so the ones not re-detected clear.
+        conn = sqlite3.connect(fixture_db)
+        conn.execute(
+            "UPDATE signal_state SET last_evaluated_at = '2000-01-01T00:00:00+00:00' "
+            "WHERE CAST(SUBSTR(entity_id, 7) AS INTEGER) < 100"
+        )
+        conn.commit()
+        conn.close()
+
+        result = update_signal_state([sig(i) for i in range(50, 350)], fixture_db)
+
+        assert len(result["new_signals"]) == 50
+        assert len(result["ongoing_signals"]) == 250
+        assert len(result["cleared_signals"]) == 50
+        assert {s["evaluation_count"] for s in result["ongoing_signals"]} == {2}
+        conn = sqlite3.connect(fixture_db)
+        active = conn.execute(
+            "SELECT COUNT(*) FROM signal_state WHERE signal_id = 'sig_batch' AND status = 'active'"
+        ).fetchone()[0]
+        conn.close()
+        assert active == 300
+
+    def test_duplicate_detections_in_one_batch(self, fixture_db):
+        """A signal repeated within one batch is inserted once, then counted as ongoing."""
+        detected = [
+            {
+                "signal_id": "sig_dup",
+                "entity_type": "client",
+                "entity_id": "dup-client",
+                "severity": "warning",
+                "evidence": {},
+            }
+        ] * 2
+
+        result = update_signal_state(detected, fixture_db)
+
+        assert len(result["new_signals"]) == 1
+        assert result["ongoing_signals"][0]["evaluation_count"] == 2
+        active = get_active_signals(entity_id="dup-client", db_path=fixture_db)
+        assert len(active) == 1
+        assert active[0]["evaluation_count"] == 2
+
 
 class TestPortfolioTrendDeadCodeRemoved:
     """The portfolio TREND branch must not run the wasteful N×M portfolio_trajectory query."""
@@ -7,15 +7,25 @@ Tests cover:
 - Edge cases (empty list, last page, oversized page)
 - Cursor pagination model
 - PaginationParams dependency
+- Keyset pagination engine and signed cursors
 """
 
+import sqlite3
+
 import pytest
 from pydantic import ValidationError
 
 from lib.api.pagination import (
     CursorPaginatedResponse,
+    InvalidCursor,
+    KeysetSpec,
     PaginatedResponse,
     PaginationParams,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+    keyset_paginate,
+    offset_paginate,
     paginate,
 )
 
@@ -342,3 +352,134 @@ class TestPaginationEdgeCases:
         items = list(range(1, 98))  # 97 items
         response = paginate(items, page=1, page_size=25)
         assert response.total_pages == 4  # 97 / 25 = 3.88, rounds up to 4
+
+
+@pytest.fixture
+def items_db():
+    """25 items with duplicate created_at values, so ties need the id."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id TEXT PRIMARY KEY, created_at TEXT, kind TEXT)")
+    conn.execute("CREATE INDEX idx_items_created ON items (created_at, id)")
+    conn.executemany(
+        "INSERT INTO items VALUES (?, ?, ?)",
+        [(f"i{n:02d}", f"2024-01-{n // 3 + 1:02d}", "a" if n % 2 else "b") for n in range(25)],
+    )
+    yield conn
+    conn.close()
+
+
+ITEMS = KeysetSpec(name="items", source="items", columns="id, kind", key="created_at")
+
+
+def _walk(conn, spec, limit, **kwargs):
+    ids, cursor, pages = [], None, 0
+    while True:
+        rows, cursor = keyset_page(conn, spec, limit, cursor, **kwargs)
+        ids.extend(row["id"] for row in rows)
+        pages += 1
+        if cursor is None:
+            return ids, pages
+
+
+class TestKeysetCursor:
+    """Tests for signed keyset cursors."""
+
+    def test_round_trip(self):
+        cursor = encode_cursor(["2024-01-01", "i01"], "items:desc")
+        assert decode_cursor(cursor, "items:desc") == ["2024-01-01", "i01"]
+
+    def test_tampered_cursor_rejected(self):
+        cursor = encode_cursor(["2024-01-01", "i01"], "items:desc")
+        tampered = cursor[:-2] + ("A" if cursor[-2] != "A" else "B") + cursor[-1]
+        with pytest.raises(InvalidCursor):
+            decode_cursor(tampered, "items:desc")
+        with pytest.raises(InvalidCursor):
+            decode_cursor("not-a-cursor", "items:desc")
+
+    def test_cursor_bound_to_scope(self):
+        cursor = encode_cursor(["2024-01-01", "i01"], "items:desc")
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor, "items:asc")
+
+    def test_secret_from_environment(self, monkeypatch):
+        monkeypatch.setenv("MOH_CURSOR_SECRET", "one")
+        cursor = encode_cursor([1, "a"])
+        assert decode_cursor(cursor) == [1, "a"]
+        monkeypatch.setenv("MOH_CURSOR_SECRET", "two")
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor)
+
+    def test_default_secret_is_shared_through_data_dir(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("MOH_CURSOR_SECRET", raising=False)
+        monkeypatch.setenv("MOH_TIME_OS_HOME", str(tmp_path))
+        cursor = encode_cursor([1, "a"])
+
+        key = tmp_path / "data" / ".cursor_secret"
+        assert key.stat().st_mode & 0o777 == 0o600
+        # Another worker, or this one after a restart, reads the same key
+        monkeypatch.setattr("lib.api.pagination._file_secrets", {})
+        assert decode_cursor(cursor) == [1, "a"]
+
+        monkeypatch.setattr("lib.api.pagination._file_secrets", {})
+        key.write_bytes(b"rotated")
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor)
+
+
+class TestKeysetPagination:
+    """Tests for keyset_page() and the SQL it runs."""
+
+    def test_pages_cover_rows_once_in_order(self, items_db):
+        expected = [
+            row[0]
+            for row in items_db.execute("SELECT id FROM items ORDER BY created_at DESC, id DESC")
+        ]
+        ids, pages = _walk(items_db, ITEMS, 4)
+        assert ids == expected
+        assert pages == 7
+
+    def test_ascending_with_filter(self, items_db):
+        spec = KeysetSpec(
+            name="items", source="items", columns="id", key="created_at", descending=False
+        )
+        ids, _ = _walk(items_db, spec, 3, where="kind = ?", params=["a"])
+        expected = [
+            row[0]
+            for row in items_db.execute(
+                "SELECT id FROM items WHERE kind = 'a' ORDER BY created_at, id"
+            )
+        ]
+        assert ids == expected
+
+    def test_cursor_from_other_direction_rejected(self, items_db):
+        _, cursor = keyset_page(items_db, ITEMS, 2)
+        spec = KeysetSpec(
+            name="items", source="items", columns="id", key="created_at", descending=False
+        )
+        with pytest.raises(InvalidCursor):
+            keyset_page(items_db, spec, 2, cursor)
+
+    def test_next_page_uses_index_range(self, items_db):
+        plan = items_db.execute(
+            "EXPLAIN QUERY PLAN " + ITEMS.page_sql(after=True), ["x", "x", "y", 10, 0]
+        ).fetchall()
+        assert any("SEARCH items USING INDEX idx_items_created" in row[3] for row in plan)
+
+    def test_keyset_paginate_response(self, items_db):
+        first = keyset_paginate(items_db, ITEMS, 20)
+        assert isinstance(first, CursorPaginatedResponse)
+        assert first.has_more is True
+        assert set(first.data[0]) == {"id", "kind"}
+        last = keyset_paginate(items_db, ITEMS, 20, first.next_cursor)
+        assert len(last.data) == 5
+        assert last.has_more is False
+        assert last.next_cursor is None
+
+    def test_offset_paginate_matches_paginate(self, items_db):
+        ids, _ = _walk(items_db, ITEMS, 25)
+        response = offset_paginate(items_db, ITEMS, page=3, page_size=10)
+        expected = paginate(ids, page=3, page_size=10)
+        assert [row["id"] for row in response.data] == expected.data
+        assert response.total == 25
+        assert response.total_pages == expected.total_pages
+        assert response.has_next is False
@@ -0,0 +1,218 @@
+"""Tests for the materialised priority queue.
+
+PriorityAnalyzer.analyze() rewrites priority_queue, sync_queue() rescores only
+changed items, and search_queue() filters, sorts and pages it in SQL.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from lib import schema_engine
+from lib.analyzers import priority_queue
+from lib.analyzers.priority import PriorityAnalyzer
+from lib.state_store import StateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "queue.db"
+    conn = sqlite3.connect(str(path))
+    schema_engine.create_fresh(conn)
+    conn.close()
+    StateStore._instance = None
+    store = StateStore(str(path))
+    today = datetime.now(timezone.utc).date()
+    tasks = [
+        ("t1", "Ship release", today.isoformat(), "alice", '["urgent"]'),
+        ("t2", "Write docs", None, None, None),
+        ("t3", "Fix 100% bug", (today + timedelta(days=3)).isoformat(), "bob", "[]"),
+        ("t4", "Plan offsite", (today - timedelta(days=2)).isoformat(), "alice", '["ops"]'),
+        ("t5", "Review budget", None, "carol", None),
+    ]
+    for task_id, title, due, assignee, tags in tasks:
+        store.insert(
+            "tasks",
+            {
+                "id": task_id,
+                "title": title,
+                "due_date": due,
+                "assignee": assignee,
+                "tags": tags,
+                "status": "active",
+            },
+        )
+    store.insert(
+        "communications",
+        {
+            "id": "m1",
+            "subject": "Contract question",
+            "labels": "[]",
+            "requires_response": 1,
+            "processed": 0,
+        },
+    )
+    yield store
+    store.close_connections()
+    StateStore._instance = None
+
+
+@pytest.fixture
+def analyzer(store):
+    return PriorityAnalyzer(config={}, store=store)
+
+
+def _ids(result):
+    return [item["id"] for item in result["items"]]
+
+
+def test_analyze_persists_queue(store, analyzer):
+    items = analyzer.analyze()
+
+    result = priority_queue.search_queue(store, limit=100)
+    assert result["total"] == 6
+    assert [i["score"] for i in result["items"]] == sorted(
+        (i["score"] for i in items), reverse=True
+    )
+    assert {i["id"] for i in result["items"]} == {i["id"] for i in items}
+
+
+def test_sync_rescores_only_changed_items(store, analyzer):
+    analyzer.analyze()
+    assert analyzer.sync_queue() == {"rescored": 0, "removed": 0, "more": False}
+
+    store.update("tasks", "t2", {"due_date": datetime.now(timezone.utc).date().isoformat()})
+    store.update("tasks", "t5", {"status": "done"})
+    store.insert("tasks", {"id": "t6", "title": "New task", "status": "active"})
+
+    assert analyzer.sync_queue() == {"rescored": 2, "removed": 1, "more": False}
+    ids = _ids(priority_queue.search_queue(store, limit=100))
+    assert "t5" not in ids
+    assert "t6" in ids
+    assert priority_queue.search_queue(store, due="today")["total"] == 2
+
+
+def test_filters_run_in_sql(store, analyzer):
+    analyzer.analyze()
+
+    assert _ids(priority_queue.search_queue(store, q="100%")) == ["t3"]
+    assert _ids(priority_queue.search_queue(store, q="docs")) == ["t2"]
+    assert set(_ids(priority_queue.search_queue(store, due="no_date"))) == {"t2", "t5", "m1"}
+    assert _ids(priority_queue.search_queue(store, due="overdue")) == ["t4"]
+    assert set(_ids(priority_queue.search_queue(store, assignee="ALICE"))) == {"t1", "t4"}
+    assert set(_ids(priority_queue.search_queue(store, assignee="unassigned"))) == {"t2", "m1"}
+    assert set(_ids(priority_queue.search_queue(store, tags="urgent, ops"))) == {"t1", "t4"}
+    assert _ids(priority_queue.search_queue(store, status="active", sort="title", order="asc")) == [
+        "t3",
+        "t4",
+        "t5",
+        "t1",
+        "t2",
+    ]
+
+
+def test_keyset_pages_cover_queue_once(store, analyzer):
+    analyzer.analyze()
+    expected = _ids(priority_queue.search_queue(store, sort="due", limit=100))
+
+    seen, cursor = [], None
+    while True:
+        page = priority_queue.search_queue(store, sort="due", limit=2, cursor=cursor)
+        seen.extend(_ids(page))
+        if not page["has_more"]:
+            break
+        cursor = page["next_cursor"]
+
+    assert seen == expected
+    with pytest.raises(ValueError):
+        priority_queue.search_queue(store, cursor="not-a-cursor")
+
+
+def test_catch_up_syncs_after_published_writes(store, analyzer):
+    analyzer.analyze()
+    priority_queue.catch_up(analyzer, max_age_seconds=3600)
+    assert priority_queue.catch_up(analyzer, max_age_seconds=3600) is None
+
+    store.update("tasks", "t1", {"title": "Ship release now"})
+
+    assert priority_queue.catch_up(analyzer, max_age_seconds=3600) == {
+        "rescored": 1,
+        "removed": 0,
+        "more": False,
+    }
+
+
+def test_catch_up_is_bounded_and_stays_stale(store, analyzer):
+    priority_queue._stale.set()  # never analysed: every item is missing
+
+    assert priority_queue.catch_up(analyzer, max_age_seconds=3600, limit=2) == {
+        "rescored": 3,  # two tasks, the one email
+        "removed": 0,
+        "more": True,
+    }
+    assert priority_queue.search_queue(store, limit=100)["total"] == 3
+    assert priority_queue.catch_up(analyzer, max_age_seconds=3600, limit=2)["rescored"] == 2
+    assert priority_queue.catch_up(analyzer, max_age_seconds=3600, limit=2)["more"] is False
+    assert priority_queue.search_queue(store, limit=100)["total"] == 6
+
+
+def test_catch_up_serves_stored_queue_while_background_sync_runs(store, analyzer):
+    priority_queue._stale.set()
+    with priority_queue._sync_lock:  # as held by start_background_sync()
+        assert priority_queue.catch_up(analyzer, max_age_seconds=3600) is None
+
+    priority_queue.start_background_sync(analyzer).join()
+    assert priority_queue.search_queue(store, limit=100)["total"] == 6
+    assert priority_queue.catch_up(analyzer, max_age_seconds=3600) is None
+
+
+def test_score_write_back_skips_unchanged_rows(store, analyzer):
+    items = analyzer.analyze()
+    assert analyzer._update_stored_scores(items) == 0
+
+    items[0] = {**items[0], "score": items[0]["score"] - 10}
+    assert analyzer._update_stored_scores(items) == 1
+    table = "tasks" if items[0]["type"] == "task" else "communications"
+    assert store.get(table, items[0]["id"])["priority"] == int(items[0]["score"])
+
+
+def test_daemon_priorities_stage_runs_full_pass(store, monkeypatch):
+    from unittest.mock import MagicMock
+
+    from lib.daemon import TimeOSDaemon
+
+    monkeypatch.setattr("lib.analyzers.priority.get_store", lambda: store)
+    monkeypatch.setattr(PriorityAnalyzer, "_load_config", lambda self: {})
+    daemon = TimeOSDaemon.__new__(TimeOSDaemon)
+    daemon.logger = MagicMock()
+
+    daemon._handle_priorities()
+
+    assert priority_queue.search_queue(store, limit=100)["total"] == 6
+
+
+def test_priorities_endpoints_read_stored_queue(store, analyzer, monkeypatch):
+    from types import SimpleNamespace
+
+    from pathlib import Path
+
+    import lib.paths
+
+    # api.server opens its stores on import
+    monkeypatch.setattr(lib.paths, "db_path", lambda: Path(store.db_path))
+    monkeypatch.setattr(lib.paths, "data_dir", lambda: Path(store.db_path).parent)
+    import api.server as server
+
+    analyzer.analyze()
+    monkeypatch.setattr(server, "store", store)
+    monkeypatch.setattr(server, "analyzers", SimpleNamespace(priority_analyzer=analyzer))
+    monkeypatch.setattr(analyzer, "analyze", lambda: pytest.fail("rescored on read"))
+
+    result = server._stored_priorities(limit=2)
+
+    assert result["total"] == 6
+    assert [i["score"] for i in result["items"]] == sorted(
+        (i["score"] for i in result["items"]), reverse=True
+    )
+    assert len(result["items"]) == 2
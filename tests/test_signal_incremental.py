@@ -0,0 +1,73 @@
+"""
+Tests for incremental signal detection (detect_all_signals(incremental=True)).
+
+Entities whose input fingerprint (cached aggregate row plus task/invoice/
+communication watermarks) is unchanged since their last evaluation reuse the
+signals persisted then; only dirty entities are re-run.
+"""
+
+import sqlite3
+
+import pytest
+
+from lib.intelligence.signals import detect_all_signals
+from tests.fixtures.fixture_db import create_fixture_db
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "incremental.db"
+    create_fixture_db(path).close()
+    return path
+
+
+def _keys(result):
+    return sorted((s["signal_id"], s["entity_type"], s["entity_id"]) for s in result["signals"])
+
+
+def _entity_count(result):
+    return result["entities_evaluated"] + result["entities_reused"]
+
+
+def test_second_run_reuses_every_clean_entity(db_path):
+    first = detect_all_signals(db_path, quick=True, incremental=True)
+    second = detect_all_signals(db_path, quick=True, incremental=True)
+
+    assert first["entities_reused"] == 0
+    assert first["entities_evaluated"] > 0
+    assert second["entities_evaluated"] == 0
+    assert second["entities_reused"] == _entity_count(first)
+    assert _keys(second) == _keys(first)
+
+
+def test_incremental_matches_full_evaluation(db_path):
+    detect_all_signals(db_path, quick=True, incremental=True)
+    reused = detect_all_signals(db_path, quick=True, incremental=True)
+    full = detect_all_signals(db_path, quick=True)
+
+    assert full["incremental"] is False
+    assert full["entities_reused"] == 0
+    assert _keys(reused) == _keys(full)
+
+
+def test_touching_a_task_only_dirties_its_entities(db_path):
+    first = detect_all_signals(db_path, quick=True, incremental=True)
+
+    conn = sqlite3.connect(db_path)
+    task = conn.execute("SELECT id FROM tasks WHERE project_id IS NOT NULL LIMIT 1").fetchone()
+    assert task is not None
+    conn.execute("UPDATE tasks SET updated_at = '2999-01-01T00:00:00' WHERE id = ?", task)
+    conn.commit()
+    conn.close()
+
+    second = detect_all_signals(db_path, quick=True, incremental=True)
+
+    assert 1 <= second["entities_evaluated"] <= 3  # its client, project and assignee
+    assert second["entities_reused"] == _entity_count(first) - second["entities_evaluated"]
+
+
+def test_modes_keep_separate_fingerprints(db_path):
+    detect_all_signals(db_path, quick=True, incremental=True)
+    other_mode = detect_all_signals(db_path, quick=False, incremental=True)
+
+    assert other_mode["entities_reused"] == 0
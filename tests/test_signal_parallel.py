@@ -0,0 +1,60 @@
+"""
+Tests for parallel signal evaluation (detect_all_signals(workers=N)).
+
+The client/project/person loops can be fanned out over a worker pool sharing the
+primed DetectionCache; the merged output must match a serial run exactly.
+"""
+
+import pytest
+
+from lib.intelligence import signals
+from lib.intelligence.signals import (
+    DetectionCache,
+    SignalEvaluationError,
+    _entity_universe,
+    _evaluate_entities,
+    detect_all_signals,
+)
+
+
+def _strip(result):
+    return [{k: v for k, v in s.items() if k != "detected_at"} for s in result["signals"]]
+
+
+@pytest.mark.parametrize("quick", [True, False])
+def test_parallel_matches_serial(fixture_db_path, quick):
+    serial = detect_all_signals(fixture_db_path, quick=quick)
+    parallel = detect_all_signals(fixture_db_path, quick=quick, workers=3)
+
+    assert _strip(parallel) == _strip(serial)
+    assert parallel["by_severity"] == serial["by_severity"]
+    assert parallel["evaluation_errors"] == serial["evaluation_errors"]
+
+
+def test_thread_fallback_keeps_entity_order(fixture_db_path, monkeypatch):
+    monkeypatch.setattr(signals.multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    cache = DetectionCache(fixture_db_path)
+    entities = [u[:3] for u in _entity_universe(cache)]
+
+    serial = _evaluate_entities(entities, fixture_db_path, None, cache, True)
+    threaded = _evaluate_entities(entities, fixture_db_path, None, cache, True, workers=4)
+
+    assert [[s["signal_id"] for s in d] for d, _ in threaded] == [
+        [s["signal_id"] for s in d] for d, _ in serial
+    ]
+
+
+def test_errors_merge_in_entity_order(fixture_db_path, monkeypatch):
+    def failing(entity_type, entity_id, db_path, categories, cache, fast_only, collector):
+        collector.add(SignalEvaluationError("sig_x", entity_type, entity_id, "ValueError", "boom"))
+        return []
+
+    monkeypatch.setattr(signals.multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    monkeypatch.setattr(signals, "detect_signals_for_entity", failing)
+    entities = [("client", f"c{i}", f"C{i}") for i in range(10)]
+
+    out = _evaluate_entities(
+        entities, fixture_db_path, None, DetectionCache(fixture_db_path), True, workers=3
+    )
+
+    assert [errors[0].entity_id for _, errors in out] == [f"c{i}" for i in range(10)]
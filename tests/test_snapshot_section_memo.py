@@ -0,0 +1,157 @@
+"""Tests for section-level memoisation in AgencySnapshotGenerator.
+
+generate() reuses a page section from the previous saved snapshot when the
+watermarks of the tables it reads are unchanged, and rebuilds only the
+sections whose inputs moved.
+"""
+
+import sqlite3
+from collections import Counter
+
+import pytest
+
+from lib import schema_engine
+from lib.agency_snapshot.generator import AgencySnapshotGenerator
+from lib.agency_snapshot.section_memo import sidecar_path, table_watermark
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("MOH_TIME_OS_HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("MOH_TIME_OS_ENV", "artifact_validation")
+    path = tmp_path / "snap.db"
+    conn = sqlite3.connect(str(path))
+    schema_engine.create_fresh(conn)
+    # _build_normalized_data reads the thread-scoped commitment columns.
+    for column in ("commitment_id", "commitment_text", "scope_ref_type", "scope_ref_id", "due_at"):
+        conn.execute(f"ALTER TABLE commitments ADD COLUMN {column} TEXT")
+    conn.execute("INSERT INTO clients (id, name) VALUES ('acme', 'Acme')")
+    conn.execute(
+        "INSERT INTO invoices (id, source, external_id, client_id, amount, status, due_date) "
+        "VALUES ('i1', 'xero', 'x1', 'acme', 100, 'sent', '2026-01-31')"
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+CASH_AR = {
+    "tiles": {"valid_ar": {"AED": 100.0}, "severe_ar": {}, "badge": "GREEN", "summary": ""},
+    "debtors": [
+        {
+            "client_id": "acme",
+            "client_name": "Acme",
+            "total_valid_ar": 100.0,
+            "aging_bucket": "current",
+        }
+    ],
+}
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Count page engine builds; each returns a minimal contract-valid section."""
+    counter = Counter()
+    # Keep the whole test inside one clock bucket.
+    monkeypatch.setattr("lib.agency_snapshot.section_memo.CLOCK_BUCKET_SECONDS", 10**9)
+
+    def engine(name, value):
+        def build(self):
+            counter[name] += 1
+            return value
+
+        return build
+
+    monkeypatch.setattr(
+        AgencySnapshotGenerator,
+        "_build_client_360",
+        engine("client_360", {"portfolio": []}),
+    )
+    monkeypatch.setattr(
+        AgencySnapshotGenerator,
+        "_build_cash_ar",
+        engine("cash_ar", CASH_AR),
+    )
+    monkeypatch.setattr(
+        AgencySnapshotGenerator,
+        "_build_comms_commitments",
+        engine("comms_commitments", {"threads": [], "commitments": [], "overdue_count": 0}),
+    )
+    return counter
+
+
+def _run(db_path, **kwargs):
+    generator = AgencySnapshotGenerator(db_path=db_path)
+    snapshot = generator.generate(**kwargs)
+    generator.save(snapshot)
+    return snapshot
+
+
+def test_unchanged_sections_are_reused(db_path, calls):
+    first = _run(db_path)
+    second = _run(db_path)
+
+    assert calls == {"client_360": 1, "cash_ar": 1, "comms_commitments": 1}
+    for section in ("client_360", "cash_ar", "comms_commitments", "capacity_command"):
+        assert second[section] == first[section]
+
+
+def test_only_sections_reading_a_changed_table_rebuild(db_path, calls):
+    _run(db_path)
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("INSERT INTO cost_snapshots (id, computed_at) VALUES ('s1', '2026-01-01')")
+    conn.commit()
+    conn.close()
+
+    _run(db_path)
+
+    assert calls == {"client_360": 1, "cash_ar": 1, "comms_commitments": 2}
+
+
+def test_full_rebuild_when_not_incremental(db_path, calls):
+    _run(db_path)
+    _run(db_path, incremental=False)
+
+    assert calls == {"client_360": 2, "cash_ar": 2, "comms_commitments": 2}
+
+
+def test_snapshot_saved_without_fingerprints_is_not_reused(db_path, calls):
+    snapshot = _run(db_path)
+    # A generator that did not build the snapshot (e.g. the daemon fallback).
+    AgencySnapshotGenerator(db_path=db_path).save(snapshot)
+
+    _run(db_path)
+
+    assert calls["cash_ar"] == 2
+
+
+def test_degraded_section_is_rebuilt_next_run(db_path, calls, monkeypatch):
+    def fail(self):
+        calls["cash_ar"] += 1
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(AgencySnapshotGenerator, "_build_cash_ar", fail)
+    _run(db_path)
+    _run(db_path)
+
+    assert calls["cash_ar"] == 2
+    assert calls["client_360"] == 1
+
+
+def test_table_watermark_tracks_rows_and_missing_tables(db_path):
+    conn = sqlite3.connect(str(db_path))
+    before = table_watermark(conn, "invoices")
+    conn.execute("UPDATE invoices SET updated_at = '2099-01-01' WHERE id = 'i1'")
+    after = table_watermark(conn, "invoices")
+    missing = table_watermark(conn, "no_such_table")
+    conn.close()
+
+    assert before[0] == after[0] == 1
+    assert after != before
+    assert missing is None
+
+
+def test_sidecar_sits_next_to_snapshot(tmp_path):
+    assert sidecar_path(tmp_path / "agency_snapshot.json") == (
+        tmp_path / "agency_snapshot.sections.json"
+    )
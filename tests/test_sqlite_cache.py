@@ -0,0 +1,167 @@
+"""
+Tests for the shared SQLite cache backend.
+
+Tests cover:
+- CacheManager semantics (get/set, TTL, pattern and tag invalidation)
+- Entries and invalidations visible across instances and processes
+- Compact serialisation of large values
+- Count- and byte-bounded LRU eviction
+- Backend selection via MOH_CACHE_BACKEND
+"""
+
+import multiprocessing
+import time
+
+import pytest
+
+from lib.cache import CacheManager, SQLiteCacheManager, decorators
+from lib.cache.sqlite_cache import _dumps, _loads
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "cache.db"
+
+
+@pytest.fixture
+def cache(path):
+    c = SQLiteCacheManager(path)
+    yield c
+    c.close()
+
+
+def _child_set(path, key, value):
+    SQLiteCacheManager(path).set(key, value, tags={"signals"})
+
+
+def _child_invalidate(path, tag):
+    SQLiteCacheManager(path).invalidate_tags({tag})
+
+
+class TestSemantics:
+    """Test parity with the in-memory CacheManager."""
+
+    def test_set_get_delete(self, cache):
+        cache.set("k", {"a": [1, 2]})
+        assert cache.get("k") == {"a": [1, 2]}
+        cache.delete("k")
+        assert cache.get("k") is None
+
+    def test_ttl_expiry(self, cache):
+        cache.set("k", 1, ttl_seconds=0)
+        assert cache.get("k") is None
+        assert cache.stats().size == 0
+
+    def test_invalidate_pattern(self, cache):
+        cache.set("client:1", 1)
+        cache.set("client:2", 2)
+        cache.set("project:1", 3)
+
+        assert cache.invalidate_pattern("client:*") == 2
+        assert cache.get("project:1") == 3
+
+    def test_tags_and_versions(self, cache):
+        cache.set("a", 1, tags={"signals", "client:c1"})
+        cache.set("b", 2, tags={"scores"})
+        versions = cache.tag_versions({"signals"})
+
+        assert cache.invalidate_tags({"client:c1"}) == 1
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.set("a", 1, tags={"signals"}, tag_versions=versions) is True
+
+        cache.invalidate_tags({"signals"})
+        assert cache.set("a", 1, tags={"signals"}, tag_versions=versions) is False
+
+    def test_replacing_entry_drops_old_tags(self, cache):
+        cache.set("k", 1, tags={"signals"})
+        cache.set("k", 2, tags={"scores"})
+
+        assert cache.invalidate_tags({"signals"}) == 0
+        assert cache.get("k") == 2
+
+    def test_stats(self, cache):
+        cache.set("k", 1)
+        cache.get("k")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+class TestSharing:
+    """Test that instances and processes share entries."""
+
+    def test_second_instance_sees_entries_and_invalidations(self, path, cache):
+        other = SQLiteCacheManager(path)
+        cache.set("k", "v", tags={"signals"})
+
+        assert other.get("k") == "v"
+        other.invalidate_tags({"signals"})
+        assert cache.get("k") is None
+
+    def test_cross_process(self, path, cache):
+        ctx = multiprocessing.get_context("spawn")
+        proc = ctx.Process(target=_child_set, args=(str(path), "k", [1, 2, 3]))
+        proc.start()
+        proc.join(30)
+        assert cache.get("k") == [1, 2, 3]
+
+        proc = ctx.Process(target=_child_invalidate, args=(str(path), "signals"))
+        proc.start()
+        proc.join(30)
+        assert cache.get("k") is None
+
+
+class TestStorage:
+    """Test serialisation and eviction."""
+
+    def test_large_values_are_compressed(self):
+        value = {"rows": ["same row text"] * 500}
+        blob = _dumps(value)
+
+        assert blob[:1] == b"\x01"
+        assert len(blob) < 1000
+        assert _loads(blob) == value
+        assert _dumps("small")[:1] == b"\x00"
+
+    def test_unpicklable_value_is_not_stored(self, cache):
+        assert cache.set("k", lambda: None) is False
+        assert cache.get("k") is None
+
+    def test_lru_eviction_by_count(self, path):
+        cache = SQLiteCacheManager(path, max_size=2)
+        cache.set("a", 1)
+        time.sleep(0.01)
+        cache.set("b", 2)
+        time.sleep(0.01)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_lru_eviction_by_bytes(self, path):
+        cache = SQLiteCacheManager(path, max_bytes=300)
+        cache.set("a", b"x" * 200)
+        time.sleep(0.01)
+        cache.set("b", b"y" * 200)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == b"y" * 200
+
+
+class TestBackendSelection:
+    """Test get_cache() backend selection."""
+
+    def test_env_selects_backend(self, monkeypatch, path):
+        monkeypatch.setenv(decorators.CACHE_ENV_BACKEND, "sqlite")
+        monkeypatch.setenv(decorators.CACHE_ENV_PATH, str(path))
+        assert isinstance(decorators._create_cache(), SQLiteCacheManager)
+
+        monkeypatch.delenv(decorators.CACHE_ENV_BACKEND)
+        assert type(decorators._create_cache()) is CacheManager
+
+        monkeypatch.setenv(decorators.CACHE_ENV_BACKEND, "redis")
+        with pytest.raises(ValueError):
+            decorators._create_cache()
@@ -0,0 +1,110 @@
+"""Tests for StateStore persistent connection reuse.
+
+Reads run on a per-thread reader connection and writes on one shared writer
+connection, both opened once with tuned pragmas. These tests pin reuse, pragma
+setup, read-after-write visibility, nested-write semantics, and reconnection when
+the database file or path changes.
+"""
+
+import threading
+
+import pytest
+
+from lib.state_store import StateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    StateStore._instance = None
+    s = StateStore(str(tmp_path / "pool.db"))
+    s.execute_write("CREATE TABLE g (id TEXT PRIMARY KEY, name TEXT)")
+    yield s
+    s.close_connections()
+    StateStore._instance = None
+
+
+def test_reads_reuse_one_connection_per_thread(store):
+    store.insert("g", {"id": "1", "name": "a"})
+    store.get("g", "1")  # opens this thread's reader
+    before = store.pool_stats()["connections_opened"]
+
+    for _ in range(20):
+        assert store.get("g", "1")["name"] == "a"
+        store.query("SELECT * FROM g")
+        store.count("g")
+
+    stats = store.pool_stats()
+    assert stats["connections_opened"] == before
+    assert stats["reader_connections"] == 1
+    assert stats["writer_connections"] == 1
+    assert stats["reuse_ratio"] > 0.9
+
+
+def test_pragmas_applied_once_per_connection(store):
+    conn = store._read_conn()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+
+
+def test_reader_sees_committed_writes_immediately(store):
+    assert store.get("g", "1") is None  # reader connection now open
+    store.insert("g", {"id": "1", "name": "a"})
+    assert store.get("g", "1")["name"] == "a"
+    store.update("g", "1", {"name": "b"})
+    assert store.query("SELECT name FROM g WHERE id = '1'")[0]["name"] == "b"
+    store.delete("g", "1")
+    assert store.count("g") == 0
+
+
+def test_each_thread_gets_its_own_reader(store):
+    store.insert("g", {"id": "1", "name": "a"})
+    results = []
+
+    def worker():
+        results.append(store.get("g", "1")["name"])
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["a"] * 4
+    # Readers of finished threads are reclaimed when the next reader registers.
+    store.close_connections()
+    store.get("g", "1")
+    assert store.pool_stats()["reader_connections"] == 1
+
+
+def test_nested_write_joins_enclosing_transaction(store):
+    def unit(conn):
+        conn.execute("INSERT INTO g (id, name) VALUES ('1', 'a')")
+        store.insert("g", {"id": "2", "name": "b"})
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        store.transaction(unit)
+
+    # The nested insert must not have committed the outer unit of work early.
+    assert store.count("g") == 0
+
+
+def test_reconnects_when_db_path_changes(store, tmp_path):
+    store.insert("g", {"id": "1", "name": "a"})
+    assert store.count("g") == 1
+    store.db_path = str(tmp_path / "other.db")
+    store.execute_write("CREATE TABLE g (id TEXT PRIMARY KEY, name TEXT)")
+
+    assert store.count("g") == 0
+    assert store.pool_stats()["connections_reopened"] >= 2
+
+
+def test_close_connections_reopens_lazily(store):
+    store.insert("g", {"id": "1", "name": "a"})
+    store.close_connections()
+    assert store.pool_stats()["reader_connections"] == 0
+    assert store.pool_stats()["writer_connections"] == 0
+    assert store.get("g", "1")["name"] == "a"
@@ -617,3 +617,89 @@ class TestSubjectAccessManager:
         # All should find the same data
         assert report1.total_records == report2.total_records == report3.total_records
         assert report1.total_records > 0
+
+    def test_identifier_map_covers_phone_columns(self, temp_db):
+        """Test the identifier map classifies every identifier column once."""
+        manager = SubjectAccessManager(temp_db)
+        columns = {c.name: c.kind for c in manager.identifier_map()["people"]}
+
+        assert columns == {"name": "name", "email": "email", "phone": "phone", "client_id": "id"}
+        assert manager.identifier_map()["sync_state"] == []
+
+    def test_identifier_map_refreshes_after_schema_change(self, temp_db):
+        """Test the cached map picks up columns added after it was built."""
+        manager = SubjectAccessManager(temp_db)
+        assert "owner_email" not in [c.name for c in manager.identifier_map()["events"]]
+
+        conn = sqlite3.connect(temp_db)
+        conn.execute("ALTER TABLE events ADD COLUMN owner_email TEXT")
+        conn.commit()
+        conn.close()
+
+        assert "owner_email" in [c.name for c in manager.identifier_map()["events"]]
+
+    def test_find_by_phone(self, temp_db):
+        """Test phone numbers are matched exactly."""
+        manager = SubjectAccessManager(temp_db)
+        report = manager.find_subject_data("555-1111")
+
+        assert report.tables_with_data == ["people"]
+        assert report.data_by_table["people"][0]["id"] == "p1"
+
+    def test_session_reuses_search(self, temp_db):
+        """Test a session searches once per subject until data changes."""
+        manager = SubjectAccessManager(temp_db)
+        calls = []
+        search = manager._search_table
+        manager._search_table = lambda *a, **kw: calls.append(a[0]) or search(*a, **kw)
+
+        with manager.session():
+            manager.find_subject_data("john@example.com")
+            searches = len(calls)
+            manager.export_subject_data("john@example.com")
+            manager.delete_subject_data("john@example.com", dry_run=True)
+            assert len(calls) == searches
+
+            manager.delete_subject_data("john@example.com", dry_run=False)
+            report = manager.find_subject_data("john@example.com")
+
+        # the real delete goes through the predicate; only the re-find searches
+        assert len(calls) == 2 * searches
+        assert report.total_records == 0
+
+    def test_delete_covers_tables_matched_after_the_search(self, temp_db):
+        """Test a real delete reaches tables the memoized search found empty."""
+        manager = SubjectAccessManager(temp_db)
+
+        with manager.session():
+            report = manager.find_subject_data("555-1111")
+            assert report.tables_with_data == ["people"]
+
+            conn = sqlite3.connect(temp_db)
+            conn.execute(
+                "INSERT INTO tasks (id, title, assignee_email) VALUES (?, ?, ?)",
+                ("t-late", "Call back", "555-1111"),
+            )
+            conn.commit()
+            conn.close()
+
+            result = manager.delete_subject_data("555-1111", dry_run=False)
+
+        assert sorted(result.tables_affected) == ["people", "tasks"]
+        assert manager.find_subject_data("555-1111").total_records == 0
+
+    def test_ensure_identifier_indexes(self, temp_db):
+        """Test side indexes are created once and used for name lookups."""
+        manager = SubjectAccessManager(temp_db)
+        created = manager.ensure_identifier_indexes()
+
+        assert "idx_sar_people_name" in created
+        assert manager.ensure_identifier_indexes() == []
+
+        conn = sqlite3.connect(temp_db)
+        plan = conn.execute(
+            'EXPLAIN QUERY PLAN SELECT * FROM people WHERE LOWER("name") = LOWER(?)',
+            ("john doe",),
+        ).fetchall()
+        conn.close()
+        assert "idx_sar_people_name" in str(plan)
@@ -138,7 +138,7 @@ def test_xero_invoice_id_uses_guid_not_number(tmp_path, monkeypatch):
     store = MagicMock()
     store.db_path = str(tmp_path / "x.db")
 
-    def _capture_replace(table, source_column, source_value, rows):
+    def _capture_replace(table, source_column, source_value, rows, **kwargs):
         if table == "invoices":
             stored_ids.extend(r["id"] for r in rows)
         return len(rows)
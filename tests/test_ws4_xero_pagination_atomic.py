@@ -178,7 +178,7 @@ def test_xero_line_items_cleared_before_reinsert_and_fk_matches(tmp_path, monkey
     store.db_path = str(tmp_path / "x.db")
     store.query.return_value = []
 
-    def _capture_replace(table, source_column, source_value, rows):
+    def _capture_replace(table, source_column, source_value, rows, **kwargs):
         if table == "invoices":
             invoice_ids.extend(r["id"] for r in rows)
         return len(rows)